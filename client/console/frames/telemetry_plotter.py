@@ -69,6 +69,9 @@ class F1TelemetryPlotter:
         # Timestamp inicial
         self.start_time = time.time()
 
+        # Gravação contínua da sessão (SessionRecorder, stream "telemetry")
+        self.recorder = None
+
         # Widgets
         self.frame = None
         self.canvas = None
@@ -253,6 +256,19 @@ class F1TelemetryPlotter:
         gear = sensor_data.get("current_gear", 1)
         self.gear_data.append(gear)
 
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.append("telemetry", {
+                "timestamp": self.start_time + current_time,
+                "time": current_time,
+                "speed": speed,
+                "throttle": throttle,
+                "brake": brake,
+                "g_lateral": g_lateral,
+                "g_frontal": g_frontal,
+                "gear": gear,
+            })
+
     def refresh_plots(self):
         """Atualiza os gráficos com os dados atuais"""
         if not MATPLOTLIB_AVAILABLE or not self.is_running:
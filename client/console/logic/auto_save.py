@@ -3,8 +3,13 @@ auto_save.py - Sistema de auto-save de logs, dados de sensores e telemetria
 
 Arquivos salvos em exports/auto/:
 - logs_YYYYMMDD_HHMMSS.txt - Logs do console
+- session_YYYYMMDD_HHMMSS.f1rec - Sensores, telemetria e FF da sessão inteira,
+  gravados continuamente pelo SessionRecorder (session_recorder.py)
+
+Sem o gravador (falha ao criar o arquivo), volta aos snapshots periódicos:
 - sensors_YYYYMMDD_HHMMSS.pkl - Dados brutos dos sensores
 - telemetry_YYYYMMDD_HHMMSS.pkl - Dados dos gráficos de telemetria
+- ff_YYYYMMDD_HHMMSS.pkl - Métricas calculadas no cliente (FF, vídeo)
 """
 
 import os
@@ -15,6 +20,7 @@ from datetime import datetime
 
 from managers.simple_logger import error, info
 
+from .session_recorder import SessionRecorder
 from ..utils.constants import (
     AUTO_EXPORT_DIR,
     AUTO_SAVE_INTERVAL,
@@ -41,6 +47,44 @@ class AutoSaveManager:
         self.last_sensor_count = 0
         self.last_telemetry_count = 0
         self.last_ff_count = 0
+        self.recorder = None
+
+    def start_recording(self) -> bool:
+        """Inicia a gravação contínua e conecta as fontes de dados ao gravador.
+
+        Returns:
+            bool: True se gravando (False = snapshots .pkl periódicos)
+        """
+        recorder = SessionRecorder(AUTO_EXPORT_DIR)
+        if not recorder.start():
+            return False
+        self.recorder = recorder
+        if self.console.sensor_display:
+            self.console.sensor_display.set_recorder(recorder)
+        if self.console.ff_calculator:
+            self.console.ff_calculator.recorder = recorder
+        if getattr(self.console, "telemetry_plotter", None):
+            self.console.telemetry_plotter.recorder = recorder
+        return True
+
+    def stop_recording(self):
+        """Desconecta as fontes e fecha o arquivo da sessão (índice + fsync)"""
+        recorder = self.recorder
+        if recorder is None:
+            return
+        if self.console.sensor_display:
+            self.console.sensor_display.set_recorder(None)
+        if self.console.ff_calculator:
+            self.console.ff_calculator.recorder = None
+        if getattr(self.console, "telemetry_plotter", None):
+            self.console.telemetry_plotter.recorder = None
+        self.recorder = None
+        recorder.stop()
+        info(
+            f"Sessão gravada: {recorder.path} "
+            f"({', '.join(f'{n} {s}' for s, n in recorder.rows_written.items())})",
+            "RECORDER",
+        )
 
     def auto_export_on_limit(self):
         """Exporta automaticamente logs e dados quando o limite é atingido.
@@ -56,15 +100,16 @@ class AutoSaveManager:
             except Exception:
                 pass
 
+            # Gravando a sessão: sensores, telemetria e FF já estão no .f1rec
+            recording = self.recorder is not None
+
             sensor_snapshot = None
-            if self.console.sensor_display:
+            if self.console.sensor_display and not recording:
                 try:
                     sd = self.console.sensor_display
                     with sd.data_lock:
-                        if len(sd.history.get("timestamp", [])) > 0:
-                            sensor_snapshot = {
-                                k: list(v) for k, v in sd.history.items()
-                            }
+                        if sd.history.rows > 0:
+                            sensor_snapshot = sd.history.to_dict()
                 except Exception:
                     pass
 
@@ -72,6 +117,7 @@ class AutoSaveManager:
             if (
                 hasattr(self.console, "telemetry_plotter")
                 and self.console.telemetry_plotter
+                and not recording
             ):
                 try:
                     telemetry_snapshot = self.console.telemetry_plotter.get_data_dict()
@@ -82,6 +128,7 @@ class AutoSaveManager:
             if (
                 hasattr(self.console, "ff_calculator")
                 and self.console.ff_calculator
+                and not recording
             ):
                 try:
                     ff_snapshot = self.console.ff_calculator.get_export_snapshot()
@@ -162,20 +209,25 @@ class AutoSaveManager:
                 except Exception:
                     pass
 
+            # Gravando a sessão: sensores, telemetria e FF vão direto para o
+            # .f1rec pela thread do gravador — sem cópias nem resets aqui
+            recording = self.recorder is not None
+
             current_sensor_count = 0
-            if self.console.sensor_display and hasattr(
+            if not recording and self.console.sensor_display and hasattr(
                 self.console.sensor_display, "raw_buffer"
             ):
                 try:
-                    current_sensor_count = len(
-                        self.console.sensor_display.raw_buffer.get("timestamp", [])
+                    current_sensor_count = (
+                        self.console.sensor_display.raw_buffer.rows
                     )
                 except Exception:
                     pass
 
             current_telemetry_count = 0
             if (
-                hasattr(self.console, "telemetry_plotter")
+                not recording
+                and hasattr(self.console, "telemetry_plotter")
                 and self.console.telemetry_plotter
             ):
                 try:
@@ -187,7 +239,8 @@ class AutoSaveManager:
 
             current_ff_count = 0
             if (
-                hasattr(self.console, "ff_calculator")
+                not recording
+                and hasattr(self.console, "ff_calculator")
                 and self.console.ff_calculator
             ):
                 try:
@@ -237,10 +290,8 @@ class AutoSaveManager:
             ):
                 try:
                     sd = self.console.sensor_display
-                    if len(sd.raw_buffer.get("timestamp", [])) > 0:
-                        sensor_snapshot = {
-                            k: list(v) for k, v in sd.raw_buffer.items()
-                        }
+                    if sd.raw_buffer.rows > 0:
+                        sensor_snapshot = sd.raw_buffer.to_dict()
                 except Exception:
                     pass
 
@@ -76,8 +76,8 @@ class ForceFeedbackCalculator:
         "g923_steering", "g923_throttle", "g923_brake",
         # Vídeo — decode + filtros PDI (populados pelo loop do cliente
         # a partir do VideoDisplay antes de chamar calculate_g_forces_and_ff)
-        "video_decode_ms", "video_filter_ms", "video_filters_active",
-        "video_resolution",
+        "video_decode_ms", "video_filter_ms", "video_blit_ms",
+        "video_filters_active", "video_resolution",
         # Timing individual por filtro PDI (None quando filtro inativo)
         "filter_timing_sharpen_ms", "filter_timing_unsharp_ms",
         "filter_timing_high_boost_ms", "filter_timing_clahe_ms",
@@ -111,6 +111,9 @@ class ForceFeedbackCalculator:
         self._export_buffer = defaultdict(list)
         self._export_lock = threading.Lock()
 
+        # Gravação contínua da sessão (SessionRecorder, stream "ff")
+        self.recorder = None
+
     # ================================================================
     # HISTÓRICO E DETECÇÃO DE EVENTOS
     # ================================================================
@@ -469,6 +472,11 @@ class ForceFeedbackCalculator:
         Campos ausentes são gravados como None para manter o alinhamento.
         """
         ts = time.time()
+        recorder = self.recorder
+        if recorder is not None:
+            row = {key: sensor_data.get(key) for key in self.EXPORT_FIELDS}
+            row["timestamp"] = ts
+            recorder.append("ff", row)
         with self._export_lock:
             self._export_buffer["timestamp"].append(ts)
             for key in self.EXPORT_FIELDS:
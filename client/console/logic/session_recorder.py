@@ -0,0 +1,373 @@
+"""
+session_recorder.py - Gravação contínua da sessão em um único arquivo
+
+Substitui os snapshots periódicos (sensors_*.pkl, telemetry_*.pkl, ff_*.pkl)
+por um arquivo append-only por sessão, escrito por uma thread dedicada:
+
+    exports/auto/session_YYYYMMDD_HHMMSS.f1rec
+
+FORMATO DO ARQUIVO:
+==================
+| cabeçalho | chunk | chunk | ... | índice | trailer |
+
+- Cabeçalho: FILE_HEADER  (magic "F1SR", versão, flags, início da sessão)
+- Chunk:     CHUNK_HEADER (magic "CHNK", tamanho, crc32) + payload pickle
+             {"stream", "rows", "columns": {campo: np.ndarray | list}}
+             Colunas numéricas viram float64 (None -> NaN); as demais
+             (strings) ficam como list
+- Índice:    CHUNK_HEADER com magic "INDX" + pickle da lista de
+             (stream, offset, rows, t_first, t_last), escrito no close()
+- Trailer:   TRAILER (offset do índice, magic "F1IX")
+
+ESCRITA:
+=======
+- append(stream, row): só um deque.append na thread do chamador (sem
+  cópias nem I/O) — seguro para a thread de sensores e a thread UI
+- Thread de escrita: corta cada stream em chunks de até CHUNK_ROWS linhas;
+  a cada FSYNC_INTERVAL grava também os chunks parciais e faz os.fsync()
+- Crash: cada chunk tem tamanho e CRC; o leitor aproveita o prefixo válido
+  do arquivo (sem índice, varre os chunks). Perda máxima ~FSYNC_INTERVAL
+
+LEITURA:
+=======
+SessionReader(path).read("sensors") -> {campo: np.ndarray}
+"""
+
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+from managers.simple_logger import error, info
+
+FILE_MAGIC = b"F1SR"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<4sHHd")
+CHUNK_MAGIC = b"CHNK"
+INDEX_MAGIC = b"INDX"
+CHUNK_HEADER = struct.Struct("<4sII")
+TRAILER_MAGIC = b"F1IX"
+TRAILER = struct.Struct("<Q4s")
+
+SESSION_FILE_EXTENSION = ".f1rec"
+
+# Colunas de tempo usadas no índice (t_first, t_last), por prioridade
+TIME_FIELDS = ("timestamp", "time")
+
+
+def build_columns(rows):
+    """
+    Converte linhas {campo: valor} em colunas.
+
+    Args:
+        rows: Lista de dicts (campos podem variar entre linhas)
+
+    Returns:
+        dict: {campo: np.ndarray float64 (NaN = ausente) ou list}
+    """
+    keys = {}
+    for row in rows:
+        keys.update(dict.fromkeys(row))
+
+    columns = {}
+    for key in keys:
+        values = [row.get(key) for row in rows]
+        try:
+            columns[key] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+        except (TypeError, ValueError):
+            columns[key] = values
+    return columns
+
+
+class SessionRecorder:
+    """Grava streams de linhas em chunks colunares num único arquivo por sessão"""
+
+    # Linhas por chunk (~10s a 100Hz)
+    CHUNK_ROWS = 1000
+    # Intervalo entre verificações da thread de escrita (s)
+    WRITE_INTERVAL = 1.0
+    # Intervalo entre fsyncs (s) — chunks parciais também são gravados
+    FSYNC_INTERVAL = 5.0
+
+    def __init__(self, directory: str, filename: str = None):
+        """
+        Args:
+            directory: Diretório de destino (criado se não existir)
+            filename: Nome do arquivo (padrão: session_<data>.f1rec)
+        """
+        if filename is None:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"session_{stamp}{SESSION_FILE_EXTENSION}"
+        self.path = os.path.join(directory, filename)
+        self.directory = directory
+
+        self._pending = {}  # stream -> deque de linhas
+        self._index = []  # (stream, offset, rows, t_first, t_last)
+        self.rows_written = {}  # stream -> linhas gravadas
+        self.rows_received = {}  # stream -> linhas recebidas
+
+        self._file = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._last_sync = 0.0
+
+    @property
+    def is_recording(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        Abre o arquivo e inicia a thread de escrita.
+
+        Returns:
+            bool: True se a gravação começou
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.path, "wb")
+            self._file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, 0, time.time()))
+            self._file.flush()
+        except OSError as e:
+            error(f"Não foi possível criar {self.path}: {e}", "RECORDER")
+            self._file = None
+            return False
+
+        self._last_sync = time.monotonic()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._writer_loop, name="SessionRecorder", daemon=True
+        )
+        self._thread.start()
+        info(f"Gravando sessão em {self.path}", "RECORDER")
+        return True
+
+    def append(self, stream: str, row: dict):
+        """
+        Enfileira uma linha (não copia; o chamador não deve alterar row depois).
+
+        Args:
+            stream: Nome do stream ("sensors", "ff", "telemetry", ...)
+            row: {campo: valor escalar}
+        """
+        pending = self._pending.get(stream)
+        if pending is None:
+            pending = self._pending.setdefault(stream, deque())
+            self.rows_received.setdefault(stream, 0)
+        pending.append(row)
+        self.rows_received[stream] += 1
+
+    def stop(self):
+        """Grava o restante, escreve índice e trailer e fecha o arquivo"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=10.0)
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Thread de escrita
+    # ------------------------------------------------------------------
+
+    def _writer_loop(self):
+        try:
+            while not self._stop_event.wait(self.WRITE_INTERVAL):
+                sync = time.monotonic() - self._last_sync >= self.FSYNC_INTERVAL
+                self._write_pending(partial=sync)
+                if sync:
+                    self._sync()
+            self._write_pending(partial=True)
+            self._write_index()
+        except Exception as e:
+            error(f"Erro na gravação da sessão: {e}", "RECORDER")
+        finally:
+            try:
+                self._sync()
+                self._file.close()
+            except (OSError, ValueError):
+                pass
+
+    def _write_pending(self, partial: bool):
+        """Grava chunks completos (e os parciais se partial)"""
+        for stream, pending in list(self._pending.items()):
+            while len(pending) >= self.CHUNK_ROWS or (partial and pending):
+                count = min(len(pending), self.CHUNK_ROWS)
+                rows = [pending.popleft() for _ in range(count)]
+                self._write_chunk(stream, rows)
+
+    def _write_chunk(self, stream: str, rows: list):
+        columns = build_columns(rows)
+        offset = self._file.tell()
+        self._write_record(
+            CHUNK_MAGIC,
+            pickle.dumps(
+                {"stream": stream, "rows": len(rows), "columns": columns},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ),
+        )
+        t_first = t_last = None
+        for field in TIME_FIELDS:
+            column = columns.get(field)
+            if isinstance(column, np.ndarray):
+                t_first, t_last = float(column[0]), float(column[-1])
+                break
+        self._index.append((stream, offset, len(rows), t_first, t_last))
+        self.rows_written[stream] = self.rows_written.get(stream, 0) + len(rows)
+
+    def _write_record(self, magic: bytes, payload: bytes):
+        self._file.write(CHUNK_HEADER.pack(magic, len(payload), zlib.crc32(payload)))
+        self._file.write(payload)
+
+    def _write_index(self):
+        offset = self._file.tell()
+        self._write_record(
+            INDEX_MAGIC, pickle.dumps(self._index, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        self._file.write(TRAILER.pack(offset, TRAILER_MAGIC))
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+
+class SessionReader:
+    """Lê um arquivo .f1rec (com índice, ou varrendo os chunks após um crash)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Arquivo .f1rec
+
+        Raises:
+            ValueError: Arquivo não é uma sessão gravada
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(FILE_HEADER.size)
+            if len(header) < FILE_HEADER.size:
+                raise ValueError(f"{path}: arquivo truncado")
+            magic, self.version, _, self.start_time = FILE_HEADER.unpack(header)
+            if magic != FILE_MAGIC:
+                raise ValueError(f"{path}: não é uma sessão gravada")
+            self.index = self._read_index(f)
+            self.complete = self.index is not None
+            if self.index is None:
+                self.index = self._scan(f)
+
+    def streams(self) -> list:
+        """Streams presentes no arquivo"""
+        return list(dict.fromkeys(entry[0] for entry in self.index))
+
+    def rows(self, stream: str) -> int:
+        """Número de linhas de um stream"""
+        return sum(entry[2] for entry in self.index if entry[0] == stream)
+
+    def read(self, stream: str, fields=None) -> dict:
+        """
+        Concatena os chunks de um stream.
+
+        Args:
+            stream: Nome do stream
+            fields: Campos desejados (None = todos)
+
+        Returns:
+            dict: {campo: np.ndarray} — numéricos em float64 (NaN = ausente),
+                os demais em arrays object (None = ausente)
+        """
+        chunks = []
+        with open(self.path, "rb") as f:
+            for name, offset, _, _, _ in self.index:
+                if name == stream:
+                    chunks.append(self._read_payload(f, offset)[1]["columns"])
+
+        keys = {}
+        for columns in chunks:
+            keys.update(dict.fromkeys(columns))
+        if fields is not None:
+            keys = {key: None for key in fields if key in keys}
+
+        result = {}
+        for key in keys:
+            parts = []
+            for columns in chunks:
+                rows = len(next(iter(columns.values())))
+                column = columns.get(key)
+                if column is None:
+                    parts.append(np.full(rows, np.nan))
+                elif isinstance(column, np.ndarray):
+                    parts.append(column)
+                else:
+                    parts.append(np.array(column, dtype=object))
+            if any(part.dtype == object for part in parts):
+                parts = [_as_object(part) for part in parts]
+            result[key] = np.concatenate(parts) if parts else np.empty(0)
+        return result
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_payload(f, offset: int):
+        f.seek(offset)
+        header = f.read(CHUNK_HEADER.size)
+        if len(header) < CHUNK_HEADER.size:
+            raise ValueError("chunk truncado")
+        magic, length, crc = CHUNK_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            raise ValueError("chunk corrompido")
+        return magic, pickle.loads(payload)
+
+    def _read_index(self, f):
+        """Índice via trailer (None se a sessão não foi fechada)"""
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        if end < FILE_HEADER.size + TRAILER.size:
+            return None
+        f.seek(end - TRAILER.size)
+        offset, magic = TRAILER.unpack(f.read(TRAILER.size))
+        if magic != TRAILER_MAGIC or offset >= end:
+            return None
+        try:
+            kind, index = self._read_payload(f, offset)
+        except (ValueError, pickle.UnpicklingError):
+            return None
+        return index if kind == INDEX_MAGIC else None
+
+    def _scan(self, f):
+        """Reconstrói o índice varrendo os chunks válidos"""
+        index = []
+        offset = FILE_HEADER.size
+        while True:
+            try:
+                kind, payload = self._read_payload(f, offset)
+            except (ValueError, pickle.UnpicklingError, EOFError):
+                break
+            if kind != CHUNK_MAGIC:
+                break
+            columns = payload["columns"]
+            t_first = t_last = None
+            for field in TIME_FIELDS:
+                column = columns.get(field)
+                if isinstance(column, np.ndarray):
+                    t_first, t_last = float(column[0]), float(column[-1])
+                    break
+            index.append((payload["stream"], offset, payload["rows"], t_first, t_last))
+            offset = f.tell()
+        return index
+
+
+def _as_object(part: np.ndarray) -> np.ndarray:
+    """Converte para object (NaN vira None)"""
+    if part.dtype == object:
+        return part
+    column = part.astype(object)
+    column[np.isnan(part)] = None
+    return column
@@ -31,6 +31,7 @@ from datetime import datetime
 from tkinter import ttk
 
 from managers.keyboard import KeyboardController
+from managers.sensor_ring import SensorRing
 from managers.simple_logger import debug, error
 from managers.slider import SliderController
 
@@ -140,8 +141,9 @@ class ConsoleInterface:
         self.update_interval = UPDATE_INTERVAL
 
         # Thread de processamento de sensores a 100Hz
-        self._latest_sensor_data = {}
-        self._sensor_data_lock = threading.Lock()
+        # Snapshot processado -> GUI: ring SPSC (lê só o mais recente, sem lock
+        # nem cópia; a sensor thread não altera o dict depois de publicar)
+        self._sensor_snapshots = SensorRing(slots=4)
         self._sensor_thread = None
 
         # Auto-save periódico
@@ -1021,6 +1023,7 @@ class ConsoleInterface:
                     if self.video_display:
                         sensor_data["video_decode_ms"] = round(self.video_display._last_decode_ms, 2)
                         sensor_data["video_filter_ms"] = round(self.video_display._last_filter_ms, 2)
+                        sensor_data["video_blit_ms"] = round(self.video_display.last_blit_ms, 2)
                         active = self.video_display._last_active_filters
                         sensor_data["video_filters_active"] = ",".join(active) if active else ""
                         sensor_data["video_resolution"] = (
@@ -1080,6 +1083,9 @@ class ConsoleInterface:
                         client_timings["client_timing_video_filter_ms"] = round(
                             self.video_display._last_filter_ms, 2
                         )
+                        client_timings["client_timing_video_blit_ms"] = round(
+                            self.video_display.last_blit_ms, 2
+                        )
                         active = self.video_display._last_active_filters
                         if active:
                             client_timings["client_video_filters_active"] = ",".join(active)
@@ -1093,8 +1099,7 @@ class ConsoleInterface:
 
                     # Disponibiliza snapshot para a GUI thread
                     sensor_data["client_timing_total_ms"] = round(t_total_client * 1000, 2)
-                    with self._sensor_data_lock:
-                        self._latest_sensor_data = sensor_data
+                    self._sensor_snapshots.publish(sensor_data)
             except Exception as e:
                 error(f"Erro no loop de sensores: {e}", "CONSOLE")
 
@@ -1120,8 +1125,7 @@ class ConsoleInterface:
 
             # Atualiza GUI com último snapshot processado pela sensor thread
             t_gui_update = time.monotonic()
-            with self._sensor_data_lock:
-                sensor_data = dict(self._latest_sensor_data)
+            _, sensor_data = self._sensor_snapshots.latest()
             if sensor_data:
                 self.update_sensor_data(sensor_data)
                 t_gui_update = time.monotonic() - t_gui_update
@@ -1184,7 +1188,9 @@ class ConsoleInterface:
             # Inicia processamento de filas
             self.root.after(self.update_interval, self.process_queues)
 
-            # Inicia auto-save periódico
+            # Gravação contínua da sessão (sensores, telemetria, FF) + auto-save
+            # periódico dos logs
+            self.auto_save_manager.start_recording()
             self.root.after(
                 self.auto_save_interval, self.auto_save_manager.periodic_auto_save
             )
@@ -1489,6 +1495,10 @@ class ConsoleInterface:
 
         self.is_running = False
 
+        # Fecha o arquivo da sessão (grava o restante + índice)
+        if self.auto_save_manager:
+            self.auto_save_manager.stop_recording()
+
         if hasattr(self, "root") and self.root:
             try:
                 self.root.after_idle(self._cleanup_tkinter_resources)
@@ -8,6 +8,7 @@ SISTEMA COMPLETO:
 ├── main.py                    - Aplicação principal (este arquivo)
 ├── managers/network.py        - Gerencia recepção UDP
 ├── managers/video.py          - Gerencia janela de vídeo
+├── managers/video_process.py  - Recepção/decode de vídeo em processo separado
 ├── managers/sensor.py         - Gerencia dados dos sensores
 └── console/                   - Interface do console
 
@@ -44,9 +45,23 @@ try:
     from managers.g923 import G923Manager
     from managers.network import NetworkClient
     from managers.sensor import SensorDisplay
+    from managers.sensor_ring import SensorRing
     from managers.simple_logger import debug, error, info, warn
     from managers.video import VideoDisplay
-    from managers.constants import VIDEO_PORT, SENSOR_PORT, COMMAND_PORT
+    from managers.video_process import VideoProcess
+    from managers.constants import (
+        COMMAND_PORT,
+        SENSOR_PORT,
+        SENSOR_RING_SLOTS,
+        VIDEO_PORT,
+        VIDEO_PROCESS_ENABLED,
+    )
+    from managers.telemetry_codec import (
+        CHANNEL_ACTUATORS,
+        CHANNEL_POWER,
+        CHANNEL_SYSTEM,
+        CHANNEL_TEMPERATURE,
+    )
 except ImportError as e:
     print(f"❌ ERRO: Não foi possível importar módulos necessários: {e}")
     print("\nVerifique se os arquivos estão na mesma pasta:")
@@ -57,8 +72,15 @@ except ImportError as e:
 # Filas para comunicação entre threads
 log_queue = queue.Queue(maxsize=1000)
 status_queue = queue.Queue(maxsize=100)
-sensor_queue = queue.Queue(maxsize=200)
+sensor_ring = SensorRing(SENSOR_RING_SLOTS)  # SPSC: NetworkClient -> SensorDisplay
 video_queue = queue.Queue(maxsize=30)
+# Canais lentos de telemetria (o canal IMU usa sensor_ring)
+channel_queues = {
+    CHANNEL_POWER: queue.Queue(maxsize=20),
+    CHANNEL_TEMPERATURE: queue.Queue(maxsize=5),
+    CHANNEL_SYSTEM: queue.Queue(maxsize=5),
+    CHANNEL_ACTUATORS: queue.Queue(maxsize=200),
+}
 
 # Configurações padrão
 DEFAULT_PORT = VIDEO_PORT
@@ -74,6 +96,7 @@ class F1ClientApplication:
         buffer_size=DEFAULT_BUFFER_SIZE,
         rpi_ip=None,
         client_ip=None,
+        video_process=VIDEO_PROCESS_ENABLED,
     ):
         """
         Inicializa a aplicação cliente
@@ -83,15 +106,19 @@ class F1ClientApplication:
             buffer_size (int): Tamanho do buffer UDP
             rpi_ip (str): IP do Raspberry Pi
             client_ip (str): IP do cliente (este PC)
+            video_process (bool): Recepção e decode de vídeo em processo
+                separado (isola o vídeo do GIL da interface e do loop de FF)
         """
         self.port = port
         self.buffer_size = buffer_size
         self.rpi_ip = rpi_ip
         self.client_ip = client_ip
+        self.use_video_process = video_process
 
         # Componentes do sistema
         self.network_client = None
         self.video_display = None
+        self.video_process = None
         self.sensor_display = None
         self.console_interface = None
         self.g923_manager = None
@@ -168,6 +195,20 @@ class F1ClientApplication:
         debug(f"Porta UDP: {self.port}, Buffer: {self.buffer_size // 1024}KB", "CLIENT")
 
         try:
+            # 0. Processo de vídeo (escuta a porta de vídeo no lugar do NetworkClient)
+            if self.use_video_process:
+                self.video_process = VideoProcess(
+                    video_port=self.port,
+                    command_port=COMMAND_PORT,
+                    buffer_size=self.buffer_size,
+                    rpi_ip=self.rpi_ip,
+                    log_queue=log_queue,
+                    status_queue=status_queue,
+                )
+                if not self.video_process.start():
+                    warn("Processo de vídeo indisponível - vídeo em threads", "CLIENT")
+                    self.video_process = None
+
             # 1. Inicializa cliente de rede
             debug("Inicializando cliente de rede...", "CLIENT")
             self.network_client = NetworkClient(
@@ -179,8 +220,10 @@ class F1ClientApplication:
                 client_ip=self.client_ip,
                 log_queue=log_queue,
                 status_queue=status_queue,
-                sensor_queue=sensor_queue,
+                sensor_ring=sensor_ring,
                 video_queue=video_queue,
+                channel_queues=channel_queues,
+                receive_video=self.video_process is None,
             )
 
             # 1.5. Inicializa gerenciador do G923
@@ -195,12 +238,28 @@ class F1ClientApplication:
             self.video_display = VideoDisplay(
                 video_queue=video_queue,
                 log_queue=log_queue,
+                video_process=self.video_process,
             )
+            if self.video_process:
+                # VIDEO_FEEDBACK e pedidos de IDR saem do processo de vídeo;
+                # aqui chegam só os contadores (liberam o TX de comandos)
+                self.video_process.stats_callback = self._on_video_process_stats
+            else:
+                # Tempo de decode vai no VIDEO_FEEDBACK (controle de bitrate no RPi)
+                self.network_client.video_stats_provider = (
+                    self.video_display.get_feedback_stats
+                )
+                # H.264: decoder pede IDR ao RPi após perda de frame
+                self.video_display.keyframe_request_callback = (
+                    self.network_client.request_keyframe
+                )
 
             # 3. Inicializa exibição de sensores
             debug("Inicializando interface de sensores...", "CLIENT")
             self.sensor_display = SensorDisplay(
-                sensor_queue=sensor_queue, log_queue=log_queue
+                sensor_ring=sensor_ring,
+                log_queue=log_queue,
+                channel_queues=channel_queues,
             )
 
             # 4. Inicializa interface do console
@@ -238,6 +297,13 @@ class F1ClientApplication:
             self.network_thread.start()
             log_queue.put(("INFO", "Thread de rede iniciada"))
 
+    def _on_video_process_stats(self, stats):
+        """Estatísticas do processo de vídeo (thread VideoEvents)"""
+        if self.network_client:
+            self.network_client.apply_video_stats(stats["network"])
+        if self.video_display:
+            self.video_display.apply_remote_stats(stats["display"])
+
     def start_video_thread(self):
         """Inicia thread de vídeo"""
         if self.video_display:
@@ -376,6 +442,8 @@ class F1ClientApplication:
                 # Aguarda thread do vídeo parar antes de destruir Tkinter
                 if self.video_thread and self.video_thread.is_alive():
                     self.video_thread.join(timeout=1.0)
+            if self.video_process:
+                self.video_process.stop()
         except Exception as e:
             try:
                 debug(f"Erro ao parar video: {e}", "CLIENT")
@@ -489,6 +557,7 @@ class F1ClientApplication:
             # Remove referências aos componentes
             self.console_interface = None
             self.video_display = None
+            self.video_process = None
             self.network_client = None
             self.g923_manager = None
 
@@ -562,6 +631,12 @@ Para parar: Feche a janela do console ou pressione Ctrl+C.
         "--debug", action="store_true", help="Modo debug com mais informações"
     )
 
+    parser.add_argument(
+        "--no-video-process",
+        action="store_true",
+        help="Recebe e decodifica vídeo em threads do processo da interface",
+    )
+
     return parser
 
 
@@ -606,7 +681,11 @@ def main():
 
     # Criar e executar aplicação com IPs fixos
     app = F1ClientApplication(
-        port=args.port, buffer_size=buffer_size, rpi_ip=rpi_ip, client_ip=client_ip
+        port=args.port,
+        buffer_size=buffer_size,
+        rpi_ip=rpi_ip,
+        client_ip=client_ip,
+        video_process=VIDEO_PROCESS_ENABLED and not args.no_video_process,
     )
 
     try:
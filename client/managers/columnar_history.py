@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+columnar_history.py - Histórico Colunar de Sensores (NumPy)
+Substitui o dict de deques/listas do SensorDisplay por colunas NumPy
+pré-alocadas, todas compartilhando o mesmo índice de linha.
+
+LAYOUT:
+======
+- Colunas numéricas: um bloco float64 (linhas x colunas); cada coluna é
+  uma view com stride do bloco, e uma linha inteira é escrita com uma
+  única atribuição NumPy
+- Colunas object: um array por campo
+- capacity + slack linhas; as linhas válidas são sempre o trecho
+  contíguo [start, end)
+
+append_row():  escreve na linha end (O(1)); campos ausentes na linha
+               recebem "faltante"
+end == fim:    compacta — move as últimas capacity linhas para o início
+               (um memmove a cada slack appends, O(1) amortizado;
+               substitui o trim de 2000 linhas por lista)
+window():      view (sem cópia) das últimas n linhas de uma coluna
+
+TIPOS:
+=====
+- Tipo definido pelo primeiro valor visto:
+  - numérico/bool -> float64, faltante = NaN
+  - string/outros -> object, faltante = None
+- Valor não numérico em coluna float promove a coluna para object
+- Dicts/listas aninhados (ex: system_status) são ignorados
+- to_dict() devolve o formato dos .pkl anteriores: faltante = None e
+  int/bool no tipo original (guardado pelo primeiro valor não nulo)
+
+MEMÓRIA:
+=======
+10k linhas x 150 campos: ~15 MB em float64 (com a folga de 25%) contra
+~50 MB de deques de floats Python (ponteiro + objeto por valor)
+"""
+
+import numpy as np
+
+
+class ColumnarHistory:
+    """Ring buffer colunar com janelas contíguas (views sem cópia)"""
+
+    # Folga além da capacidade (fração): define a frequência da compactação
+    SLACK_FRACTION = 0.25
+    # Colunas numéricas alocadas a mais quando o bloco enche
+    BLOCK_GROWTH = 16
+    # Tipos numéricos (viram float64)
+    NUMERIC_TYPES = (int, float, np.number, np.bool_)
+    # Tipos ignorados (estruturas aninhadas não viram coluna)
+    SKIP_TYPES = (dict, list, tuple)
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Número máximo de linhas mantidas (as mais antigas são
+                descartadas)
+        """
+        self.capacity = max(1, int(capacity))
+        self._size = self.capacity + max(1, int(self.capacity * self.SLACK_FRACTION))
+        self.clear()
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    @property
+    def rows(self) -> int:
+        """Número de linhas válidas"""
+        return self._end - self._start
+
+    def clear(self):
+        """Remove todas as linhas e colunas"""
+        self._fields = {"timestamp": None}  # Todos os campos, em ordem de chegada
+        self._seen = {"timestamp": None}  # Campos + chaves ignoradas (dicts/listas)
+        self._numeric = {"timestamp": 0}  # campo -> coluna do bloco
+        self._kinds = {"timestamp": float}  # campo numérico -> bool/int/float
+        self._untyped = set()  # Campos numéricos ainda sem valor não nulo
+        self._objects = {}  # campo -> array object
+        self._block = np.full((self._size, self.BLOCK_GROWTH), np.nan)
+        self._start = self._end = 0
+
+    def append_row(self, row: dict, timestamp=None):
+        """
+        Adiciona uma linha com todos os campos escalares de row.
+
+        Args:
+            row: {campo: valor}; campos ausentes ficam como faltante
+            timestamp: Valor da coluna "timestamp" (padrão: row["timestamp"])
+        """
+        if self._end == self._size:
+            self._compact()
+        pos = self._end
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+        if timestamp is None:
+            timestamp = row.get("timestamp")
+
+        # Campos novos — sem lista fixa (ex: timing_* do RPi)
+        if not row.keys() <= self._seen.keys():
+            for key in row.keys() - self._seen.keys():
+                value = row[key]
+                self._seen[key] = None
+                if not isinstance(value, self.SKIP_TYPES):
+                    self._new_column(key, value)
+
+        # Colunas numéricas: uma atribuição para a linha inteira
+        get = row.get
+        numeric = self._numeric
+        values = [get(key) for key in numeric]
+        values[0] = timestamp
+        try:
+            self._block[pos, : len(values)] = values
+        except (TypeError, ValueError):
+            # None (faltante) ou valor não numérico: coluna por coluna
+            for key, value in zip(list(numeric), values):
+                self._set(key, pos, value)
+        if self._untyped:
+            for key in list(self._untyped):
+                self._set_kind(key, get(key))
+
+        # Colunas object (faltante = None sobrescreve o valor antigo do ring)
+        for key, column in self._objects.items():
+            value = get(key)
+            column[pos] = None if isinstance(value, self.SKIP_TYPES) else value
+
+    def set_last(self, fields: dict):
+        """Sobrescreve campos da última linha (cria colunas novas se preciso)"""
+        if self._end == self._start:
+            return
+        pos = self._end - 1
+        for key, value in fields.items():
+            if isinstance(value, self.SKIP_TYPES):
+                continue
+            if key not in self._fields:
+                self._new_column(key, value)
+            self._set(key, pos, value)
+
+    def _new_column(self, key: str, value):
+        """Cria a coluna (tipo pelo primeiro valor), faltante nas linhas anteriores"""
+        self._fields[key] = None
+        self._seen[key] = None
+        if value is not None and not isinstance(value, self.NUMERIC_TYPES):
+            self._objects[key] = np.full(self._size, None, dtype=object)
+            return
+        self._kinds[key] = None
+        self._untyped.add(key)
+        self._set_kind(key, value)
+        index = len(self._numeric)
+        if index == self._block.shape[1]:
+            grown = np.full((self._size, index + self.BLOCK_GROWTH), np.nan)
+            grown[:, :index] = self._block
+            self._block = grown
+        else:
+            self._block[:, index] = np.nan
+        self._numeric[key] = index
+
+    def _set(self, key: str, pos: int, value):
+        """Escreve um valor, promovendo a coluna para object se não for numérico"""
+        if isinstance(value, self.SKIP_TYPES):
+            value = None
+        column = self._objects.get(key)
+        if column is not None:
+            column[pos] = value
+            return
+        if value is None:
+            value = np.nan
+        elif key in self._untyped:
+            self._set_kind(key, value)
+        try:
+            self._block[pos, self._numeric[key]] = value
+        except (TypeError, ValueError):
+            self._promote(key)
+            self._objects[key][pos] = value
+
+    def _set_kind(self, key: str, value):
+        """Guarda o tipo Python (bool/int/float) do primeiro valor não nulo"""
+        if value is None or key not in self._untyped:
+            return
+        if isinstance(value, (bool, np.bool_)):
+            self._kinds[key] = bool
+        elif isinstance(value, (int, np.integer)):
+            self._kinds[key] = int
+        else:
+            self._kinds[key] = float
+        self._untyped.discard(key)
+
+    def _promote(self, key: str):
+        """Move uma coluna do bloco float64 para object (NaN vira None)"""
+        index = self._numeric.pop(key)
+        self._untyped.discard(key)
+        self._objects[key] = _as_objects(self._block[:, index], self._kinds.pop(key))
+
+        # Fecha o buraco no bloco (mantém coluna == posição em _numeric)
+        self._block[:, index:-1] = self._block[:, index + 1:].copy()
+        self._block[:, -1] = np.nan
+        self._numeric = {name: i for i, name in enumerate(self._numeric)}
+
+    def _compact(self):
+        """Move as linhas válidas para o início"""
+        rows = self._end - self._start
+        self._block[:rows] = self._block[self._start:self._end]
+        for column in self._objects.values():
+            column[:rows] = column[self._start:self._end]
+        self._start = 0
+        self._end = rows
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def window(self, key: str, num_points=None) -> np.ndarray:
+        """
+        Últimas num_points linhas de uma coluna (todas se None).
+
+        Returns:
+            np.ndarray: View somente leitura — válida até o próximo append;
+                copie para guardar
+        """
+        start = self._start
+        if num_points is not None:
+            start = max(start, self._end - num_points)
+        column = self._objects.get(key)
+        if column is None:
+            if key not in self._fields:
+                raise KeyError(key)
+            view = self._block[start:self._end, self._numeric[key]]
+        else:
+            view = column[start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot {campo: list} no formato dos .pkl exportados: faltante é
+        None e campos int/bool voltam ao tipo original
+        """
+        result = {}
+        for key in self._fields:
+            window = self.window(key)
+            if key in self._numeric:
+                window = _as_objects(window, self._kinds[key])
+            result[key] = window.tolist()
+        return result
+
+    # Compatibilidade com o dict de listas anterior (auto_save, export)
+    def keys(self):
+        return self._fields.keys()
+
+    def items(self):
+        return [(key, self.window(key)) for key in self._fields]
+
+    def get(self, key: str, default=None):
+        if key not in self._fields:
+            return default
+        return self.window(key)
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.window(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+
+def _as_objects(data: np.ndarray, kind) -> np.ndarray:
+    """
+    Converte uma coluna float64 em object: NaN vira None e, se todos os
+    valores couberem, int/bool voltam ao tipo original
+    """
+    missing = np.isnan(data)
+    values = data[~missing]
+    if kind is bool and np.isin(values, (0.0, 1.0)).all():
+        column = (data != 0).astype(object)
+    elif (
+        kind is int
+        and np.isfinite(values).all()
+        and (values == np.round(values)).all()
+        and (np.abs(values) < 2.0**63).all()
+    ):
+        column = np.where(missing, 0.0, data).astype(np.int64).astype(object)
+    else:
+        column = data.astype(object)
+    column[missing] = None
+    return column
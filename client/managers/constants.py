@@ -15,12 +15,38 @@ SENSOR_SOCKET_RCVBUF = 65536
 MAX_FRAME_SIZE = 1_000_000
 MAX_SENSOR_SIZE = 50_000
 
+# Telemetria binária: intervalo entre pedidos SENSOR_FORMAT enquanto chega JSON
+SENSOR_FORMAT_RETRY_INTERVAL = 2.0
+
+# Vídeo: intervalo do relatório de perda (VIDEO_FEEDBACK) que ajusta o FEC no RPi
+VIDEO_FEEDBACK_INTERVAL = 1.0
+
+# Vídeo H.264: intervalo mínimo entre pedidos de IDR (VIDEO_KEYFRAME) ao RPi
+VIDEO_KEYFRAME_REQUEST_INTERVAL = 0.5
+
 # Connection
 CONNECTION_TIMEOUT = 10.0
 
 # Buffer & data limits
 DEFAULT_SENSOR_HISTORY_SIZE = 10_000
+# Ring SPSC de sensores (NetworkClient -> SensorDisplay): ~2.5s a 100Hz
+SENSOR_RING_SLOTS = 256
 MAX_VIDEO_QUEUE_FRAMES = 10
 
+# Vídeo: threads de decode MJPEG (limitado também por cpu_count - 1)
+VIDEO_DECODE_MAX_WORKERS = 4
+# Intervalo entre ajustes do número de workers ativos (s)
+VIDEO_DECODE_ADAPT_INTERVAL = 1.0
+
+# Processo de vídeo separado (recepção + decode + filtros fora do processo da
+# interface; frames prontos chegam por um ring em memória compartilhada)
+VIDEO_PROCESS_ENABLED = True
+VIDEO_RING_SLOTS = 3
+VIDEO_RING_MAX_PIXELS = 1920 * 1080  # Capacidade de cada slot (RGB)
+VIDEO_PROCESS_STATS_INTERVAL = 0.5  # Estatísticas do processo de vídeo (s)
+
+# Filtros PDI: "auto" (GPU se houver CuPy, senão CPU multi-thread), "gpu", "cpu", "cpu-mt"
+IMAGE_FILTER_BACKEND = "auto"
+
 # Input rates
 G923_SEND_RATE_HZ = 60
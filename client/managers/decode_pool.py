@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+decode_pool.py - Pool de Decode JPEG com Entrega Ordenada (latest-wins)
+Distribui o decode MJPEG entre threads (cv2.imdecode libera o GIL) para que
+1080p com filtros PDI não fique limitado a um único core.
+
+FLUXO:
+=====
+submit(seq, data) -> slot "pendente" (só o frame mais recente) -> worker
+livre decodifica -> deliver(seq, resultado)
+
+- Sequência: o dispatcher numera os frames em ordem de chegada
+- Latest-wins na entrada: com todos os workers ocupados, um frame novo
+  substitui o pendente (o antigo nunca é decodificado)
+- Latest-wins na saída: o consumidor descarta resultados com sequência
+  menor ou igual à do último frame exibido (ver VideoDisplay)
+
+TAMANHO ADAPTATIVO:
+==================
+Todas as threads são criadas no início; active_workers limita quantos
+decodes rodam ao mesmo tempo. adapt() ajusta o limite para
+ceil(decode_ms / intervalo entre frames): decode rápido usa uma thread
+(sem custo de troca de contexto), decode lento usa até max_workers.
+"""
+
+import math
+import threading
+
+
+class DecodePool:
+    """Pool de threads de decode com slot pendente único (latest-wins)"""
+
+    # Folga sobre o decode medido antes de adicionar um worker
+    HEADROOM = 1.2
+
+    def __init__(self, decode_fn, deliver_fn, max_workers: int):
+        """
+        Args:
+            decode_fn: Callable(data) -> resultado (roda nos workers)
+            deliver_fn: Callable(seq, resultado) (roda nos workers, em
+                ordem de término — o consumidor descarta os atrasados)
+            max_workers: Número de threads
+        """
+        self._decode_fn = decode_fn
+        self._deliver_fn = deliver_fn
+        self.max_workers = max(1, max_workers)
+        self.active_workers = 1
+
+        self._cond = threading.Condition()
+        self._pending = None  # (seq, data) mais recente aguardando worker
+        self._in_flight = 0
+        self._running = True
+
+        # Estatísticas
+        self.frames_submitted = 0
+        self.frames_replaced = 0  # Substituídos no slot pendente (sem decode)
+
+        self._threads = [
+            threading.Thread(
+                target=self._worker_loop, name=f"VideoDecode-{i}", daemon=True
+            )
+            for i in range(self.max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, seq: int, data) -> bool:
+        """
+        Enfileira um frame para decode.
+
+        Returns:
+            bool: True se substituiu um frame pendente (descartado sem decode)
+        """
+        with self._cond:
+            replaced = self._pending is not None
+            if replaced:
+                self.frames_replaced += 1
+            self._pending = (seq, data)
+            self.frames_submitted += 1
+            self._cond.notify()
+        return replaced
+
+    def adapt(self, decode_ms: float, frame_interval_ms: float):
+        """Ajusta os workers ativos ao tempo de decode e à taxa de chegada"""
+        if frame_interval_ms <= 0:
+            return
+        needed = math.ceil(decode_ms * self.HEADROOM / frame_interval_ms)
+        workers = max(1, min(self.max_workers, needed))
+        if workers != self.active_workers:
+            with self._cond:
+                self.active_workers = workers
+                self._cond.notify_all()
+
+    def _worker_loop(self):
+        """Loop de cada worker: pega o pendente, decodifica e entrega"""
+        while True:
+            with self._cond:
+                while self._running and (
+                    self._pending is None or self._in_flight >= self.active_workers
+                ):
+                    self._cond.wait()
+                if not self._running:
+                    return
+                seq, data = self._pending
+                self._pending = None
+                self._in_flight += 1
+
+            try:
+                result = self._decode_fn(data)
+                self._deliver_fn(seq, result)
+            except Exception:
+                pass  # Frame corrompido: o próximo substitui
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify()
+
+    def stop(self):
+        """Encerra os workers (frames pendentes são descartados)"""
+        with self._cond:
+            self._running = False
+            self._pending = None
+            self._cond.notify_all()
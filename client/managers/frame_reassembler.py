@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+frame_reassembler.py - Reassembly de Frames Fragmentados sem Cópias (porta 9999)
+Remonta frames MJPEG fragmentados pelo RPi diretamente em buffers
+pré-alocados, sem criar um objeto bytes por datagrama nem concatenar chunks.
+
+ESTRUTURA DO FRAGMENTO:
+======================
+| 4 bytes    | 4 bytes  | 2 bytes     | 2 bytes      | N bytes    |
+| FRAG_MAGIC | frame_id | chunk_index | total_chunks | chunk_data |
+
+O RPi fragmenta o pacote <4 bytes frame_size><frame_data> em chunks de
+CHUNK_SIZE bytes (o último pode ser menor), então o chunk i começa sempre
+no offset i * CHUNK_SIZE do pacote remontado.
+
+FRAGMENTO COM FEC (paridade XOR):
+================================
+| 4 bytes   | 4 bytes  | 2 bytes | 2 bytes     | 1 byte        | 1 byte | 4 bytes    | N bytes |
+| FEC_MAGIC | frame_id | index   | data_chunks | parity_chunks | flags  | packet_len | payload |
+
+- index < data_chunks: chunk de dados (FEC_CHUNK_SIZE bytes, último menor)
+- index >= data_chunks: paridade j = index - data_chunks, XOR (com padding
+  de zeros) dos chunks de dados i com i % parity_chunks == j
+- Recupera um chunk perdido por grupo; grupos intercalados fazem rajadas
+  de perdas consecutivas caírem em grupos diferentes
+- Enviado só a clientes que mandam VIDEO_FEEDBACK (perda medida aqui)
+
+RECEPÇÃO:
+========
+- Linux/macOS: MSG_PEEK lê só o cabeçalho e recvmsg_into() grava o payload
+  direto na posição final do slot (memoryview), sem cópia intermediária.
+- Sem recvmsg_into (Windows): recvfrom_into() em um buffer de rascunho
+  pré-alocado + cópia do chunk para o slot (sem alocação).
+
+POOL DE SLOTS:
+=============
+- SLOTS buffers de max_frame_size, reutilizados entre frames
+- Quando um frame completa, frames incompletos mais antigos são descartados
+  (nunca serão exibidos: o consumidor só mostra o mais recente)
+- Sem slot livre, o frame incompleto mais antigo é descartado
+- Único objeto alocado por frame: a cópia bytes entregue ao consumidor
+"""
+
+import socket
+import struct
+import time
+from collections import deque
+
+import numpy as np
+
+# Cabeçalhos dos fragmentos (devem ser iguais ao servidor)
+FRAG_MAGIC = 0x46524147  # "FRAG" em ASCII hex
+FRAG_HEADER = struct.Struct("<IIHH")
+FRAG_HEADER_SIZE = FRAG_HEADER.size  # 12 bytes
+FEC_MAGIC = 0x46524746  # "FRGF" em ASCII hex
+FEC_HEADER = struct.Struct("<IIHHBBI")
+FEC_HEADER_SIZE = FEC_HEADER.size  # 18 bytes
+_MAGIC = struct.Struct("<I")
+
+# Pacote remontado: <4 bytes frame_size><frame_data>
+_FRAME_SIZE = struct.Struct("<I")
+
+
+class _FrameSlot:
+    """Buffer pré-alocado de um frame em remontagem"""
+
+    __slots__ = ("buffer", "view", "frame_id", "total", "parity", "stride",
+                 "received", "count", "parity_count", "length", "started")
+
+    def __init__(self, capacity: int):
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.frame_id = None  # None = slot livre
+        self.total = 0  # Chunks de dados
+        self.parity = 0  # Chunks de paridade (0 = sem FEC)
+        self.stride = 0
+        self.received = 0  # Bitmask dos chunks recebidos (dados + paridade)
+        self.count = 0  # Chunks de dados recebidos
+        self.parity_count = 0
+        self.length = 0  # Tamanho do pacote remontado
+        self.started = 0.0
+
+    def reset(self, frame_id: int, total: int, parity: int, stride: int, now: float):
+        self.frame_id = frame_id
+        self.total = total
+        self.parity = parity
+        self.stride = stride
+        self.received = 0
+        self.count = 0
+        self.parity_count = 0
+        self.length = 0
+        self.started = now
+
+    def grow(self, capacity: int):
+        """Aumenta o buffer (frame maior que o previsto — raro)"""
+        self.view.release()
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+
+
+class FrameReassembler:
+    """Remonta frames fragmentados em slots pré-alocados"""
+
+    # Payload por fragmento (devem ser iguais ao servidor:
+    # MAX_PACKET_SIZE - tamanho do cabeçalho, com MAX_PACKET_SIZE = 60000)
+    CHUNK_SIZE = 59988
+    FEC_CHUNK_SIZE = 59982
+    SLOTS = 4
+    FRAG_TIMEOUT = 1.0  # Descarta frames incompletos parados há mais tempo
+
+    def __init__(self, max_frame_size: int, datagram_size: int = 65536):
+        """
+        Args:
+            max_frame_size: Tamanho máximo esperado de um frame (bytes)
+            datagram_size: Tamanho do buffer de rascunho (>= maior datagrama)
+        """
+        capacity = -(-(max_frame_size + _FRAME_SIZE.size) // self.CHUNK_SIZE)
+        self._slots = [
+            _FrameSlot(capacity * self.CHUNK_SIZE) for _ in range(self.SLOTS)
+        ]
+        # Frames já entregues (paridade que chega depois é ignorada)
+        self._completed = deque(maxlen=self.SLOTS * 2)
+
+        # Datagramas não-fragmentados (e fallback sem recvmsg_into)
+        self._scratch = bytearray(max(datagram_size, 65536))
+        self._scratch_view = memoryview(self._scratch)
+        self._header = bytearray(FEC_HEADER_SIZE)
+        self._header_view = memoryview(self._header)
+        self._zero_copy = hasattr(socket.socket, "recvmsg_into")
+        self._zeros = memoryview(bytes(self.CHUNK_SIZE))
+
+        # Estatísticas
+        self.frames_completed = 0
+        self.frames_recovered = 0  # Completados graças à paridade
+        self.frames_dropped = 0  # Incompletos descartados (perda de chunk)
+        self.chunks_invalid = 0  # Duplicados ou fora do layout esperado
+        self.chunks_expected = 0  # Chunks de dados dos frames finalizados
+        self.chunks_lost = 0  # ... que não chegaram (perda na rede)
+
+    def recv(self, sock, source_ip=None):
+        """
+        Recebe um datagrama do socket de vídeo.
+
+        Args:
+            sock: Socket UDP de vídeo
+            source_ip: Se definido, datagramas de outros IPs são descartados
+
+        Returns:
+            tuple: (addr, nbytes, datagram, frame)
+                - datagram: memoryview do datagrama não-fragmentado (válido
+                  só até a próxima chamada) ou None
+                - frame: bytes do frame completado por este fragmento, ou None
+        """
+        if self._zero_copy:
+            nbytes, addr = sock.recvfrom_into(
+                self._header, FEC_HEADER_SIZE, socket.MSG_PEEK
+            )
+            if source_ip is None or addr[0] == source_ip:
+                fragment = self._parse_header(self._header_view[:nbytes])
+                if fragment is not None:
+                    return self._recv_fragment_in_place(sock, addr, fragment)
+
+        nbytes, addr = sock.recvfrom_into(self._scratch)
+        if source_ip is not None and addr[0] != source_ip:
+            return addr, nbytes, None, None
+
+        datagram = self._scratch_view[:nbytes]
+        fragment = self._parse_header(datagram)
+        if fragment is not None:
+            header_size = fragment[-1]
+            return addr, nbytes, None, self._store_copy(
+                fragment, datagram[header_size:]
+            )
+
+        return addr, nbytes, datagram, None
+
+    def add_fragment(self, packet):
+        """
+        Adiciona um fragmento já recebido (bytes com cabeçalho).
+
+        Returns:
+            bytes do frame completo, ou None se ainda aguardando chunks
+        """
+        fragment = self._parse_header(packet)
+        if fragment is None:
+            return None
+        return self._store_copy(fragment, memoryview(packet)[fragment[-1]:])
+
+    def _parse_header(self, packet):
+        """
+        Interpreta o cabeçalho de fragmento (FRAG ou FEC).
+
+        Returns:
+            (frame_id, index, total, parity, packet_len, stride, header_size),
+            ou None se não for fragmento
+        """
+        if len(packet) < FRAG_HEADER_SIZE:
+            return None
+        magic = _MAGIC.unpack_from(packet)[0]
+        if magic == FRAG_MAGIC:
+            _, frame_id, index, total = FRAG_HEADER.unpack_from(packet)
+            return frame_id, index, total, 0, 0, self.CHUNK_SIZE, FRAG_HEADER_SIZE
+        if magic == FEC_MAGIC and len(packet) >= FEC_HEADER_SIZE:
+            _, frame_id, index, total, parity, _, packet_len = FEC_HEADER.unpack_from(
+                packet
+            )
+            return (frame_id, index, total, parity, packet_len,
+                    self.FEC_CHUNK_SIZE, FEC_HEADER_SIZE)
+        return None
+
+    def _recv_fragment_in_place(self, sock, addr, fragment):
+        """Consome o fragmento espiado gravando o payload direto no slot"""
+        slot = self._slot_for(fragment)
+        if slot is None:
+            nbytes = sock.recv_into(self._scratch)  # Descarta
+            return addr, nbytes, None, None
+
+        index, stride, header_size = fragment[1], fragment[5], fragment[6]
+        offset = index * stride
+        nbytes, _, flags, _ = sock.recvmsg_into(
+            [self._header_view[:header_size], slot.view[offset:offset + stride]]
+        )
+        if flags & socket.MSG_TRUNC:
+            # Chunk maior que o stride: servidor com outro MAX_PACKET_SIZE
+            self.chunks_invalid += 1
+            self._drop(slot)
+            return addr, nbytes, None, None
+        return addr, nbytes, None, self._mark(slot, index, nbytes - header_size)
+
+    def _store_copy(self, fragment, payload):
+        """Copia um chunk já recebido para o slot do frame"""
+        slot = self._slot_for(fragment)
+        if slot is None:
+            return None
+        size = len(payload)
+        if size > slot.stride:
+            self.chunks_invalid += 1
+            self._drop(slot)
+            return None
+        offset = fragment[1] * slot.stride
+        slot.view[offset:offset + size] = payload
+        return self._mark(slot, fragment[1], size)
+
+    def _slot_for(self, fragment):
+        """Retorna o slot do frame (alocando um), ou None se o chunk é inválido"""
+        frame_id, index, total, parity, packet_len, stride, _ = fragment
+        if total == 0 or index >= total + parity:
+            self.chunks_invalid += 1
+            return None
+        if frame_id in self._completed:
+            return None  # Paridade/duplicado de frame já entregue
+
+        free = None
+        oldest = None
+        for slot in self._slots:
+            if slot.frame_id == frame_id:
+                if (
+                    slot.total != total
+                    or slot.parity != parity
+                    or slot.received >> index & 1
+                ):
+                    self.chunks_invalid += 1
+                    return None
+                return slot
+            if slot.frame_id is None:
+                if free is None:
+                    free = slot
+            elif oldest is None or slot.started < oldest.started:
+                oldest = slot
+
+        if free is None:
+            # Pool cheio: descarta o frame incompleto mais antigo
+            self._drop(oldest)
+            free = oldest
+
+        needed = (total + parity) * stride
+        if needed > len(free.buffer):
+            free.grow(needed)
+        free.reset(frame_id, total, parity, stride, time.monotonic())
+        free.length = packet_len
+        return free
+
+    def _mark(self, slot, index, size):
+        """Registra o chunk recebido; entrega o frame quando completo"""
+        stride = slot.stride
+        last = slot.total - 1
+        if index == last:
+            if not slot.parity:
+                slot.length = last * stride + size
+            elif size != slot.length - last * stride:
+                self.chunks_invalid += 1
+                self._drop(slot)
+                return None
+            else:
+                # Padding de zeros: a paridade foi calculada assim
+                offset = index * stride
+                slot.view[offset + size:offset + stride] = self._zeros[:stride - size]
+        elif size != stride:
+            # Layout diferente do esperado (chunk intermediário curto)
+            self.chunks_invalid += 1
+            self._drop(slot)
+            return None
+
+        slot.received |= 1 << index
+        if index < slot.total:
+            slot.count += 1
+        else:
+            slot.parity_count += 1
+
+        if slot.count < slot.total:
+            if slot.count + slot.parity_count < slot.total or not self._recover(slot):
+                return None
+
+        frame = self._extract(slot)
+        self._evict_older(slot)
+        self._completed.append(slot.frame_id)
+        slot.frame_id = None
+        return frame
+
+    def _recover(self, slot) -> bool:
+        """Reconstrói chunks de dados perdidos a partir da paridade XOR"""
+        total, parity, stride = slot.total, slot.parity, slot.stride
+        missing = [i for i in range(total) if not slot.received >> i & 1]
+        groups = [i % parity for i in missing]
+        if len(set(groups)) != len(groups):
+            return False  # Mais de uma perda no mesmo grupo
+        if any(not slot.received >> (total + j) & 1 for j in groups):
+            return False  # Paridade do grupo ainda não chegou
+
+        rows = np.frombuffer(
+            slot.buffer, dtype=np.uint8, count=(total + parity) * stride
+        ).reshape(total + parity, stride)
+        for i, j in zip(missing, groups):
+            members = [m for m in range(j, total, parity) if m != i]
+            np.bitwise_xor.reduce(rows[[total + j] + members], axis=0, out=rows[i])
+        del rows
+
+        self.frames_recovered += 1
+        return True
+
+    def _extract(self, slot):
+        """Copia o frame remontado para bytes (o slot será reutilizado)"""
+        self.chunks_expected += slot.total
+        self.chunks_lost += slot.total - slot.count
+        if slot.length < _FRAME_SIZE.size:
+            return None
+        frame_size = _FRAME_SIZE.unpack_from(slot.buffer)[0]
+        end = _FRAME_SIZE.size + frame_size
+        if frame_size == 0 or end > slot.length:
+            self.chunks_invalid += 1
+            return None
+        self.frames_completed += 1
+        return bytes(slot.view[_FRAME_SIZE.size:end])
+
+    def _evict_older(self, completed):
+        """Descarta frames incompletos anteriores ao frame completado"""
+        now = time.monotonic()
+        for slot in self._slots:
+            if slot is completed or slot.frame_id is None:
+                continue
+            # Comparação módulo 2^32 (frame_id dá a volta)
+            older = (completed.frame_id - slot.frame_id) & 0xFFFFFFFF < 0x80000000
+            if older or now - slot.started > self.FRAG_TIMEOUT:
+                self._drop(slot)
+
+    def _drop(self, slot):
+        if slot.frame_id is not None:
+            self.chunks_expected += slot.total
+            self.chunks_lost += slot.total - slot.count
+            slot.frame_id = None
+            self.frames_dropped += 1
+
+    def pending_frames(self) -> int:
+        """Número de frames em remontagem"""
+        return sum(1 for slot in self._slots if slot.frame_id is not None)
@@ -10,6 +10,30 @@ Implementa máscaras e filtros para aprimoramento de qualidade de vídeo:
 
 Filtros são combináveis via checkboxes na interface.
 
+Pipeline compilado (CPU):
+- Os filtros ativos são compilados em estágios uma vez por combinação
+  de filtros + resolução (não a cada frame)
+- Filtros lineares adjacentes viram um estágio só: Sharpen e High-Boost
+  são compostos em um único kernel 5x5, Unsharp usa o resultado em float
+  (sem saturação intermediária)
+- Brilho +/- é sempre um estágio próprio no canal V do HSV (o mesmo
+  resultado com ou sem outros filtros ativos)
+- Cada estágio escreve em buffers pré-alocados por resolução (dst=);
+  o frame retornado é um desses buffers e vale até a próxima chamada
+- Timing por estágio em last_stage_timings; last_filter_timings divide
+  o tempo de um estágio fundido igualmente entre seus filtros
+
+Backend CPU multi-thread (backend="cpu-mt"):
+- Cada estágio roda em faixas horizontais em um pool de threads
+  (OpenCV libera o GIL); cada faixa lê halo linhas extras acima/abaixo
+  (raio do kernel) e só as linhas centrais são copiadas para a saída,
+  então o resultado é idêntico ao single-thread
+- Número de faixas automático: uma por worker, com no mínimo
+  STRIPE_MIN_ROWS linhas e 4x o halo por faixa (halo <= 50% do trabalho)
+- CLAHE depende de histogramas da imagem inteira: só as conversões de
+  cor rodam em faixas; a equalização do canal L roda na imagem inteira
+- Super-Res roda inteiro (não é dividido em faixas)
+
 Suporte a GPU NVIDIA via CuPy (opcional):
 - Sharpen, High-Boost: convolução GPU
 - Unsharp Mask: blur gaussiano + operações aritméticas GPU
@@ -23,12 +47,16 @@ Referências teóricas:
 - Máscaras de convolução para realce espacial
 """
 
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import cv2
 import numpy as np
 
+from .constants import IMAGE_FILTER_BACKEND
 from .simple_logger import debug, error, info, warn
 
 # Tenta importar CuPy para aceleração GPU
@@ -62,9 +90,60 @@ def _create_gaussian_kernel(size=5, sigma=1.0):
     return (kernel_2d / kernel_2d.sum()).astype(np.float32)
 
 
+def _compose_kernels(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Kernel equivalente a aplicar first e depois second (convolução completa)"""
+    rows = first.shape[0] + second.shape[0] - 1
+    cols = first.shape[1] + second.shape[1] - 1
+    composed = np.zeros((rows, cols), dtype=np.float32)
+    for i in range(second.shape[0]):
+        for j in range(second.shape[1]):
+            composed[i:i + first.shape[0], j:j + first.shape[1]] += first * second[i, j]
+    return composed
+
+
+class _Stage:
+    """Estágio do pipeline compilado: um filtro ou vários filtros fundidos"""
+
+    def __init__(self, filters, run, halo):
+        """
+        Args:
+            filters: Chaves dos filtros executados pelo estágio
+            run: Callable(src, dst, tag) -> dst (tag separa os buffers de cada faixa)
+            halo: Raio de vizinhança (linhas) que o estágio lê ao redor de
+                cada pixel; None = não pode ser dividido em faixas
+        """
+        self.filters = tuple(filters)
+        self.name = "+".join(self.filters)
+        self.run = run
+        self.halo = halo
+
+
 class ImageFilters:
     """Gerencia filtros PDI para processamento de frames de vídeo"""
 
+    # Ordem de aplicação dos filtros ativos
+    ORDER = (
+        "brightness_up",
+        "brightness_down",
+        "bilateral",
+        "clahe",
+        "super_res",
+        "sharpen",
+        "unsharp",
+        "high_boost",
+    )
+
+    # Filtros lineares fundíveis em um estágio (kernels somam 1)
+    KERNEL_FILTERS = {"sharpen": "laplacian", "high_boost": "high_boost"}
+    BRIGHTNESS_DELTAS = {"brightness_up": 30, "brightness_down": -30}
+    UNSHARP_SIGMA = 3
+    BILATERAL_DIAMETER = 9
+
+    # Backends: "auto" = GPU se disponível, senão CPU multi-thread
+    BACKENDS = ("gpu", "cpu", "cpu-mt")
+    STRIPE_MIN_ROWS = 32
+    MAX_STRIPE_WORKERS = 8
+
     # Máscaras de convolução clássicas
     KERNELS = {
         # Laplaciano 3x3 - detecta bordas em todas as direções
@@ -121,19 +200,47 @@ class ImageFilters:
         },
     }
 
-    def __init__(self, use_gpu=True):
+    def __init__(self, use_gpu=True, backend=None):
         """
         Inicializa o gerenciador de filtros
 
         Args:
-            use_gpu: Se True, usa GPU quando disponível
-        """
+            use_gpu: Se True, usa GPU quando disponível (ignorado se backend for dado)
+            backend: "gpu", "cpu", "cpu-mt" ou "auto"; None = decide por use_gpu
+        """
+        if backend is None:
+            backend = "gpu" if use_gpu else "cpu"
+        elif backend == "auto":
+            backend = "gpu" if GPU_AVAILABLE else "cpu-mt"
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend de filtros desconhecido: {backend}")
+        if backend == "gpu" and not GPU_AVAILABLE:
+            backend = "cpu"
         self.current_filter = "original"
         self.active_filters = set()  # Filtros ativos (para modo checkbox)
         self.last_filter_timings = {}  # Timing individual por filtro (ms)
-        self.use_gpu = use_gpu and GPU_AVAILABLE
+        self.last_stage_timings = {}  # Timing por estágio compilado (ms)
+        self.backend = backend
+        self.use_gpu = backend == "gpu"
         self.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
 
+        # Pipeline compilado (CPU): estágios por combinação de filtros + resolução
+        self._pipeline_key = None
+        self._stages = []
+        self._scratch = {}  # Buffers pré-alocados: nome -> np.ndarray
+        self._apply_lock = threading.Lock()
+
+        # Backend multi-thread: pool de faixas (1 core = sem pool, roda direto)
+        self.stripe_workers = 1
+        self._stripe_pool = None
+        if backend == "cpu-mt":
+            self.stripe_workers = min(self.MAX_STRIPE_WORKERS, os.cpu_count() or 1)
+            if self.stripe_workers > 1:
+                self._stripe_pool = ThreadPoolExecutor(
+                    max_workers=self.stripe_workers, thread_name_prefix="FilterStripe"
+                )
+            info(f"Filtros CPU multi-thread: {self.stripe_workers} workers", "FILTERS")
+
         # Cache para super-resolução (evita recriar toda vez)
         self._super_res_size = None
 
@@ -226,20 +333,11 @@ class ImageFilters:
 
         # Modo checkbox: aplica filtros ativos em ordem
         if self.active_filters:
-            # Ordem de aplicação otimizada
-            order = [
-                "brightness_up",
-                "brightness_down",
-                "bilateral",
-                "clahe",
-                "super_res",
-                "sharpen",
-                "unsharp",
-                "high_boost",
-            ]
+            if not self.use_gpu:
+                return self._apply_compiled(frame)
 
             self.last_filter_timings = {}
-            for filter_key in order:
+            for filter_key in self.ORDER:
                 if filter_key in self.active_filters:
                     try:
                         method = getattr(self, f"_apply_{filter_key}", None)
@@ -267,6 +365,230 @@ class ImageFilters:
             error(f"Erro ao aplicar filtro: {e}", "FILTER")
             return frame
 
+    # ================================================================
+    # PIPELINE COMPILADO (CPU)
+    # ================================================================
+
+    def _apply_compiled(self, frame: np.ndarray) -> np.ndarray:
+        """Aplica os filtros ativos pelo pipeline compilado (buffers reutilizados)"""
+        with self._apply_lock:
+            key = (frozenset(self.active_filters), frame.shape, frame.dtype)
+            if key != self._pipeline_key:
+                if self._pipeline_key is None or self._pipeline_key[1:] != key[1:]:
+                    self._scratch.clear()  # Resolução mudou
+                self._stages = self._compile(self.active_filters)
+                self._pipeline_key = key
+
+            filter_timings = {}
+            stage_timings = {}
+            for index, stage in enumerate(self._stages):
+                try:
+                    t = time.time()
+                    dst = self._buffer(("out", index), frame.shape)
+                    if stage.halo is None:
+                        frame = stage.run(frame, dst, None)
+                    else:
+                        frame = self._run_striped(stage.run, frame, dst, stage.halo)
+                    elapsed_ms = (time.time() - t) * 1000
+                except Exception as e:
+                    error(f"Erro ao aplicar {stage.name}: {e}", "FILTER")
+                    continue
+                stage_timings[stage.name] = round(elapsed_ms, 2)
+                for filter_key in stage.filters:
+                    filter_timings[filter_key] = round(elapsed_ms / len(stage.filters), 2)
+
+            self.last_filter_timings = filter_timings
+            self.last_stage_timings = stage_timings
+            return frame
+
+    def _buffer(self, name, shape, dtype=np.uint8, tag=None) -> np.ndarray:
+        """Buffer de trabalho pré-alocado (recriado só se o formato mudar)"""
+        key = name if tag is None else (tag, name)
+        buf = self._scratch.get(key)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._scratch[key] = buf
+        return buf
+
+    def _stripes(self, rows: int, halo: int) -> List[tuple]:
+        """Faixas (y0, y1) de linhas: uma por worker, sem faixas pequenas demais"""
+        min_rows = max(self.STRIPE_MIN_ROWS, 4 * halo)
+        count = max(1, min(self.stripe_workers, rows // min_rows))
+        step = -(-rows // count)
+        return [(y0, min(rows, y0 + step)) for y0 in range(0, rows, step)]
+
+    def _run_striped(self, run, src, dst, halo):
+        """
+        Executa run(src, dst, tag) em faixas horizontais no pool de threads.
+        Cada faixa processa halo linhas extras de cada lado (a borda da faixa
+        vira borda artificial) e copia só as linhas centrais para dst.
+        """
+        stripes = self._stripes(src.shape[0], halo) if self._stripe_pool else []
+        if len(stripes) <= 1:
+            return run(src, dst, None)
+
+        rows = src.shape[0]
+
+        def run_stripe(index, y0, y1):
+            tag = ("stripe", index)
+            s0 = max(0, y0 - halo)
+            s1 = min(rows, y1 + halo)
+            if s0 == y0 and s1 == y1:
+                run(src[y0:y1], dst[y0:y1], tag)
+                return
+            out = self._buffer("stripe_out", (s1 - s0,) + dst.shape[1:], dst.dtype, tag)
+            run(src[s0:s1], out, tag)
+            dst[y0:y1] = out[y0 - s0:y1 - s0]
+
+        futures = [
+            self._stripe_pool.submit(run_stripe, index, y0, y1)
+            for index, (y0, y1) in enumerate(stripes)
+        ]
+        for future in futures:
+            future.result()
+        return dst
+
+    def _compile(self, active) -> List[_Stage]:
+        """
+        Compila os filtros ativos em estágios, fundindo filtros lineares
+        adjacentes (na ordem ORDER) em um único estágio e os ajustes de
+        brilho adjacentes em um estágio HSV
+        """
+        stages = []
+        run = []  # Filtros lineares consecutivos ainda não emitidos
+        brightness = []  # Ajustes de brilho consecutivos ainda não emitidos
+        for filter_key in self.ORDER:
+            if filter_key not in active:
+                continue
+            if filter_key in self.BRIGHTNESS_DELTAS:
+                stages.extend(self._compile_linear(run))
+                run = []
+                brightness.append(filter_key)
+                continue
+            stages.extend(self._compile_brightness(brightness))
+            brightness = []
+            if filter_key in self.KERNEL_FILTERS or filter_key == "unsharp":
+                run.append(filter_key)
+                continue
+            stages.extend(self._compile_linear(run))
+            run = []
+            stages.append(self._compile_nonlinear(filter_key))
+        stages.extend(self._compile_brightness(brightness))
+        stages.extend(self._compile_linear(run))
+        return stages
+
+    def _compile_nonlinear(self, filter_key: str) -> _Stage:
+        """Estágio de um filtro não-linear"""
+        if filter_key == "bilateral":
+            return _Stage([filter_key], self._stage_bilateral, self.BILATERAL_DIAMETER // 2)
+        if filter_key == "clahe":
+            return _Stage([filter_key], self._stage_clahe, None)
+        if filter_key == "super_res":
+            return _Stage([filter_key], self._stage_super_res, None)
+        raise ValueError(f"Filtro desconhecido: {filter_key}")
+
+    def _compile_brightness(self, brightness) -> List[_Stage]:
+        """Estágio HSV para ajustes de brilho adjacentes"""
+        if not brightness:
+            return []
+        deltas = [self.BRIGHTNESS_DELTAS[f] for f in brightness]
+        return [
+            _Stage(
+                brightness,
+                lambda src, dst, tag: self._stage_hsv_brightness(src, dst, deltas, tag),
+                0,
+            )
+        ]
+
+    def _compile_linear(self, run) -> List[_Stage]:
+        """Estágio(s) para uma sequência de filtros lineares adjacentes"""
+        if not run:
+            return []
+
+        kernel_filters = [f for f in run if f in self.KERNEL_FILTERS]
+        unsharp = "unsharp" in run
+
+        # Kernels 3x3 compostos em um só (operações lineares comutam)
+        kernel = None
+        for filter_key in kernel_filters:
+            k = self.KERNELS[self.KERNEL_FILTERS[filter_key]]
+            kernel = k if kernel is None else _compose_kernels(kernel, k)
+
+        halo = 0 if kernel is None else kernel.shape[0] // 2
+        if unsharp:
+            # Raio do GaussianBlur(sigma) em float: ksize = round(sigma * 8 + 1) | 1
+            # (em 8 bits é sigma * 6 + 1; usa o maior)
+            halo += (int(round(self.UNSHARP_SIGMA * 8 + 1)) | 1) // 2
+
+        def run_linear(src, dst, tag):
+            return self._stage_linear(src, dst, kernel, unsharp, tag)
+
+        return [_Stage(run, run_linear, halo)]
+
+    def _stage_linear(self, src, dst, kernel, unsharp, tag=None):
+        """Kernel composto + unsharp, sem saturar entre eles"""
+        if not unsharp:
+            return cv2.filter2D(src, -1, kernel, dst=dst)
+
+        if kernel is None:
+            base = src
+            blurred = self._buffer("unsharp_blur", src.shape, tag=tag)
+        else:
+            base = cv2.filter2D(
+                src, cv2.CV_32F, kernel, dst=self._buffer("linear_f32", src.shape, np.float32, tag)
+            )
+            blurred = self._buffer("unsharp_blur_f32", src.shape, np.float32, tag)
+        cv2.GaussianBlur(base, (0, 0), self.UNSHARP_SIGMA, dst=blurred)
+        return cv2.addWeighted(base, 1.5, blurred, -0.5, 0, dst=dst, dtype=cv2.CV_8U)
+
+    def _stage_hsv_brightness(self, src, dst, deltas, tag=None):
+        """Brilho no canal V do HSV (mesmo resultado de _apply_brightness_*)"""
+        hsv = cv2.cvtColor(src, cv2.COLOR_BGR2HSV, dst=self._buffer("hsv", src.shape, tag=tag))
+        value = cv2.extractChannel(hsv, 2, dst=self._buffer("hsv_v", src.shape[:2], tag=tag))
+        for delta in deltas:
+            if delta > 0:
+                cv2.add(value, delta, dst=value)
+            else:
+                cv2.subtract(value, -delta, dst=value)
+        cv2.insertChannel(value, hsv, 2)
+        return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=dst)
+
+    def _stage_bilateral(self, src, dst, tag=None):
+        """Bilateral em buffer pré-alocado"""
+        return cv2.bilateralFilter(
+            src, self.BILATERAL_DIAMETER, sigmaColor=75, sigmaSpace=75, dst=dst
+        )
+
+    def _stage_clahe(self, src, dst, tag=None):
+        """
+        CLAHE no canal L do LAB, sem split/merge. As conversões de cor são
+        por pixel (rodam em faixas no cpu-mt); a equalização usa histogramas
+        de tiles da imagem inteira e roda sem divisão.
+        """
+        lab = self._run_striped(
+            lambda s, d, t: cv2.cvtColor(s, cv2.COLOR_BGR2LAB, dst=d),
+            src,
+            self._buffer("lab", src.shape, tag=tag),
+            0,
+        )
+        lum = cv2.extractChannel(lab, 0, dst=self._buffer("lab_l", src.shape[:2], tag=tag))
+        lum = self.clahe.apply(lum, dst=self._buffer("lab_l_eq", src.shape[:2], tag=tag))
+        cv2.insertChannel(lum, lab, 0)
+        return self._run_striped(
+            lambda s, d, t: cv2.cvtColor(s, cv2.COLOR_LAB2BGR, dst=d), lab, dst, 0
+        )
+
+    def _stage_super_res(self, src, dst, tag=None):
+        """Supersampling 2x com buffer intermediário reutilizado"""
+        h, w = src.shape[:2]
+        upscaled = cv2.resize(
+            src,
+            (w * 2, h * 2),
+            dst=self._buffer("super_res_2x", (h * 2, w * 2) + src.shape[2:], tag=tag),
+            interpolation=cv2.INTER_LANCZOS4,
+        )
+        return cv2.resize(upscaled, (w, h), dst=dst, interpolation=cv2.INTER_AREA)
+
     def _apply_sharpen(self, frame: np.ndarray) -> np.ndarray:
         """
         Aplica aguçamento com máscara Laplaciana
@@ -527,5 +849,5 @@ def get_filters() -> ImageFilters:
     """Retorna instância global dos filtros"""
     global _filters
     if _filters is None:
-        _filters = ImageFilters()
+        _filters = ImageFilters(backend=IMAGE_FILTER_BACKEND)
     return _filters
@@ -13,6 +13,34 @@ FORMATO DO PACOTE RECEBIDO (fragmentado):
 | 4 bytes    | 4 bytes  | 2 bytes     | 2 bytes      | N bytes    |
 | FRAG_MAGIC | frame_id | chunk_index | total_chunks | chunk_data |
 
+Fragmentos são remontados pelo FrameReassembler (frame_reassembler.py)
+direto em buffers pré-alocados, sem um bytes por datagrama. A cada
+VIDEO_FEEDBACK_INTERVAL o cliente envia "VIDEO_FEEDBACK:loss=<fração>"
+com a perda de chunks medida; o RPi responde adicionando paridade XOR
+(fragmentos FEC) proporcional à perda, e o reassembler reconstrói os
+chunks perdidos sem retransmissão.
+
+PROCESSO DE VÍDEO SEPARADO (video_process.py):
+=============================================
+A recepção pode ser dividida entre dois processos: receive_video=False
+no processo da interface (só sensores e comandos; contadores de vídeo
+chegam por apply_video_stats) e receive_sensors=False no processo de
+vídeo (só a porta 9999; não envia DISCONNECT, a sessão é da interface).
+
+FORMATO DOS SENSORES (porta 9997):
+=================================
+- JSON (servidores antigos)
+- Binário com schema (telemetry_codec.py), completo ou delta/keyframe:
+  negociado enviando "SENSOR_FORMAT:DLT1,BIN1" ao receber JSON; detectado
+  pelo magic do pacote. O decoder reconstrói o estado completo a partir dos
+  deltas, então o sensor_ring sempre recebe dicts com todos os campos.
+- Canais (CHN1), pedido apenas quando channel_queues é fornecido: cada
+  fonte chega no seu canal e taxa. O canal IMU (e o consolidado) vai para
+  o sensor_ring; os demais para channel_queues[canal], mantendo só os
+  valores mais recentes. O SensorDisplay mescla os canais em cada linha.
+- sensor_ring (sensor_ring.py): ring SPSC sem locks; o dict decodificado
+  é publicado por referência e o SensorDisplay lê tudo desde o último seq.
+
 DADOS DOS SENSORES ESPERADOS:
 ============================
 O cliente está preparado para receber TODOS os 37+ campos do BMI160:
@@ -41,12 +69,24 @@ from .constants import (
     CONNECTION_TIMEOUT,
     MAX_FRAME_SIZE,
     MAX_SENSOR_SIZE,
+    SENSOR_FORMAT_RETRY_INTERVAL,
     SENSOR_PORT,
     SENSOR_SOCKET_RCVBUF,
     UDP_SOCKET_TIMEOUT,
+    VIDEO_FEEDBACK_INTERVAL,
+    VIDEO_KEYFRAME_REQUEST_INTERVAL,
     VIDEO_PORT,
     VIDEO_SOCKET_RCVBUF,
 )
+from .frame_reassembler import FrameReassembler
+from .telemetry_codec import (
+    CHANNEL_CONSOLIDATED,
+    SENSOR_FORMAT_BINARY,
+    SENSOR_FORMAT_CHANNELS,
+    SENSOR_FORMAT_DELTA,
+    TelemetryDecoder,
+    is_binary_packet,
+)
 
 
 class NetworkClient:
@@ -68,8 +108,11 @@ class NetworkClient:
         client_ip=None,
         log_queue=None,
         status_queue=None,
-        sensor_queue=None,
+        sensor_ring=None,
         video_queue=None,
+        channel_queues=None,
+        receive_video=True,
+        receive_sensors=True,
     ):
         """
         Inicializa o cliente de rede bidirecional
@@ -82,8 +125,15 @@ class NetworkClient:
             host (str): IP para escutar (0.0.0.0 = todas as interfaces)
             log_queue (Queue): Fila para mensagens de log
             status_queue (Queue): Fila para estatísticas de conexão
-            sensor_queue (Queue): Fila para dados de sensores
+            sensor_ring (SensorRing): Ring SPSC dos registros de sensores
+                (esta thread de recepção é o único produtor)
             video_queue (Queue): Fila para frames de vídeo
+            channel_queues (dict): {canal: Queue} para os canais lentos de
+                telemetria (CHN1); None mantém o pacote consolidado
+            receive_video (bool): Escuta a porta de vídeo (False quando o
+                vídeo roda no processo de vídeo)
+            receive_sensors (bool): Escuta a porta de sensores (False no
+                processo de vídeo)
         """
         self.port = video_port
         self.sensor_port = sensor_port
@@ -98,8 +148,11 @@ class NetworkClient:
         # Filas de comunicação
         self.log_queue = log_queue
         self.status_queue = status_queue
-        self.sensor_queue = sensor_queue
+        self.sensor_ring = sensor_ring
         self.video_queue = video_queue
+        self.channel_queues = channel_queues or {}
+        self.receive_video = receive_video
+        self.receive_sensors = receive_sensors
 
         # Sockets UDP
         self.receive_socket = None  # Para receber vídeo (porta 9999)
@@ -128,11 +181,34 @@ class NetworkClient:
         self.packet_errors = 0
         self.last_error_log = 0
 
-        # Buffer para reassembly de fragmentos
-        # Estrutura: {frame_id: {'chunks': {chunk_idx: data}, 'total': N, 'timestamp': time}}
-        self.fragment_buffer = {}
+        # Telemetria binária (negociada com o RPi; JSON até a negociação concluir)
+        self.telemetry_decoder = TelemetryDecoder()
+        self.sensor_format = "json"
+        self._last_format_request = 0.0
+        formats = [SENSOR_FORMAT_DELTA, SENSOR_FORMAT_BINARY]
+        if self.channel_queues:
+            formats.insert(0, SENSOR_FORMAT_CHANNELS)
+        self._format_request = "SENSOR_FORMAT:" + ",".join(formats)
+
+        # Reassembly de fragmentos em buffers pré-alocados (thread de vídeo)
+        self.reassembler = FrameReassembler(
+            MAX_FRAME_SIZE, datagram_size=self.buffer_size
+        )
         self.fragment_lock = threading.Lock()
-        self.last_fragment_cleanup = time.time()
+        self._last_video_feedback = time.monotonic()
+        self._feedback_chunks = (0, 0)  # (esperados, perdidos) no último relatório
+
+        # Jitter de chegada dos frames (média móvel de |Δintervalo|, RFC 3550)
+        self._last_frame_arrival = None
+        self._last_frame_gap = None
+        self.frame_jitter_ms = 0.0
+        # Estatísticas do display para o VIDEO_FEEDBACK (ex: decode_ms);
+        # callable que retorna dict, definido pelo main
+        self.video_stats_provider = None
+        self._last_keyframe_request = 0.0
+        self.keyframe_requests = 0
+        # Estatísticas do reassembler no processo de vídeo (receive_video=False)
+        self._remote_video_stats = {}
 
     def _log(self, level, message):
         """Envia mensagem para fila de log"""
@@ -153,13 +229,24 @@ class NetworkClient:
             except queue.Full:
                 pass
 
-    def _send_sensor_data(self, sensor_data):
-        """Envia dados de sensores para a interface"""
-        if self.sensor_queue:
+    def _send_sensor_data(self, sensor_data, channel=CHANNEL_CONSOLIDATED):
+        """Envia dados de sensores para a interface (fila do canal)"""
+        channel_queue = self.channel_queues.get(channel)
+        if channel_queue is not None:
+            # Canal lento: só o estado mais recente importa
             try:
-                self.sensor_queue.put_nowait(sensor_data)
+                channel_queue.put_nowait(sensor_data)
             except queue.Full:
-                pass  # Descarta dado antigo — consumer vai drenar a fila
+                try:
+                    channel_queue.get_nowait()
+                    channel_queue.put_nowait(sensor_data)
+                except (queue.Empty, queue.Full):
+                    pass
+            return
+
+        if self.sensor_ring is not None:
+            # Nunca bloqueia: consumer atrasado perde os registros mais antigos
+            self.sensor_ring.publish(sensor_data)
 
     def _send_video_frame(self, frame_data):
         """Envia frame de vídeo para exibição"""
@@ -181,18 +268,20 @@ class NetworkClient:
             self._log("INFO", f"Vídeo: porta {self.port}, Sensores: porta {self.sensor_port}, Comandos: porta {self.command_port}")
 
             # Socket para receber vídeo (porta 9999)
-            self.receive_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.receive_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.receive_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, VIDEO_SOCKET_RCVBUF)
-            self.receive_socket.settimeout(UDP_SOCKET_TIMEOUT)
-            self.receive_socket.bind((self.host, self.port))
+            if self.receive_video:
+                self.receive_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self.receive_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self.receive_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, VIDEO_SOCKET_RCVBUF)
+                self.receive_socket.settimeout(UDP_SOCKET_TIMEOUT)
+                self.receive_socket.bind((self.host, self.port))
 
             # Socket para receber sensores (porta 9997)
-            self.sensor_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.sensor_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.sensor_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SENSOR_SOCKET_RCVBUF)
-            self.sensor_socket.settimeout(UDP_SOCKET_TIMEOUT)
-            self.sensor_socket.bind((self.host, self.sensor_port))
+            if self.receive_sensors:
+                self.sensor_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self.sensor_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self.sensor_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SENSOR_SOCKET_RCVBUF)
+                self.sensor_socket.settimeout(UDP_SOCKET_TIMEOUT)
+                self.sensor_socket.bind((self.host, self.sensor_port))
 
             # Socket para enviar comandos (porta 9998)
             self.send_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -352,7 +441,8 @@ class NetworkClient:
 
     def _handle_fragment(self, packet):
         """
-        Processa pacote fragmentado e reassembla quando completo.
+        Processa pacote fragmentado já recebido e reassembla quando completo.
+        A thread de vídeo usa self.reassembler.recv() direto no socket.
 
         Estrutura do fragmento:
         | 4 bytes    | 4 bytes  | 2 bytes     | 2 bytes      | N bytes    |
@@ -365,106 +455,14 @@ class NetworkClient:
             tuple: (frame_data, sensor_data) quando completo, ou (None, None) se ainda aguardando
         """
         try:
-            if len(packet) < self.FRAG_HEADER_SIZE:
-                return None, None
-
-            # Extrai cabeçalho do fragmento
-            magic, frame_id, chunk_idx, total_chunks = struct.unpack("<IIHH", packet[:12])
-            chunk_data = packet[12:]
-
-            current_time = time.time()
-
             with self.fragment_lock:
-                # Limpa fragmentos antigos periodicamente
-                if current_time - self.last_fragment_cleanup > 1.0:
-                    self._cleanup_old_fragments(current_time)
-                    self.last_fragment_cleanup = current_time
-
-                # Cria entrada para este frame se não existe
-                if frame_id not in self.fragment_buffer:
-                    self.fragment_buffer[frame_id] = {
-                        'chunks': {},
-                        'total': total_chunks,
-                        'timestamp': current_time
-                    }
-
-                # Armazena chunk
-                self.fragment_buffer[frame_id]['chunks'][chunk_idx] = chunk_data
-
-                # Verifica se temos todos os chunks
-                if len(self.fragment_buffer[frame_id]['chunks']) == total_chunks:
-                    # Reassembla o pacote completo
-                    complete_data = b''
-                    for i in range(total_chunks):
-                        if i in self.fragment_buffer[frame_id]['chunks']:
-                            complete_data += self.fragment_buffer[frame_id]['chunks'][i]
-                        else:
-                            # Falta um chunk - não deveria acontecer
-                            del self.fragment_buffer[frame_id]
-                            return None, None
-
-                    # Remove do buffer
-                    del self.fragment_buffer[frame_id]
-
-                    # Processa o pacote completo como pacote normal
-                    return self._parse_complete_packet(complete_data)
-
-            # Ainda aguardando mais chunks
-            return None, None
-
-        except Exception as e:
-            self._log("ERROR", f"Erro ao processar fragmento: {e}")
-            return None, None
-
-    def _parse_complete_packet(self, packet):
-        """
-        Analisa pacote completo após reassembly de fragmentos.
-
-        O RPi envia vídeo fragmentado como <4 bytes frame_size><frame_data>
-        (mesmo formato que pacotes únicos em send_video_frame). O formato antigo
-        com sensor_size embutido no pacote de vídeo foi descontinuado — sensores
-        vão pela porta 9997.
-
-        Args:
-            packet (bytes): Pacote completo reassemblado
-
-        Returns:
-            tuple: (frame_data, None) — sempre None no segundo elemento, mantido
-                   apenas para retrocompatibilidade do chamador que espera tupla
-        """
-        try:
-            if len(packet) < 4:
-                return None, None
-
-            frame_size = struct.unpack("<I", packet[:4])[0]
-
-            if frame_size == 0:
-                return None, None
-
-            if len(packet) < 4 + frame_size:
-                self._log(
-                    "ERROR",
-                    f"Pacote reassemblado incompleto: {len(packet)} < {4 + frame_size}",
-                )
-                return None, None
-
-            frame_data = packet[4:4 + frame_size]
+                frame_data = self.reassembler.add_fragment(packet)
             return frame_data, None
 
         except Exception as e:
-            self._log("ERROR", f"Erro em _parse_complete_packet: {e}")
+            self._log("ERROR", f"Erro ao processar fragmento: {e}")
             return None, None
 
-    def _cleanup_old_fragments(self, current_time):
-        """Remove fragmentos incompletos que expiraram"""
-        expired_frames = []
-        for frame_id, data in self.fragment_buffer.items():
-            if current_time - data['timestamp'] > self.FRAG_TIMEOUT:
-                expired_frames.append(frame_id)
-
-        for frame_id in expired_frames:
-            del self.fragment_buffer[frame_id]
-
     def update_connection_status(self, addr):
         """Atualiza status da conexão"""
         if self.connected_addr != addr:
@@ -531,15 +529,19 @@ class NetworkClient:
             self.raspberry_pi_ip = self.rpi_ip
             self._log("INFO", f"Raspberry Pi configurado: {self.raspberry_pi_ip} (aguardando conexão)")
 
-        # Thread de sensores roda em background
-        self._sensor_rx_thread = threading.Thread(
-            target=self._sensor_receiver_loop, name="SensorRX", daemon=True
-        )
-        self._sensor_rx_thread.start()
-
-        # Thread principal: recepção de vídeo
+        # Thread principal: recepção de vídeo (ou de sensores, se o vídeo
+        # roda no processo de vídeo)
         try:
-            self._video_receiver_loop()
+            if self.receive_video:
+                if self.receive_sensors:
+                    # Thread de sensores roda em background
+                    self._sensor_rx_thread = threading.Thread(
+                        target=self._sensor_receiver_loop, name="SensorRX", daemon=True
+                    )
+                    self._sensor_rx_thread.start()
+                self._video_receiver_loop()
+            else:
+                self._sensor_receiver_loop()
         except KeyboardInterrupt:
             self._log("INFO", "Recepção interrompida pelo usuário")
         finally:
@@ -557,7 +559,11 @@ class NetworkClient:
         """Recebe frames de vídeo (porta 9999)"""
         while self.is_running:
             try:
-                packet, addr = self.receive_socket.recvfrom(self.buffer_size)
+                # Fragmentos vão direto para o buffer do frame; datagrama
+                # não-fragmentado vem como memoryview do buffer de rascunho
+                addr, nbytes, datagram, frame_data = self.reassembler.recv(
+                    self.receive_socket, self.rpi_ip
+                )
 
                 if self.rpi_ip and addr[0] != self.rpi_ip:
                     continue
@@ -565,13 +571,12 @@ class NetworkClient:
                 self._confirm_connection(addr)
                 with self._stats_lock:
                     self.packets_received += 1
-                    self.bytes_received += len(packet)
+                    self.bytes_received += nbytes
                 self.update_connection_status(addr)
 
-                # Verifica comando de texto (SERVER_CONNECT)
-                try:
-                    packet_str = packet.decode("utf-8")
-                    if packet_str.startswith("SERVER_CONNECT"):
+                if datagram is not None:
+                    # Verifica comando de texto (SERVER_CONNECT)
+                    if datagram[:14] == b"SERVER_CONNECT":
                         self._log("INFO", "🔄 Recebido comando de reconexão do Raspberry Pi")
                         self.raspberry_pi_ip = addr[0]
                         self.is_connected_to_rpi = True
@@ -580,19 +585,20 @@ class NetworkClient:
                             "status": "Ativo via SERVER_CONNECT",
                         })
                         continue
-                except UnicodeDecodeError:
-                    pass
 
-                # Pacote de vídeo: 4 bytes tamanho + dados do frame
-                frame_data = self._parse_video_packet(packet)
+                    # Pacote de vídeo: 4 bytes tamanho + dados do frame
+                    frame_data = self._parse_video_packet(datagram)
+
                 if frame_data == "TERMINATE":
                     break
                 if frame_data is not None:
                     with self._stats_lock:
                         self.frames_received += 1
+                    self._update_frame_jitter()
                     self._send_video_frame(frame_data)
 
                 self.update_statistics()
+                self._send_video_feedback()
 
             except socket.timeout:
                 self.check_connection_timeout()
@@ -603,6 +609,75 @@ class NetworkClient:
                     self.last_error_log = current_time
                 time.sleep(0.001)
 
+    def _update_frame_jitter(self):
+        """Atualiza o jitter com o intervalo de chegada do frame atual"""
+        now = time.monotonic()
+        if self._last_frame_arrival is not None:
+            gap = (now - self._last_frame_arrival) * 1000
+            if self._last_frame_gap is not None:
+                delta = abs(gap - self._last_frame_gap)
+                self.frame_jitter_ms += (delta - self.frame_jitter_ms) / 16
+            self._last_frame_gap = gap
+        self._last_frame_arrival = now
+
+    def _send_video_feedback(self):
+        """
+        Envia ao RPi o relatório de recepção de vídeo: perda de chunks desde
+        o último relatório, jitter de chegada e estatísticas do display
+        (usado pelo FEC e pelo controle adaptativo de bitrate)
+        """
+        now = time.monotonic()
+        if now - self._last_video_feedback < VIDEO_FEEDBACK_INTERVAL:
+            return
+        self._last_video_feedback = now
+        if not self.is_connected_to_rpi:
+            return
+
+        expected = self.reassembler.chunks_expected
+        lost = self.reassembler.chunks_lost
+        last_expected, last_lost = self._feedback_chunks
+        self._feedback_chunks = (expected, lost)
+        window = expected - last_expected
+        loss = (lost - last_lost) / window if window > 0 else 0.0
+
+        report = f"loss={loss:.4f},jitter_ms={self.frame_jitter_ms:.1f}"
+        if self.video_stats_provider:
+            for key, value in self.video_stats_provider().items():
+                report += f",{key}={value:.1f}"
+        self.send_command_to_rpi(f"VIDEO_FEEDBACK:{report}")
+
+    def request_keyframe(self):
+        """
+        Pede um IDR ao RPi (decoder H.264 perdeu um frame e aguarda keyframe).
+        Chamado pela thread de display; limitado a um pedido por
+        VIDEO_KEYFRAME_REQUEST_INTERVAL.
+        """
+        now = time.monotonic()
+        if now - self._last_keyframe_request < VIDEO_KEYFRAME_REQUEST_INTERVAL:
+            return
+        self._last_keyframe_request = now
+        if self.send_command_to_rpi("VIDEO_KEYFRAME"):
+            self.keyframe_requests += 1
+
+    def apply_video_stats(self, stats):
+        """
+        Atualiza os contadores de vídeo com as estatísticas do processo de
+        vídeo (receive_video=False). packets_received > 0 libera o envio de
+        comandos, como na recepção local.
+
+        Args:
+            stats (dict): get_statistics() do NetworkClient do processo de
+                vídeo, mais "rpi_ip" (IP confirmado ou None)
+        """
+        with self._stats_lock:
+            self.packets_received = stats.get("packets_received", self.packets_received)
+            self.bytes_received = stats.get("bytes_received", self.bytes_received)
+            self.frames_received = stats.get("frames_received", self.frames_received)
+        self.keyframe_requests = stats.get("keyframe_requests", self.keyframe_requests)
+        self._remote_video_stats = stats
+        if stats.get("rpi_ip"):
+            self._confirm_connection((stats["rpi_ip"], self.port))
+
     def _sensor_receiver_loop(self):
         """Recebe dados de sensores (porta 9997)"""
         while self.is_running:
@@ -614,13 +689,15 @@ class NetworkClient:
 
                 self._confirm_connection(addr)
 
-                # Pacote de sensores: JSON direto
+                # Pacote de sensores: binário com schema ou JSON (servidor antigo)
                 try:
                     t_recv = time.time()
-                    t_json = time.monotonic()
-                    sensor_data = json.loads(packet.decode("utf-8"))
+                    t_decode = time.monotonic()
+                    sensor_data = self._decode_sensor_packet(packet)
+                    if sensor_data is None:
+                        continue
                     sensor_data["client_timing_json_decode_ms"] = round(
-                        (time.monotonic() - t_json) * 1000, 2
+                        (time.monotonic() - t_decode) * 1000, 2
                     )
                     # Latência de rede: diferença entre timestamp RPi e momento de recepção
                     # Inclui clock skew (offset constante) — o jitter é o que importa
@@ -630,8 +707,11 @@ class NetworkClient:
                     sensor_data["client_recv_timestamp"] = t_recv
                     with self._stats_lock:
                         self.sensor_packets_received += 1
-                    self._send_sensor_data(sensor_data)
-                except (json.JSONDecodeError, UnicodeDecodeError):
+                    self._send_sensor_data(
+                        sensor_data, self.telemetry_decoder.last_channel
+                    )
+                except (ValueError, UnicodeDecodeError, struct.error):
+                    # json.JSONDecodeError é subclasse de ValueError
                     with self._stats_lock:
                         self.decode_errors += 1
 
@@ -644,6 +724,35 @@ class NetworkClient:
                     self.last_error_log = current_time
                 time.sleep(0.001)
 
+    def _decode_sensor_packet(self, packet):
+        """
+        Decodifica pacote de sensores (binário ou JSON).
+
+        Enquanto o servidor enviar JSON, pede o formato binário a cada
+        SENSOR_FORMAT_RETRY_INTERVAL. Servidores antigos ignoram o pedido.
+
+        Args:
+            packet (bytes): Pacote recebido na porta 9997
+
+        Returns:
+            dict: Dados dos sensores, ou None (pacote de schema / schema ainda desconhecido)
+        """
+        if is_binary_packet(packet):
+            sensor_data = self.telemetry_decoder.decode(packet)
+            if self.telemetry_decoder.last_channel == CHANNEL_CONSOLIDATED:
+                self.sensor_format = "binary"
+            else:
+                self.sensor_format = "channels"
+            return sensor_data
+
+        self.sensor_format = "json"
+        self.telemetry_decoder.last_channel = CHANNEL_CONSOLIDATED
+        now = time.monotonic()
+        if now - self._last_format_request >= SENSOR_FORMAT_RETRY_INTERVAL:
+            self._last_format_request = now
+            self.send_command_to_rpi(self._format_request)
+        return json.loads(packet.decode("utf-8"))
+
     def _parse_video_packet(self, packet):
         """Parse de pacote de vídeo (4 bytes tamanho + frame data).
         Compatível com pacotes antigos (frame_size + sensor_size + data)."""
@@ -672,9 +781,10 @@ class NetworkClient:
                         return "TERMINATE"
                 return None
 
-            # Novo formato: 4 bytes tamanho + frame
+            # Novo formato: 4 bytes tamanho + frame (cópia: o buffer de
+            # recepção é reutilizado)
             if len(packet) >= 4 + frame_size:
-                return packet[4:4 + frame_size]
+                return bytes(packet[4:4 + frame_size])
 
             return None
         except (struct.error, IndexError):
@@ -695,7 +805,16 @@ class NetworkClient:
             "packets_received": self.packets_received,
             "bytes_received": self.bytes_received,
             "frames_received": self.frames_received,
+            "frames_incomplete": self._remote_video_stats.get(
+                "frames_incomplete", self.reassembler.frames_dropped
+            ),
+            "frames_recovered": self._remote_video_stats.get(
+                "frames_recovered", self.reassembler.frames_recovered
+            ),
+            "keyframe_requests": self.keyframe_requests,
             "sensor_packets_received": self.sensor_packets_received,
+            "sensor_format": self.sensor_format,
+            "sensor_packets_lost": self.telemetry_decoder.packets_lost,
             "decode_errors": self.decode_errors,
             "packet_errors": self.packet_errors,
             "elapsed_time": round(elapsed, 2),
@@ -721,8 +840,9 @@ class NetworkClient:
 
         self.is_running = False
 
-        # Envia comando DISCONNECT se conectado
-        if self.is_connected_to_rpi:
+        # Envia comando DISCONNECT se conectado (a sessão é de quem recebe
+        # sensores: o processo de vídeo não encerra a conexão)
+        if self.is_connected_to_rpi and self.receive_sensors:
             try:
                 self.send_command_to_rpi("DISCONNECT")
             except OSError:
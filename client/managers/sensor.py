@@ -19,7 +19,7 @@ CARACTERÍSTICAS:
 - Processamento automático de tipos numpy
 - Validação de dados recebidos
 - Cálculos derivados adicionais
-- Histórico de dados para gráficos
+- Histórico colunar (NumPy) para gráficos e exportação
 - Detecção de anomalias
 - Estatísticas em tempo real
 """
@@ -28,9 +28,9 @@ import pickle
 import queue
 import threading
 import time
-from collections import defaultdict, deque
 from datetime import datetime
 
+from .columnar_history import ColumnarHistory
 from .simple_logger import debug, error, info, warn
 
 from .constants import DEFAULT_SENSOR_HISTORY_SIZE
@@ -39,16 +39,30 @@ from .constants import DEFAULT_SENSOR_HISTORY_SIZE
 class SensorDisplay:
     """Gerencia processamento e exibição de dados de sensores"""
 
-    def __init__(self, sensor_queue=None, log_queue=None, history_size=DEFAULT_SENSOR_HISTORY_SIZE):
+    def __init__(
+        self,
+        sensor_ring=None,
+        log_queue=None,
+        history_size=DEFAULT_SENSOR_HISTORY_SIZE,
+        channel_queues=None,
+    ):
         """
         Inicializa o processador de sensores
 
         Args:
-            sensor_queue (Queue): Fila de dados de sensores
+            sensor_ring (SensorRing): Ring SPSC dos registros de sensores
+                (esta instância é o único consumidor)
             log_queue (Queue): Fila para mensagens de log
             history_size (int): Tamanho do histórico de dados (padrão: 10000 = ~100s @ 100Hz)
+            channel_queues (dict): {canal: Queue} dos canais lentos de telemetria
+                (energia, temperatura, sistema, atuadores)
         """
-        self.sensor_queue = sensor_queue
+        self.sensor_ring = sensor_ring
+        self._ring_seq = 0  # Próximo registro a ler do ring
+        self.channel_queues = channel_queues or {}
+
+        # Último estado mesclado dos canais lentos (completa as linhas do IMU)
+        self.channel_state = {}
         self.log_queue = log_queue
         self.history_size = history_size
 
@@ -162,11 +176,17 @@ class SensorDisplay:
         }
 
         # Histórico para gráficos (pacote mais recente por ciclo — usado pela GUI)
-        self.history = defaultdict(lambda: deque(maxlen=history_size))
+        self.history = ColumnarHistory(history_size)
 
         # Buffer raw: salva TODOS os pacotes recebidos (sem drain) para pickle
         self.MAX_RAW_BUFFER_ROWS = 12000  # ~2 min a 100Hz
-        self.raw_buffer = defaultdict(list)
+        self.raw_buffer = ColumnarHistory(self.MAX_RAW_BUFFER_ROWS)
+
+        # Gravação contínua da sessão (SessionRecorder, stream "sensors").
+        # A última linha fica retida até o próximo pacote para receber os
+        # campos de inject_into_last_raw_row()
+        self.recorder = None
+        self._last_raw_row = None
 
         # Estatísticas
         self.stats = {
@@ -266,22 +286,9 @@ class SensorDisplay:
 
             # NÃO usar data_lock aqui — chamado de dentro de update_sensor_data
             # que já segura o lock
-            self.history["timestamp"].append(timestamp)
-            n = len(self.history["timestamp"])
-
             # Salva TUDO que chega — sem lista fixa
             # Campos novos do RPi (ex: timing_*) entram automaticamente
-            for key, value in data.items():
-                if key == "timestamp":
-                    continue
-                # Pula dicts/lists aninhados (ex: system_status)
-                if isinstance(value, (dict, list)):
-                    continue
-                if key not in self.history:
-                    # Novo campo: preenche com None para alinhar (mantém deque com maxlen)
-                    self.history[key] = deque([None] * (n - 1), maxlen=self.history_size)
-                self.history[key].append(value)
-
+            self.history.append_row(data, timestamp)
 
         except Exception as e:
             self._log("ERROR", f"Erro ao atualizar histórico: {e}")
@@ -458,12 +465,13 @@ class SensorDisplay:
             num_points (int): Número de pontos a retornar
 
         Returns:
-            tuple: (timestamps, values)
+            tuple: (timestamps, values) — views NumPy somente leitura (sem
+                cópia), válidas até o próximo pacote; NaN = campo ausente
         """
         with self.data_lock:
-            if field in self.history and len(self.history[field]) > 0:
-                timestamps = list(self.history["timestamp"])[-num_points:]
-                values = list(self.history[field])[-num_points:]
+            if field in self.history and self.history.rows > 0:
+                timestamps = self.history.window("timestamp", num_points)
+                values = self.history.window(field, num_points)
                 return timestamps, values
             else:
                 return [], []
@@ -495,26 +503,38 @@ class SensorDisplay:
                     2,
                 ),
                 "last_packet_time": self.stats["last_packet_time"],
-                "history_size": len(self.history["timestamp"]),
+                "history_size": self.history.rows,
                 "fields_tracked": len(self.display_data),
             }
 
     def process_queue(self):
-        """Processa fila de sensores — drena e usa apenas o pacote mais recente (tempo real).
-        Todos os pacotes são salvos no raw_buffer para exportação completa no pickle."""
+        """Processa o ring de sensores — lê tudo desde a última chamada e usa apenas
+        o pacote mais recente (tempo real). Todos os pacotes são salvos no
+        raw_buffer para exportação completa no pickle. Sem locks nem cópias
+        no ring: os registros são lidos por referência.
+
+        Com canais (CHN1), os canais lentos são drenados primeiro e seu estado
+        mais recente é mesclado em cada pacote do IMU, para que cada linha do
+        raw_buffer continue com todos os campos."""
         latest = None
-        drained = 0
 
-        # Drena toda a fila, salva todos no raw_buffer, mantém apenas o mais recente
-        while True:
-            try:
-                packet = self.sensor_queue.get_nowait()
-                drained += 1
+        for channel_queue in self.channel_queues.values():
+            while True:
+                try:
+                    self.channel_state.update(channel_queue.get_nowait())
+                except queue.Empty:
+                    break
+        channel_state = self.channel_state
+
+        # Lê tudo desde o último seq, salva todos no raw_buffer, mantém apenas o mais recente
+        if self.sensor_ring is not None:
+            self._ring_seq, packets = self.sensor_ring.read_since(self._ring_seq)
+            for packet in packets:
+                if channel_state:
+                    packet = {**channel_state, **packet}
                 # Salva no raw_buffer (todos os pacotes, sem perda)
                 self._append_raw(packet)
                 latest = packet
-            except queue.Empty:
-                break
 
         if latest is None:
             self.update_connection_status()
@@ -528,22 +548,14 @@ class SensorDisplay:
     def _append_raw(self, data):
         """Append pacote ao raw_buffer (todos os pacotes, sem drain)"""
         ts = data.get("timestamp", time.time())
-        self.raw_buffer["timestamp"].append(ts)
-        for key, value in data.items():
-            if key == "timestamp":
-                continue
-            if isinstance(value, (dict, list)):
-                continue
-            if key not in self.raw_buffer:
-                n = len(self.raw_buffer["timestamp"]) - 1
-                self.raw_buffer[key] = [None] * n
-            self.raw_buffer[key].append(value)
-
-        # Trim para evitar crescimento ilimitado de memória
-        if len(self.raw_buffer["timestamp"]) > self.MAX_RAW_BUFFER_ROWS:
-            trim = 2000  # Remove os 2000 mais antigos
-            for key in self.raw_buffer:
-                self.raw_buffer[key] = self.raw_buffer[key][trim:]
+        # Ring de MAX_RAW_BUFFER_ROWS linhas: as mais antigas são sobrescritas
+        self.raw_buffer.append_row(data, ts)
+
+        recorder = self.recorder
+        if recorder is not None:
+            if self._last_raw_row is not None:
+                recorder.append("sensors", self._last_raw_row)
+            self._last_raw_row = data
 
     def inject_into_last_raw_row(self, fields: dict):
         """Injeta campos adicionais no último registro do raw_buffer.
@@ -555,18 +567,26 @@ class SensorDisplay:
         Chamado após o processamento do pacote mais recente.
         """
         with self.data_lock:
-            n = len(self.raw_buffer.get("timestamp", []))
-            if n == 0:
-                return
-            for key, value in fields.items():
-                if key not in self.raw_buffer:
-                    self.raw_buffer[key] = [None] * n
-                # Sobrescreve o último valor (pacote processado)
-                self.raw_buffer[key][-1] = value
+            # Sobrescreve o último valor (pacote processado)
+            self.raw_buffer.set_last(fields)
+            if self._last_raw_row is not None:
+                # Novo dict: o pacote pode ser o registro do sensor_ring
+                self._last_raw_row = {**self._last_raw_row, **fields}
 
     # Alias retrocompatível (nome antigo)
     inject_client_timings = inject_into_last_raw_row
 
+    def set_recorder(self, recorder):
+        """Conecta (ou desconecta, com None) o SessionRecorder do raw_buffer.
+
+        Ao trocar, a linha retida é entregue ao gravador anterior.
+        """
+        with self.data_lock:
+            if self.recorder is not None and self._last_raw_row is not None:
+                self.recorder.append("sensors", self._last_raw_row)
+            self._last_raw_row = None
+            self.recorder = recorder
+
     def reset_statistics(self):
         """Reseta estatísticas do processador"""
         with self.data_lock:
@@ -599,9 +619,9 @@ class SensorDisplay:
 
             # Snapshot rápido sob lock, I/O fora do lock
             with self.data_lock:
-                if len(self.history["timestamp"]) == 0:
+                if self.history.rows == 0:
                     return None
-                snapshot = {k: list(v) for k, v in self.history.items()}
+                snapshot = self.history.to_dict()
 
             # Pickle fora do lock — não bloqueia sensor updates
             with open(filename, "wb") as f:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+sensor_ring.py - Ring SPSC de Registros de Sensores (sem locks)
+Substitui o queue.Queue entre o NetworkClient (thread de recepção, único
+produtor) e o SensorDisplay (thread de sensores a 100Hz, único consumidor).
+
+FUNCIONAMENTO:
+=============
+- slots: lista pré-alocada de tamanho fixo; o registro de número seq fica
+  no slot seq % slots (o dict decodificado, por referência — sem cópia)
+- publish(): grava o slot e só então avança _head (uma atribuição de int,
+  atômica sob o GIL) — o consumidor nunca vê um seq sem o registro
+- Produtor nunca bloqueia: com o consumidor atrasado, os registros mais
+  antigos são sobrescritos (contados em dropped pelo leitor)
+
+LEITURA:
+=======
+- latest():          (seq, registro mais recente) — GUI / tempo real
+- read_since(seq):   (novo seq, registros com número >= seq) — raw_buffer
+- Depois de copiar as referências, o leitor relê _head e descarta o que o
+  produtor pode ter sobrescrito durante a leitura (sem locks)
+
+Os registros publicados são imutáveis por contrato: o produtor não os
+altera depois de publish() e o consumidor não os altera na leitura.
+"""
+
+
+class SensorRing:
+    """Ring de registros de sensores (1 produtor, 1 consumidor, sem locks)"""
+
+    def __init__(self, slots: int = 256):
+        """
+        Args:
+            slots: Capacidade do ring (registros mantidos para read_since)
+        """
+        self.slots = max(2, int(slots))
+        self._slots = [None] * self.slots
+        self._head = 0  # Número do próximo registro (= total publicado)
+        self.dropped = 0  # Registros sobrescritos antes de serem lidos
+
+    # ------------------------------------------------------------------
+    # Produtor
+    # ------------------------------------------------------------------
+
+    def publish(self, record) -> int:
+        """
+        Publica um registro (nunca bloqueia).
+
+        Returns:
+            int: Número (seq) do registro publicado
+        """
+        seq = self._head
+        self._slots[seq % self.slots] = record
+        self._head = seq + 1
+        return seq
+
+    # ------------------------------------------------------------------
+    # Consumidor
+    # ------------------------------------------------------------------
+
+    @property
+    def head(self) -> int:
+        """Número do próximo registro (total publicado)"""
+        return self._head
+
+    def latest(self):
+        """
+        Registro mais recente.
+
+        Returns:
+            tuple: (seq, registro), ou (-1, None) se nada foi publicado
+        """
+        head = self._head
+        if head == 0:
+            return -1, None
+        return head - 1, self._slots[(head - 1) % self.slots]
+
+    def read_since(self, seq: int):
+        """
+        Registros com número >= seq, em ordem.
+
+        Args:
+            seq: Primeiro número desejado (o valor retornado pela chamada
+                anterior; 0 na primeira)
+
+        Returns:
+            tuple: (próximo seq, lista de registros) — registros já
+                sobrescritos são pulados e somados em dropped
+        """
+        head = self._head
+        if seq >= head:
+            return head, []
+        first = max(seq, head - self.slots)
+
+        slots = self._slots
+        size = self.slots
+        start = first % size
+        end = start + (head - first)
+        if end <= size:
+            records = slots[start:end]
+        else:
+            records = slots[start:] + slots[: end - size]
+
+        # O produtor pode ter sobrescrito o início durante a cópia
+        oldest_valid = self._head - size
+        if oldest_valid > first:
+            records = records[oldest_valid - first:]
+            first = oldest_valid
+
+        self.dropped += first - seq
+        return head, records
+
@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+"""
+telemetry_codec.py - Codec Binário de Telemetria (porta 9997)
+Substitui o JSON por pacote: os nomes dos campos são anunciados uma única vez
+em um pacote SCHEMA e cada pacote DATA seguinte carrega apenas os valores,
+em layout struct fixo.
+
+IMPORTANTE: este arquivo é IDÊNTICO em raspberry/managers/ e client/managers/.
+Qualquer mudança no formato deve ser aplicada nos dois lados.
+
+CABEÇALHO (todos os pacotes binários):
+=====================================
+| 4 bytes   | 1 byte | 1 byte  | 2 bytes   | 2 bytes |
+| TLM_MAGIC | kind   | channel | schema_id | seq     |
+
+- kind: KIND_SCHEMA, KIND_DATA (keyframe) ou KIND_DELTA
+- channel: canal lógico (0 = pacote consolidado)
+- schema_id: versão do schema (muda quando o conjunto/tipo de campos muda)
+- seq: contador de pacotes DATA/DELTA do canal (detecção de perda)
+
+PACOTE SCHEMA:
+=============
+| header | JSON utf-8: [[nome, tipo], ...] |
+
+PACOTE DATA:
+===========
+| header | bitmap de nulos (ceil(n/8) bytes) | valores fixos (struct) | cauda |
+
+A cauda contém, na ordem do schema, os campos de tamanho variável
+(tipos "s" e "j") não-nulos: 2 bytes de tamanho + bytes utf-8.
+
+PACOTE DELTA (modo delta/keyframe):
+==================================
+| header | bitmap de alterados | bitmap de nulos | valores alterados |
+
+Apenas os campos que mudaram desde o pacote anterior, na ordem do schema,
+cada um com seu próprio tipo (campos "s"/"j" com 2 bytes de tamanho).
+Um pacote DATA completo (keyframe) é enviado a cada keyframe_interval e
+sempre que o schema muda, para que clientes que entraram depois ou
+perderam pacotes se ressincronizem. Após uma perda (salto de seq), o
+decoder descarta os deltas até o próximo keyframe: aplicá-los sobre a base
+antiga deixaria desatualizados os campos alterados no pacote perdido.
+
+TIPOS:
+=====
+- ?  bool     (1 byte)
+- i  int32    (4 bytes)
+- q  int64    (8 bytes)
+- f  float32  (4 bytes) - |valor| < 1e5; acima disso o schema passa a "d"
+- d  float64  (8 bytes) - timestamps e valores grandes
+- s  str      (cauda)
+- j  JSON     (cauda) - dicts/listas aninhados (ex: system_status)
+
+NEGOCIAÇÃO:
+==========
+O cliente envia "SENSOR_FORMAT:CHN1,DLT1,BIN1" (formatos em ordem de
+preferência) pela porta de comandos (9998) e o servidor escolhe o primeiro
+que suporta. Servidores antigos ignoram o comando e continuam enviando JSON;
+o cliente detecta o formato pelo primeiro byte do pacote ('{' = JSON) e
+aceita todos.
+
+CANAIS (formato CHN1):
+=====================
+Em vez de um pacote consolidado por tick, cada fonte é publicada em seu
+próprio canal, em modo delta, na sua taxa natural:
+
+- CHANNEL_IMU (1)         BMI160 + timings do TX   sensor_rate (100Hz)
+- CHANNEL_POWER (2)       INA219 / ADS1115         10Hz
+- CHANNEL_TEMPERATURE (3) DS18B20                  1Hz
+- CHANNEL_SYSTEM (4)      métricas RPi + status    1Hz
+- CHANNEL_ACTUATORS (5)   motor/freio/direção      quando muda (+1Hz)
+
+Os formatos BIN1/DLT1/JSON continuam usando o canal 0 (consolidado).
+"""
+
+import json
+import struct
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Magic dos pacotes binários de telemetria
+TLM_MAGIC = 0x544C4D31  # "TLM1" em ASCII hex
+
+KIND_SCHEMA = 0
+KIND_DATA = 1
+KIND_DELTA = 2
+
+# Tokens de negociação (comando SENSOR_FORMAT:<token>[,<token>...])
+SENSOR_FORMAT_DELTA = "DLT1"
+SENSOR_FORMAT_BINARY = "BIN1"
+SENSOR_FORMAT_JSON = "JSON"
+SENSOR_FORMAT_CHANNELS = "CHN1"
+
+# Canais lógicos (byte channel do cabeçalho)
+CHANNEL_CONSOLIDATED = 0
+CHANNEL_IMU = 1
+CHANNEL_POWER = 2
+CHANNEL_TEMPERATURE = 3
+CHANNEL_SYSTEM = 4
+CHANNEL_ACTUATORS = 5
+TELEMETRY_CHANNELS = (
+    CHANNEL_IMU,
+    CHANNEL_POWER,
+    CHANNEL_TEMPERATURE,
+    CHANNEL_SYSTEM,
+    CHANNEL_ACTUATORS,
+)
+
+HEADER = struct.Struct("<IBBHH")
+HEADER_SIZE = HEADER.size  # 10 bytes
+_TAIL_LEN = struct.Struct("<H")
+
+# Ordem de promoção: um campo nunca "encolhe" de tipo (evita troca de schema)
+_RANK = {"?": 0, "i": 1, "q": 2, "f": 3, "d": 4, "s": 5, "j": 6}
+_TAIL_CODES = ("s", "j")
+_ZERO = {"?": False, "i": 0, "q": 0, "f": 0.0, "d": 0.0}
+_CODE_STRUCTS = {code: struct.Struct("<" + code) for code in _ZERO}
+
+_INT_TYPES = (int, np.integer)
+_NUM_TYPES = (int, float, np.integer, np.floating)
+_ACCEPTS = {
+    "?": (bool, np.bool_),
+    "i": _INT_TYPES,
+    "q": _INT_TYPES,
+    "f": _NUM_TYPES,
+    "d": _NUM_TYPES,
+    "s": (str,),
+}
+
+# float32 tem ~7 dígitos significativos: acima disso usa float64
+_FLOAT32_MAX_ABS = 1e5
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+
+def is_binary_packet(packet: bytes) -> bool:
+    """Verifica se o pacote é telemetria binária (vs JSON)"""
+    return len(packet) >= HEADER_SIZE and HEADER.unpack_from(packet)[0] == TLM_MAGIC
+
+
+def _json_default(obj):
+    """Converte tipos numpy em tipos nativos para json.dumps"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if hasattr(obj, "item"):
+        return obj.item()
+    return str(obj)
+
+
+def _accepts(code: str, value: Any) -> bool:
+    """Verifica se o valor cabe no tipo do campo ("j" aceita qualquer coisa)"""
+    if code == "j":
+        return True
+    return isinstance(value, _ACCEPTS[code])
+
+
+def _infer_code(value: Any) -> Optional[str]:
+    """Infere o tipo de um valor (None = ainda desconhecido)"""
+    if value is None:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return "?"
+    if isinstance(value, _INT_TYPES):
+        return "i" if _INT32_MIN <= value <= _INT32_MAX else "q"
+    if isinstance(value, (float, np.floating)):
+        return "d" if abs(value) >= _FLOAT32_MAX_ABS else "f"
+    if isinstance(value, str):
+        return "s"
+    return "j"
+
+
+class _SchemaMismatch(Exception):
+    """Valor não cabe no schema atual (força reconstrução)"""
+
+
+class TelemetryEncoder:
+    """Codifica dicts de telemetria em pacotes binários com schema (lado RPi)"""
+
+    def __init__(self, channel: int = 0, keyframe_interval: float = 0.0):
+        """
+        Args:
+            channel: Canal lógico gravado no cabeçalho
+            keyframe_interval: Intervalo entre keyframes em segundos
+                (0 = sempre pacote completo, > 0 = modo delta)
+        """
+        self.channel = channel
+        self.keyframe_interval = keyframe_interval
+        self.schema_id = 0
+        self.seq = 0
+
+        # Estado do modo delta (valores do último pacote, na ordem do schema;
+        # campos "j" guardados já serializados)
+        self._prev: Optional[List[Any]] = None
+        self._last_keyframe = 0.0
+        self.keyframes_sent = 0
+        self.deltas_sent = 0
+
+        self._keys: Optional[Tuple[str, ...]] = None
+        self._fields: List[Tuple[str, str]] = []
+        self._codes: Dict[str, str] = {}  # Tipo promovido por campo (persistente)
+        self._struct: Optional[struct.Struct] = None
+        self._bitmap_len = 0
+        self._schema_packet = b""
+
+    def schema_packet(self) -> bytes:
+        """Retorna o pacote SCHEMA do schema atual (vazio antes do 1º encode)"""
+        return self._schema_packet
+
+    def request_keyframe(self):
+        """Força pacote completo no próximo encode (ex: cliente novo)"""
+        self._prev = None
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """
+        Codifica um dict em pacote DATA (ou DELTA no modo delta). Reconstrói
+        o schema automaticamente se o conjunto de campos ou algum tipo mudar
+        (ver schema_id).
+
+        Args:
+            data: Dados de telemetria (aceita tipos numpy diretamente)
+
+        Returns:
+            bytes: Pacote DATA ou DELTA
+        """
+        keys = tuple(data)
+        if keys != self._keys:
+            self._rebuild(data, keys)
+        row = [data[key] for key in keys]
+        try:
+            return self._encode_row(row)
+        except (_SchemaMismatch, struct.error):
+            # Tipo mudou (ex: None -> str) ou valor estourou o tipo (int32, float32)
+            self._rebuild(data, keys)
+            return self._encode_row(row)
+
+    def _encode_row(self, row: List[Any]) -> bytes:
+        """Escolhe entre keyframe e delta"""
+        if self.keyframe_interval <= 0:
+            return self._pack(row)
+
+        now = time.monotonic()
+        sent = list(row)
+        if self._prev is None or now - self._last_keyframe >= self.keyframe_interval:
+            packet = self._pack(row, sent)
+            self._last_keyframe = now
+            self.keyframes_sent += 1
+        else:
+            packet = self._pack_delta(row, sent)
+            self.deltas_sent += 1
+        self._prev = sent
+        return packet
+
+    def _rebuild(self, data: Dict[str, Any], keys: Tuple[str, ...]):
+        """Reconstrói o schema a partir dos valores atuais"""
+        fields = []
+        for key in keys:
+            value = data[key]
+            previous = self._codes.get(key)
+            inferred = _infer_code(value)
+            if inferred is None:
+                code = previous or "d"
+            elif previous is None:
+                code = inferred
+            else:
+                code = max(previous, inferred, key=_RANK.__getitem__)
+            if value is not None and not _accepts(code, value):
+                code = "j"
+            if (
+                code == "f"
+                and value is not None
+                and abs(value) >= _FLOAT32_MAX_ABS
+            ):
+                code = "d"
+            if code == "i" and value is not None and not (
+                _INT32_MIN <= value <= _INT32_MAX
+            ):
+                code = "q"
+            self._codes[key] = code
+            fields.append((key, code))
+
+        self._keys = keys
+        self._fields = fields
+        self._struct = struct.Struct(
+            "<" + "".join(code for _, code in fields if code not in _TAIL_CODES)
+        )
+        self._bitmap_len = (len(fields) + 7) // 8
+        self.schema_id = (self.schema_id + 1) & 0xFFFF
+        self._prev = None  # Schema novo sempre começa com keyframe
+
+        payload = json.dumps(fields, ensure_ascii=False).encode("utf-8")
+        self._schema_packet = (
+            HEADER.pack(TLM_MAGIC, KIND_SCHEMA, self.channel, self.schema_id, self.seq)
+            + payload
+        )
+
+    def _pack(self, row: List[Any], sent: Optional[List[Any]] = None) -> bytes:
+        """
+        Monta pacote DATA (completo) com o schema atual
+
+        Args:
+            row: Valores na ordem do schema
+            sent: Recebe os campos "j" serializados (estado do modo delta)
+        """
+        fixed = []
+        tail = []
+        nulls = 0
+
+        for bit, ((key, code), value) in enumerate(zip(self._fields, row)):
+            if value is None:
+                nulls |= 1 << bit
+                if code not in _TAIL_CODES:
+                    fixed.append(_ZERO[code])
+                continue
+            if not _accepts(code, value):
+                raise _SchemaMismatch(key)
+            if code == "s":
+                raw = value.encode("utf-8")
+                tail.append(_TAIL_LEN.pack(len(raw)))
+                tail.append(raw)
+            elif code == "j":
+                raw = json.dumps(
+                    value, ensure_ascii=False, default=_json_default
+                ).encode("utf-8")
+                tail.append(_TAIL_LEN.pack(len(raw)))
+                tail.append(raw)
+                if sent is not None:
+                    sent[bit] = raw
+            else:
+                if code == "f" and abs(value) >= _FLOAT32_MAX_ABS:
+                    raise _SchemaMismatch(key)  # Ex: 0.0 -> epoch (vira "d")
+                fixed.append(value)
+
+        body = self._struct.pack(*fixed)
+        self.seq = (self.seq + 1) & 0xFFFF
+        header = HEADER.pack(TLM_MAGIC, KIND_DATA, self.channel, self.schema_id, self.seq)
+        return b"".join(
+            (header, nulls.to_bytes(self._bitmap_len, "little"), body, *tail)
+        )
+
+    def _pack_delta(self, row: List[Any], sent: List[Any]) -> bytes:
+        """
+        Monta pacote DELTA com os campos alterados desde o pacote anterior.
+
+        Campos escalares são comparados por valor; campos "j" (listas, dicts,
+        arrays) pelos bytes serializados — cobre arrays e objetos alterados
+        no lugar.
+        """
+        parts = []
+        changed = 0
+        nulls = 0
+
+        for bit, ((key, code), value, old) in enumerate(zip(self._fields, row, self._prev)):
+            if value is None:
+                if old is None:
+                    continue
+                changed |= 1 << bit
+                nulls |= 1 << bit
+                continue
+            if not _accepts(code, value):
+                raise _SchemaMismatch(key)
+            if code == "j":
+                raw = json.dumps(
+                    value, ensure_ascii=False, default=_json_default
+                ).encode("utf-8")
+                sent[bit] = raw
+                if raw == old:
+                    continue
+                parts.append(_TAIL_LEN.pack(len(raw)))
+                parts.append(raw)
+            elif value is old or (value == old and type(value) is type(old)):
+                continue
+            elif code == "s":
+                raw = value.encode("utf-8")
+                parts.append(_TAIL_LEN.pack(len(raw)))
+                parts.append(raw)
+            else:
+                if code == "f" and abs(value) >= _FLOAT32_MAX_ABS:
+                    raise _SchemaMismatch(key)
+                parts.append(_CODE_STRUCTS[code].pack(value))
+            changed |= 1 << bit
+
+        self.seq = (self.seq + 1) & 0xFFFF
+        header = HEADER.pack(TLM_MAGIC, KIND_DELTA, self.channel, self.schema_id, self.seq)
+        return b"".join(
+            (
+                header,
+                changed.to_bytes(self._bitmap_len, "little"),
+                nulls.to_bytes(self._bitmap_len, "little"),
+                *parts,
+            )
+        )
+
+
+class _DecoderSchema:
+    """Schema recebido, pré-compilado para decodificação"""
+
+    __slots__ = ("keys", "codes", "struct", "bitmap_len", "fixed_idx", "tail_idx")
+
+    def __init__(self, fields: List[List[str]]):
+        self.keys = [name for name, _ in fields]
+        self.codes = [code for _, code in fields]
+        self.struct = struct.Struct(
+            "<" + "".join(code for code in self.codes if code not in _TAIL_CODES)
+        )
+        self.bitmap_len = (len(fields) + 7) // 8
+        self.fixed_idx = [i for i, code in enumerate(self.codes) if code not in _TAIL_CODES]
+        self.tail_idx = [i for i, code in enumerate(self.codes) if code in _TAIL_CODES]
+
+
+class TelemetryDecoder:
+    """Decodifica pacotes binários de telemetria em dicts (lado cliente)"""
+
+    # Schemas mantidos por canal (pacotes atrasados de schema anterior)
+    MAX_SCHEMAS_PER_CHANNEL = 4
+
+    def __init__(self):
+        self._schemas: Dict[Tuple[int, int], _DecoderSchema] = {}
+        self._last_seq: Dict[int, int] = {}
+
+        # Estado completo por canal para aplicar deltas: {channel: (schema_id, row)}
+        self._state: Dict[int, Tuple[int, List[Any]]] = {}
+
+        # Canal do último pacote decodificado (roteamento no cliente)
+        self.last_channel = CHANNEL_CONSOLIDATED
+
+        # Estatísticas
+        self.packets_decoded = 0
+        self.packets_lost = 0  # Lacunas de seq (perda UDP)
+        self.unknown_schema = 0  # DATA recebido antes do SCHEMA
+        self.waiting_keyframe = 0  # DELTA recebido sem keyframe de base
+
+    def has_schema(self, channel: int = 0) -> bool:
+        """Indica se já recebeu algum schema do canal"""
+        return any(ch == channel for ch, _ in self._schemas)
+
+    def decode(self, packet: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Decodifica um pacote binário.
+
+        Args:
+            packet: Pacote recebido (começando em TLM_MAGIC)
+
+        Returns:
+            dict com os dados (estado completo, também para DELTA), ou None
+            (pacote SCHEMA, schema desconhecido ou DELTA sem keyframe de base
+            ou após uma perda)
+
+        Raises:
+            ValueError: Pacote malformado
+        """
+        magic, kind, channel, schema_id, seq = HEADER.unpack_from(packet)
+        if magic != TLM_MAGIC:
+            raise ValueError("magic inválido")
+        self.last_channel = channel
+
+        if kind == KIND_SCHEMA:
+            fields = json.loads(bytes(packet[HEADER_SIZE:]).decode("utf-8"))
+            self._store_schema(channel, schema_id, _DecoderSchema(fields))
+            return None
+
+        if kind not in (KIND_DATA, KIND_DELTA):
+            raise ValueError(f"kind desconhecido: {kind}")
+
+        schema = self._schemas.get((channel, schema_id))
+        if schema is None:
+            self.unknown_schema += 1
+            return None
+
+        if kind == KIND_DATA:
+            row = self._unpack(schema, packet)
+            self._track_seq(channel, seq)
+        else:
+            state = self._state.get(channel)
+            if self._track_seq(channel, seq) and state is not None:
+                # Delta perdido: a base está desatualizada até o próximo keyframe
+                del self._state[channel]
+                state = None
+            if state is None or state[0] != schema_id:
+                self.waiting_keyframe += 1
+                return None
+            row = self._apply_delta(schema, packet, state[1])
+
+        self.packets_decoded += 1
+        self._state[channel] = (schema_id, row)
+        return dict(zip(schema.keys, row))
+
+    def _store_schema(self, channel: int, schema_id: int, schema: _DecoderSchema):
+        """Guarda schema, descartando os mais antigos do canal"""
+        self._schemas[(channel, schema_id)] = schema
+        same_channel = [key for key in self._schemas if key[0] == channel]
+        for key in same_channel[: -self.MAX_SCHEMAS_PER_CHANNEL]:
+            del self._schemas[key]
+
+    def _track_seq(self, channel: int, seq: int) -> int:
+        """
+        Conta pacotes perdidos pelo salto de seq (módulo 2^16)
+
+        Returns:
+            int: Pacotes perdidos desde o anterior do canal
+        """
+        last = self._last_seq.get(channel)
+        self._last_seq[channel] = seq
+        if last is None:
+            return 0
+        gap = (seq - last - 1) & 0xFFFF
+        if gap >= 0x8000:  # Ignora reordenação/reinício do servidor
+            return 0
+        self.packets_lost += gap
+        return gap
+
+    def _unpack(self, schema: _DecoderSchema, packet: bytes) -> List[Any]:
+        """Lê valores de um pacote DATA na ordem do schema"""
+        offset = HEADER_SIZE
+        nulls = int.from_bytes(packet[offset:offset + schema.bitmap_len], "little")
+        offset += schema.bitmap_len
+
+        row: List[Any] = [None] * len(schema.keys)
+        fixed = schema.struct.unpack_from(packet, offset)
+        offset += schema.struct.size
+        for idx, value in zip(schema.fixed_idx, fixed):
+            row[idx] = value
+
+        for idx in schema.tail_idx:
+            if nulls >> idx & 1:
+                continue
+            (length,) = _TAIL_LEN.unpack_from(packet, offset)
+            offset += 2
+            raw = bytes(packet[offset:offset + length]).decode("utf-8")
+            offset += length
+            row[idx] = raw if schema.codes[idx] == "s" else json.loads(raw)
+
+        if nulls:
+            for idx in schema.fixed_idx:
+                if nulls >> idx & 1:
+                    row[idx] = None
+
+        return row
+
+    def _apply_delta(
+        self, schema: _DecoderSchema, packet: bytes, base: List[Any]
+    ) -> List[Any]:
+        """Aplica um pacote DELTA sobre o estado anterior (retorna nova lista)"""
+        offset = HEADER_SIZE
+        size = schema.bitmap_len
+        changed = int.from_bytes(packet[offset:offset + size], "little")
+        nulls = int.from_bytes(packet[offset + size:offset + 2 * size], "little")
+        offset += 2 * size
+
+        row = list(base)
+        codes = schema.codes
+        idx = 0
+        while changed:
+            if changed & 1:
+                code = codes[idx]
+                if nulls >> idx & 1:
+                    row[idx] = None
+                elif code in _TAIL_CODES:
+                    (length,) = _TAIL_LEN.unpack_from(packet, offset)
+                    offset += 2
+                    raw = bytes(packet[offset:offset + length]).decode("utf-8")
+                    offset += length
+                    row[idx] = raw if code == "s" else json.loads(raw)
+                else:
+                    code_struct = _CODE_STRUCTS[code]
+                    (row[idx],) = code_struct.unpack_from(packet, offset)
+                    offset += code_struct.size
+            changed >>= 1
+            idx += 1
+        return row
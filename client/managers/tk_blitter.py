@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+tk_blitter.py - Exibição de Frames em Tkinter com PhotoImage Persistente
+Substitui o Image.fromarray + ImageTk.PhotoImage + label.configure por
+frame: um PhotoImage por tamanho de container, atualizado no lugar com
+PhotoImage.paste a partir de buffers reutilizados.
+
+FLUXO:
+=====
+thread de vídeo:  begin(h, w) -> escreve o frame RGBA no buffer -> commit()
+main thread (Tk): _blit() -> photo.paste(buffer pendente)
+
+- Buffers RGBA: o PIL só mapeia (sem cópia) buffers de 4 bytes por pixel,
+  e o cv2.cvtColor(..., COLOR_BGR2RGBA, dst=buffer) converte e preenche o
+  alfa em uma passada; o PhotoImage também é RGBA (paste sem conversão)
+- Três buffers por tamanho: um sendo escrito, um pendente e um em
+  paste; a escrita nunca toca o buffer que o Tk está lendo
+- Frame novo antes do paste do anterior substitui o pendente (só um
+  after() agendado por vez; frames_coalesced conta os substituídos)
+- PhotoImage, buffers e Image PIL (que compartilha a memória do buffer)
+  só são recriados quando o tamanho do frame muda
+- Timing do paste medido na main thread (last_blit_ms / blit_ms_avg)
+"""
+
+import threading
+import time
+import tkinter as tk
+
+import numpy as np
+from PIL import Image, ImageTk
+
+
+class _BlitBuffer:
+    """Buffer RGBA reutilizado e a Image PIL que enxerga a mesma memória"""
+
+    def __init__(self, height: int, width: int):
+        self.array = np.full((height, width, 4), 255, dtype=np.uint8)
+        self.image = Image.frombuffer("RGBA", (width, height), self.array, "raw", "RGBA", 0, 1)
+
+
+class TkFrameBlitter:
+    """Atualiza um Label Tkinter no lugar a partir de frames RGBA"""
+
+    BUFFER_COUNT = 3
+
+    def __init__(self, label):
+        """
+        Args:
+            label: tk.Label onde o vídeo é exibido
+        """
+        self.label = label
+        self._lock = threading.Lock()
+        self._size = None  # (altura, largura) dos buffers atuais
+        self._buffers = []
+        self._free = []  # Índices livres para escrita
+        self._writing = None
+        self._pending = None  # (índice, callback) aguardando paste
+        self._blit_scheduled = False
+
+        # Só a main thread toca no PhotoImage
+        self._photo = None
+        self._photo_size = None
+        self._attached = False  # Label exibindo o PhotoImage (não o "sem sinal")
+
+        # Estatísticas
+        self.last_blit_ms = 0.0
+        self.blit_ms_avg = 0.0
+        self.frames_blitted = 0
+        self.frames_coalesced = 0
+        self.photo_allocations = 0
+
+    def begin(self, height: int, width: int) -> np.ndarray:
+        """
+        Buffer RGBA (height x width x 4) para o próximo frame (thread de
+        vídeo). Recria os buffers se o tamanho mudou.
+        """
+        with self._lock:
+            if self._size != (height, width):
+                self._size = (height, width)
+                self._buffers = [_BlitBuffer(height, width) for _ in range(self.BUFFER_COUNT)]
+                self._free = list(range(self.BUFFER_COUNT))
+                self._pending = None
+                self._writing = None
+            if self._writing is None:
+                # begin() sem commit() anterior (erro no meio) reaproveita o buffer
+                self._writing = self._free.pop()
+            return self._buffers[self._writing].array
+
+    def commit(self, on_blit=None):
+        """
+        Publica o buffer de begin() e agenda o paste na main thread
+
+        Args:
+            on_blit: Callable executado na main thread após o paste
+        """
+        with self._lock:
+            if self._writing is None:
+                return
+            if self._pending is not None:
+                # Paste anterior ainda não rodou: o frame antigo é descartado
+                self._free.append(self._pending[0])
+                self.frames_coalesced += 1
+            self._pending = (self._writing, on_blit)
+            self._writing = None
+            schedule = not self._blit_scheduled
+            self._blit_scheduled = True
+
+        if schedule:
+            try:
+                self.label.after(0, self._blit)
+            except (tk.TclError, RuntimeError):
+                with self._lock:
+                    self._blit_scheduled = False
+
+    def detach(self):
+        """O label passou a exibir outra coisa ("sem sinal"): reanexa no próximo paste"""
+        self._attached = False
+
+    def _blit(self):
+        """Paste do frame pendente no PhotoImage persistente (main thread)"""
+        with self._lock:
+            self._blit_scheduled = False
+            if self._pending is None:
+                return
+            index, on_blit = self._pending
+            self._pending = None
+            buffers = self._buffers
+            blit_buffer = buffers[index]
+
+        try:
+            if not self.label.winfo_exists():
+                return
+            t_blit = time.perf_counter()
+            height, width = blit_buffer.array.shape[:2]
+            if self._photo is None or self._photo_size != (height, width):
+                self._photo = ImageTk.PhotoImage("RGBA", (width, height))
+                self._photo_size = (height, width)
+                self._attached = False
+                self.photo_allocations += 1
+            self._photo.paste(blit_buffer.image)
+            if not self._attached:
+                self.label.configure(image=self._photo)
+                self.label.image = self._photo
+                self._attached = True
+
+            self.last_blit_ms = (time.perf_counter() - t_blit) * 1000
+            self.blit_ms_avg += (self.last_blit_ms - self.blit_ms_avg) / 16
+            self.frames_blitted += 1
+            if on_blit:
+                on_blit()
+        except (tk.TclError, RuntimeError):
+            pass
+        finally:
+            with self._lock:
+                # Buffer volta a ficar livre (se ainda é do tamanho atual)
+                if self._buffers is buffers:
+                    self._free.append(index)
+
+    def get_statistics(self):
+        """Estatísticas do blit"""
+        return {
+            "blit_ms": round(self.last_blit_ms, 2),
+            "blit_ms_avg": round(self.blit_ms_avg, 2),
+            "frames_blitted": self.frames_blitted,
+            "frames_coalesced": self.frames_coalesced,
+            "photo_allocations": self.photo_allocations,
+        }
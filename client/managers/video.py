@@ -1,23 +1,47 @@
 #!/usr/bin/env python3
 """
-video_display.py - Gerenciamento da Exibição de Vídeo (MJPEG + Tkinter)
-Responsável por decodificar vídeo MJPEG e exibir frames na interface integrada
+video_display.py - Gerenciamento da Exibição de Vídeo (MJPEG/H.264 + Tkinter)
+Responsável por decodificar vídeo MJPEG ou H.264 e exibir frames na interface integrada
 
 CARACTERÍSTICAS:
 ===============
 - Decodificação MJPEG (cada frame é JPEG independente)
+- Decodificação H.264 via PyAV (opcional), detectada pelo cabeçalho "H264"
+- Latest-only: a fila é drenada como bytes e só o frame mais recente é
+  decodificado (frames antigos contam em frames_skipped)
+- Pool de decode MJPEG (decode_pool.py): frames numerados em sequência,
+  decodificados em paralelo e exibidos só se mais novos que o último
+  exibido; workers ativos acompanham o tempo de decode medido
+- Decode na escala do display: JPEG com escala DCT do libjpeg
+  (IMREAD_REDUCED_COLOR_2/4/8) quando o container é menor que o vídeo,
+  direto em RGB sem filtro PDI ativo, e resize final com cv2 (INTER_AREA)
 - Redimensionamento automático
+- Exibição por PhotoImage persistente (tk_blitter.py): o frame é
+  convertido direto para o buffer RGBA reutilizado e colado no lugar, sem
+  Image/PhotoImage novos por frame; timing do blit em get_statistics()
 - Estatísticas de FPS em tempo real
 - Tratamento de erros robusto
 - Integração completa com Tkinter
 
-NOTA: H.264 foi removido devido a problemas de distorção causados por
-perda de pacotes UDP (P-frames dependem de frames anteriores).
-MJPEG transmite frames independentes, eliminando este problema.
-Ver: docs/CAMERA_VIDEO_ISSUES.md
+H.264 E PERDA DE PACOTES:
+========================
+P-frames dependem dos anteriores: decodificar após uma perda gera
+distorção até o próximo keyframe. Cada frame H.264 traz um número de
+sequência; numa lacuna (ou erro de decode) o decoder descarta frames até
+o próximo IDR e pede um ao RPi via keyframe_request_callback.
+
+PROCESSO DE VÍDEO (video_process.py):
+====================================
+- No processo de vídeo, frame_sink recebe cada frame pronto (filtros,
+  overlay, escala do container, RGB) no lugar do label Tkinter
+- No processo da interface (video_process definido), run_display só lê o
+  slot mais recente do ring e exibe; tamanho do container e filtros PDI
+  são repassados ao processo de vídeo
 """
 
+import os
 import queue
+import struct
 import threading
 import time
 import tkinter as tk
@@ -25,31 +49,61 @@ from typing import Optional
 
 from .simple_logger import debug, error, info, warn
 
-from .constants import MAX_VIDEO_QUEUE_FRAMES
+from .constants import (
+    MAX_VIDEO_QUEUE_FRAMES,
+    VIDEO_DECODE_ADAPT_INTERVAL,
+    VIDEO_DECODE_MAX_WORKERS,
+)
+from .decode_pool import DecodePool
+from .tk_blitter import TkFrameBlitter
 
 import cv2
 import numpy as np
-from PIL import Image, ImageTk
+
+try:
+    import av
+
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+# Frame H.264: magic + seq + flags antes do access unit (ver RPi network.py)
+H264_MAGIC = b"H264"
+_H264_HEADER = struct.Struct("<4sIB")
+_H264_FLAG_KEYFRAME = 0x01
+
+# Decode JPEG reduzido: fator -> flag do imdecode (escala DCT do libjpeg)
+_JPEG_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+# OpenCV >= 4.10 decodifica direto em RGB (0 = indisponível, usa cvtColor)
+_IMREAD_COLOR_RGB = getattr(cv2, "IMREAD_COLOR_RGB", 0)
 
 
 class VideoDisplay:
-    """Gerencia a exibição de vídeo do veículo F1 (MJPEG + Tkinter)"""
+    """Gerencia a exibição de vídeo do veículo F1 (MJPEG/H.264 + Tkinter)"""
 
     # Overlay text positions
     _OVERLAY_X = 10
     _OVERLAY_Y_START = 25
     _OVERLAY_Y_STEP = 25
 
-    def __init__(self, video_queue=None, log_queue=None):
+    def __init__(self, video_queue=None, log_queue=None, video_process=None):
         """
         Inicializa o display de vídeo
 
         Args:
             video_queue (Queue): Fila de frames de vídeo
             log_queue (Queue): Fila para mensagens de log
+            video_process (VideoProcess): Processo de vídeo que publica os
+                frames prontos no ring (None = decode neste processo)
         """
         self.video_queue = video_queue
         self.log_queue = log_queue
+        self.video_process = video_process
 
         # Estatísticas
         self.start_time = time.time()
@@ -72,9 +126,42 @@ class VideoDisplay:
         self._last_filter_ms = 0.0
         self._last_active_filters = []
         self._last_decode_ms = 0.0
+        self._decode_ms_avg = 0.0  # Média móvel (VIDEO_FEEDBACK para o RPi)
+
+        # Codec detectado pelo conteúdo do frame ("MJPEG" ou "H.264")
+        self.codec = "MJPEG"
+
+        # Decoder H.264 (criado no primeiro frame H.264)
+        self._h264_decoder = None
+        self._h264_last_seq = None
+        self._h264_waiting_keyframe = True
+        self._h264_unavailable_logged = False
+        self.h264_frames_skipped = 0  # Descartados aguardando keyframe
+
+        # Latest-only: frames da fila que nunca foram exibidos
+        self.frames_skipped = 0
+        self.decodes_skipped = 0  # Desses, quantos nem foram decodificados
+        self.frames_stale = 0  # Decodificados, mas um frame mais novo já foi exibido
+
+        # Pool de decode MJPEG (criado em run_display) e ordem de exibição
+        self._decode_pool = None
+        self._frame_seq = 0  # Sequência atribuída na chegada
+        self._displayed_seq = 0  # Último frame exibido
+        self._display_lock = threading.Lock()
+        self._arrival_ms_avg = 0.0  # Intervalo médio entre frames recebidos
+        self._last_arrival = None
+        self._last_pool_adapt = 0.0
+        # Pede IDR ao RPi (definido pelo main: NetworkClient.request_keyframe)
+        self.keyframe_request_callback = None
+        # Processo de vídeo: Callable(frame_rgb, (largura, altura) do stream)
+        # recebe os frames prontos no lugar do label Tkinter
+        self.frame_sink = None
+        # Estatísticas de decode vindas do processo de vídeo (modo ring)
+        self._remote_stats = {}
 
         # Integração com Tkinter
         self.tkinter_label = None
+        self._blitter = None  # PhotoImage persistente do label
         self.tkinter_container = None  # Container para obter tamanho disponível
         self.status_callback = None
 
@@ -85,7 +172,12 @@ class VideoDisplay:
         self.original_width = 0
         self.original_height = 0
 
-        self._log("INFO", "VideoDisplay inicializado (MJPEG)")
+        # Tamanho do container (atualizado pelo <Configure> na main thread)
+        self._container_size = (0, 0)
+        # Fator de redução do último decode (1 = resolução original)
+        self._decode_scale = 1
+
+        self._log("INFO", "VideoDisplay inicializado (MJPEG/H.264)")
 
     def _log(self, level, message):
         """Envia mensagem para fila de log (não-bloqueante)"""
@@ -101,11 +193,20 @@ class VideoDisplay:
     def set_tkinter_label(self, label):
         """Define o label Tkinter para exibir vídeo"""
         self.tkinter_label = label
+        self._blitter = TkFrameBlitter(label) if label is not None else None
         self._log("INFO", "Label Tkinter configurado")
 
     def set_tkinter_container(self, container):
         """Define o container Tkinter para obter tamanho disponível"""
         self.tkinter_container = container
+        # Tamanho em cache: a thread de display não consulta o Tk diretamente
+        container.bind("<Configure>", self._on_container_resize, add="+")
+
+    def _on_container_resize(self, event):
+        """Atualiza o tamanho do container (main thread do Tkinter)"""
+        self._container_size = (event.width, event.height)
+        if self.video_process:
+            self.video_process.set_container_size(event.width, event.height)
 
     def set_status_callback(self, callback):
         """Define callback para atualizar status do vídeo"""
@@ -119,12 +220,24 @@ class VideoDisplay:
             image_filter: Instância de ImageFilters ou None para desativar
         """
         self.image_filter = image_filter
+        if self.video_process:
+            # Filtros rodam no processo de vídeo
+            self.video_process.set_filters(image_filter)
+            return
         if image_filter:
             info = image_filter.get_current_filter_info()
             self._log("INFO", f"Filtro PDI: {info.get('name', 'Desconhecido')}")
 
-    def update_tkinter_frame(self, frame):
-        """Atualiza frame no label Tkinter via main thread (thread-safe)"""
+    def update_tkinter_frame(self, frame, rgb: bool = False, stream_size=None):
+        """
+        Atualiza frame no label Tkinter via main thread (thread-safe)
+
+        Args:
+            frame (np.ndarray): Frame (possivelmente decodificado reduzido)
+            rgb (bool): True se o frame já está em RGB
+            stream_size (tuple): (largura, altura) do stream; None = deriva
+                do frame e do fator de decode reduzido
+        """
         try:
             # Verifica se ainda está rodando e se o label existe
             if not self.is_running or not self.tkinter_label:
@@ -137,32 +250,33 @@ class VideoDisplay:
             except tk.TclError:
                 return
 
-            height, width = frame.shape[:2]
+            # Resolução do stream (o decode pode ter sido reduzido)
+            if stream_size is None:
+                height = frame.shape[0] * self._decode_scale
+                width = frame.shape[1] * self._decode_scale
+            else:
+                width, height = stream_size
             self.original_width = width
             self.original_height = height
 
-            # Conversão BGR→RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # PIL Image
-            pil_image = Image.fromarray(rgb_frame, mode="RGB")
-
             # Escala para caber no container mantendo proporção
-            pil_image = self._scale_to_fit(pil_image)
-
-            # PhotoImage
-            photo = ImageTk.PhotoImage(image=pil_image)
+            frame = self._scale_to_fit(frame)
+
+            # Conversão para RGBA (após o resize: menos pixels) direto no
+            # buffer do PhotoImage persistente
+            blit_buffer = self._blitter.begin(frame.shape[0], frame.shape[1])
+            cv2.cvtColor(
+                frame,
+                cv2.COLOR_RGB2RGBA if rgb else cv2.COLOR_BGR2RGBA,
+                dst=blit_buffer,
+            )
 
-            # Agenda atualização na main thread do Tkinter (thread-safe)
+            # Paste na main thread do Tkinter (thread-safe); status depois
             fps = self.current_fps
             status_cb = self.status_callback
 
             def _do_update():
                 try:
-                    if not self.tkinter_label or not self.tkinter_label.winfo_exists():
-                        return
-                    self.tkinter_label.configure(image=photo)
-                    self.tkinter_label.image = photo
                     if status_cb and self.is_running:
                         status_cb({
                             "connected": True,
@@ -170,66 +284,69 @@ class VideoDisplay:
                             "height": height,
                             "resolution": f"{width}x{height}",
                             "fps": fps,
-                            "codec": "MJPEG",
+                            "codec": self.codec,
                         })
                 except (tk.TclError, RuntimeError):
                     pass
 
-            self.tkinter_label.after(0, _do_update)
+            self._blitter.commit(_do_update)
 
         except (tk.TclError, RuntimeError):
             # Ignora erros durante shutdown
             pass
 
-    def _scale_to_fit(self, pil_image):
+    def _fit_scale(self, img_width, img_height):
         """
-        Escala a imagem para caber no container mantendo proporção
-
-        Args:
-            pil_image: Imagem PIL
+        Escala que faz a imagem caber no container mantendo proporção
 
         Returns:
-            Imagem PIL redimensionada
+            float: Escala, ou None se não há container renderizado
         """
-        try:
-            # Se não tem container, retorna imagem original
-            if not self.tkinter_container:
-                return pil_image
-
-            # Obtém tamanho do container
-            try:
-                container_width = self.tkinter_container.winfo_width()
-                container_height = self.tkinter_container.winfo_height()
-            except tk.TclError:
-                return pil_image
-
-            # Container ainda não foi renderizado
-            if container_width <= 1 or container_height <= 1:
-                return pil_image
+        container_width, container_height = self._container_size
+        if container_width <= 1 or container_height <= 1 or not img_width or not img_height:
+            return None
+        return min(container_width / img_width, container_height / img_height)
 
-            # Tamanho original da imagem
-            img_width, img_height = pil_image.size
+    def _scale_to_fit(self, frame):
+        """
+        Escala o frame para caber no container mantendo proporção
 
-            # Calcula escala mantendo proporção
-            scale_w = container_width / img_width
-            scale_h = container_height / img_height
-            scale = min(scale_w, scale_h)
+        Args:
+            frame (np.ndarray): Frame
 
-            # Novo tamanho
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
+        Returns:
+            np.ndarray: Frame redimensionado
+        """
+        try:
+            img_height, img_width = frame.shape[:2]
+            scale = self._fit_scale(img_width, img_height)
+            if scale is None:
+                return frame
 
-            # Redimensiona se necessário
-            if new_width != img_width or new_height != img_height:
-                pil_image = pil_image.resize(
-                    (new_width, new_height),
-                    Image.Resampling.LANCZOS
-                )
+            new_width = max(1, int(img_width * scale))
+            new_height = max(1, int(img_height * scale))
+            if new_width == img_width and new_height == img_height:
+                return frame
 
-            return pil_image
+            # INTER_AREA para reduzir (sem aliasing), linear para ampliar
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+            return cv2.resize(frame, (new_width, new_height), interpolation=interpolation)
 
         except Exception:
-            return pil_image
+            return frame
+
+    def _jpeg_reduce_factor(self):
+        """
+        Maior fator de redução DCT (1, 2, 4 ou 8) cuja imagem ainda é maior
+        ou igual ao tamanho exibido no container (nunca amplia após reduzir)
+        """
+        scale = self._fit_scale(self.original_width, self.original_height)
+        if scale is None:
+            return 1
+        for factor in (8, 4, 2):
+            if scale * factor <= 1.0:
+                return factor
+        return 1
 
     def display_no_signal(self):
         """Exibe mensagem de 'Sem Sinal' no Tkinter"""
@@ -253,6 +370,8 @@ class VideoDisplay:
                 font=("Arial", 12),
             )
             self.tkinter_label.image = None
+            if self._blitter:
+                self._blitter.detach()
 
             if self.status_callback and self.is_running:
                 status = {
@@ -276,7 +395,7 @@ class VideoDisplay:
             if self.frame_count % 5 != 0:
                 return frame
 
-            fps_text = f"MJPEG | FPS: {self.current_fps:.1f}"
+            fps_text = f"{self.codec} | FPS: {self.current_fps:.1f}"
             resolution_text = f"{frame.shape[1]}x{frame.shape[0]}"
 
             # Adiciona info do filtro se ativo
@@ -315,15 +434,21 @@ class VideoDisplay:
         except Exception:
             return frame
 
-    def display_frame(self, frame):
+    def display_frame(self, frame, rgb: bool = False):
         """
         Exibe frame no Tkinter
 
         Args:
             frame (np.ndarray): Frame para exibir
+            rgb (bool): True se o frame está em RGB (padrão: BGR)
         """
         try:
             with self.frame_lock:
+                if rgb and self.image_filter:
+                    # Filtro ativado após o decode: filtros esperam BGR
+                    frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+                    rgb = False
+
                 # Aplica filtro PDI se configurado
                 if self.image_filter:
                     t_filter = time.time()
@@ -337,7 +462,9 @@ class VideoDisplay:
                 frame_with_overlay = self.add_overlay_info(frame.copy())
 
                 if self.tkinter_label:
-                    self.update_tkinter_frame(frame_with_overlay)
+                    self.update_tkinter_frame(frame_with_overlay, rgb)
+                elif self.frame_sink:
+                    self._publish_frame(frame_with_overlay, rgb)
 
                 self.last_frame = frame.copy()
                 self.last_frame_time = time.time()
@@ -346,6 +473,21 @@ class VideoDisplay:
         except Exception as e:
             self._log("ERROR", f"Erro ao exibir frame: {e}")
 
+    def _publish_frame(self, frame, rgb: bool):
+        """
+        Entrega o frame pronto ao frame_sink (processo de vídeo): escala do
+        container e RGB feitos aqui, o processo da interface só exibe
+        """
+        height = frame.shape[0] * self._decode_scale
+        width = frame.shape[1] * self._decode_scale
+        self.original_width = width
+        self.original_height = height
+
+        frame = self._scale_to_fit(frame)
+        if not rgb:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self.frame_sink(frame, (width, height))
+
     def update_statistics(self):
         """Atualiza estatísticas de FPS"""
         current_time = time.time()
@@ -358,69 +500,347 @@ class VideoDisplay:
             self.frame_count = 0
             self.last_fps_time = current_time
 
-    def _decode_frame(self, frame_data: bytes) -> Optional[np.ndarray]:
+    def _decode_frame(
+        self, frame_data: bytes, convert: bool = True, rgb: bool = False
+    ) -> Optional[np.ndarray]:
         """
-        Decodifica frame MJPEG
+        Decodifica frame MJPEG ou H.264 (detectado pelo cabeçalho).
+        JPEG é decodificado já reduzido para o tamanho do container
+        (fator em self._decode_scale).
 
         Args:
-            frame_data: Bytes do frame JPEG
+            frame_data: Bytes do frame JPEG ou frame H.264 com cabeçalho
+            convert: H.264 - False só alimenta o decoder (frame não exibido)
+            rgb: Decodifica em RGB em vez de BGR
 
         Returns:
-            np.ndarray em formato BGR ou None
+            np.ndarray em formato BGR (ou RGB) ou None
         """
         if not frame_data:
             return None
 
         try:
-            # Decodifica JPEG
             t_dec = time.time()
-            nparr = np.frombuffer(frame_data, dtype=np.uint8)
-            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            self._last_decode_ms = (time.time() - t_dec) * 1000
+            if frame_data[:4] == H264_MAGIC:
+                self.codec = "H.264"
+                self._decode_scale = 1
+                frame = self._decode_h264(frame_data, convert, rgb)
+            else:
+                self.codec = "MJPEG"
+                frame, self._decode_scale = self._decode_jpeg(frame_data, rgb)
+            if frame is not None:
+                self._record_decode_time(t_dec)
             return frame
         except Exception:
             return None
 
-    def process_video_queue(self):
-        """Processa frames da fila de vídeo (MJPEG)"""
+    def _decode_jpeg(self, frame_data: bytes, rgb: bool = False):
+        """
+        Decodifica JPEG reduzido pela escala DCT se couber no container
+        (seguro em paralelo: não altera estado do display)
+
+        Returns:
+            tuple: (np.ndarray ou None, fator de redução)
+        """
+        factor = self._jpeg_reduce_factor()
+        flags = _JPEG_REDUCED_FLAGS[factor]
+        if rgb and _IMREAD_COLOR_RGB:
+            # Troca o bit BGR (IMREAD_COLOR) pelo RGB: os dois juntos são erro
+            flags = (flags & ~cv2.IMREAD_COLOR) | _IMREAD_COLOR_RGB
+        nparr = np.frombuffer(frame_data, dtype=np.uint8)
+        frame = cv2.imdecode(nparr, flags)
+        if rgb and frame is not None and not _IMREAD_COLOR_RGB:
+            # OpenCV < 4.10: JPEG veio em BGR
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return frame, factor
+
+    def _record_decode_time(self, t_dec: float):
+        """Atualiza tempo de decode (último e média móvel)"""
+        self._last_decode_ms = (time.time() - t_dec) * 1000
+        self._decode_ms_avg += (self._last_decode_ms - self._decode_ms_avg) / 16
+
+    def _decode_h264(
+        self, frame_data: bytes, convert: bool = True, rgb: bool = False
+    ) -> Optional[np.ndarray]:
+        """
+        Decodifica um access unit H.264 (todos devem passar por aqui, em ordem).
+        Com convert=False o frame só atualiza as referências do decoder
+        (sem a conversão YUV→BGR).
+
+        Lacuna de sequência ou erro de decode: descarta até o próximo
+        keyframe e pede um IDR ao RPi.
+        """
+        if not AV_AVAILABLE:
+            if not self._h264_unavailable_logged:
+                self._log("ERROR", "Vídeo H.264 recebido mas PyAV não instalado (pip install av)")
+                self._h264_unavailable_logged = True
+            return None
+
+        _, seq, flags = _H264_HEADER.unpack_from(frame_data)
+        keyframe = bool(flags & _H264_FLAG_KEYFRAME)
+
+        if self._h264_last_seq is not None and seq != (self._h264_last_seq + 1) & 0xFFFFFFFF:
+            self._h264_waiting_keyframe = True
+        self._h264_last_seq = seq
+
+        if self._h264_waiting_keyframe:
+            if not keyframe:
+                self.h264_frames_skipped += 1
+                self._request_keyframe()
+                return None
+            self._h264_waiting_keyframe = False
+
+        if self._h264_decoder is None:
+            self._h264_decoder = av.CodecContext.create("h264", "r")
+            try:
+                # Threads por slice: sem atraso de frames no decoder
+                self._h264_decoder.thread_type = "SLICE"
+            except (AttributeError, ValueError):
+                pass
+
         try:
-            latest_frame = None
-            frames_decoded = 0
-            max_frames = MAX_VIDEO_QUEUE_FRAMES  # Limita para não travar se fila acumular muito
+            packet = av.Packet(frame_data[_H264_HEADER.size:])
+            frames = self._h264_decoder.decode(packet)
+        except Exception as e:
+            self._log("WARN", f"Erro de decode H.264 (aguardando keyframe): {e}")
+            self._h264_waiting_keyframe = True
+            self._request_keyframe()
+            return None
 
-            while frames_decoded < max_frames:
-                try:
-                    frame_data = self.video_queue.get_nowait()
-                except queue.Empty:
-                    break
-                frames_decoded += 1
+        if not frames or not convert:
+            return None
+        return frames[-1].to_ndarray(format="rgb24" if rgb else "bgr24")
 
-                if frame_data is None:
-                    continue
+    def _request_keyframe(self):
+        """Pede IDR ao RPi (o NetworkClient limita a taxa de pedidos)"""
+        if self.keyframe_request_callback:
+            self.keyframe_request_callback()
 
-                if isinstance(frame_data, bytes):
-                    frame = self._decode_frame(frame_data)
-                else:
-                    frame = frame_data
+    def _drain_queue(self, first=None):
+        """
+        Retira da fila os frames pendentes como bytes, sem decodificar
+        (limitado a MAX_VIDEO_QUEUE_FRAMES para não travar se a fila acumular)
+
+        Args:
+            first: Frame já retirado da fila (ex: pelo get bloqueante)
+
+        Returns:
+            list: Frames pendentes, do mais antigo para o mais recente
+        """
+        batch = [] if first is None else [first]
+        while len(batch) < MAX_VIDEO_QUEUE_FRAMES:
+            try:
+                frame_data = self.video_queue.get_nowait()
+            except queue.Empty:
+                break
+            if frame_data is not None:
+                batch.append(frame_data)
+        return batch
+
+    def _decode_rgb(self):
+        """
+        Decodifica direto em RGB? Só sem filtro PDI (que espera BGR) e se o
+        decoder do codec atual gera RGB nativamente
+        """
+        if self.image_filter is not None:
+            return False
+        if self.codec == "H.264":
+            return AV_AVAILABLE
+        return bool(_IMREAD_COLOR_RGB)
+
+    def _decode_latest(self, batch, rgb: bool = False) -> Optional[np.ndarray]:
+        """
+        Decodifica apenas o frame mais recente do lote.
+
+        MJPEG: frames antigos são descartados sem decode; se o mais recente
+        estiver corrompido, tenta o anterior. H.264: todos passam pelo
+        decoder, em ordem (P-frames), mas só o último é convertido.
+
+        Args:
+            batch: Frames pendentes (bytes ou np.ndarray BGR)
+            rgb: Retorna o frame em RGB em vez de BGR
+
+        Returns:
+            np.ndarray ou None
+        """
+        if not batch:
+            return None
+
+        if any(isinstance(d, bytes) and d[:4] == H264_MAGIC for d in batch):
+            frame = None
+            last = len(batch) - 1
+            for i, frame_data in enumerate(batch):
+                frame = self._decode_item(frame_data, rgb, convert=(i == last))
+            self.frames_skipped += last
+            return frame
+
+        for i in range(len(batch) - 1, -1, -1):
+            frame = self._decode_item(batch[i], rgb)
+            if frame is not None:
+                self.frames_skipped += i
+                self.decodes_skipped += i
+                return frame
+        self.frames_skipped += len(batch)
+        return None
+
+    def _decode_item(self, frame_data, rgb: bool, convert: bool = True):
+        """Decodifica bytes da fila; np.ndarray (BGR) passa direto"""
+        if isinstance(frame_data, bytes):
+            return self._decode_frame(frame_data, convert, rgb)
+        self._decode_scale = 1
+        if rgb:
+            return cv2.cvtColor(frame_data, cv2.COLOR_BGR2RGB)
+        return frame_data
+
+    def _start_decode_pool(self):
+        """Cria o pool de decode MJPEG (deixa um core para a UI e a rede)"""
+        workers = min(VIDEO_DECODE_MAX_WORKERS, max(1, (os.cpu_count() or 2) - 1))
+        self._decode_pool = DecodePool(self._pool_decode, self._deliver_frame, workers)
+        self._log("INFO", f"Pool de decode MJPEG: até {workers} threads")
+
+    def _pool_decode(self, job):
+        """Decode de um frame MJPEG em um worker do pool"""
+        frame_data, rgb = job
+        t_dec = time.time()
+        frame, factor = self._decode_jpeg(frame_data, rgb)
+        if frame is not None:
+            self._record_decode_time(t_dec)
+        return frame, factor, rgb
+
+    def _deliver_frame(self, seq: int, result):
+        """
+        Exibe um frame decodificado se for mais novo que o último exibido
+        (workers terminam fora de ordem: o atrasado é descartado)
+        """
+        frame, factor, rgb = result
+        if frame is None:
+            return
+        with self._display_lock:
+            if seq <= self._displayed_seq:
+                self.frames_stale += 1
+                self.frames_skipped += 1
+                return
+            self._displayed_seq = seq
+            self._decode_scale = factor
+            self.display_frame(frame, rgb)
+
+    def _dispatch(self, batch, rgb: bool):
+        """
+        Encaminha os frames drenados da fila: MJPEG vai para o pool (só o
+        mais recente); H.264 e frames já decodificados seguem em ordem
+        nesta thread
+        """
+        self._update_arrival(len(batch))
+        newest = batch[-1]
+        pool_ok = self._decode_pool is not None and all(
+            isinstance(d, bytes) and d[:4] != H264_MAGIC for d in batch
+        )
+
+        if pool_ok:
+            self.codec = "MJPEG"
+            stale = len(batch) - 1
+            self._frame_seq += 1
+            if self._decode_pool.submit(self._frame_seq, (newest, rgb)):
+                stale += 1  # Pendente anterior substituído sem decode
+            self.frames_skipped += stale
+            self.decodes_skipped += stale
+            return
+
+        frame = self._decode_latest(batch, rgb)
+        if frame is not None:
+            self._frame_seq += 1
+            self._deliver_frame(self._frame_seq, (frame, self._decode_scale, rgb))
 
-                # Mantém sempre o frame mais recente decodificado com sucesso
-                if frame is not None:
-                    latest_frame = frame
+    def _update_arrival(self, count: int):
+        """Mede o intervalo entre frames e ajusta os workers do pool"""
+        now = time.monotonic()
+        if self._last_arrival is not None:
+            interval_ms = (now - self._last_arrival) * 1000 / count
+            self._arrival_ms_avg += (interval_ms - self._arrival_ms_avg) / 16
+        self._last_arrival = now
 
-            # Exibe apenas o frame mais recente
+        if self._decode_pool and now - self._last_pool_adapt >= VIDEO_DECODE_ADAPT_INTERVAL:
+            self._last_pool_adapt = now
+            self._decode_pool.adapt(self._decode_ms_avg, self._arrival_ms_avg)
+
+    def process_video_queue(self):
+        """Processa frames da fila de vídeo (decodifica só o mais recente)"""
+        try:
+            rgb = self._decode_rgb()
+            latest_frame = self._decode_latest(self._drain_queue(), rgb)
             if latest_frame is not None:
-                self.display_frame(latest_frame)
+                self.display_frame(latest_frame, rgb)
 
         except Exception as e:
             self._log("ERROR", f"Erro ao processar fila de vídeo: {e}")
 
+    def _check_no_signal(self, no_signal_time):
+        """
+        Exibe "sem sinal" após 2s sem frame exibido (uma vez por queda)
+
+        Returns:
+            Instante em que "sem sinal" foi exibido (ou o anterior)
+        """
+        current_time = time.time()
+        if current_time - self.last_frame_time > 2.0 and (
+            no_signal_time is None or self.last_frame_time > no_signal_time
+        ):
+            self.display_no_signal()
+            return current_time
+        return no_signal_time
+
+    def _run_ring_display(self):
+        """Loop de exibição com decode no processo de vídeo: só o slot mais recente"""
+        no_signal_time = None
+        last_seq = 0
+        while self.is_running:
+            try:
+                self.video_process.wait_frame(0.1)
+                latest = self.video_process.read_latest(last_seq)
+                if latest is not None:
+                    last_seq, frame, frame_info = latest
+                    self._show_ring_frame(frame, frame_info)
+            except Exception as e:
+                self._log("DEBUG", f"Erro ao ler frame do processo de vídeo: {e}")
+            no_signal_time = self._check_no_signal(no_signal_time)
+
+    def _show_ring_frame(self, frame, frame_info):
+        """Exibe um frame do ring (já filtrado, escalado e em RGB)"""
+        with self.frame_lock:
+            self._last_decode_ms = frame_info["decode_ms"]
+            self._last_filter_ms = frame_info["filter_ms"]
+            if self.tkinter_label:
+                self.update_tkinter_frame(frame, True, frame_info["stream_size"])
+            self.last_frame_time = time.time()
+            self.update_statistics()
+
+    def apply_remote_stats(self, stats):
+        """
+        Estatísticas do VideoDisplay do processo de vídeo (modo ring):
+        codec, descartes e timings dos filtros PDI para o console
+        """
+        self._remote_stats = stats
+        self.codec = stats.get("codec", self.codec)
+        self._last_active_filters = stats.get("active_filters", [])
+        if self.image_filter is not None:
+            self.image_filter.last_filter_timings = stats.get("filter_timings", {})
+
     def run_display(self):
         """Loop principal de exibição de vídeo"""
-        self._log("INFO", "Iniciando display de vídeo (MJPEG)...")
+        self._log("INFO", "Iniciando display de vídeo (MJPEG/H.264)...")
 
         self.is_running = True
-        no_signal_displayed = False
-        last_frame_time = time.time()
+        no_signal_time = None  # Quando "sem sinal" foi exibido
+        self.last_frame_time = time.time()
+
+        if self.video_process:
+            try:
+                self._run_ring_display()
+            finally:
+                self.stop()
+            return
+
+        self._start_decode_pool()
 
         try:
             while self.is_running:
@@ -429,52 +849,16 @@ class VideoDisplay:
                     try:
                         frame_data = self.video_queue.get(timeout=0.1)
                     except queue.Empty:
-                        # Timeout - verifica se precisa mostrar "sem sinal"
-                        current_time = time.time()
-                        if current_time - last_frame_time > 2.0 and not no_signal_displayed:
-                            self.display_no_signal()
-                            no_signal_displayed = True
-                        continue
-                    latest_frame = None
-
-                    # Processa o frame recebido
+                        frame_data = None
                     if frame_data is not None:
-                        if isinstance(frame_data, bytes):
-                            frame = self._decode_frame(frame_data)
-                        else:
-                            frame = frame_data
-                        if frame is not None:
-                            latest_frame = frame
-
-                    # Se há mais frames na fila, processa todos
-                    # (mas só exibe o último para não travar)
-                    frames_extra = 0
-                    while frames_extra < 5:
-                        try:
-                            extra_data = self.video_queue.get_nowait()
-                            frames_extra += 1
-                            if extra_data is not None:
-                                if isinstance(extra_data, bytes):
-                                    frame = self._decode_frame(extra_data)
-                                else:
-                                    frame = extra_data
-                                if frame is not None:
-                                    latest_frame = frame
-                        except queue.Empty:
-                            break
-
-                    # Exibe o frame mais recente
-                    if latest_frame is not None:
-                        self.display_frame(latest_frame)
-                        last_frame_time = time.time()
-                        no_signal_displayed = False
-
+                        # Drena o restante da fila como bytes; só o mais
+                        # recente é decodificado (no pool, se MJPEG)
+                        self._dispatch(self._drain_queue(frame_data), self._decode_rgb())
                 except Exception:
-                    # Erro real no processamento de frame
-                    current_time = time.time()
-                    if current_time - last_frame_time > 2.0 and not no_signal_displayed:
-                        self.display_no_signal()
-                        no_signal_displayed = True
+                    pass  # Erro real no processamento de frame
+
+                # Sem frame exibido há 2s (exibidos também pelos workers)
+                no_signal_time = self._check_no_signal(no_signal_time)
 
         except KeyboardInterrupt:
             self._log("INFO", "Display de vídeo interrompido pelo usuário")
@@ -494,17 +878,46 @@ class VideoDisplay:
             "avg_fps": self.total_frames_ever / runtime if runtime > 0 else 0,
             "last_frame_time": self.last_frame_time,
             "is_running": self.is_running,
-            "codec": "MJPEG",
+            "codec": self.codec,
+            "frames_skipped": self.frames_skipped,
+            "decodes_skipped": self.decodes_skipped,
+            "frames_stale": self.frames_stale,
+            "decode_workers": self._decode_pool.active_workers if self._decode_pool else 1,
+            "h264_frames_skipped": self.h264_frames_skipped,
         }
+        if self._blitter:
+            stats.update(self._blitter.get_statistics())
+        if self.video_process:
+            # Descartes e workers são do processo de vídeo
+            for key in (
+                "frames_skipped",
+                "decodes_skipped",
+                "frames_stale",
+                "decode_workers",
+                "h264_frames_skipped",
+            ):
+                if key in self._remote_stats:
+                    stats[key] = self._remote_stats[key]
 
         return stats
 
+    @property
+    def last_blit_ms(self) -> float:
+        """Tempo do último paste no PhotoImage (ms; 0 sem label Tkinter)"""
+        return self._blitter.last_blit_ms if self._blitter else 0.0
+
+    def get_feedback_stats(self):
+        """Estatísticas do display enviadas ao RPi no VIDEO_FEEDBACK"""
+        return {"decode_ms": self._decode_ms_avg}
+
     def stop(self):
         """Para o display de vídeo"""
         if not self.is_running:
             return
 
         self.is_running = False
+        if self._decode_pool:
+            self._decode_pool.stop()
 
         # Não limpa tkinter_label aqui - será limpo pelo main thread
         # Isso evita o erro "Tcl_AsyncDelete: async handler deleted by the wrong thread"
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+video_process.py - Recepção e Decode de Vídeo em Processo Separado
+Tira recepção, decode, filtros PDI e escala do vídeo do processo da
+interface: o Tk, o loop de sensores e o loop de force feedback a 100Hz
+deixam de disputar o GIL com o vídeo, e o jitter do FF para de acompanhar
+a carga de vídeo.
+
+ARQUITETURA:
+===========
+Processo de vídeo (_video_process_main):
+  NetworkClient (só porta 9999) -> fila local -> VideoDisplay (decode,
+  filtros PDI, overlay, escala do container, BGR->RGB) -> SharedFrameRing
+Processo da interface:
+  VideoDisplay em modo ring: lê só o slot mais recente e exibe
+
+RING EM MEMÓRIA COMPARTILHADA (SharedFrameRing):
+===============================================
+| cabeçalho (int64[8]) | metadados (int64[slots][META]) | pixels (slots x slot_bytes) |
+
+- Cabeçalho[0]: sequência do último frame publicado (0 = nenhum)
+- Frame seq vai para o slot seq % slots
+- Escritor único: seq_begin = seq -> pixels/metadados -> seq_end = seq ->
+  cabeçalho = seq -> frame_ready.set()
+- Leitor: confere seq_end == seq, copia o slot para um buffer próprio e
+  confere seq_begin == seq depois da cópia (se o escritor deu a volta no
+  ring durante a cópia, o frame é descartado)
+
+CANAIS (multiprocessing.Queue):
+==============================
+- control (interface -> vídeo): tamanho do container, filtros ativos, stop
+- events (vídeo -> interface): log, status de conexão e estatísticas
+  (a cada VIDEO_PROCESS_STATS_INTERVAL)
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from .constants import (
+    COMMAND_PORT,
+    MAX_VIDEO_QUEUE_FRAMES,
+    VIDEO_PORT,
+    VIDEO_PROCESS_STATS_INTERVAL,
+    VIDEO_RING_MAX_PIXELS,
+    VIDEO_RING_SLOTS,
+)
+from .simple_logger import debug, error, info, warn
+
+
+class SharedFrameRing:
+    """Ring de frames decodificados em memória compartilhada (1 escritor, 1 leitor)"""
+
+    HEADER_FIELDS = 8
+    # Metadados por slot (int64)
+    SEQ_BEGIN = 0
+    SEQ_END = 1
+    HEIGHT = 2
+    WIDTH = 3
+    CHANNELS = 4
+    STREAM_WIDTH = 5
+    STREAM_HEIGHT = 6
+    TIMESTAMP_NS = 7
+    DECODE_US = 8
+    FILTER_US = 9
+    META_FIELDS = 10
+
+    def __init__(self, shm, slots: int, slot_bytes: int, owner: bool):
+        self._shm = shm
+        self.name = shm.name
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self._owner = owner
+
+        header_bytes = self.HEADER_FIELDS * 8
+        meta_bytes = slots * self.META_FIELDS * 8
+        self._header = np.ndarray((self.HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        self._meta = np.ndarray(
+            (slots, self.META_FIELDS), dtype=np.int64, buffer=shm.buf, offset=header_bytes
+        )
+        self._data = np.ndarray(
+            (slots, slot_bytes), dtype=np.uint8, buffer=shm.buf, offset=header_bytes + meta_bytes
+        )
+        self._read_buffer = None  # Destino da cópia do leitor (reutilizado)
+
+    @classmethod
+    def _size(cls, slots: int, slot_bytes: int) -> int:
+        return (cls.HEADER_FIELDS + slots * cls.META_FIELDS) * 8 + slots * slot_bytes
+
+    @classmethod
+    def create(cls, slots: int = VIDEO_RING_SLOTS, slot_bytes: int = VIDEO_RING_MAX_PIXELS * 3):
+        """Cria o ring (processo da interface, dono da memória)"""
+        shm = shared_memory.SharedMemory(create=True, size=cls._size(slots, slot_bytes))
+        ring = cls(shm, slots, slot_bytes, owner=True)
+        ring._header[:] = 0
+        ring._meta[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, slots: int, slot_bytes: int):
+        """Abre um ring existente (processo de vídeo)"""
+        return cls(shared_memory.SharedMemory(name=name), slots, slot_bytes, owner=False)
+
+    def write(self, frame: np.ndarray, stream_size, decode_ms: float = 0.0, filter_ms: float = 0.0) -> int:
+        """
+        Publica um frame (uint8, HxW ou HxWxC) no próximo slot.
+
+        Args:
+            frame: Frame pronto para exibir (até slot_bytes bytes)
+            stream_size: (largura, altura) do vídeo recebido
+            decode_ms: Tempo de decode do frame
+            filter_ms: Tempo dos filtros PDI do frame
+
+        Returns:
+            int: Sequência publicada
+
+        Raises:
+            ValueError: Frame maior que o slot
+        """
+        if frame.nbytes > self.slot_bytes:
+            raise ValueError(f"Frame de {frame.nbytes} bytes não cabe no slot ({self.slot_bytes})")
+
+        seq = int(self._header[0]) + 1
+        meta = self._meta[seq % self.slots]
+        meta[self.SEQ_BEGIN] = seq
+        np.copyto(self._data[seq % self.slots, :frame.nbytes].reshape(frame.shape), frame)
+        meta[self.HEIGHT] = frame.shape[0]
+        meta[self.WIDTH] = frame.shape[1]
+        meta[self.CHANNELS] = frame.shape[2] if frame.ndim == 3 else 1
+        meta[self.STREAM_WIDTH], meta[self.STREAM_HEIGHT] = stream_size
+        meta[self.TIMESTAMP_NS] = time.time_ns()
+        meta[self.DECODE_US] = int(decode_ms * 1000)
+        meta[self.FILTER_US] = int(filter_ms * 1000)
+        meta[self.SEQ_END] = seq
+        self._header[0] = seq
+        return seq
+
+    def read_latest(self, after_seq: int = 0):
+        """
+        Copia o frame mais recente, se for mais novo que after_seq.
+
+        O array retornado é um buffer do leitor, reutilizado na próxima
+        leitura com o mesmo formato.
+
+        Returns:
+            tuple: (seq, frame, info) ou None (nada novo / frame sobrescrito
+                durante a cópia); info = {"stream_size", "timestamp",
+                "decode_ms", "filter_ms"}
+        """
+        seq = int(self._header[0])
+        if seq <= after_seq:
+            return None
+        slot = seq % self.slots
+        meta = self._meta[slot].copy()
+        if meta[self.SEQ_END] != seq:
+            return None
+
+        channels = int(meta[self.CHANNELS])
+        shape = (int(meta[self.HEIGHT]), int(meta[self.WIDTH]))
+        if channels > 1:
+            shape += (channels,)
+        if self._read_buffer is None or self._read_buffer.shape != shape:
+            self._read_buffer = np.empty(shape, dtype=np.uint8)
+        np.copyto(
+            self._read_buffer,
+            self._data[slot, :self._read_buffer.nbytes].reshape(shape),
+        )
+
+        if self._meta[slot, self.SEQ_BEGIN] != seq:
+            return None  # Escritor deu a volta no ring durante a cópia
+        return seq, self._read_buffer, {
+            "stream_size": (int(meta[self.STREAM_WIDTH]), int(meta[self.STREAM_HEIGHT])),
+            "timestamp": int(meta[self.TIMESTAMP_NS]) / 1e9,
+            "decode_ms": int(meta[self.DECODE_US]) / 1000,
+            "filter_ms": int(meta[self.FILTER_US]) / 1000,
+        }
+
+    def close(self):
+        """Fecha o mapeamento (o dono também remove a memória)"""
+        # Views numpy precisam sair antes do close (BufferError)
+        self._header = self._meta = self._data = self._read_buffer = None
+        try:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+        except (OSError, BufferError):
+            pass
+
+
+class _EventQueue:
+    """Adapta a fila de eventos para quem espera uma Queue de log/status"""
+
+    def __init__(self, events, kind: str):
+        self._events = events
+        self._kind = kind
+
+    def put_nowait(self, item):
+        self._events.put_nowait((self._kind, item))
+
+    def put(self, item, block=True, timeout=None):
+        self._events.put((self._kind, item), block, timeout)
+
+
+class VideoProcess:
+    """Processo de vídeo (lado da interface): inicia, controla e lê o ring"""
+
+    def __init__(
+        self,
+        video_port=VIDEO_PORT,
+        command_port=COMMAND_PORT,
+        buffer_size=131072,
+        rpi_ip=None,
+        log_queue=None,
+        status_queue=None,
+    ):
+        """
+        Args:
+            video_port (int): Porta UDP de vídeo (escutada pelo processo de vídeo)
+            command_port (int): Porta de comandos do RPi (VIDEO_FEEDBACK/KEYFRAME)
+            buffer_size (int): Tamanho do buffer UDP
+            rpi_ip (str): IP do Raspberry Pi
+            log_queue (Queue): Fila de log da interface
+            status_queue (Queue): Fila de status da interface
+        """
+        self.config = {
+            "video_port": video_port,
+            "command_port": command_port,
+            "buffer_size": buffer_size,
+            "rpi_ip": rpi_ip,
+            "ring_slots": VIDEO_RING_SLOTS,
+            "slot_bytes": VIDEO_RING_MAX_PIXELS * 3,
+        }
+        self.log_queue = log_queue
+        self.status_queue = status_queue
+
+        # spawn em todas as plataformas: fork com threads ativas é inseguro
+        self._ctx = multiprocessing.get_context("spawn")
+        self._control = self._ctx.Queue(maxsize=100)
+        self._events = self._ctx.Queue(maxsize=1000)
+        self._frame_ready = self._ctx.Event()
+        self._stop_event = self._ctx.Event()
+        self._process = None
+        self._event_thread = None
+        self.ring = None
+        self.is_running = False
+
+        # Callable(stats) chamado com as estatísticas do processo de vídeo
+        # ({"network": ..., "display": ...}); definido pelo main
+        self.stats_callback = None
+        self.stats = {}
+        self._container_size = None
+
+    def _log(self, level, message):
+        """Envia mensagem para fila de log"""
+        if self.log_queue:
+            try:
+                self.log_queue.put_nowait((level, message))
+            except queue.Full:
+                pass
+        else:
+            _fn = {"ERROR": error, "WARN": warn, "DEBUG": debug}.get(level, info)
+            _fn(message, "VIDEO")
+
+    def start(self) -> bool:
+        """
+        Cria o ring e inicia o processo de vídeo
+
+        Returns:
+            bool: True se iniciado
+        """
+        try:
+            self.ring = SharedFrameRing.create(
+                self.config["ring_slots"], self.config["slot_bytes"]
+            )
+            self._process = self._ctx.Process(
+                target=_video_process_main,
+                args=(
+                    self.config,
+                    self.ring.name,
+                    self._control,
+                    self._events,
+                    self._frame_ready,
+                    self._stop_event,
+                ),
+                name="F1Video",
+                daemon=True,
+            )
+            self._process.start()
+        except Exception as e:
+            self._log("ERROR", f"Falha ao iniciar processo de vídeo: {e}")
+            if self.ring:
+                self.ring.close()
+                self.ring = None
+            return False
+
+        self.is_running = True
+        self._event_thread = threading.Thread(
+            target=self._event_loop, name="VideoEvents", daemon=True
+        )
+        self._event_thread.start()
+        self._log(
+            "INFO",
+            f"Processo de vídeo iniciado (pid {self._process.pid}, ring "
+            f"{self.config['ring_slots']}x{self.config['slot_bytes'] // 1024} KB)",
+        )
+        return True
+
+    def _event_loop(self):
+        """Repassa log/status/estatísticas do processo de vídeo"""
+        while self.is_running:
+            try:
+                kind, item = self._events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+
+            target = None
+            if kind == "log":
+                target = self.log_queue
+            elif kind == "status":
+                target = self.status_queue
+            elif kind == "stats":
+                self.stats = item
+                if self.stats_callback:
+                    try:
+                        self.stats_callback(item)
+                    except Exception as e:
+                        self._log("DEBUG", f"Erro ao aplicar estatísticas de vídeo: {e}")
+                continue
+
+            if target is not None:
+                try:
+                    target.put_nowait(item)
+                except queue.Full:
+                    pass
+
+    def _send_control(self, message):
+        """Envia mensagem de controle (descarta se o processo não consome)"""
+        if not self.is_running:
+            return
+        try:
+            self._control.put_nowait(message)
+        except queue.Full:
+            pass
+
+    def set_container_size(self, width: int, height: int):
+        """Tamanho do container (decode reduzido e escala no processo de vídeo)"""
+        if self._container_size == (width, height):
+            return
+        self._container_size = (width, height)
+        self._send_control(("container", (width, height)))
+
+    def set_filters(self, image_filter):
+        """Replica a configuração de filtros PDI (None = sem filtro)"""
+        if image_filter is None:
+            self._send_control(("filters", None))
+        else:
+            self._send_control((
+                "filters",
+                (sorted(image_filter.active_filters), image_filter.current_filter),
+            ))
+
+    def wait_frame(self, timeout: float) -> bool:
+        """Aguarda a publicação de um frame (True se houve publicação)"""
+        ready = self._frame_ready.wait(timeout)
+        self._frame_ready.clear()
+        return ready
+
+    def read_latest(self, after_seq: int = 0):
+        """Frame mais recente do ring (ver SharedFrameRing.read_latest)"""
+        if self.ring is None:
+            return None
+        return self.ring.read_latest(after_seq)
+
+    def stop(self):
+        """Encerra o processo de vídeo e libera o ring"""
+        if not self.is_running:
+            return
+        self._send_control(("stop", None))
+        self._stop_event.set()
+        self.is_running = False
+
+        if self._process is not None:
+            self._process.join(timeout=3.0)
+            if self._process.is_alive():
+                self._log("WARN", "Processo de vídeo não encerrou - terminando")
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+        if self._event_thread and self._event_thread.is_alive():
+            self._event_thread.join(timeout=1.0)
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+
+def _video_process_main(config, ring_name, control, events, frame_ready, stop_event):
+    """
+    Entrada do processo de vídeo: recepção, decode e filtros PDI, com os
+    frames prontos publicados no ring
+    """
+    # Import tardio: o processo da interface não precisa desses módulos aqui
+    from .image_filters import get_filters
+    from .network import NetworkClient
+    from .video import VideoDisplay
+
+    log_queue = _EventQueue(events, "log")
+    ring = SharedFrameRing.attach(ring_name, config["ring_slots"], config["slot_bytes"])
+    frames = queue.Queue(maxsize=MAX_VIDEO_QUEUE_FRAMES * 3)
+
+    network = NetworkClient(
+        video_port=config["video_port"],
+        command_port=config["command_port"],
+        buffer_size=config["buffer_size"],
+        rpi_ip=config["rpi_ip"],
+        log_queue=log_queue,
+        status_queue=_EventQueue(events, "status"),
+        video_queue=frames,
+        receive_sensors=False,
+    )
+    display = VideoDisplay(video_queue=frames, log_queue=log_queue)
+    network.video_stats_provider = display.get_feedback_stats
+    display.keyframe_request_callback = network.request_keyframe
+
+    def publish(frame, stream_size):
+        if frame.nbytes > ring.slot_bytes:
+            # Container maior que a capacidade do slot: reduz mantendo proporção
+            scale = (ring.slot_bytes / frame.nbytes) ** 0.5
+            size = (max(1, int(frame.shape[1] * scale)), max(1, int(frame.shape[0] * scale)))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        ring.write(frame, stream_size, display._last_decode_ms, display._last_filter_ms)
+        frame_ready.set()
+
+    display.frame_sink = publish
+
+    threads = [
+        threading.Thread(target=network.run_receiver, name="VideoRX", daemon=True),
+        threading.Thread(target=display.run_display, name="VideoDecode", daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    parent = multiprocessing.parent_process()
+    last_stats = 0.0
+    try:
+        # Interface encerrada sem stop() (ex: os._exit): encerra junto
+        while not stop_event.is_set() and (parent is None or parent.is_alive()):
+            try:
+                kind, value = control.get(timeout=VIDEO_PROCESS_STATS_INTERVAL)
+            except queue.Empty:
+                kind = None
+            if kind == "stop":
+                break
+            if kind == "container":
+                display._container_size = value
+            elif kind == "filters":
+                if value is None:
+                    display.set_image_filter(None)
+                else:
+                    image_filter = get_filters()
+                    image_filter.active_filters = set(value[0])
+                    image_filter.current_filter = value[1]
+                    display.set_image_filter(image_filter)
+
+            now = time.monotonic()
+            if now - last_stats >= VIDEO_PROCESS_STATS_INTERVAL:
+                last_stats = now
+                net_stats = network.get_statistics()
+                net_stats["rpi_ip"] = (
+                    network.raspberry_pi_ip if network.is_connected_to_rpi else None
+                )
+                display_stats = display.get_statistics()
+                display_stats["decode_ms"] = display._last_decode_ms
+                display_stats["filter_ms"] = display._last_filter_ms
+                display_stats["active_filters"] = display._last_active_filters
+                display_stats["filter_timings"] = (
+                    dict(display.image_filter.last_filter_timings) if display.image_filter else {}
+                )
+                try:
+                    events.put_nowait(("stats", {"network": net_stats, "display": display_stats}))
+                except queue.Full:
+                    pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        display.stop()
+        network.is_running = False
+        for thread in threads:
+            thread.join(timeout=2.0)
+        display.frame_sink = None
+        ring.close()
@@ -0,0 +1,26 @@
+"""
+conftest.py - Configuração do pytest para os testes do cliente
+
+Os testes unitários importam módulos puros (telemetry_codec, sensor_ring,
+session_recorder...) como managers.<módulo> / console.logic.<módulo>. Os
+pacotes são registrados sem executar os __init__, que importam a GUI
+(Tk, PIL, evdev) só para reexportar classes.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+CLIENT_DIR = Path(__file__).resolve().parent.parent
+
+for name in ("managers", "console", "console.logic"):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [str(CLIENT_DIR.joinpath(*name.split(".")))]
+        sys.modules[name] = package
+
+# Scripts manuais de hardware: test_g923.py encerra o processo sem evdev
+collect_ignore = []
+if importlib.util.find_spec("evdev") is None:
+    collect_ignore.append("test_g923.py")
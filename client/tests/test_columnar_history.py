@@ -0,0 +1,108 @@
+"""
+test_columnar_history.py - Testes do histórico colunar de sensores
+
+Capacidade, compactação do ring e promoção de colunas float64 -> object.
+
+Roda: python -m pytest client/tests/test_columnar_history.py
+"""
+
+import numpy as np
+import pytest
+
+from managers.columnar_history import ColumnarHistory
+
+
+def _fill(history, count, start=0):
+    for i in range(start, start + count):
+        history.append_row({"timestamp": float(i), "speed": i * 2.0})
+
+
+def test_window_returns_last_rows_without_copy():
+    history = ColumnarHistory(capacity=10)
+    _fill(history, 5)
+
+    window = history.window("speed", 3)
+    assert window.tolist() == [4.0, 6.0, 8.0]
+    assert not window.flags.writeable
+    assert not window.flags.owndata
+
+
+def test_compaction_keeps_last_capacity_rows():
+    history = ColumnarHistory(capacity=8)
+    _fill(history, 8 * 5 + 3)  # Várias compactações (folga de 2 linhas)
+
+    assert history.rows == 8
+    assert history.window("timestamp").tolist() == [float(i) for i in range(35, 43)]
+    assert history.window("speed").tolist() == [i * 2.0 for i in range(35, 43)]
+
+
+def test_compaction_moves_object_columns_with_numeric_rows():
+    history = ColumnarHistory(capacity=4)
+    for i in range(13):
+        history.append_row({"timestamp": float(i), "ctx": f"c{i}"})
+
+    assert history.window("timestamp").tolist() == [9.0, 10.0, 11.0, 12.0]
+    assert history.window("ctx").tolist() == ["c9", "c10", "c11", "c12"]
+
+
+def test_missing_fields_and_new_columns():
+    history = ColumnarHistory(capacity=10)
+    history.append_row({"timestamp": 0.0, "rpm": 1000})
+    history.append_row({"timestamp": 1.0, "mode": "sport"})
+    history.append_row({"timestamp": 2.0, "rpm": 1200, "status": {"camera": "ok"}})
+
+    rpm = history.window("rpm")
+    assert rpm[0] == 1000 and np.isnan(rpm[1]) and rpm[2] == 1200
+    assert history.window("mode").tolist() == [None, "sport", None]
+    assert "status" not in history  # Dicts aninhados não viram coluna
+    with pytest.raises(KeyError):
+        history.window("status")
+
+
+def test_non_numeric_value_promotes_column_to_object():
+    history = ColumnarHistory(capacity=10)
+    history.append_row({"timestamp": 0.0, "gear": 1, "rpm": 900.0})
+    history.append_row({"timestamp": 1.0, "rpm": 950.0})  # gear faltante (NaN)
+    history.append_row({"timestamp": 2.0, "gear": "N", "rpm": 1000.0})
+
+    gear = history.window("gear")
+    assert gear.dtype == object
+    assert gear.tolist() == [1.0, None, "N"]
+    # As demais colunas do bloco continuam no lugar após a promoção
+    assert history.window("rpm").tolist() == [900.0, 950.0, 1000.0]
+    assert history.window("timestamp").tolist() == [0.0, 1.0, 2.0]
+
+
+def test_set_last_overwrites_last_row():
+    history = ColumnarHistory(capacity=10)
+    _fill(history, 3)
+    history.set_last({"speed": -1.0, "lap": 2})
+
+    assert history.window("speed").tolist() == [0.0, 2.0, -1.0]
+    assert history.window("lap")[-1] == 2
+    assert np.isnan(history.window("lap")[:2]).all()
+
+
+def test_to_dict_restores_none_and_scalar_types():
+    history = ColumnarHistory(capacity=10)
+    history.append_row({"timestamp": 0.0, "gear": 1, "braking": True, "rpm": 900.5})
+    history.append_row({"timestamp": 1.0, "gear": None, "braking": False})
+    history.append_row({"timestamp": 2.0, "late": 7, "gear": 2, "braking": True})
+
+    snapshot = history.to_dict()
+
+    assert snapshot["gear"] == [1, None, 2]
+    assert all(type(v) is int for v in snapshot["gear"] if v is not None)
+    assert [type(v) for v in snapshot["braking"]] == [bool, bool, bool]
+    assert snapshot["braking"] == [True, False, True]
+    assert snapshot["rpm"] == [900.5, None, None]
+    assert snapshot["late"] == [None, None, 7] and type(snapshot["late"][2]) is int
+    assert snapshot["timestamp"] == [0.0, 1.0, 2.0]
+
+
+def test_to_dict_keeps_floats_when_int_field_gets_fractions():
+    history = ColumnarHistory(capacity=10)
+    history.append_row({"timestamp": 0.0, "temp": 0})
+    history.append_row({"timestamp": 1.0, "temp": 21.5})
+
+    assert history.to_dict()["temp"] == [0.0, 21.5]
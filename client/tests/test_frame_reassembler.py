@@ -0,0 +1,137 @@
+"""
+test_frame_reassembler.py - Testes da remontagem de frames fragmentados
+
+Fragmentos montados aqui no mesmo layout do RPi (ver frame_reassembler.py)
+e entregues via add_fragment(), sem socket.
+
+Roda: python -m pytest client/tests/test_frame_reassembler.py
+"""
+
+import os
+import struct
+
+from managers.frame_reassembler import (
+    FEC_HEADER,
+    FEC_MAGIC,
+    FRAG_HEADER,
+    FRAG_MAGIC,
+    FrameReassembler,
+)
+
+FRAME_SIZE = struct.Struct("<I")
+
+
+def _frag_packets(frame_id, frame, chunk_size=FrameReassembler.CHUNK_SIZE):
+    """Fragmentos FRAG de <tamanho><frame>"""
+    packet = FRAME_SIZE.pack(len(frame)) + frame
+    chunks = [packet[i:i + chunk_size] for i in range(0, len(packet), chunk_size)]
+    return [
+        FRAG_HEADER.pack(FRAG_MAGIC, frame_id, index, len(chunks)) + chunk
+        for index, chunk in enumerate(chunks)
+    ]
+
+
+def _fec_packets(frame_id, frame, parity, chunk_size=FrameReassembler.FEC_CHUNK_SIZE):
+    """Fragmentos FEC: chunks de dados seguidos das paridades XOR intercaladas"""
+    packet = FRAME_SIZE.pack(len(frame)) + frame
+    chunks = [packet[i:i + chunk_size] for i in range(0, len(packet), chunk_size)]
+    total = len(chunks)
+
+    parities = []
+    for j in range(parity):
+        acc = bytearray(chunk_size)
+        for chunk in chunks[j::parity]:
+            for k, byte in enumerate(chunk):
+                acc[k] ^= byte
+        parities.append(bytes(acc))
+
+    return [
+        FEC_HEADER.pack(FEC_MAGIC, frame_id, index, total, parity, 0, len(packet)) + payload
+        for index, payload in enumerate(chunks + parities)
+    ]
+
+
+def test_reassembles_fragments_in_any_order():
+    reassembler = FrameReassembler(max_frame_size=200_000)
+    frame = os.urandom(150_000)
+    packets = _frag_packets(7, frame)
+    assert len(packets) == 3
+
+    assert reassembler.add_fragment(packets[2]) is None
+    assert reassembler.add_fragment(packets[0]) is None
+    assert reassembler.add_fragment(packets[1]) == frame
+    assert reassembler.frames_completed == 1
+    assert reassembler.pending_frames() == 0
+
+
+def test_duplicate_fragment_is_counted_and_ignored():
+    reassembler = FrameReassembler(max_frame_size=200_000)
+    frame = os.urandom(100_000)
+    first, second = _frag_packets(1, frame)
+
+    reassembler.add_fragment(first)
+    assert reassembler.add_fragment(first) is None
+    assert reassembler.chunks_invalid == 1
+    assert reassembler.add_fragment(second) == frame
+
+
+def test_completed_frame_drops_older_incomplete_frames():
+    reassembler = FrameReassembler(max_frame_size=200_000)
+    old = _frag_packets(1, os.urandom(100_000))
+    new_frame = os.urandom(1000)
+
+    reassembler.add_fragment(old[0])
+    assert reassembler.add_fragment(_frag_packets(2, new_frame)[0]) == new_frame
+
+    assert reassembler.frames_dropped == 1
+    assert reassembler.pending_frames() == 0
+    assert reassembler.add_fragment(old[1]) is None  # Frame 1 recomeça, incompleto
+
+
+def test_slots_are_reused_without_growing():
+    reassembler = FrameReassembler(max_frame_size=200_000)
+    buffers = [slot.buffer for slot in reassembler._slots]
+
+    for frame_id in range(3 * FrameReassembler.SLOTS):
+        frame = os.urandom(120_000)
+        packets = _frag_packets(frame_id, frame)
+        results = [reassembler.add_fragment(p) for p in packets]
+        assert results[-1] == frame
+
+    assert [slot.buffer for slot in reassembler._slots] == buffers
+
+
+def test_fec_recovers_one_lost_data_fragment():
+    reassembler = FrameReassembler(max_frame_size=300_000)
+    frame = os.urandom(200_000)
+    packets = _fec_packets(3, frame, parity=2)
+    assert len(packets) == 6  # 4 de dados + 2 de paridade
+
+    received = [p for index, p in enumerate(packets) if index != 1]
+    results = [reassembler.add_fragment(p) for p in received]
+
+    assert results[:-1] == [None] * (len(received) - 1)
+    assert results[-1] == frame
+    assert reassembler.frames_recovered == 1
+    assert reassembler.chunks_lost == 1
+
+
+def test_fec_without_losses_ignores_parity():
+    reassembler = FrameReassembler(max_frame_size=300_000)
+    frame = os.urandom(70_000)
+    packets = _fec_packets(4, frame, parity=1)
+
+    assert reassembler.add_fragment(packets[0]) is None
+    assert reassembler.add_fragment(packets[1]) == frame
+    assert reassembler.frames_recovered == 0
+
+
+def test_fec_two_losses_in_same_group_are_not_recovered():
+    reassembler = FrameReassembler(max_frame_size=300_000)
+    packets = _fec_packets(5, os.urandom(200_000), parity=2)
+
+    # Chunks 0 e 2 pertencem ao mesmo grupo (i % 2 == 0)
+    received = [p for index, p in enumerate(packets) if index not in (0, 2)]
+    assert all(reassembler.add_fragment(p) is None for p in received)
+    assert reassembler.frames_recovered == 0
+    assert reassembler.pending_frames() == 1
@@ -0,0 +1,84 @@
+"""
+test_sensor_ring.py - Testes do ring SPSC de registros de sensores
+
+Roda: python -m pytest client/tests/test_sensor_ring.py
+"""
+
+import threading
+
+from managers.sensor_ring import SensorRing
+
+
+def test_latest_on_empty_and_after_publish():
+    ring = SensorRing(slots=4)
+    assert ring.latest() == (-1, None)
+
+    assert ring.publish({"seq": 0}) == 0
+    assert ring.publish({"seq": 1}) == 1
+    assert ring.latest() == (1, {"seq": 1})
+    assert ring.head == 2
+
+
+def test_read_since_returns_records_in_order():
+    ring = SensorRing(slots=8)
+    for i in range(5):
+        ring.publish(i)
+
+    seq, records = ring.read_since(0)
+    assert (seq, records) == (5, [0, 1, 2, 3, 4])
+    assert ring.read_since(seq) == (5, [])
+
+    ring.publish(5)
+    ring.publish(6)
+    assert ring.read_since(seq) == (7, [5, 6])
+    assert ring.dropped == 0
+
+
+def test_read_since_across_wraparound():
+    ring = SensorRing(slots=4)
+    for i in range(3):
+        ring.publish(i)
+    seq, _ = ring.read_since(0)
+
+    for i in range(3, 7):  # Dá a volta no ring sem sobrescrever o não lido
+        ring.publish(i)
+    assert ring.read_since(seq) == (7, [3, 4, 5, 6])
+    assert ring.dropped == 0
+
+
+def test_overwritten_records_are_skipped_and_counted():
+    ring = SensorRing(slots=4)
+    for i in range(10):
+        ring.publish(i)
+
+    seq, records = ring.read_since(0)
+    assert (seq, records) == (10, [6, 7, 8, 9])
+    assert ring.dropped == 6
+    assert ring.latest() == (9, 9)
+
+
+def test_minimum_two_slots():
+    ring = SensorRing(slots=0)
+    assert ring.slots == 2
+
+
+def test_consumer_sees_every_record_or_counts_it_dropped():
+    ring = SensorRing(slots=64)
+    total = 20000
+    received = []
+
+    def produce():
+        for i in range(total):
+            ring.publish(i)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    seq = 0
+    while producer.is_alive() or seq < ring.head:
+        seq, records = ring.read_since(seq)
+        received.extend(records)
+    producer.join()
+
+    assert received == sorted(received)
+    assert len(received) + ring.dropped == total
+    assert received[-1] == total - 1
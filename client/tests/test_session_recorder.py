@@ -0,0 +1,78 @@
+"""
+test_session_recorder.py - Testes da gravação de sessão (.f1rec)
+
+Arquivo fechado normalmente (índice + trailer) e arquivo de uma sessão
+interrompida: sem índice e com o último chunk truncado.
+
+Roda: python -m pytest client/tests/test_session_recorder.py
+"""
+
+import os
+
+import numpy as np
+
+from console.logic.session_recorder import TRAILER, SessionReader, SessionRecorder
+
+
+def _record(tmp_path, rows=25):
+    recorder = SessionRecorder(str(tmp_path), "session.f1rec")
+    recorder.CHUNK_ROWS = 10
+    recorder.WRITE_INTERVAL = 0.01
+    assert recorder.start()
+    for i in range(rows):
+        recorder.append("sensors", {"timestamp": float(i), "speed": i * 0.5})
+    recorder.append("ff", {"time": 0.0, "context": "Reta"})
+    recorder.stop()
+    return recorder.path
+
+
+def _index_offset(path):
+    with open(path, "rb") as f:
+        f.seek(-TRAILER.size, os.SEEK_END)
+        offset, _ = TRAILER.unpack(f.read(TRAILER.size))
+    return offset
+
+
+def test_closed_session_reads_through_index(tmp_path):
+    path = _record(tmp_path)
+    reader = SessionReader(path)
+
+    assert reader.complete
+    assert reader.streams() == ["sensors", "ff"]
+    assert reader.rows("sensors") == 25
+
+    sensors = reader.read("sensors")
+    np.testing.assert_array_equal(sensors["timestamp"], np.arange(25.0))
+    np.testing.assert_array_equal(sensors["speed"], np.arange(25.0) * 0.5)
+    assert reader.read("ff")["context"].tolist() == ["Reta"]
+
+
+def test_session_without_index_is_scanned(tmp_path):
+    path = _record(tmp_path)
+    with open(path, "r+b") as f:
+        f.truncate(_index_offset(path))  # Crash antes do close(): sem índice
+
+    reader = SessionReader(path)
+
+    assert not reader.complete
+    assert reader.rows("sensors") == 25
+    assert [entry[2] for entry in reader.index if entry[0] == "sensors"] == [10, 10, 5]
+    assert reader.read("sensors", ["timestamp"])["timestamp"].tolist() == [
+        float(i) for i in range(25)
+    ]
+
+
+def test_truncated_chunk_keeps_valid_prefix(tmp_path):
+    path = _record(tmp_path)
+    chunks = SessionReader(path).index
+    last = max(entry[1] for entry in chunks)
+    with open(path, "r+b") as f:
+        f.truncate(last + 20)  # Crash no meio da escrita do último chunk
+
+    reader = SessionReader(path)
+
+    assert not reader.complete
+    assert len(reader.index) == len(chunks) - 1
+    assert sum(entry[2] for entry in reader.index) == sum(
+        entry[2] for entry in chunks[:-1]
+    )
@@ -0,0 +1,148 @@
+"""
+test_telemetry_codec.py - Testes do formato binário de telemetria
+
+Ida e volta TelemetryEncoder -> TelemetryDecoder: schema, tipos, pacotes
+DELTA e keyframes.
+
+Roda: python -m pytest client/tests/test_telemetry_codec.py
+"""
+
+import numpy as np
+import pytest
+
+from managers import telemetry_codec
+from managers.telemetry_codec import TelemetryDecoder, TelemetryEncoder
+
+
+def _decoder_for(encoder):
+    decoder = TelemetryDecoder()
+    assert decoder.decode(encoder.schema_packet()) is None
+    return decoder
+
+
+def test_data_round_trip_all_types():
+    encoder = TelemetryEncoder()
+    data = {
+        "timestamp": 1712345678.25,
+        "accel_x": np.float32(0.5),
+        "frame_count": 123456,
+        "big_counter": 2**40,
+        "is_braking": True,
+        "ff_context": "Reta",
+        "voltage_battery": None,
+        "system_status": {"camera": "Online"},
+    }
+    packet = encoder.encode(data)
+
+    decoded = _decoder_for(encoder).decode(packet)
+
+    assert decoded == {
+        "timestamp": 1712345678.25,
+        "accel_x": 0.5,
+        "frame_count": 123456,
+        "big_counter": 2**40,
+        "is_braking": True,
+        "ff_context": "Reta",
+        "voltage_battery": None,
+        "system_status": {"camera": "Online"},
+    }
+
+
+def test_data_before_schema_is_dropped():
+    encoder = TelemetryEncoder()
+    packet = encoder.encode({"speed": 1.0})
+    decoder = TelemetryDecoder()
+
+    assert decoder.decode(packet) is None
+    assert decoder.unknown_schema == 1
+
+
+def test_type_change_rebuilds_schema():
+    encoder = TelemetryEncoder()
+    encoder.encode({"gear": 1, "mode": None})
+    first_schema = encoder.schema_id
+
+    packet = encoder.encode({"gear": 1, "mode": "sport"})
+
+    assert encoder.schema_id != first_schema
+    assert _decoder_for(encoder).decode(packet) == {"gear": 1, "mode": "sport"}
+
+
+@pytest.mark.parametrize("keyframe_interval", [0.0, 60.0])
+def test_float_field_started_at_zero_keeps_epoch_precision(keyframe_interval):
+    # Ex: last_movement_time começa em 0.0 (float32) e depois recebe time.time()
+    encoder = TelemetryEncoder(keyframe_interval=keyframe_interval)
+    first = encoder.encode({"ts": 0.0, "speed": 1.5})
+    decoder = _decoder_for(encoder)
+    assert decoder.decode(first) == {"ts": 0.0, "speed": 1.5}
+
+    packet = encoder.encode({"ts": 1712345678.123, "speed": 1.5})
+
+    assert dict(encoder._fields)["ts"] == "d"
+    assert _decoder_for(encoder).decode(packet) == {"ts": 1712345678.123, "speed": 1.5}
+
+
+def test_delta_carries_only_changed_fields():
+    encoder = TelemetryEncoder(keyframe_interval=60.0)
+    base = {"timestamp": 1.0, "rpm": 1000.5, "gear": 2, "ctx": "Reta"}
+    keyframe = encoder.encode(base)
+    decoder = _decoder_for(encoder)
+    assert decoder.decode(keyframe) == base
+
+    update = dict(base, timestamp=2.0)
+    delta = encoder.encode(update)
+
+    assert encoder.deltas_sent == 1
+    assert len(delta) < len(keyframe)
+    assert decoder.decode(delta) == update
+
+
+def test_delta_array_and_mutated_list_fields():
+    encoder = TelemetryEncoder(keyframe_interval=60.0)
+    samples = [1, 2]
+    keyframe = encoder.encode({"v": np.array([1.0, 2.0]), "samples": samples})
+    decoder = _decoder_for(encoder)
+    decoder.decode(keyframe)
+
+    unchanged = encoder.encode({"v": np.array([1.0, 2.0]), "samples": samples})
+    assert decoder.decode(unchanged) == {"v": [1.0, 2.0], "samples": [1, 2]}
+
+    samples.append(3)  # Alterada no lugar: mesmo objeto, conteúdo novo
+    changed = encoder.encode({"v": np.array([1.0, 3.0]), "samples": samples})
+    assert decoder.decode(changed) == {"v": [1.0, 3.0], "samples": [1, 2, 3]}
+
+
+def test_delta_without_keyframe_waits_for_next_keyframe(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(telemetry_codec.time, "monotonic", lambda: clock[0])
+    encoder = TelemetryEncoder(keyframe_interval=1.0)
+    encoder.encode({"speed": 1.0})  # Keyframe perdido
+    decoder = _decoder_for(encoder)
+
+    assert decoder.decode(encoder.encode({"speed": 2.0})) is None
+    assert decoder.waiting_keyframe == 1
+
+    clock[0] += 1.0
+    keyframe = encoder.encode({"speed": 3.0})
+    assert encoder.keyframes_sent == 2
+    assert decoder.decode(keyframe) == {"speed": 3.0}
+
+
+def test_lost_delta_waits_for_next_keyframe(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(telemetry_codec.time, "monotonic", lambda: clock[0])
+    encoder = TelemetryEncoder(keyframe_interval=1.0)
+    keyframe = encoder.encode({"a": 1, "b": 1})
+    decoder = _decoder_for(encoder)
+    assert decoder.decode(keyframe) == {"a": 1, "b": 1}
+
+    encoder.encode({"a": 2, "b": 1})  # Delta perdido: só ele carrega "a"
+    assert decoder.decode(encoder.encode({"a": 2, "b": 5})) is None
+    assert decoder.packets_lost == 1
+    assert decoder.waiting_keyframe == 1
+    assert decoder.decode(encoder.encode({"a": 2, "b": 6})) is None
+
+    clock[0] += 1.0
+    assert decoder.decode(encoder.encode({"a": 2, "b": 7})) == {"a": 2, "b": 7}
+    assert decoder.packets_lost == 1
+    assert decoder.packets_decoded == 2
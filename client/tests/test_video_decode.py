@@ -0,0 +1,55 @@
+"""
+test_video_decode.py - Testes do decode JPEG do VideoDisplay
+
+Decode reduzido (escala DCT) em BGR e direto em RGB, sem janela Tk: o
+display é criado sem __init__ e só o fator de redução é fixado.
+
+Roda: python -m pytest client/tests/test_video_decode.py
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from managers.video import VideoDisplay
+
+
+def _jpeg(width=320, height=240):
+    y, x = np.mgrid[0:height, 0:width]
+    image = np.dstack([x % 256, y % 256, (x + y) % 256]).astype(np.uint8)
+    ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 95])
+    assert ok
+    return encoded.tobytes()
+
+
+def _display(factor):
+    display = VideoDisplay.__new__(VideoDisplay)
+    display._jpeg_reduce_factor = lambda: factor
+    display._decode_scale = 1
+    display._last_decode_ms = 0.0
+    display._decode_ms_avg = 0.0
+    return display
+
+
+@pytest.mark.parametrize("factor", [1, 2, 4, 8])
+def test_decode_jpeg_rgb_matches_bgr_at_each_reduce_factor(factor):
+    data = _jpeg()
+    display = _display(factor)
+
+    bgr, bgr_factor = display._decode_jpeg(data, rgb=False)
+    rgb, rgb_factor = display._decode_jpeg(data, rgb=True)
+
+    assert bgr_factor == rgb_factor == factor
+    assert bgr.shape == (240 // factor, 320 // factor, 3)
+    np.testing.assert_array_equal(rgb, bgr[..., ::-1])
+
+
+@pytest.mark.parametrize("factor", [1, 2, 4])
+def test_decode_frame_rgb_returns_frame(factor):
+    display = _display(factor)
+
+    frame = display._decode_frame(_jpeg(), rgb=True)
+
+    assert frame is not None
+    assert display.codec == "MJPEG"
+    assert display._decode_scale == factor
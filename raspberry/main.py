@@ -5,19 +5,21 @@ Integra todos os componentes: câmera, sensores, motor, freios, direção, displ
 
 ARQUITETURA DE THREADS:
 =======================
-├── Thread Câmera (60Hz)      - Captura frames independente
-├── Thread Sensores (100Hz)   - Lê BMI160 em alta taxa
+├── Thread Câmera (60Hz)      - Captura frames independente (aplica ajustes ABR)
+├── Thread Sensores (100Hz)   - Lê BMI160 em alta taxa (ou drena o FIFO a 400-1600Hz)
 ├── Thread Energia (10Hz)     - Monitora Pro Micro (serial) + INA219 (I2C)
 ├── Thread Temperatura (1Hz)  - Lê DS18B20
-├── Thread TX Vídeo (60Hz)    - Transmite frames MJPEG (porta 9999)
-├── Thread TX Sensores (100Hz)- Transmite dados consolidados (porta 9997)
-└── Thread RX Comandos        - Recebe comandos (daemon no NetworkManager, porta 9998)
+├── Thread TX Vídeo (60Hz)    - Transmite frames MJPEG/H.264 (porta 9999)
+├── Thread TX Sensores (100Hz)- Transmite canais de telemetria (porta 9997)
+├── Thread RX Comandos        - Recebe comandos (daemon no NetworkManager, porta 9998)
+└── Thread I2C                - Dona do barramento I2C (I2CBusScheduler)
 
 COMUNICAÇÃO ENTRE THREADS:
 =========================
 - Filas thread-safe (queue.Queue) para dados
 - Variáveis atômicas para estado atual
 - Locks para acesso a recursos compartilhados
+- Transações I2C enfileiradas para a thread do barramento (servos sem espera)
 
 HARDWARE CONECTADO:
 ==================
@@ -78,6 +80,7 @@ from managers import (
     LogLevel,
     MotorManager,
     NetworkManager,
+    PCA9685Output,
     PowerMonitorManager,
     RpiSystemMonitor,
     SteeringManager,
@@ -88,7 +91,16 @@ from managers import (
     init_logger,
     warn,
 )
-from utils import PriorityI2CLock
+from managers.video_abr import AdaptiveBitrateController
+from managers.telemetry_codec import (
+    CHANNEL_ACTUATORS,
+    CHANNEL_IMU,
+    CHANNEL_POWER,
+    CHANNEL_SYSTEM,
+    CHANNEL_TEMPERATURE,
+    SENSOR_FORMAT_CHANNELS,
+)
+from utils import I2CBusScheduler
 
 
 class F1CarMultiThreadSystem:
@@ -101,6 +113,8 @@ class F1CarMultiThreadSystem:
         camera_resolution: tuple = (640, 480),
         camera_fps: int = 60,
         camera_quality: int = 85,
+        camera_codec: str = "mjpeg",
+        keyframe_interval: int = 30,
         camera_sharpness: float = 1.0,
         camera_contrast: float = 1.0,
         camera_saturation: float = 1.0,
@@ -108,6 +122,9 @@ class F1CarMultiThreadSystem:
         sensor_rate: int = 100,
         brake_balance: float = 60.0,
         calibrate_power: bool = False,
+        abr_enabled: bool = True,
+        imu_fifo_odr: Optional[int] = None,
+        imu_int_pin: Optional[int] = None,
     ):
         """
         Inicializa o sistema multi-thread
@@ -117,7 +134,9 @@ class F1CarMultiThreadSystem:
             target_port: Porta UDP de destino
             camera_resolution: Resolução da câmera (largura, altura)
             camera_fps: Taxa de frames da câmera
-            camera_quality: Qualidade MJPEG 1-100
+            camera_quality: Qualidade 1-100 (MJPEG: Q; H.264: fração do bitrate)
+            camera_codec: "mjpeg" ou "h264"
+            keyframe_interval: H.264 - frames entre keyframes (IDR)
             camera_sharpness: Nitidez 0.0-2.0
             camera_contrast: Contraste 0.0-2.0
             camera_saturation: Saturação 0.0-2.0
@@ -125,12 +144,20 @@ class F1CarMultiThreadSystem:
             sensor_rate: Taxa de amostragem dos sensores (Hz)
             brake_balance: Balanço de freio 0-100%
             calibrate_power: Se True, calibra sensores de corrente na inicialização
+            abr_enabled: Se True, ajusta qualidade/resolução/FPS do vídeo pelo
+                VIDEO_FEEDBACK do cliente (configuração inicial = teto)
+            imu_fifo_odr: ODR do FIFO do BMI160 (400/800/1600Hz); a thread de
+                sensores drena o FIFO a sensor_rate (None = leitura direta)
+            imu_int_pin: GPIO (BCM) ligado ao INT1 do BMI160 (None = agendamento
+                por deadline a sensor_rate)
         """
         self.target_ip = target_ip
         self.target_port = target_port
         self.camera_resolution = camera_resolution
         self.camera_fps = camera_fps
         self.camera_quality = camera_quality
+        self.camera_codec = camera_codec
+        self.keyframe_interval = keyframe_interval
         self.camera_sharpness = camera_sharpness
         self.camera_contrast = camera_contrast
         self.camera_saturation = camera_saturation
@@ -138,6 +165,9 @@ class F1CarMultiThreadSystem:
         self.sensor_rate = sensor_rate
         self.brake_balance = brake_balance
         self.calibrate_power = calibrate_power
+        self.abr_enabled = abr_enabled
+        self.imu_fifo_odr = imu_fifo_odr
+        self.imu_int_pin = imu_int_pin
 
         # === GERENCIADORES DE COMPONENTES ===
         self.camera_mgr: Optional[CameraManager] = None
@@ -153,9 +183,26 @@ class F1CarMultiThreadSystem:
         # === REDE ===
         self._client_ip = None
 
-        # === LOCK I2C COM PRIORIDADE (bus 1: BMI160 + PCA9685 + INA219) ===
+        # === VÍDEO ADAPTATIVO ===
+        # Mudanças de qualidade/resolução/FPS ficam pendentes e são aplicadas
+        # pela thread de câmera (reconfigurar fora dela disputa com capture)
+        self.video_abr: Optional[AdaptiveBitrateController] = None
+        self._video_settings_lock = threading.Lock()
+        self._pending_video_settings: Dict[str, Any] = {}
+
+        # === ESCALONADOR I2C (bus 1: BMI160 + PCA9685 + INA219) ===
+        # Uma thread dona do barramento executa as transações submetidas.
         # Prioridade: 0=alta (steering/brake), 1=média (BMI160), 2=baixa (INA219)
-        self.i2c_lock = PriorityI2CLock()
+        self.i2c_scheduler = I2CBusScheduler()
+
+        # Saída PCA9685 compartilhada por direção e freios: os managers só
+        # atualizam o buffer e um flush por comando escreve os canais alterados.
+        # Inicializada pelo primeiro manager que a usar.
+        self.pwm_output = PCA9685Output(
+            address=SteeringManager.PCA9685_I2C_ADDRESS,
+            frequency=SteeringManager.PWM_FREQUENCY,
+            i2c_scheduler=self.i2c_scheduler,
+        )
 
         # === DADOS ATUAIS (thread-safe via locks) ===
         self.current_data_lock = threading.Lock()
@@ -222,6 +269,9 @@ class F1CarMultiThreadSystem:
         success_count = 0
         total_components = 9
 
+        # Thread do barramento I2C antes dos dispositivos I2C
+        self.i2c_scheduler.start()
+
         # 1. Rede (crítico - deve inicializar primeiro)
         debug("Inicializando rede UDP...", "MAIN")
         self.network_mgr = NetworkManager(
@@ -243,6 +293,8 @@ class F1CarMultiThreadSystem:
             resolution=self.camera_resolution,
             frame_rate=self.camera_fps,
             quality=self.camera_quality,
+            codec=self.camera_codec,
+            keyframe_interval=self.keyframe_interval,
             sharpness=self.camera_sharpness,
             contrast=self.camera_contrast,
             saturation=self.camera_saturation,
@@ -252,6 +304,17 @@ class F1CarMultiThreadSystem:
             self.system_status["camera"] = "Online"
             success_count += 1
             debug("Câmera inicializada", "MAIN")
+            self.network_mgr.keyframe_request_callback = self._on_keyframe_request
+
+            if self.abr_enabled:
+                self.video_abr = AdaptiveBitrateController(
+                    resolutions=list(CameraManager.RESOLUTION_PRESETS),
+                    resolution=self.camera_mgr.get_resolution_name(),
+                    frame_rate=self.camera_fps,
+                    quality=self.camera_quality,
+                )
+                self.network_mgr.video_feedback_callback = self._on_video_feedback
+                debug("Controle adaptativo de bitrate ativo", "MAIN")
         else:
             warn("Câmera não inicializada", "MAIN")
 
@@ -261,7 +324,9 @@ class F1CarMultiThreadSystem:
             sample_rate=self.sensor_rate,
             accel_range=BMI160Manager.ACCEL_RANGE_2G,
             gyro_range=BMI160Manager.GYRO_RANGE_250,
-            i2c_lock=self.i2c_lock,
+            i2c_scheduler=self.i2c_scheduler,
+            fifo_odr=self.imu_fifo_odr,
+            int_pin=self.imu_int_pin,
         )
         if self.bmi160_mgr.initialize():
             self.system_status["sensors"] = "Online"
@@ -276,7 +341,8 @@ class F1CarMultiThreadSystem:
             brake_balance=self.brake_balance,
             max_brake_force=100.0,
             response_time=0.1,
-            i2c_lock=self.i2c_lock,
+            i2c_scheduler=self.i2c_scheduler,
+            pwm_output=self.pwm_output,
         )
         if self.brake_mgr.initialize():
             self.system_status["brakes"] = "Online"
@@ -301,7 +367,8 @@ class F1CarMultiThreadSystem:
             steering_sensitivity=1.2,
             max_steering_angle=90.0,
             response_time=0.12,
-            i2c_lock=self.i2c_lock,
+            i2c_scheduler=self.i2c_scheduler,
+            pwm_output=self.pwm_output,
         )
         if self.steering_mgr.initialize():
             self.system_status["steering"] = "Online"
@@ -324,7 +391,7 @@ class F1CarMultiThreadSystem:
 
         # 8. Monitor de energia (Pro Micro USB Serial + INA219 I2C)
         debug("Inicializando monitor de energia...", "MAIN")
-        self.power_mgr = PowerMonitorManager(sample_rate=10, buffer_size=20, i2c_lock=self.i2c_lock)
+        self.power_mgr = PowerMonitorManager(sample_rate=10, buffer_size=20, i2c_scheduler=self.i2c_scheduler)
         if self.power_mgr.initialize():
             self.system_status["power"] = "Online"
             success_count += 1
@@ -365,13 +432,15 @@ class F1CarMultiThreadSystem:
     def _camera_thread_loop(self):
         """Thread dedicada para captura de câmera"""
         debug(f"Thread de câmera iniciada ({self.camera_fps}Hz)", "CAM")
-        interval = 1.0 / self.camera_fps
         SLOW_THRESHOLD = 0.100  # 100ms (capture pode ser mais lento)
 
         while self.running:
             try:
                 t0 = time.monotonic()
 
+                # Mudanças de vídeo pendentes (ABR / comandos do cliente)
+                self._apply_pending_video_settings()
+
                 t_capture = 0
                 t_lock = 0
                 if self.camera_mgr and self.system_status["camera"] == "Online":
@@ -396,7 +465,7 @@ class F1CarMultiThreadSystem:
                         "DIAG",
                     )
 
-                time.sleep(interval)
+                time.sleep(self._video_interval())
 
             except Exception as e:
                 warn(f"Erro na thread de câmera: {e}", "CAM", rate_limit=5.0)
@@ -408,18 +477,31 @@ class F1CarMultiThreadSystem:
         """Thread dedicada para sensores BMI160.
 
         Atualiza current_sensor_data para a thread TX incluir no pacote consolidado.
+
+        Com INT1 ligado (--imu-int-pin) a leitura acontece logo após cada
+        borda de data-ready/watermark, no ritmo do sensor. Sem interrupção,
+        agenda por deadline absoluto (next_tick): o tempo da leitura não
+        atrasa o próximo ciclo.
         """
         debug(f"Thread de sensores iniciada ({self.sensor_rate}Hz)", "BMI160")
         interval = 1.0 / self.sensor_rate
         SLOW_THRESHOLD = 0.050  # 50ms
+        next_tick = time.monotonic()
 
         while self.running:
+            interrupt = False
             try:
                 t0 = time.monotonic()
 
                 t_read = 0
                 t_lock = 0
                 if self.bmi160_mgr and self.system_status["sensors"] == "Online":
+                    interrupt = self.bmi160_mgr.interrupt_enabled
+                    if interrupt:
+                        # Timeout de 2 períodos: lê mesmo se uma borda se perdeu
+                        self.bmi160_mgr.wait_for_interrupt(2 * interval)
+                        t0 = time.monotonic()
+
                     t_read_start = time.monotonic()
                     updated = self.bmi160_mgr.update()
                     t_read = time.monotonic() - t_read_start
@@ -444,12 +526,21 @@ class F1CarMultiThreadSystem:
                         "DIAG",
                     )
 
-                time.sleep(interval)
-
             except Exception as e:
                 warn(f"Erro na thread de sensores: {e}", "BMI160", rate_limit=5.0)
                 time.sleep(0.01)
 
+            if interrupt:
+                next_tick = time.monotonic()
+                continue
+
+            next_tick += interval
+            sleep_time = next_tick - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            else:
+                next_tick = time.monotonic()
+
         debug("Thread de sensores finalizada", "BMI160")
 
     def _power_thread_loop(self):
@@ -515,9 +606,10 @@ class F1CarMultiThreadSystem:
     def _video_tx_thread_loop(self):
         """Thread dedicada para transmissão de vídeo (porta 9999)"""
         debug(f"Thread TX vídeo iniciada ({self.camera_fps}Hz)", "NET-TX")
-        interval = 1.0 / self.camera_fps
         SLOW_THRESHOLD = 0.050  # 50ms
         next_tick = time.monotonic()
+        last_sent = None  # Não reenvia o mesmo frame (FPS reduzido = menos banda)
+        last_seq = None  # H.264: último frame transmitido
 
         while self.running:
             try:
@@ -529,8 +621,21 @@ class F1CarMultiThreadSystem:
                 t_lock = time.monotonic() - t_lock_start
 
                 t_send_start = time.monotonic()
-                if self.network_mgr and self.system_status["network"] == "Online":
+                if self.camera_codec == "h264":
+                    # H.264: todos os frames, em ordem (P-frames dependem dos anteriores)
+                    if self.network_mgr and self.system_status["network"] == "Online":
+                        for frame in self.camera_mgr.get_stream_frames(last_seq):
+                            last_seq = frame["seq"]
+                            if self.network_mgr.send_h264_frame(frame):
+                                with self.stats_lock:
+                                    self.packets_sent += 1
+                elif (
+                    self.network_mgr
+                    and self.system_status["network"] == "Online"
+                    and frame_data is not last_sent
+                ):
                     if self.network_mgr.send_video_frame(frame_data):
+                        last_sent = frame_data
                         with self.stats_lock:
                             self.packets_sent += 1
                 t_send = time.monotonic() - t_send_start
@@ -546,7 +651,7 @@ class F1CarMultiThreadSystem:
             except Exception as e:
                 warn(f"Erro na thread TX vídeo: {e}", "NET-TX", rate_limit=5.0)
 
-            next_tick += interval
+            next_tick += self._video_interval()
             sleep_time = next_tick - time.monotonic()
             if sleep_time > 0:
                 time.sleep(sleep_time)
@@ -555,29 +660,121 @@ class F1CarMultiThreadSystem:
 
         debug("Thread TX vídeo finalizada", "NET-TX")
 
+    def _video_interval(self) -> float:
+        """Intervalo entre frames no FPS atual da câmera (muda com o ABR)"""
+        if self.camera_mgr:
+            return 1.0 / self.camera_mgr.frame_rate
+        return 1.0 / self.camera_fps
+
+    # === VÍDEO ADAPTATIVO ===
+
+    def _request_video_settings(self, **settings):
+        """Agenda mudança de quality/resolution/frame_rate para a thread de câmera"""
+        with self._video_settings_lock:
+            self._pending_video_settings.update(settings)
+
+    def _apply_pending_video_settings(self):
+        """Aplica mudanças de vídeo pendentes (chamado pela thread de câmera)"""
+        with self._video_settings_lock:
+            if not self._pending_video_settings:
+                return
+            settings = self._pending_video_settings
+            self._pending_video_settings = {}
+
+        if not self.camera_mgr or self.system_status["camera"] != "Online":
+            return
+
+        resolution = settings.get("resolution")
+        if resolution and not self.camera_mgr.set_resolution(resolution):
+            warn(f"Falha ao alterar resolução para {resolution}", "CAM")
+        if "quality" in settings:
+            self.camera_mgr.set_quality(settings["quality"])
+        if "frame_rate" in settings:
+            self.camera_mgr.set_frame_rate(settings["frame_rate"])
+
+    def _on_keyframe_request(self, client_ip: str):
+        """Callback do NetworkManager: cliente H.264 pediu um IDR"""
+        if self.camera_mgr and self.camera_mgr.request_keyframe():
+            debug(f"IDR pedido por {client_ip}", "CAM")
+
+    def _on_video_feedback(self, client_ip: str, feedback: Dict[str, float]):
+        """Callback do NetworkManager para cada VIDEO_FEEDBACK recebido"""
+        if self.video_abr is None:
+            return
+        settings = self.video_abr.update(feedback)
+        if settings is None:
+            return
+
+        # Resolução só entra na fila se mudar o preset atual (set_resolution
+        # com a mesma resolução só gera log); descarta também um pedido
+        # pendente para outra resolução, que já não vale
+        resolution = settings.pop("resolution", None)
+        current = self.camera_mgr.get_resolution_name() if self.camera_mgr else None
+        with self._video_settings_lock:
+            if resolution and resolution != current:
+                settings["resolution"] = resolution
+            else:
+                self._pending_video_settings.pop("resolution", None)
+            self._pending_video_settings.update(settings)
+
+        info(
+            f"ABR: Q={settings['quality']} {settings.get('resolution', '')} "
+            f"{settings['frame_rate']}fps (loss={feedback.get('loss', 0.0):.1%}, "
+            f"jitter={feedback.get('jitter_ms', 0.0):.0f}ms, "
+            f"decode={feedback.get('decode_ms', 0.0):.0f}ms)",
+            "ABR",
+        )
+
     def _sensor_tx_thread_loop(self):
-        """Thread dedicada para transmissão de sensores (porta 9997)"""
+        """
+        Thread dedicada para transmissão de sensores (porta 9997)
+
+        Clientes CHN1 recebem um canal por fonte, cada um na sua taxa:
+        IMU a cada tick, energia/temperatura/sistema quando a thread de
+        aquisição publica um dict novo, atuadores quando o status muda (com
+        reenvio a cada ACTUATOR_HEARTBEAT). O pacote consolidado só é montado
+        se algum cliente usa outro formato (JSON/BIN1/DLT1).
+        """
         debug(f"Thread TX sensores iniciada ({self.sensor_rate}Hz)", "NET-TX")
         interval = 1.0 / self.sensor_rate
         last_stats_time = time.time()
         last_connect_ping = time.time()
         SLOW_THRESHOLD = 0.050  # 50ms
+        ACTUATOR_HEARTBEAT = 1.0  # Reenvio do canal de atuadores sem mudança
         next_tick = time.monotonic()
 
+        # Grupos lentos (temperatura 1Hz, energia 10Hz, sistema 1Hz): só são
+        # publicados/mesclados quando alguma thread publica um dict novo
+        slow_refs = (None, None, None)
+        channel_refs = (None, None, None)
+        slow_data = {}
+        status_snapshot = {}
+        status_changed = False
+        last_actuators = None
+        last_actuator_send = 0.0
+
         while self.running:
             try:
                 t0 = time.monotonic()
                 current_time = time.time()
 
                 # === COLETA DADOS ATUAIS ===
+                # As threads de aquisição sempre publicam dicts novos (nunca
+                # alteram o dict publicado), então basta copiar as referências
                 t_lock_start = time.monotonic()
                 with self.current_data_lock:
-                    sensor_data = self.current_sensor_data.copy()
-                    power_data = self.current_power_data.copy()
-                    temp_data = self.current_temp_data.copy()
-                    rpi_sys_data = self.current_rpi_sys_data.copy()
+                    sensor_data = self.current_sensor_data
+                    refs = (
+                        self.current_temp_data,
+                        self.current_power_data,
+                        self.current_rpi_sys_data,
+                    )
                 t_lock = time.monotonic() - t_lock_start
 
+                if self.system_status != status_snapshot:
+                    status_snapshot = self.system_status.copy()
+                    status_changed = True
+
                 # Atualiza status dos atuadores (não bloqueante)
                 t_status_start = time.monotonic()
                 motor_status = {}
@@ -593,19 +790,13 @@ class F1CarMultiThreadSystem:
                     steering_status = self.steering_mgr.get_steering_status()
                 t_status = time.monotonic() - t_status_start
 
-                # === CONSOLIDA E TRANSMITE ===
-                t_consolidate = time.monotonic()
-                consolidated_data = {
-                    **sensor_data,
-                    **motor_status,
-                    **brake_status,
-                    **steering_status,
-                    **temp_data,
-                    **power_data,
-                    **rpi_sys_data,
-                    "system_status": self.system_status.copy(),
+                sensor_formats = set()
+                if self.network_mgr and self.system_status["network"] == "Online":
+                    sensor_formats = self.network_mgr.get_sensor_formats()
+
+                # Timings internos (ms) para diagnóstico no client
+                tick_meta = {
                     "system_uptime": current_time - self.start_time,
-                    # Timings internos (ms) para diagnóstico no client
                     "timing_lock_ms": round(t_lock * 1000, 2),
                     "timing_status_ms": round(t_status * 1000, 2),
                     "timing_state_cmd_ms": self._last_state_cmd_ms,
@@ -613,7 +804,56 @@ class F1CarMultiThreadSystem:
                 }
 
                 t_send_start = time.monotonic()
-                if self.network_mgr and self.system_status["network"] == "Online":
+
+                # === CANAIS (CHN1) ===
+                if SENSOR_FORMAT_CHANNELS in sensor_formats:
+                    send_channel = self.network_mgr.send_channel_data
+                    send_channel(
+                        CHANNEL_IMU, {"timestamp": current_time, **sensor_data, **tick_meta}
+                    )
+
+                    temp_data, power_data, rpi_sys_data = refs
+                    if power_data and power_data is not channel_refs[1]:
+                        send_channel(CHANNEL_POWER, power_data)
+                    if temp_data and temp_data is not channel_refs[0]:
+                        send_channel(CHANNEL_TEMPERATURE, temp_data)
+                    if rpi_sys_data is not channel_refs[2] or status_changed:
+                        send_channel(
+                            CHANNEL_SYSTEM,
+                            {**rpi_sys_data, "system_status": status_snapshot},
+                        )
+                    channel_refs = refs
+                    status_changed = False
+
+                    # Atuadores: "timestamp" do motor muda a cada chamada e
+                    # não conta como mudança
+                    actuators = {**motor_status, **brake_status, **steering_status}
+                    actuator_ts = actuators.pop("timestamp", current_time)
+                    if (
+                        actuators != last_actuators
+                        or current_time - last_actuator_send >= ACTUATOR_HEARTBEAT
+                    ):
+                        last_actuators = actuators.copy()
+                        last_actuator_send = current_time
+                        actuators["timestamp"] = actuator_ts
+                        send_channel(CHANNEL_ACTUATORS, actuators)
+
+                # === CONSOLIDADO (JSON/BIN1/DLT1) ===
+                if sensor_formats - {SENSOR_FORMAT_CHANNELS}:
+                    if any(new is not old for new, old in zip(refs, slow_refs)):
+                        slow_refs = refs
+                        temp_data, power_data, rpi_sys_data = refs
+                        slow_data = {**temp_data, **power_data, **rpi_sys_data}
+
+                    consolidated_data = {
+                        **sensor_data,
+                        **motor_status,
+                        **brake_status,
+                        **steering_status,
+                        **slow_data,
+                        "system_status": status_snapshot,
+                        **tick_meta,
+                    }
                     self.network_mgr.send_sensor_data(consolidated_data)
                 t_send = time.monotonic() - t_send_start
 
@@ -673,20 +913,22 @@ class F1CarMultiThreadSystem:
                         throttle = float(parts[1])
                         brake = float(parts[2])
                         if self.steering_mgr:
-                            self.steering_mgr.set_steering_input(steering)
+                            self.steering_mgr.set_steering_input(steering, flush=False)
                         if self.motor_mgr:
                             with self.motor_mgr.state_lock:
                                 self.motor_mgr.brake_input = brake
                             self.motor_mgr.set_throttle(throttle)
                         if self.brake_mgr:
-                            self.brake_mgr.apply_brake(brake)
+                            self.brake_mgr.apply_brake(brake, flush=False)
+                        # Direção + 2 freios em uma única escrita em bloco
+                        self.pwm_output.request_flush()
                         t_state = time.monotonic() - t0
                         # Salva timing do último STATE para incluir no pacote TX
                         self._last_state_cmd_ms = round(t_state * 1000, 2)
                         if t_state > 0.050:
                             warn(
                                 f"[DIAG] STATE CMD LENTO: {t_state*1000:.0f}ms "
-                                f"(steering+motor+brake com I2C lock)",
+                                f"(steering+motor+brake)",
                                 "DIAG",
                             )
                     else:
@@ -730,19 +972,24 @@ class F1CarMultiThreadSystem:
                             info(f"Marcha: {self.motor_mgr.current_gear}", "CMD")
 
                 elif control_cmd.startswith("CAMERA_QUALITY:"):
-                    quality = int(control_cmd[15:])
+                    quality = max(1, min(100, int(control_cmd[15:])))
                     if self.camera_mgr:
-                        # TODO: recriação do encoder necessária para efetivar mudança
-                        self.camera_mgr.quality = max(1, min(100, quality))
-                        info(f"Qualidade MJPEG: {quality} (requer restart do encoder)", "CMD")
+                        # Ajuste manual vira o teto do ABR
+                        if self.video_abr:
+                            self.video_abr.set_ceiling(quality=quality)
+                        self._request_video_settings(quality=quality)
+                        info(f"Qualidade de vídeo: {quality}", "CMD")
 
                 elif control_cmd.startswith("CAMERA_RESOLUTION:"):
                     resolution = control_cmd[18:].strip()
                     if self.camera_mgr:
-                        if self.camera_mgr.set_resolution(resolution):
+                        if resolution in CameraManager.RESOLUTION_PRESETS:
+                            if self.video_abr:
+                                self.video_abr.set_ceiling(resolution=resolution)
+                            self._request_video_settings(resolution=resolution)
                             info(f"Resolução da câmera: {resolution}", "CMD")
                         else:
-                            warn(f"Falha ao alterar resolução para {resolution}", "CMD")
+                            warn(f"Resolução desconhecida: {resolution}", "CMD")
 
                 elif control_cmd.startswith("CAMERA_CONTROLS:"):
                     # Formato: CAMERA_CONTROLS:sharpness:contrast:saturation:brightness
@@ -899,6 +1146,10 @@ class F1CarMultiThreadSystem:
                 except Exception as e:
                     warn(f"Erro ao parar {name}: {e}", "STOP")
 
+        # Depois dos componentes: executa as escritas finais (servos soltos/centrados)
+        self.i2c_scheduler.stop()
+        self.pwm_output.cleanup()
+
         info("Sistema parado com sucesso", "MAIN")
 
 
@@ -912,6 +1163,7 @@ Exemplos de uso:
   python3 main.py                                    # Padrão (480p@60fps)
   python3 main.py --resolution 720p --fps 60        # HD 720p a 60fps
   python3 main.py --quality 95 --sharpness 1.5      # Alta qualidade + nitidez
+  python3 main.py --resolution 720p --codec h264    # H.264 (5-10x menos banda)
   python3 main.py --debug                            # Modo verbose
 
 Presets de resolução:
@@ -937,7 +1189,20 @@ Presets de resolução:
         "--fps", type=int, default=60, help="FPS da câmera (default: 60)"
     )
     parser.add_argument(
-        "--quality", type=int, default=85, help="Qualidade MJPEG 1-100 (default: 85)"
+        "--quality", type=int, default=85, help="Qualidade 1-100 (MJPEG: Q, H.264: bitrate) (default: 85)"
+    )
+    parser.add_argument(
+        "--codec",
+        type=str,
+        choices=["mjpeg", "h264"],
+        default="mjpeg",
+        help="Codec de vídeo (default: mjpeg; h264 requer PyAV no cliente)",
+    )
+    parser.add_argument(
+        "--keyframe-interval",
+        type=int,
+        default=30,
+        help="H.264: frames entre keyframes (default: 30)",
     )
     parser.add_argument(
         "--sharpness", type=float, default=1.0, help="Nitidez 0.0-2.0 (default: 1.0)"
@@ -968,6 +1233,26 @@ Presets de resolução:
         action="store_true",
         help="Calibra sensores de corrente ACS758 (desligar cargas primeiro!)",
     )
+    parser.add_argument(
+        "--no-abr",
+        action="store_true",
+        help="Desativa o ajuste adaptativo de qualidade/resolução/FPS do vídeo",
+    )
+    parser.add_argument(
+        "--imu-fifo-odr",
+        type=int,
+        choices=[400, 800, 1600],
+        default=None,
+        help="Modo FIFO do BMI160 nesse ODR (Hz), drenado a --sensor-rate "
+        "(default: leitura direta dos registradores)",
+    )
+    parser.add_argument(
+        "--imu-int-pin",
+        type=int,
+        default=None,
+        help="GPIO (BCM) ligado ao INT1 do BMI160, ex: 17 "
+        "(default: sem interrupção, agendamento por deadline)",
+    )
 
     return parser
 
@@ -1003,8 +1288,16 @@ def main():
         error("Taxa de sensores deve estar entre 10 e 1000 Hz", "CONFIG")
         sys.exit(1)
 
+    if args.keyframe_interval < 1:
+        error("Intervalo de keyframe deve ser >= 1", "CONFIG")
+        sys.exit(1)
+
     # Log configuração de câmera
-    info(f"Câmera: {args.resolution} @ {args.fps}fps, qualidade={args.quality}", "CONFIG")
+    info(
+        f"Câmera: {args.resolution} @ {args.fps}fps, {args.codec.upper()}, "
+        f"qualidade={args.quality}",
+        "CONFIG",
+    )
 
     # Cria e inicia sistema
     system = F1CarMultiThreadSystem(
@@ -1013,6 +1306,8 @@ def main():
         camera_resolution=resolution,
         camera_fps=args.fps,
         camera_quality=args.quality,
+        camera_codec=args.codec,
+        keyframe_interval=args.keyframe_interval,
         camera_sharpness=args.sharpness,
         camera_contrast=args.contrast,
         camera_saturation=args.saturation,
@@ -1020,6 +1315,9 @@ def main():
         sensor_rate=args.sensor_rate,
         brake_balance=args.brake_balance,
         calibrate_power=args.calibrate_power,
+        abr_enabled=not args.no_abr,
+        imu_fifo_odr=args.imu_fifo_odr,
+        imu_int_pin=args.imu_int_pin,
     )
 
     try:
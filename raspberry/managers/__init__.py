@@ -4,6 +4,7 @@ from managers.camera import CameraManager
 from managers.logger import LogLevel, debug, error, info, init_logger, warn
 from managers.motor import MotorManager
 from managers.network import NetworkManager
+from managers.pca9685_output import PCA9685Output
 from managers.power_monitor import PowerMonitorManager
 from managers.rpi_system import RpiSystemMonitor
 from managers.steering import SteeringManager
@@ -67,11 +67,48 @@ REGISTRADORES IMPORTANTES (conforme datasheet):
   0x7E - CMD (comandos de controle)
   0x12-0x17 - ACCEL_DATA (6 bytes: X_LSB, X_MSB, Y_LSB, Y_MSB, Z_LSB, Z_MSB)
   0x0C-0x11 - GYRO_DATA (6 bytes: X_LSB, X_MSB, Y_LSB, Y_MSB, Z_LSB, Z_MSB)
+
+LEITURA EM BURST:
+================
+  GYRO_DATA e ACCEL_DATA são contíguos (0x0C-0x17): uma única transação
+  de 12 bytes lê os dois (gyro X/Y/Z, accel X/Y/Z), decodificados com um
+  struct.unpack("<6h") — metade da ocupação do barramento por amostra.
+
+MODO FIFO (fifo_odr = 400, 800 ou 1600 Hz):
+==========================================
+  O sensor amostra no ODR alto e guarda frames com header (accel + gyro,
+  13 bytes) no FIFO interno de 1024 bytes (~48ms a 1600Hz). Cada update()
+  (a cada 10-20ms, sensor_rate 50-100Hz) drena o FIFO em uma leitura em
+  bloco (i2c_rdwr, sem o limite de 32 bytes do SMBus):
+
+  0x22-0x23 - FIFO_LENGTH (bytes no FIFO, 11 bits)
+  0x24      - FIFO_DATA   (leitura em bloco não incrementa o endereço)
+  0x46/0x47 - FIFO_CONFIG_0/1 (watermark / header, accel, gyro, sensortime)
+  0x18-0x1A - SENSORTIME (24 bits, 39.0625µs por LSB)
+
+  Após o último frame o FIFO entrega um frame de sensortime: os timestamps
+  de cada amostra saem dele (espaçados de 1/ODR) e são convertidos para o
+  relógio do RPi. get_sensor_data() publica a média do lote (decimação
+  para sensor_rate) + RMS de vibração; get_fifo_samples() devolve as
+  amostras em alta taxa.
+
+MODO INTERRUPÇÃO (int_pin = GPIO BCM ligado ao INT1):
+====================================================
+  INT1 -> GPIO17 (Pin 11) sugerido [push-pull, ativo em HIGH]
+  O GY-BMI160 de 7 pinos não expõe INT1; só em módulos com o pino INT1.
+
+  - Leitura direta: interrupção data-ready (uma borda por amostra no ODR)
+  - Modo FIFO: interrupção de watermark (lote de ODR/sample_rate frames)
+  A thread de sensores espera a borda (wait_for_interrupt) e lê logo em
+  seguida, alinhada ao ODR do sensor. Sem bordas por INT_TIMEOUT_LIMIT
+  esperas seguidas (pino não ligado), volta ao agendamento por deadline.
 """
 
+import struct
 import threading
 import time
 
+import numpy as np
 import smbus2
 
 from managers.logger import debug, error, info, warn
@@ -98,6 +135,23 @@ class BMI160Manager:
     REG_ACCEL_DATA = 0x12  # 6 bytes: X_LSB, X_MSB, Y_LSB, Y_MSB, Z_LSB, Z_MSB
     REG_GYRO_DATA = 0x0C  # 6 bytes: X_LSB, X_MSB, Y_LSB, Y_MSB, Z_LSB, Z_MSB
 
+    # Burst gyro + accel (0x0C-0x17): GX, GY, GZ, AX, AY, AZ (int16 LE)
+    DATA_BURST_LEN = 12
+    DATA_BURST = struct.Struct("<6h")
+
+    # FIFO
+    REG_SENSORTIME = 0x18  # 3 bytes (24 bits)
+    REG_FIFO_LENGTH = 0x22  # 2 bytes: fifo_byte_counter[10:0]
+    REG_FIFO_DATA = 0x24
+    REG_FIFO_CONFIG_0 = 0x46  # Watermark (unidades de 4 bytes)
+    REG_FIFO_CONFIG_1 = 0x47
+
+    # Interrupções
+    REG_INT_EN_1 = 0x51  # bit4 = data-ready, bit6 = FIFO watermark
+    REG_INT_OUT_CTRL = 0x53  # Pino INT1: edge, nível, open-drain, saída
+    REG_INT_LATCH = 0x54  # 0 = não travada
+    REG_INT_MAP_1 = 0x56  # bit7 = drdy -> INT1, bit6 = fwm -> INT1
+
     # Chip ID esperado
     CHIP_ID_BMI160 = 0xD1
 
@@ -130,6 +184,35 @@ class BMI160Manager:
     CMD_ACC_SET_PMU_MODE = 0x11  # Acelerômetro para modo normal
     CMD_GYR_SET_PMU_MODE = 0x15  # Giroscópio para modo normal
     CMD_FOC_ENABLE = 0x03  # Fast Offset Compensation
+    CMD_FIFO_FLUSH = 0xB0  # Esvazia o FIFO
+
+    # ===== FIFO (registrador 0x47 e headers dos frames) =====
+    FIFO_GYR_EN = 0x80
+    FIFO_ACC_EN = 0x40
+    FIFO_HEADER_EN = 0x10
+    FIFO_TIME_EN = 0x02
+    FIFO_SIZE = 1024  # bytes
+
+    FIFO_HEAD_ACC_GYR = 0x8C  # Frame regular: gyro + accel (12 bytes)
+    FIFO_HEAD_SKIP = 0x40  # Frames descartados por overflow (1 byte)
+    FIFO_HEAD_SENSORTIME = 0x44  # Sensortime do último frame (3 bytes)
+    FIFO_HEAD_CONFIG = 0x48  # Mudança de configuração (1 byte)
+    FIFO_HEAD_OVER_READ = 0x80  # Leitura além do fim do FIFO
+
+    SENSORTIME_RESOLUTION = 39.0625e-6  # s por LSB
+    SENSORTIME_WRAP = 1 << 24
+
+    # ODRs aceitos no modo FIFO (Hz -> valor do registrador)
+    FIFO_ODRS = {400: ODR_400HZ, 800: ODR_800HZ, 1600: ODR_1600HZ}
+
+    # Lotes mantidos para get_fifo_samples() (~1-2s)
+    FIFO_HISTORY_BATCHES = 100
+
+    # ===== INTERRUPÇÕES =====
+    INT_DRDY = 0x10  # INT_EN_1 / INT_MAP_1 (<< 3): data-ready
+    INT_FWM = 0x40  # INT_EN_1 / INT_MAP_1 (<< 0): FIFO watermark
+    INT1_OUT_CONFIG = 0x0B  # Saída habilitada, push-pull, ativo HIGH, edge
+    INT_TIMEOUT_LIMIT = 50  # Esperas sem borda antes de desistir do pino
 
     # ===== FATORES DE CONVERSÃO =====
     ACCEL_SCALE_FACTORS = {
@@ -153,7 +236,9 @@ class BMI160Manager:
         accel_range=None,  # Será ACCEL_RANGE_2G por padrão
         gyro_range=None,  # Será GYRO_RANGE_250 por padrão
         i2c_address=None,  # Será I2C_ADDRESS_LOW por padrão
-        i2c_lock=None,  # Lock compartilhado do bus I2C
+        i2c_scheduler=None,  # Escalonador compartilhado do bus I2C
+        fifo_odr=None,  # ODR do modo FIFO (None = leitura direta dos registradores)
+        int_pin=None,  # GPIO (BCM) ligado ao INT1 (None = sem interrupção)
     ):
         """
         Inicializa o gerenciador do BMI160
@@ -163,9 +248,14 @@ class BMI160Manager:
             accel_range (int): Range do acelerômetro (usar constantes ACCEL_RANGE_*)
             gyro_range (int): Range do giroscópio (usar constantes GYRO_RANGE_*)
             i2c_address (int): Endereço I2C do sensor
-            i2c_lock: threading.Lock compartilhado entre dispositivos I2C
+            i2c_scheduler: I2CBusScheduler compartilhado entre dispositivos I2C
+            fifo_odr (int): Se definido (400, 800 ou 1600 Hz), ativa o modo FIFO
+                com o sensor nesse ODR; sample_rate passa a ser a taxa de
+                drenagem/publicação
+            int_pin (int): GPIO (BCM) ligado ao INT1 do sensor; ativa a
+                leitura por interrupção (data-ready ou FIFO watermark)
         """
-        self.i2c_lock = i2c_lock
+        self.i2c_scheduler = i2c_scheduler
         # Valores padrão recomendados para veículos (melhor dinâmica)
         self.accel_range = (
             accel_range if accel_range is not None else self.ACCEL_RANGE_4G
@@ -180,8 +270,15 @@ class BMI160Manager:
         # Lock para thread-safety (acesso concorrente por threads de sensores e TX)
         self.state_lock = threading.Lock()
 
-        # Mapear sample_rate para ODR
-        self.odr_value = self._get_odr_value(sample_rate)
+        # Modo FIFO: ODR alto no sensor, drenado em lotes a sample_rate
+        self.fifo_mode = fifo_odr is not None
+        if self.fifo_mode:
+            self.fifo_odr = min(self.FIFO_ODRS, key=lambda hz: abs(hz - fifo_odr))
+            self.odr_value = self.FIFO_ODRS[self.fifo_odr]
+        else:
+            self.fifo_odr = None
+            # Mapear sample_rate para ODR
+            self.odr_value = self._get_odr_value(sample_rate)
 
         # Fatores de escala baseados nos ranges selecionados
         self.accel_scale = self.ACCEL_SCALE_FACTORS[self.accel_range]
@@ -222,8 +319,7 @@ class BMI160Manager:
         self.readings_count = 0
 
         # Cache de últimos dados válidos (fallback se leitura falhar)
-        self._last_accel_data = [0, 0, 0, 0, 0, 0]
-        self._last_gyro_data = [0, 0, 0, 0, 0, 0]
+        self._last_data = [0] * self.DATA_BURST_LEN
 
         # Watchdog: detecta zeros consecutivos (brown-out recovery)
         self._consecutive_zeros = 0
@@ -233,6 +329,23 @@ class BMI160Manager:
         self._error_count = 0
         self._debug_counter = 0
 
+        # Estado do modo FIFO
+        self._fifo_batches = []  # [(timestamps, raw int16 (n, 6))]
+        self._sensortime_last = None  # Último sensortime lido (24 bits)
+        self._sensortime_wraps = 0
+        self._time_offset = None  # time.time() - sensortime (s)
+        self.fifo_samples = 0  # Amostras no último lote
+        self.fifo_dropped = 0  # Frames perdidos por overflow
+        self.accel_vib_rms = 0.0  # RMS da vibração no último lote (m/s²)
+        self.sample_time = time.time()  # Instante médio do último lote
+
+        # Interrupção INT1 -> GPIO (borda sinaliza _interrupt_event)
+        self.int_pin = int_pin
+        self.interrupt_enabled = False
+        self._interrupt_event = threading.Event()
+        self._interrupt_timeouts = 0
+        self._gpio = None
+
     def _get_odr_value(self, sample_rate):
         """Converte sample_rate para valor ODR do registrador"""
         if sample_rate <= 25:
@@ -250,18 +363,19 @@ class BMI160Manager:
         else:
             return self.ODR_1600HZ
 
+    def _i2c_call(self, fn, *args):
+        """Executa uma transação no barramento (prioridade média) e espera"""
+        if self.i2c_scheduler:
+            return self.i2c_scheduler.call(fn, *args, priority=1)
+        return fn(*args)
+
     def _write_register(self, reg, value):
         """Escreve valor em registrador via I2C (prioridade média)"""
         try:
             if self.i2c_bus:
-                if self.i2c_lock:
-                    self.i2c_lock.acquire(priority=1)
-                try:
-                    self.i2c_bus.write_byte_data(self.i2c_address, reg, value)
-                    time.sleep(0.001)  # 1ms (datasheet: 2µs normal mode)
-                finally:
-                    if self.i2c_lock:
-                        self.i2c_lock.release()
+                self._i2c_call(self.i2c_bus.write_byte_data, self.i2c_address, reg, value)
+                # Espera fora da transação: não segura o barramento
+                time.sleep(0.001)  # 1ms (datasheet: 2µs normal mode)
             else:
                 warn("I2C bus não inicializado", "BMI160")
                 return False
@@ -275,13 +389,7 @@ class BMI160Manager:
         """Lê valor de registrador via I2C (prioridade média)"""
         try:
             if self.i2c_bus:
-                if self.i2c_lock:
-                    self.i2c_lock.acquire(priority=1)
-                try:
-                    return self.i2c_bus.read_byte_data(self.i2c_address, reg)
-                finally:
-                    if self.i2c_lock:
-                        self.i2c_lock.release()
+                return self._i2c_call(self.i2c_bus.read_byte_data, self.i2c_address, reg)
             else:
                 warn("I2C bus não inicializado", "BMI160")
                 return None
@@ -298,15 +406,10 @@ class BMI160Manager:
 
         for attempt in range(3):
             try:
-                if self.i2c_lock:
-                    self.i2c_lock.acquire(priority=1)
-                try:
-                    return self.i2c_bus.read_i2c_block_data(
-                        self.i2c_address, start_reg, num_bytes
-                    )
-                finally:
-                    if self.i2c_lock:
-                        self.i2c_lock.release()
+                return self._i2c_call(
+                    self.i2c_bus.read_i2c_block_data,
+                    self.i2c_address, start_reg, num_bytes,
+                )
 
             except OSError as e:
                 if e.errno == 5:  # Input/output error
@@ -335,6 +438,140 @@ class BMI160Manager:
         # Não deveria chegar aqui, mas por segurança
         return [0] * num_bytes
 
+    def _read_fifo_block(self):
+        """
+        Lê todo o conteúdo do FIFO (prioridade média, uma única transação).
+
+        FIFO_LENGTH e FIFO_DATA em sequência; lê 4 bytes além do
+        preenchimento para receber o frame de sensortime.
+
+        Returns:
+            bytes: Dados brutos do FIFO (vazio se não há frames), ou None
+        """
+        if not self.i2c_bus:
+            warn("I2C bus não inicializado", "BMI160")
+            return None
+
+        try:
+            return self._i2c_call(self._drain_fifo)
+
+        except Exception as e:
+            self._error_count += 1
+            if self._error_count >= 1000:
+                self._error_count = 0
+            if self._error_count % 50 == 0:
+                warn(f"Erro I2C ao ler FIFO (erro #{self._error_count}): {e}", "BMI160")
+            return None
+
+    def _drain_fifo(self):
+        """FIFO_LENGTH + leitura em bloco de FIFO_DATA (na thread do barramento)"""
+        length = self.i2c_bus.read_i2c_block_data(
+            self.i2c_address, self.REG_FIFO_LENGTH, 2
+        )
+        length = ((length[1] & 0x07) << 8) | length[0]
+        if length == 0:
+            return b""
+        write = smbus2.i2c_msg.write(self.i2c_address, [self.REG_FIFO_DATA])
+        read = smbus2.i2c_msg.read(self.i2c_address, length + 4)
+        self.i2c_bus.i2c_rdwr(write, read)
+        return bytes(read)
+
+    def _configure_fifo(self):
+        """Ativa FIFO com header (accel + gyro + sensortime) e esvazia"""
+        config = (
+            self.FIFO_GYR_EN | self.FIFO_ACC_EN | self.FIFO_HEADER_EN | self.FIFO_TIME_EN
+        )
+        if not self._write_register(self.REG_FIFO_CONFIG_1, config):
+            return False
+        if not self._write_register(self.REG_CMD, self.CMD_FIFO_FLUSH):
+            return False
+        self._sensortime_last = None
+        self._sensortime_wraps = 0
+        self._time_offset = None  # Soft reset zera o sensortime
+        return True
+
+    def _configure_interrupt(self):
+        """Mapeia data-ready (ou FIFO watermark no modo FIFO) para o INT1"""
+        if self.fifo_mode:
+            # Watermark = frames de um período de sample_rate (4 bytes/unidade)
+            frames = max(1, round(self.fifo_odr / self.sample_rate))
+            watermark = min(-(-frames * 13 // 4), self.FIFO_SIZE // 4 - 1)
+            if not self._write_register(self.REG_FIFO_CONFIG_0, watermark):
+                return False
+            source = self.INT_FWM
+            int_map = self.INT_FWM
+        else:
+            source = self.INT_DRDY
+            int_map = self.INT_DRDY << 3
+
+        return (
+            self._write_register(self.REG_INT_OUT_CTRL, self.INT1_OUT_CONFIG)
+            and self._write_register(self.REG_INT_LATCH, 0x00)
+            and self._write_register(self.REG_INT_MAP_1, int_map)
+            and self._write_register(self.REG_INT_EN_1, source)
+        )
+
+    def _setup_interrupt_pin(self):
+        """Detecção de borda de subida no GPIO do INT1 (RPi.GPIO)"""
+        try:
+            import RPi.GPIO as GPIO
+
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setwarnings(False)
+            GPIO.setup(self.int_pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+            GPIO.add_event_detect(
+                self.int_pin, GPIO.RISING, callback=self._on_interrupt
+            )
+            self._gpio = GPIO
+            return True
+
+        except Exception as e:
+            warn(f"GPIO{self.int_pin} indisponível para INT1: {e}", "BMI160")
+            return False
+
+    def _on_interrupt(self, channel):
+        """Callback do RPi.GPIO (thread de eventos): dados novos no sensor"""
+        self._interrupt_event.set()
+
+    def wait_for_interrupt(self, timeout):
+        """
+        Espera a próxima borda do INT1.
+
+        Args:
+            timeout (float): Espera máxima (s)
+
+        Returns:
+            bool: True se houve borda; False no timeout (após
+                INT_TIMEOUT_LIMIT timeouts seguidos o modo é desativado)
+        """
+        fired = self._interrupt_event.wait(timeout)
+        # Limpa antes da leitura: borda durante a leitura vale para a próxima
+        self._interrupt_event.clear()
+
+        if fired:
+            self._interrupt_timeouts = 0
+            return True
+
+        self._interrupt_timeouts += 1
+        if self._interrupt_timeouts >= self.INT_TIMEOUT_LIMIT:
+            warn(
+                f"Sem bordas no GPIO{self.int_pin} - INT1 desativado, usando deadline",
+                "BMI160",
+            )
+            self._release_interrupt_pin()
+        return False
+
+    def _release_interrupt_pin(self):
+        """Desliga a detecção de borda (volta ao agendamento por deadline)"""
+        self.interrupt_enabled = False
+        if self._gpio:
+            try:
+                self._gpio.remove_event_detect(self.int_pin)
+                self._gpio.cleanup(self.int_pin)
+            except Exception:
+                pass
+            self._gpio = None
+
     def initialize(self):
         """
         Inicializa o sensor BMI160 conforme sequência do datasheet
@@ -422,17 +659,34 @@ class BMI160Manager:
             # 9. Aguardar estabilização final
             time.sleep(0.1)
 
+            # 9b. Modo FIFO: frames com header (accel + gyro + sensortime)
+            if self.fifo_mode and not self._configure_fifo():
+                error("Falha ao configurar FIFO", "BMI160")
+                return False
+
+            # 9c. Interrupção INT1 -> GPIO (opcional)
+            if self.int_pin is not None:
+                if self._configure_interrupt() and self._setup_interrupt_pin():
+                    self.interrupt_enabled = True
+                    self._interrupt_timeouts = 0
+                else:
+                    warn("Interrupção INT1 não configurada - usando deadline", "BMI160")
+
             # 10. Teste de leitura para verificar se funciona
-            test_accel = self._read_sensor_registers(self.REG_ACCEL_DATA, 6)
-            test_gyro = self._read_sensor_registers(self.REG_GYRO_DATA, 6)
-            if test_accel is None or test_gyro is None:
+            test_data = self._read_sensor_registers(
+                self.REG_GYRO_DATA, self.DATA_BURST_LEN
+            )
+            if test_data is None:
                 error("Falha no teste de leitura - sensor não responde", "BMI160")
                 return False
 
             self.is_initialized = True
+            mode = f"FIFO {self.fifo_odr}Hz" if self.fifo_mode else "registradores"
+            if self.interrupt_enabled:
+                mode += f", INT1 -> GPIO{self.int_pin}"
             info(
                 f"BMI160 inicializado | Accel: ±{self._get_accel_range_g()}g | "
-                f"Gyro: ±{self._get_gyro_range_dps()}°/s | {self.sample_rate}Hz",
+                f"Gyro: ±{self._get_gyro_range_dps()}°/s | {self.sample_rate}Hz ({mode})",
                 "BMI160",
             )
             return True
@@ -504,6 +758,8 @@ class BMI160Manager:
             test = self._read_sensor_registers(self.REG_ACCEL_DATA, 6)
             if test and any(b != 0 for b in test):
                 info("BMI160: PMU re-ativado com sucesso", "BMI160")
+                if self.fifo_mode:
+                    self._configure_fifo()
                 self._consecutive_zeros = 0
                 return True
             else:
@@ -519,6 +775,10 @@ class BMI160Manager:
                 self._write_register(self.REG_GYR_RANGE, self.gyro_range)
                 self._write_register(self.REG_GYR_CONF, gyr_conf)
                 time.sleep(0.010)
+                if self.fifo_mode:
+                    self._configure_fifo()  # Soft reset limpa a config do FIFO
+                if self.interrupt_enabled:
+                    self._configure_interrupt()
                 self._consecutive_zeros = 0
                 info("BMI160: soft reset completo", "BMI160")
                 return True
@@ -533,23 +793,15 @@ class BMI160Manager:
             return False
 
         try:
-            # Ler dados do acelerômetro (6 bytes a partir do 0x12)
-            accel_data = self._read_sensor_registers(self.REG_ACCEL_DATA, 6)
-            if accel_data is None:
-                accel_data = self._last_accel_data
+            # Burst de 12 bytes a partir do 0x0C: gyro (0x0C-0x11) + accel (0x12-0x17)
+            data = self._read_sensor_registers(self.REG_GYRO_DATA, self.DATA_BURST_LEN)
+            if data is None:
+                data = self._last_data
             else:
-                self._last_accel_data = list(accel_data)
-
-            # Ler dados do giroscópio (6 bytes a partir do 0x0C)
-            gyro_data = self._read_sensor_registers(self.REG_GYRO_DATA, 6)
-            if gyro_data is None:
-                gyro_data = self._last_gyro_data
-            else:
-                self._last_gyro_data = list(gyro_data)
+                self._last_data = data
 
             # Watchdog: detecta brown-out (todos bytes zero = sensor em suspend)
-            all_zero = all(b == 0 for b in accel_data) and all(b == 0 for b in gyro_data)
-            if all_zero:
+            if not any(data):
                 self._consecutive_zeros += 1
                 if self._consecutive_zeros >= self._ZERO_THRESHOLD:
                     self._rewake_sensor()
@@ -561,20 +813,20 @@ class BMI160Manager:
             self._debug_counter += 1
 
             if self._debug_counter % 200 == 0:  # A cada ~3s
-                debug(f"RAW I2C: accel={accel_data}, gyro={gyro_data}", "BMI160")
+                debug(f"RAW I2C: gyro={data[:6]}, accel={data[6:]}", "BMI160")
 
             # CONVERSÃO CONFORME DATASHEET:
-            # Dados em complemento de 2, LSB primeiro
+            # Dados em complemento de 2, LSB primeiro (int16 little-endian)
+            gx, gy, gz, ax, ay, az = self.DATA_BURST.unpack(bytes(data))
 
             with self.state_lock:
-                # Hardware real - converte dados I2C
-                self.accel_x_raw = self._bytes_to_int16(accel_data[0], accel_data[1])
-                self.accel_y_raw = self._bytes_to_int16(accel_data[2], accel_data[3])
-                self.accel_z_raw = self._bytes_to_int16(accel_data[4], accel_data[5])
+                self.accel_x_raw = ax
+                self.accel_y_raw = ay
+                self.accel_z_raw = az
 
-                self.gyro_x_raw = self._bytes_to_int16(gyro_data[0], gyro_data[1])
-                self.gyro_y_raw = self._bytes_to_int16(gyro_data[2], gyro_data[3])
-                self.gyro_z_raw = self._bytes_to_int16(gyro_data[4], gyro_data[5])
+                self.gyro_x_raw = gx
+                self.gyro_y_raw = gy
+                self.gyro_z_raw = gz
 
                 # Converter para unidades físicas usando fatores de escala
                 self.accel_x = (
@@ -601,22 +853,205 @@ class BMI160Manager:
             warn(f"Erro ao ler BMI160: {e}", "BMI160")
             return False
 
-    def _bytes_to_int16(self, lsb, msb):
-        """Converte 2 bytes para int16 com sinal (complemento de 2)"""
-        value = (msb << 8) | lsb
-        if value >= 32768:  # Se bit de sinal estiver setado
-            value -= 65536
-        return value
+    def read_fifo_data(self):
+        """Drena o FIFO (modo FIFO) e publica a média do lote"""
+        if not self.is_initialized:
+            return False
+
+        try:
+            data = self._read_fifo_block()
+            t_read = time.time()
+            if data is None:
+                return False
+
+            payload, sensortime, dropped = self._parse_fifo(data)
+            raw = np.frombuffer(bytes(payload), dtype="<i2").reshape(-1, 6)
+            n = len(raw)
+
+            # Watchdog: FIFO vazio ou zerado = sensor em suspend (brown-out)
+            if n == 0 or not raw.any():
+                self._consecutive_zeros += 1
+                if self._consecutive_zeros >= self._ZERO_THRESHOLD:
+                    self._rewake_sensor()
+                return False
+            self._consecutive_zeros = 0
+
+            timestamps = self._fifo_timestamps(n, sensortime, t_read)
+
+            # Decimação para sample_rate: média do lote (GX, GY, GZ, AX, AY, AZ)
+            mean = raw.mean(axis=0)
+            accel = (
+                raw[:, 3:] * self.accel_scale
+                - (self.accel_x_offset, self.accel_y_offset, self.accel_z_offset)
+            ) * 9.81
+            vibration = accel - accel.mean(axis=0)
+            vib_rms = float(np.sqrt(np.mean(np.sum(vibration * vibration, axis=1))))
+
+            self._debug_counter += 1
+            if self._debug_counter % 200 == 0:
+                debug(
+                    f"FIFO: {n} amostras, {len(data)} bytes, perdidos={self.fifo_dropped}",
+                    "BMI160",
+                )
+
+            with self.state_lock:
+                self.gyro_x_raw, self.gyro_y_raw, self.gyro_z_raw = (
+                    int(round(v)) for v in mean[:3]
+                )
+                self.accel_x_raw, self.accel_y_raw, self.accel_z_raw = (
+                    int(round(v)) for v in mean[3:]
+                )
+
+                self.accel_x = (mean[3] * self.accel_scale - self.accel_x_offset) * 9.81
+                self.accel_y = (mean[4] * self.accel_scale - self.accel_y_offset) * 9.81
+                self.accel_z = (mean[5] * self.accel_scale - self.accel_z_offset) * 9.81
+
+                self.gyro_x = mean[0] * self.gyro_scale - self.gyro_x_offset
+                self.gyro_y = mean[1] * self.gyro_scale - self.gyro_y_offset
+                self.gyro_z = mean[2] * self.gyro_scale - self.gyro_z_offset
+
+                self.fifo_samples = n
+                self.fifo_dropped += dropped
+                self.accel_vib_rms = vib_rms
+                self.sample_time = float(timestamps.mean())
+                self.readings_count += n
+
+                self._fifo_batches.append((timestamps, raw))
+                if len(self._fifo_batches) > self.FIFO_HISTORY_BATCHES:
+                    del self._fifo_batches[0]
+
+            return True
+
+        except Exception as e:
+            warn(f"Erro ao ler FIFO do BMI160: {e}", "BMI160")
+            return False
+
+    def _parse_fifo(self, data):
+        """
+        Separa os frames do FIFO.
+
+        Returns:
+            tuple: (payloads gyro+accel concatenados (12 bytes por amostra),
+                sensortime do último frame ou None, frames perdidos)
+        """
+        payload = bytearray()
+        sensortime = None
+        dropped = 0
+        pos = 0
+        end = len(data)
+
+        while pos < end:
+            header = data[pos] & 0xFC  # bits [1:0] = tags de interrupção
+            pos += 1
+            if header == self.FIFO_HEAD_OVER_READ:
+                break
+
+            if header & 0xC0 == 0x80:
+                # Frame regular: [mag 8][gyro 6][accel 6] conforme bits 4..2
+                size = (
+                    (8 if header & 0x10 else 0)
+                    + (6 if header & 0x08 else 0)
+                    + (6 if header & 0x04 else 0)
+                )
+                if pos + size > end:
+                    break
+                # Frames só de accel/gyro (início após configurar) são ignorados
+                if header == self.FIFO_HEAD_ACC_GYR:
+                    payload += data[pos:pos + 12]
+                pos += size
+            elif header == self.FIFO_HEAD_SENSORTIME:
+                if pos + 3 <= end:
+                    sensortime = int.from_bytes(data[pos:pos + 3], "little")
+                pos += 3
+            elif header == self.FIFO_HEAD_SKIP:
+                if pos < end:
+                    dropped += data[pos]
+                pos += 1
+            elif header == self.FIFO_HEAD_CONFIG:
+                pos += 1
+            else:
+                break  # Header inválido: descarta o resto
+
+        return payload, sensortime, dropped
+
+    def _fifo_timestamps(self, n, sensortime, t_read):
+        """
+        Timestamps (time.time()) das n amostras do lote.
+
+        As amostras são espaçadas de 1/ODR e terminam no sensortime do
+        último frame. O offset sensortime -> time.time() é a menor latência
+        observada, subindo devagar para seguir a deriva entre os relógios.
+        Sem frame de sensortime, usa o instante da leitura.
+        """
+        t_last = t_read
+        if sensortime is not None:
+            if self._sensortime_last is not None and sensortime < self._sensortime_last:
+                self._sensortime_wraps += 1
+            self._sensortime_last = sensortime
+
+            t_sensor = (
+                self._sensortime_wraps * self.SENSORTIME_WRAP + sensortime
+            ) * self.SENSORTIME_RESOLUTION
+            offset = t_read - t_sensor
+            if self._time_offset is None or offset < self._time_offset:
+                self._time_offset = offset
+            else:
+                self._time_offset += (offset - self._time_offset) * 0.01
+            t_last = t_sensor + self._time_offset
+
+        return t_last - np.arange(n - 1, -1, -1) / self.fifo_odr
+
+    def get_fifo_samples(self, clear=True):
+        """
+        Amostras em alta taxa dos últimos lotes do FIFO.
+
+        Args:
+            clear (bool): Descarta os lotes retornados
+
+        Returns:
+            dict: {"timestamp", "accel_x/y/z" (m/s²), "gyro_x/y/z" (°/s)}
+                como np.ndarray, ou {} se não há amostras
+        """
+        with self.state_lock:
+            batches = self._fifo_batches
+            if clear:
+                self._fifo_batches = []
+            else:
+                batches = list(batches)
+
+        if not batches:
+            return {}
+
+        raw = np.concatenate([batch[1] for batch in batches])
+        accel = (
+            raw[:, 3:] * self.accel_scale
+            - (self.accel_x_offset, self.accel_y_offset, self.accel_z_offset)
+        ) * 9.81
+        gyro = raw[:, :3] * self.gyro_scale - (
+            self.gyro_x_offset, self.gyro_y_offset, self.gyro_z_offset
+        )
+        return {
+            "timestamp": np.concatenate([batch[0] for batch in batches]),
+            "accel_x": accel[:, 0],
+            "accel_y": accel[:, 1],
+            "accel_z": accel[:, 2],
+            "gyro_x": gyro[:, 0],
+            "gyro_y": gyro[:, 1],
+            "gyro_z": gyro[:, 2],
+        }
 
     def update(self):
         """Atualização principal do sensor - apenas lê dados, não processa"""
         current_time = time.time()
         dt = current_time - self.last_update
 
-        # Controla taxa de atualização
-        if dt >= 1.0 / self.sample_rate:
-            # Lê dados do sensor
-            if self.read_sensor_data():
+        # Controla taxa de atualização (com INT1 o sensor dita o ritmo).
+        # Meio período: quem chama agenda por deadline, então um ciclo que
+        # atrasou não deve fazer o seguinte (no horário) ser descartado
+        if self.interrupt_enabled or dt >= 0.5 / self.sample_rate:
+            # Lê dados do sensor (modo FIFO: drena o lote acumulado)
+            read = self.read_fifo_data if self.fifo_mode else self.read_sensor_data
+            if read():
                 # Apenas atualiza o timestamp - NENHUM processamento
                 self.last_update = current_time
                 return True
@@ -631,7 +1066,7 @@ class BMI160Manager:
             dict: Dados RAW do BMI160 apenas
         """
         with self.state_lock:
-            return {
+            data = {
                 # === DADOS RAW DO BMI160 (LSB) ===
                 "bmi160_accel_x_raw": self.accel_x_raw,
                 "bmi160_accel_y_raw": self.accel_y_raw,
@@ -657,6 +1092,16 @@ class BMI160Manager:
                 "sample_rate": self.sample_rate,
                 "is_initialized": self.is_initialized,
             }
+            if self.fifo_mode:
+                # === MODO FIFO (média do lote + vibração em alta taxa) ===
+                data.update({
+                    "bmi160_sample_time": round(self.sample_time, 4),
+                    "bmi160_fifo_odr": self.fifo_odr,
+                    "bmi160_fifo_samples": self.fifo_samples,
+                    "bmi160_fifo_dropped": self.fifo_dropped,
+                    "bmi160_accel_vib_rms": round(self.accel_vib_rms, 3),
+                })
+            return data
 
     def cleanup(self):
         """Libera recursos do sensor"""
@@ -666,6 +1111,8 @@ class BMI160Manager:
                 self._write_register(self.REG_CMD, 0x10)  # Accel suspend
                 self._write_register(self.REG_CMD, 0x14)  # Gyro suspend
 
+            self._release_interrupt_pin()
+
             # Fecha barramento I2C
             if self.i2c_bus:
                 self.i2c_bus.close()
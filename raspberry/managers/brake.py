@@ -104,12 +104,8 @@ sudo pip3 install adafruit-circuitpython-pca9685
 import threading
 import time
 
-import board
-import busio
-from adafruit_motor import servo
-from adafruit_pca9685 import PCA9685
-
 from managers.logger import debug, error, info, warn
+from managers.pca9685_output import PCA9685Output
 
 
 class BrakeManager:
@@ -144,7 +140,8 @@ class BrakeManager:
         brake_balance: float = 50.0,  # 50% = balanceado
         max_brake_force: float = 100.0,
         response_time: float = 0.1,
-        i2c_lock=None,  # Lock compartilhado do bus I2C
+        i2c_scheduler=None,  # Escalonador compartilhado do bus I2C
+        pwm_output: PCA9685Output = None,  # Saída PCA9685 compartilhada com direção
     ):
         """
         Inicializa o sistema de freios
@@ -156,9 +153,10 @@ class BrakeManager:
             brake_balance (float): Balanço de freio 0-100% (0=mais dianteiro, 100=mais traseiro)
             max_brake_force (float): Força máxima de freio 0-100%
             response_time (float): Tempo de resposta do servo em segundos
-            i2c_lock: threading.Lock compartilhado entre dispositivos I2C
+            i2c_scheduler: I2CBusScheduler compartilhado entre dispositivos I2C
+            pwm_output: PCA9685Output compartilhado (None = cria um próprio)
         """
-        self.i2c_lock = i2c_lock
+        self.i2c_scheduler = i2c_scheduler
         self.front_channel = front_channel or self.FRONT_BRAKE_CHANNEL
         self.rear_channel = rear_channel or self.REAR_BRAKE_CHANNEL
         self.pca9685_address = pca9685_address or self.PCA9685_I2C_ADDRESS
@@ -184,12 +182,8 @@ class BrakeManager:
 
         # Estado dos servos e PCA9685
         self.is_initialized = False
-        self.pca9685 = None
-        self.i2c = None
-        self.front_servo = None
-        self.rear_servo = None
-        self._last_front_angle = None  # Dedup I2C writes
-        self._last_rear_angle = None
+        self.pwm_output = pwm_output  # Buffer de pulsos; escrita em bloco no flush
+        self._owns_output = pwm_output is None
 
         # Estatísticas
         self.brake_applications = 0
@@ -207,40 +201,26 @@ class BrakeManager:
         info(f"Inicializando freios | Canais: front={self.front_channel} rear={self.rear_channel} | I2C: 0x{self.pca9685_address:02X} | Balanço: {self.brake_balance:.1f}%", "BRAKE")
 
         try:
-            # Inicializa barramento I2C
-            self.i2c = busio.I2C(board.SCL, board.SDA)
-            debug("I2C inicializado", "BRAKE")
-
-            # Inicializa PCA9685
-            self.pca9685 = PCA9685(self.i2c, address=self.pca9685_address)
-            self.pca9685.frequency = self.PWM_FREQUENCY
-            debug(f"PCA9685 inicializado @ {self.PWM_FREQUENCY}Hz", "BRAKE")
+            # Saída PCA9685 (normalmente compartilhada com steering_manager)
+            if self.pwm_output is None:
+                self.pwm_output = PCA9685Output(
+                    self.pca9685_address, self.PWM_FREQUENCY, self.i2c_scheduler
+                )
+            if not self.pwm_output.is_initialized and not self.pwm_output.initialize():
+                raise RuntimeError(f"PCA9685 0x{self.pca9685_address:02X} indisponível")
 
             # Configura servos nos canais especificados
-            self.front_servo = servo.Servo(
-                self.pca9685.channels[self.front_channel],
-                min_pulse=int(self.PULSE_MIN * 1000),  # converte para microssegundos
-                max_pulse=int(self.PULSE_MAX * 1000),
-            )
-
-            self.rear_servo = servo.Servo(
-                self.pca9685.channels[self.rear_channel],
-                min_pulse=int(self.PULSE_MIN * 1000),  # converte para microssegundos
-                max_pulse=int(self.PULSE_MAX * 1000),
-            )
+            for channel in (self.front_channel, self.rear_channel):
+                self.pwm_output.add_servo(
+                    channel,
+                    min_pulse=int(self.PULSE_MIN * 1000),  # converte para microssegundos
+                    max_pulse=int(self.PULSE_MAX * 1000),
+                )
             debug(f"Servos configurados (canais {self.front_channel} e {self.rear_channel})", "BRAKE")
 
-            # Posiciona servos na posição solta (freios liberados)
-            if self.i2c_lock:
-                self.i2c_lock.acquire(priority=0)  # Alta
-                try:
-                    self.front_servo.angle = self.BRAKE_MIN_ANGLE
-                    self.rear_servo.angle = self.BRAKE_MIN_ANGLE
-                finally:
-                    self.i2c_lock.release()
-            else:
-                self.front_servo.angle = self.BRAKE_MIN_ANGLE
-                self.rear_servo.angle = self.BRAKE_MIN_ANGLE
+            # Posiciona servos na posição solta (freios liberados, espera a escrita)
+            self._set_servo_angles(self.BRAKE_MIN_ANGLE, self.BRAKE_MIN_ANGLE)
+            self.pwm_output.request_flush(wait=True)
             # Aguarda servos se posicionarem
             time.sleep(0.5)
 
@@ -276,12 +256,14 @@ class BrakeManager:
                 if self.total_brake_input > 0:
                     self._calculate_brake_angles(self.total_brake_input)
 
-    def apply_brake(self, brake_input: float):
+    def apply_brake(self, brake_input: float, flush: bool = True):
         """
         Aplica freio com a intensidade especificada
 
         Args:
             brake_input (float): Intensidade do freio 0-100%
+            flush (bool): Agenda a escrita no PCA9685; False quando o chamador
+                faz um único flush para direção e freios no mesmo tick
         """
         if not self.is_initialized:
             return
@@ -308,14 +290,13 @@ class BrakeManager:
                 self._last_log_time = now
                 debug(f"Freio: {brake_input:.1f}% (Diant: {self.front_brake_force:.1f}%, Tras: {self.rear_brake_force:.1f}%)", "BRAKE")
 
-            # Copia valores para I2C fora do lock
-            front_angle = self.front_brake_angle
-            rear_angle = self.rear_brake_angle
-            last_front = self._last_front_angle
-            last_rear = self._last_rear_angle
+            # Só atualiza o buffer (sem I2C)
+            self._set_servo_angles(self.front_brake_angle, self.rear_brake_angle)
 
-        # I2C write fora do state_lock para não bloquear TX thread
-        self._write_brake_servos(front_angle, rear_angle, last_front, last_rear)
+        # I2C fora do state_lock e sem esperar o barramento: os dois canais
+        # saem no mesmo flush (uma transação)
+        if flush and self.pwm_output is not None:
+            self.pwm_output.request_flush()
 
     def _calculate_brake_angles(self, total_input: float):
         """
@@ -345,10 +326,12 @@ class BrakeManager:
         )
         self.rear_brake_angle = self.BRAKE_MIN_ANGLE + (self.rear_brake_force / 100.0) * rear_range
 
-    def _write_brake_servos(self, front_angle: float, rear_angle: float,
-                            last_front, last_rear):
-        """Escreve ângulos nos servos via I2C (fora do state_lock)."""
-        if not (self.front_servo and self.rear_servo):
+    def _set_servo_angles(self, front_angle: float, rear_angle: float):
+        """Atualiza os dois canais no buffer do PCA9685 (sem I2C).
+
+        O buffer só marca para escrita os canais cujo pulso mudou.
+        """
+        if self.pwm_output is None:
             return
 
         # Limita ângulos ao range válido (0° a 180°)
@@ -361,28 +344,8 @@ class BrakeManager:
             min(self.BRAKE_MAX_ANGLE, rear_angle),
         )
 
-        # Só escreve no I2C se o ângulo mudou (dedup)
-        front_changed = last_front is None or abs(front_angle - last_front) >= 0.1
-        rear_changed = last_rear is None or abs(rear_angle - last_rear) >= 0.1
-        if front_changed or rear_changed:
-            if self.i2c_lock:
-                self.i2c_lock.acquire(priority=0)  # Alta
-                try:
-                    if front_changed:
-                        self.front_servo.angle = front_angle
-                    if rear_changed:
-                        self.rear_servo.angle = rear_angle
-                finally:
-                    self.i2c_lock.release()
-            else:
-                if front_changed:
-                    self.front_servo.angle = front_angle
-                if rear_changed:
-                    self.rear_servo.angle = rear_angle
-            if front_changed:
-                self._last_front_angle = front_angle
-            if rear_changed:
-                self._last_rear_angle = rear_angle
+        self.pwm_output.set_angle(self.front_channel, front_angle)
+        self.pwm_output.set_angle(self.rear_channel, rear_angle)
 
     def release_brakes(self):
         """Libera completamente os freios"""
@@ -452,17 +415,10 @@ class BrakeManager:
             self.release_brakes()
             time.sleep(0.2)
 
-            # Libera recursos do PCA9685
-            if self.front_servo:
-                self.front_servo = None
-            if self.rear_servo:
-                self.rear_servo = None
-            if self.pca9685:
-                self.pca9685.deinit()
-                self.pca9685 = None
-            if self.i2c:
-                self.i2c.deinit()
-                self.i2c = None
+            # Saída compartilhada é liberada por quem a criou (main.py)
+            if self.pwm_output and self._owns_output:
+                self.pwm_output.cleanup()
+            self.pwm_output = None
 
             self.is_initialized = False
             info("Sistema de freios finalizado", "BRAKE")
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """
-camera_manager.py - Gerenciamento da Câmera OV5647 com MJPEG Encoder
+camera_manager.py - Gerenciamento da Câmera OV5647 com MJPEG/H.264 Encoder
 
-Usa encoder MJPEG para máxima fidelidade de imagem.
-Cada frame é uma imagem JPEG independente (sem dependência entre frames).
+Usa encoder MJPEG para máxima fidelidade de imagem (padrão) ou H.264 em
+hardware para banda reduzida (5-10x menor que MJPEG em 720p).
 
 PINOUT CÂMERA OV5647:
 ===================
@@ -22,13 +22,24 @@ CONFIGURAÇÃO NECESSÁRIA:
 
 FORMATO DE SAÍDA:
 ================
-- MJPEG (Motion JPEG)
+MJPEG (codec="mjpeg"):
 - Cada frame é JPEG independente
 - Qualidade: 85 (ajustável)
 - Sem dependência entre frames (perda de 1 frame não afeta os outros)
+
+H.264 (codec="h264"):
+- Annex B, um access unit por frame, SPS/PPS repetidos em cada IDR
+- Keyframe (IDR) a cada keyframe_interval frames e sob demanda
+  (request_keyframe, ex: cliente perdeu um frame)
+- Bitrate derivado da qualidade: pixels x FPS x H264_BITS_PER_PIXEL x Q/100
+- P-frames dependem dos anteriores: TODOS os frames são transmitidos em
+  ordem (get_stream_frames), com número de sequência para o cliente
+  detectar lacunas e aguardar o próximo IDR
 """
 
+import fcntl
 import io
+import struct
 import threading
 import time
 import traceback
@@ -36,7 +47,7 @@ from collections import deque
 
 from managers.logger import debug, error, info, warn
 from picamera2 import Picamera2
-from picamera2.encoders import MJPEGEncoder
+from picamera2.encoders import H264Encoder, MJPEGEncoder
 from picamera2.outputs import FileOutput
 
 
@@ -110,8 +121,157 @@ class CircularBuffer(io.BufferedIOBase):
         return False
 
 
+class NalRingBuffer(io.BufferedIOBase):
+    """
+    Buffer circular para streaming H.264 (Annex B)
+
+    O picamera2 entrega um access unit (frame) por write(). Cada frame recebe
+    um número de sequência e é marcado como keyframe se contém um slice IDR;
+    IDRs sem SPS/PPS recebem os últimos parâmetros vistos, para que o cliente
+    sempre consiga começar a decodificar em qualquer keyframe.
+    """
+
+    NAL_IDR = 5
+    NAL_SPS = 7
+    NAL_PPS = 8
+    NAL_AUD = 9
+
+    def __init__(self, max_frames=60, first_seq=0):
+        self.frames = deque(maxlen=max_frames)
+        self.lock = threading.Lock()
+        self.next_seq = first_seq
+        self.frame_count = 0
+        self.total_bytes = 0
+        self.total_frames_ever = 0
+        self._sps = None
+        self._pps = None
+
+    def write(self, data):
+        """Recebe um access unit do encoder H.264"""
+        data = bytes(data)
+        spans = list(self._nal_spans(data))
+        nal_types = set()
+        for start, end in spans:
+            nal_type = data[start] & 0x1F
+            nal_types.add(nal_type)
+            if nal_type == self.NAL_SPS:
+                self._sps = data[self._start_code_at(data, start):end]
+            elif nal_type == self.NAL_PPS:
+                self._pps = data[self._start_code_at(data, start):end]
+
+        keyframe = self.NAL_IDR in nal_types
+        if keyframe and self.NAL_SPS not in nal_types and self._sps and self._pps:
+            # Parâmetros logo após o AUD (se houver), antes do slice
+            insert = 0
+            if len(spans) > 1 and data[spans[0][0]] & 0x1F == self.NAL_AUD:
+                insert = self._start_code_at(data, spans[1][0])
+            data = data[:insert] + self._sps + self._pps + data[insert:]
+
+        with self.lock:
+            self.frames.append(
+                {
+                    "seq": self.next_seq,
+                    "data": data,
+                    "timestamp": time.time(),
+                    "size": len(data),
+                    "keyframe": keyframe,
+                }
+            )
+            self.next_seq += 1
+            self.frame_count += 1
+            self.total_frames_ever += 1
+            self.total_bytes += len(data)
+        return len(data)
+
+    @staticmethod
+    def _nal_spans(data):
+        """Gera (início do header NAL, fim do NAL) para cada NAL unit"""
+        starts = []
+        pos = data.find(b"\x00\x00\x01")
+        while pos >= 0:
+            starts.append(pos + 3)
+            pos = data.find(b"\x00\x00\x01", pos + 3)
+        for i, start in enumerate(starts):
+            end = len(data)
+            if i + 1 < len(starts):
+                # Start code de 4 bytes (00 00 00 01) pertence ao próximo NAL
+                end = starts[i + 1] - 3
+                if end > start and data[end - 1] == 0:
+                    end -= 1
+            if start < end:
+                yield start, end
+
+    @staticmethod
+    def _start_code_at(data, header_pos):
+        """Posição do start code (3 ou 4 bytes) do NAL que começa em header_pos"""
+        pos = header_pos - 3
+        if pos > 0 and data[pos - 1] == 0:
+            pos -= 1
+        return pos
+
+    def get_frame(self):
+        """Obtém o frame mais recente"""
+        with self.lock:
+            if self.frames:
+                return self.frames[-1]
+            return None
+
+    def get_frames_since(self, seq):
+        """
+        Frames com sequência maior que seq, em ordem.
+
+        Args:
+            seq: Último frame já consumido (None = consumidor novo)
+
+        Returns:
+            tuple: (frames, lost) — lost=True se frames após seq já saíram
+            do buffer; nesse caso a lista começa no keyframe mais recente
+            (vazia se não houver keyframe no buffer)
+        """
+        with self.lock:
+            if not self.frames:
+                return [], False
+            oldest = self.frames[0]["seq"]
+            if seq is not None and seq + 1 >= oldest:
+                start = seq + 1 - oldest
+                return list(self.frames)[start:], False
+
+            # Consumidor novo ou atrasado: só pode começar em um keyframe
+            frames = list(self.frames)
+            for i in range(len(frames) - 1, -1, -1):
+                if frames[i]["keyframe"]:
+                    return frames[i:], seq is not None
+            return [], seq is not None
+
+    def flush(self):
+        """Flush do buffer"""
+        pass
+
+    def readable(self):
+        return False
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+
 class CameraManager:
-    """Gerencia a captura de vídeo da câmera OV5647 com MJPEG encoding"""
+    """Gerencia a captura de vídeo da câmera OV5647 com MJPEG ou H.264 encoding"""
+
+    CODECS = ("mjpeg", "h264")
+
+    # H.264: bits por pixel por frame em Q=100 (720p60 Q85 ≈ 3.8 Mbps)
+    H264_BITS_PER_PIXEL = 0.08
+    # Frames no buffer H.264 (~1s em 60fps) para o TX alcançar sem perder
+    H264_RING_FRAMES = 60
+    # Intervalo mínimo entre IDRs sob demanda (vários pedidos = um IDR)
+    KEYFRAME_REQUEST_MIN_INTERVAL = 0.5
+
+    # V4L2: força IDR no encoder em hardware (linux/v4l2-controls.h)
+    _V4L2_CID_MPEG_VIDEO_FORCE_KEY_FRAME = 0x009909E5
+    _VIDIOC_S_CTRL = 0xC008561C  # _IOWR('V', 28, struct v4l2_control)
 
     # Presets de resolução
     RESOLUTION_PRESETS = {
@@ -130,6 +290,8 @@ class CameraManager:
         saturation=1.0,
         brightness=0.0,
         exposure_mode="auto",
+        codec="mjpeg",
+        keyframe_interval=30,
     ):
         """
         Inicializa o gerenciador da câmera
@@ -143,7 +305,12 @@ class CameraManager:
             saturation (float): Saturação 0.0-2.0 (padrão: 1.0)
             brightness (float): Brilho -1.0 a 1.0 (padrão: 0.0)
             exposure_mode (str): Modo de exposição (auto, short, long)
+            codec (str): "mjpeg" (padrão) ou "h264"
+            keyframe_interval (int): H.264 - frames entre IDRs (padrão: 30)
         """
+        if codec not in self.CODECS:
+            raise ValueError(f"Codec inválido: {codec} (use {', '.join(self.CODECS)})")
+
         self.resolution = resolution
         self.frame_rate = frame_rate
         self.quality = quality
@@ -152,6 +319,8 @@ class CameraManager:
         self.saturation = saturation
         self.brightness = brightness
         self.exposure_mode = exposure_mode
+        self.codec = codec
+        self.keyframe_interval = keyframe_interval
 
         self.camera = None
         self.encoder = None
@@ -166,15 +335,20 @@ class CameraManager:
         self.last_frame_size = 0
         self.start_time = None
 
+        # IDR sob demanda (aplicado pela thread de captura)
+        self._keyframe_requested = False
+        self._last_keyframe_request = 0.0
+        self.keyframes_forced = 0
+
     def initialize(self):
         """
-        Inicializa a câmera OV5647 com encoder MJPEG
+        Inicializa a câmera OV5647 com encoder MJPEG ou H.264
 
         Returns:
             bool: True se inicializada com sucesso, False caso contrário
         """
         try:
-            info("Inicializando câmera OV5647 com MJPEG encoder...", "CAMERA")
+            info(f"Inicializando câmera OV5647 com {self.codec.upper()} encoder...", "CAMERA")
 
             # Verifica câmeras disponíveis ANTES de criar instância
             try:
@@ -229,17 +403,11 @@ class CameraManager:
             except Exception as e:
                 warn(f"Alguns controles não configurados: {e}", "CAMERA")
 
-            # Cria encoder MJPEG (usa hardware do Raspberry Pi)
-            # Qualidade controlada via parâmetro quality (1-100)
-            # Nota: algumas versões usam 'q', outras 'quality'
-            try:
-                self.encoder = MJPEGEncoder(quality=self.quality)
-            except TypeError:
-                # Fallback para versões mais antigas
-                self.encoder = MJPEGEncoder()
+            # Cria encoder (usa hardware do Raspberry Pi)
+            self.encoder = self._create_encoder()
 
             # Cria buffer circular
-            self.buffer = CircularBuffer(max_frames=10)
+            self.buffer = self._create_buffer()
 
             # Cria output que escreve no buffer
             self.output = FileOutput(self.buffer)
@@ -248,13 +416,13 @@ class CameraManager:
             self.camera.start()
             time.sleep(0.5)
 
-            # Inicia gravação com encoder MJPEG
+            # Inicia gravação com o encoder
             self.camera.start_encoder(self.encoder, self.output)
             self.is_recording = True
             self.start_time = time.time()
 
             self.is_initialized = True
-            info(f"Câmera inicializada | {self.resolution[0]}x{self.resolution[1]} | MJPEG Q={self.quality} | {self.frame_rate}fps", "CAMERA")
+            info(f"Câmera inicializada | {self.resolution[0]}x{self.resolution[1]} | {self._encoder_description()} | {self.frame_rate}fps", "CAMERA")
 
             return True
 
@@ -271,16 +439,114 @@ class CameraManager:
             self.is_initialized = False
             return False
 
+    def _create_encoder(self):
+        """
+        Cria encoder MJPEG ou H.264 com a qualidade atual (1-100)
+        Nota: algumas versões usam 'q', outras 'quality'
+        """
+        if self.codec == "h264":
+            try:
+                # repeat=True: SPS/PPS em todo IDR (cliente entra em qualquer keyframe)
+                return H264Encoder(
+                    bitrate=self._h264_bitrate(),
+                    repeat=True,
+                    iperiod=self.keyframe_interval,
+                )
+            except TypeError:
+                return H264Encoder(bitrate=self._h264_bitrate())
+        try:
+            return MJPEGEncoder(quality=self.quality)
+        except TypeError:
+            # Fallback para versões mais antigas
+            return MJPEGEncoder()
+
+    def _create_buffer(self, previous=None):
+        """Cria o buffer do codec atual (H.264 continua a sequência anterior)"""
+        if self.codec == "h264":
+            first_seq = previous.next_seq if isinstance(previous, NalRingBuffer) else 0
+            return NalRingBuffer(max_frames=self.H264_RING_FRAMES, first_seq=first_seq)
+        return CircularBuffer(max_frames=10)
+
+    def _h264_bitrate(self):
+        """Bitrate H.264 (bps) para resolução, FPS e qualidade atuais"""
+        pixels = self.resolution[0] * self.resolution[1]
+        return int(
+            pixels * self.frame_rate * self.H264_BITS_PER_PIXEL * self.quality / 100
+        )
+
+    def _encoder_description(self):
+        """Resumo do encoder para log"""
+        if self.codec == "h264":
+            return (
+                f"H.264 {self._h264_bitrate() / 1e6:.1f}Mbps "
+                f"GOP={self.keyframe_interval}"
+            )
+        return f"MJPEG Q={self.quality}"
+
+    def request_keyframe(self) -> bool:
+        """
+        Pede um IDR ao encoder H.264 (ex: cliente perdeu um frame).
+        Aplicado pela thread de captura; pedidos dentro de
+        KEYFRAME_REQUEST_MIN_INTERVAL viram um único IDR.
+
+        Returns:
+            bool: True se o pedido foi aceito
+        """
+        if self.codec != "h264":
+            return False
+        now = time.monotonic()
+        if now - self._last_keyframe_request < self.KEYFRAME_REQUEST_MIN_INTERVAL:
+            return False
+        self._last_keyframe_request = now
+        self._keyframe_requested = True
+        return True
+
+    def _force_keyframe(self):
+        """Força IDR: controle V4L2 do encoder, ou reinício do encoder"""
+        self._keyframe_requested = False
+        if self.camera is None or not self.is_recording:
+            return
+
+        device = getattr(self.encoder, "vd", None)
+        if device is not None:
+            try:
+                control = struct.pack("<Ii", self._V4L2_CID_MPEG_VIDEO_FORCE_KEY_FRAME, 1)
+                fcntl.ioctl(device, self._VIDIOC_S_CTRL, control)
+                self.keyframes_forced += 1
+                return
+            except (OSError, TypeError, ValueError) as e:
+                debug(f"FORCE_KEY_FRAME indisponível ({e}), reiniciando encoder", "CAMERA")
+
+        # Encoder novo sempre começa com IDR
+        try:
+            self._restart_encoder()
+            self.keyframes_forced += 1
+        except Exception as e:
+            warn(f"Erro ao forçar keyframe: {e}", "CAMERA")
+
+    def _restart_encoder(self):
+        """Recria o encoder com a câmera rodando (mesmo buffer)"""
+        self.camera.stop_encoder()
+        self.is_recording = False
+        self.encoder = self._create_encoder()
+        # Output novo (stop_encoder fecha o anterior) sobre o mesmo buffer
+        self.output = FileOutput(self.buffer)
+        self.camera.start_encoder(self.encoder, self.output)
+        self.is_recording = True
+
     def capture_frame(self):
         """
-        Obtém o frame JPEG mais recente do buffer
+        Obtém o frame mais recente do buffer (JPEG ou access unit H.264)
 
         Returns:
-            bytes: Frame JPEG codificado, ou None se não disponível
+            bytes: Frame codificado, ou None se não disponível
         """
         if not self.is_initialized or self.buffer is None:
             return None
 
+        if self._keyframe_requested:
+            self._force_keyframe()
+
         try:
             frame_info = self.buffer.get_frame()
 
@@ -321,6 +587,29 @@ class CameraManager:
             warn(f"Erro ao obter frame: {e}", "CAMERA")
             return None
 
+    def get_stream_frames(self, after_seq):
+        """
+        Frames H.264 ainda não transmitidos, em ordem.
+
+        Se o consumidor ficou para trás (frames já descartados do buffer),
+        recomeça no keyframe mais recente e pede um IDR se não houver.
+
+        Args:
+            after_seq: Sequência do último frame transmitido (None = início)
+
+        Returns:
+            list: Dicts {'seq', 'data', 'keyframe', 'timestamp', 'size'}
+        """
+        if not self.is_initialized or not isinstance(self.buffer, NalRingBuffer):
+            return []
+
+        frames, lost = self.buffer.get_frames_since(after_seq)
+        if lost:
+            debug(f"TX H.264 atrasado após seq={after_seq}", "CAMERA")
+        if not frames and (lost or after_seq is None):
+            self.request_keyframe()
+        return frames
+
     def get_frame_size_info(self, frame_data):
         """
         Obtém informações sobre o tamanho do frame
@@ -382,6 +671,78 @@ class CameraManager:
             warn(f"Erro ao ajustar controles: {e}", "CAMERA")
             return False
 
+    def set_quality(self, quality: int) -> bool:
+        """
+        Muda a qualidade em tempo real (MJPEG: Q; H.264: bitrate).
+
+        A qualidade é fixada na criação do encoder, então o encoder é
+        recriado; a câmera continua rodando e o buffer circular é mantido
+        (o último frame completo continua disponível durante a troca).
+
+        Args:
+            quality (int): Qualidade 1-100
+
+        Returns:
+            bool: True se mudança aplicada com sucesso
+        """
+        quality = max(1, min(100, int(quality)))
+        if quality == self.quality:
+            return True
+        self.quality = quality
+
+        if self.camera is None or not self.is_recording:
+            return True  # Vale na próxima inicialização
+
+        try:
+            self._restart_encoder()
+            debug(f"Qualidade alterada: {self._encoder_description()}", "CAMERA")
+            return True
+
+        except Exception as e:
+            error(f"Erro ao mudar qualidade: {e}", "CAMERA")
+            return False
+
+    def set_frame_rate(self, frame_rate: int) -> bool:
+        """
+        Muda o FPS da câmera em tempo real (FrameDurationLimits, sem
+        reiniciar a câmera; H.264 recria o encoder para ajustar o bitrate).
+
+        Args:
+            frame_rate (int): Frames por segundo
+
+        Returns:
+            bool: True se mudança aplicada com sucesso
+        """
+        frame_rate = max(1, int(frame_rate))
+        if frame_rate == self.frame_rate:
+            return True
+        if self.camera is None:
+            self.frame_rate = frame_rate
+            return True
+
+        try:
+            frame_duration = 1000000 // frame_rate
+            self.camera.set_controls(
+                {"FrameDurationLimits": (frame_duration, frame_duration)}
+            )
+            self.frame_rate = frame_rate
+            if self.codec == "h264" and self.is_recording:
+                # Bitrate H.264 é por segundo: recalcula para o novo FPS
+                self._restart_encoder()
+            debug(f"FPS da câmera alterado: {self.frame_rate}fps", "CAMERA")
+            return True
+
+        except Exception as e:
+            warn(f"Erro ao mudar FPS: {e}", "CAMERA")
+            return False
+
+    def get_resolution_name(self):
+        """Preset da resolução atual, ou None se fora dos presets"""
+        for name, size in self.RESOLUTION_PRESETS.items():
+            if size == tuple(self.resolution):
+                return name
+        return None
+
     def set_resolution(self, resolution_name: str) -> bool:
         """
         Muda a resolução da câmera em tempo real.
@@ -453,13 +814,10 @@ class CameraManager:
                 warn(f"Alguns controles não reaplicados após resize: {e}", "CAMERA")
 
             # Recria encoder (picamera2 exige encoder novo após stop)
-            try:
-                self.encoder = MJPEGEncoder(quality=self.quality)
-            except TypeError:
-                self.encoder = MJPEGEncoder()
+            self.encoder = self._create_encoder()
 
             # Recria buffer circular e output
-            self.buffer = CircularBuffer(max_frames=10)
+            self.buffer = self._create_buffer(self.buffer)
             self.output = FileOutput(self.buffer)
 
             # Reinicia câmera e encoder
@@ -471,7 +829,7 @@ class CameraManager:
             self.is_initialized = True
             info(
                 f"Resolução alterada: {resolution_name} "
-                f"({new_res[0]}x{new_res[1]}) | MJPEG Q={self.quality} | {self.frame_rate}fps",
+                f"({new_res[0]}x{new_res[1]}) | {self._encoder_description()} | {self.frame_rate}fps",
                 "CAMERA",
             )
             return True
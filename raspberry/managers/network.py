@@ -21,6 +21,44 @@ ESTRUTURA DO PACOTE UDP (fragmentado):
 | 4 bytes | 4 bytes  | 2 bytes     | 2 bytes      | N bytes    |
 | 0xFRAG  | frame_id | chunk_index | total_chunks | chunk_data |
 
+ESTRUTURA DO FRAGMENTO COM FEC (clientes que enviam VIDEO_FEEDBACK):
+===================================================================
+| 4 bytes | 4 bytes  | 2 bytes | 2 bytes     | 1 byte        | 1 byte | 4 bytes    | N bytes |
+| 0xFRGF  | frame_id | index   | data_chunks | parity_chunks | flags  | packet_len | payload |
+
+Após os chunks de dados vão parity_chunks chunks de paridade XOR
+intercalada (paridade j = XOR dos chunks i com i % parity_chunks == j),
+que permitem ao cliente reconstruir um chunk perdido por grupo. O número
+de chunks de paridade acompanha a perda reportada pelo cliente em
+"VIDEO_FEEDBACK:loss=<fração>" (porta 9998, ~1Hz); sem perda, ou sem
+feedback recente, o frame segue no formato FRAG sem paridade.
+
+FRAME H.264 (camera codec="h264"), no lugar do JPEG em frame_data:
+=================================================================
+| 4 bytes | 4 bytes | 1 byte | N bytes                |
+| "H264"  | seq     | flags  | access unit (Annex B)  |
+
+flags bit 0 = keyframe (IDR com SPS/PPS). O cliente detecta lacunas em seq,
+descarta frames até o próximo keyframe e pede um IDR com "VIDEO_KEYFRAME"
+(porta 9998).
+
+Os fragmentos de um frame são enviados em lote (utils/udp_batch.py):
+cabeçalho e fatia do frame como segmentos scatter-gather, sem concatenação,
+e todos os fragmentos em uma única syscall sendmmsg quando disponível.
+
+PACOTES DE SENSORES (porta 9997):
+================================
+- JSON (padrão, clientes antigos)
+- Binário com schema (telemetry_codec.py) após o cliente enviar
+  "SENSOR_FORMAT:DLT1,BIN1" (ordem de preferência). O schema é reenviado a
+  cada SCHEMA_RESEND_INTERVAL para clientes que entraram depois ou perderam
+  o pacote SCHEMA.
+- DLT1: apenas campos alterados, com keyframe completo a cada
+  DELTA_KEYFRAME_INTERVAL (ressincronização após perda).
+- CHN1: um canal delta por fonte (IMU, energia, temperatura, sistema,
+  atuadores), cada um publicado na sua taxa via send_channel_data(); o
+  pacote consolidado só é montado se houver cliente em outro formato.
+
 PORTAS UTILIZADAS:
 =================
 - 9999: Transmissão de vídeo + sensores (RPi -> PC)
@@ -28,6 +66,7 @@ PORTAS UTILIZADAS:
 """
 
 import json
+import math
 import socket
 import struct
 import threading
@@ -39,6 +78,15 @@ import subprocess
 import numpy as np
 
 from managers.logger import debug, error, info, warn
+from managers.telemetry_codec import (
+    SENSOR_FORMAT_BINARY,
+    SENSOR_FORMAT_CHANNELS,
+    SENSOR_FORMAT_DELTA,
+    SENSOR_FORMAT_JSON,
+    TELEMETRY_CHANNELS,
+    TelemetryEncoder,
+)
+from utils.udp_batch import DatagramBatcher
 
 
 class NetworkManager:
@@ -48,6 +96,32 @@ class NetworkManager:
     FRAG_MAGIC = 0x46524147  # "FRAG" em ASCII hex
     MAX_PACKET_SIZE = 60000  # Tamanho máximo seguro para UDP (< 65507)
     FRAG_HEADER_SIZE = 12    # 4 (magic) + 4 (frame_id) + 2 (chunk_idx) + 2 (total_chunks)
+    FRAG_HEADER = struct.Struct("<IIHH")
+
+    # FEC: paridade XOR intercalada para frames fragmentados
+    FEC_MAGIC = 0x46524746  # "FRGF" em ASCII hex
+    FEC_HEADER = struct.Struct("<IIHHBBI")
+    FEC_HEADER_SIZE = 18     # FRAG (12) + 1 (parity_chunks) + 1 (flags) + 4 (packet_len)
+    FEC_MIN_LOSS = 0.002  # Perda abaixo disso: sem paridade
+    FEC_LOSS_GAIN = 3.0  # Fração de paridade = ganho × perda reportada
+    FEC_MAX_RATIO = 0.5  # No máximo 1 chunk de paridade a cada 2 de dados
+    FEC_FEEDBACK_TIMEOUT = 5.0  # Sem feedback há mais tempo: desliga FEC
+
+    # Frame H.264: magic + seq + flags antes do access unit
+    H264_MAGIC = b"H264"
+    H264_HEADER = struct.Struct("<4sIB")
+    H264_FLAG_KEYFRAME = 0x01
+
+    # Telemetria binária: reenvio periódico do schema (UDP pode perder o SCHEMA)
+    SCHEMA_RESEND_INTERVAL = 1.0
+    # Modo delta: pacote completo periódico para ressincronizar clientes
+    DELTA_KEYFRAME_INTERVAL = 1.0
+    SENSOR_FORMATS = (
+        SENSOR_FORMAT_CHANNELS,
+        SENSOR_FORMAT_DELTA,
+        SENSOR_FORMAT_BINARY,
+        SENSOR_FORMAT_JSON,
+    )
 
     def __init__(
         self,
@@ -73,6 +147,7 @@ class NetworkManager:
 
         # Sockets UDP
         self.send_socket = None  # Para enviar vídeo
+        self.video_batcher = None  # Envio em lote dos fragmentos de vídeo
         self.sensor_socket = None  # Para enviar sensores
         self.receive_socket = None  # Para receber comandos
         self.is_initialized = False
@@ -96,6 +171,31 @@ class NetworkManager:
         # Contador de frames para fragmentação
         self.frame_id_counter = 0
 
+        # FEC: buffer de trabalho reutilizado e estatísticas
+        self._fec_buffer = np.zeros(0, dtype=np.uint8)
+        self.fec_ratio = 0.0
+        self.fec_parity_sent = 0
+
+        # Codecs binários de telemetria por formato negociado (SENSOR_FORMAT:...)
+        self.telemetry_encoders = {
+            SENSOR_FORMAT_BINARY: TelemetryEncoder(),
+            SENSOR_FORMAT_DELTA: TelemetryEncoder(
+                keyframe_interval=self.DELTA_KEYFRAME_INTERVAL
+            ),
+        }
+        # Último schema enviado por formato: {formato: (schema_id, monotonic)}
+        self._schema_sent = {fmt: (-1, 0.0) for fmt in self.telemetry_encoders}
+
+        # Formato CHN1: um encoder delta por canal lógico
+        self.channel_encoders = {
+            channel: TelemetryEncoder(
+                channel=channel, keyframe_interval=self.DELTA_KEYFRAME_INTERVAL
+            )
+            for channel in TELEMETRY_CHANNELS
+        }
+        # Último schema enviado por canal: {canal: (schema_id, monotonic)}
+        self._channel_schema_sent = {}
+
         # Threading para recepção de comandos
         self.command_thread = None
         self.should_stop = False
@@ -103,6 +203,12 @@ class NetworkManager:
         # Callback para processar comandos recebidos
         self.command_callback = None
 
+        # Callback para relatórios VIDEO_FEEDBACK (controle adaptativo de bitrate)
+        self.video_feedback_callback = None
+
+        # Callback para pedidos de IDR do cliente (H.264)
+        self.keyframe_request_callback = None
+
     def initialize(self) -> bool:
         """
         Inicializa a comunicação UDP bidirecional
@@ -127,6 +233,8 @@ class NetworkManager:
                 )  # IPTOS_LOWDELAY
             except (AttributeError, OSError):
                 pass
+            self.video_batcher = DatagramBatcher(self.send_socket)
+            debug(f"Envio de vídeo em lote: {self.video_batcher.mode}", "NET")
 
             # Socket para envio de sensores (porta 9997)
             self.sensor_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -234,6 +342,17 @@ class NetworkManager:
                 # Comando de controle (motor, freio, direção)
                 self._handle_control_command(client_ip, command_str[8:])
 
+            elif command_str.startswith("SENSOR_FORMAT:"):
+                self._handle_sensor_format(client_ip, command_str[14:])
+
+            elif command_str.startswith("VIDEO_FEEDBACK:"):
+                self._handle_video_feedback(client_ip, command_str[15:])
+
+            elif command_str == "VIDEO_KEYFRAME":
+                # Cliente H.264 perdeu um frame e aguarda um IDR
+                if self.keyframe_request_callback:
+                    self.keyframe_request_callback(client_ip)
+
             else:
                 # Comando personalizado - repassa para callback se existir
                 if self.command_callback:
@@ -314,6 +433,82 @@ class NetworkManager:
         if self.command_callback:
             self.command_callback(client_ip, f"CONTROL:{command}")
 
+    def _handle_sensor_format(self, client_ip: str, requested: str):
+        """
+        Negocia formato dos pacotes de sensores com o cliente
+
+        Args:
+            client_ip: IP do cliente
+            requested: Formatos aceitos pelo cliente em ordem de preferência,
+                separados por vírgula (ex: "DLT1,BIN1")
+        """
+        candidates = [fmt.strip() for fmt in requested.split(",")]
+        sensor_format = next(
+            (fmt for fmt in candidates if fmt in self.SENSOR_FORMATS), None
+        )
+        if sensor_format is None:
+            warn(f"Formato de sensores desconhecido de {client_ip}: {requested}", "NET")
+            return
+
+        with self.clients_lock:
+            client_info = self.connected_clients.get(client_ip)
+            if client_info is None:
+                return
+            if client_info.get("sensor_format", SENSOR_FORMAT_JSON) == sensor_format:
+                return
+            client_info["sensor_format"] = sensor_format
+            # Schema vai junto do próximo pacote binário
+            client_info["schema_pending"] = sensor_format in self.telemetry_encoders
+
+        # Cliente novo no modo delta precisa de um keyframe como base
+        if sensor_format == SENSOR_FORMAT_DELTA:
+            self.telemetry_encoders[SENSOR_FORMAT_DELTA].request_keyframe()
+        elif sensor_format == SENSOR_FORMAT_CHANNELS:
+            # Schemas e keyframes de todos os canais no próximo envio de cada um
+            self._channel_schema_sent = {}
+            for encoder in self.channel_encoders.values():
+                encoder.request_keyframe()
+
+        info(f"Formato de sensores para {client_ip}: {sensor_format}", "NET")
+
+    def _handle_video_feedback(self, client_ip: str, report: str):
+        """
+        Registra o relatório de recepção de vídeo do cliente
+
+        Args:
+            client_ip: IP do cliente
+            report: Pares chave=valor separados por vírgula (ex: "loss=0.012")
+        """
+        feedback = {}
+        for item in report.split(","):
+            key, sep, value = item.partition("=")
+            if not sep:
+                continue
+            try:
+                number = float(value)
+            except ValueError:
+                number = None
+            # NaN desativa as comparações de limiar do controle de bitrate
+            if number is None or not math.isfinite(number):
+                warn(
+                    f"VIDEO_FEEDBACK inválido de {client_ip}: {item!r}",
+                    "NET",
+                    rate_limit=5.0,
+                )
+                continue
+            feedback[key.strip()] = number
+
+        with self.clients_lock:
+            client_info = self.connected_clients.get(client_ip)
+            if client_info is None:
+                return
+            client_info["video_feedback"] = feedback
+            client_info["video_feedback_time"] = time.time()
+
+        # Fora do lock: o callback pode reconfigurar a câmera
+        if self.video_feedback_callback:
+            self.video_feedback_callback(client_ip, feedback)
+
     def _send_to_client(self, client_ip: str, data: bytes):
         """Envia dados para um cliente específico"""
         with self.clients_lock:
@@ -338,6 +533,14 @@ class NetworkManager:
         with self.clients_lock:
             return len(self.connected_clients) > 0
 
+    def get_sensor_formats(self) -> set:
+        """Retorna os formatos de sensores em uso pelos clientes conectados"""
+        with self.clients_lock:
+            return {
+                client_info.get("sensor_format", SENSOR_FORMAT_JSON)
+                for client_info in self.connected_clients.values()
+            }
+
     def set_command_callback(self, callback):
         """Define callback para processar comandos personalizados"""
         self.command_callback = callback
@@ -515,15 +718,17 @@ class NetworkManager:
         else:
             return self._send_single_packet(packet_data)
 
-    def _send_single_packet(self, packet_data: bytes) -> bool:
-        """Envia um único pacote (sem fragmentação)"""
+    def _send_single_packet(self, packet_data: bytes, prefix: bytes = b"") -> bool:
+        """Envia um único pacote (sem fragmentação): prefix + packet_data"""
+        datagram = [(prefix, 0, len(prefix)), (packet_data, 0, len(packet_data))]
         success_count = 0
+        total_bytes = 0
 
         with self.clients_lock:
             for client_ip, client_info in self.connected_clients.items():
                 try:
-                    self.send_socket.sendto(
-                        packet_data, (client_ip, client_info["port"])
+                    total_bytes = self.video_batcher.send(
+                        (client_ip, client_info["port"]), [datagram]
                     )
                     success_count += 1
                 except Exception as e:
@@ -531,16 +736,22 @@ class NetworkManager:
 
         if success_count > 0:
             self.packets_sent += 1
-            self.bytes_sent += len(packet_data)
+            self.bytes_sent += total_bytes
             self.last_send_time = time.time()
             return True
         else:
             self.send_errors += 1
             return False
 
-    def _send_fragmented(self, packet_data: bytes) -> bool:
+    def _send_fragmented(self, packet_data: bytes, prefix: bytes = b"") -> bool:
         """
         Envia pacote fragmentado para todos os clientes.
+        O pacote lógico é prefix + packet_data (sem concatenar: o prefixo
+        entra como segmento extra do primeiro fragmento).
+
+        Clientes com VIDEO_FEEDBACK recente recebem fragmentos FEC com
+        paridade proporcional à maior perda reportada; os demais (ou todos,
+        sem perda) recebem fragmentos FRAG.
 
         Estrutura do fragmento:
         | 4 bytes    | 4 bytes  | 2 bytes     | 2 bytes      | N bytes    |
@@ -550,47 +761,53 @@ class NetworkManager:
         self.frame_id_counter = (self.frame_id_counter + 1) & 0xFFFFFFFF
         frame_id = self.frame_id_counter
 
-        # Calcula tamanho do chunk (dados úteis por fragmento)
-        chunk_size = self.MAX_PACKET_SIZE - self.FRAG_HEADER_SIZE
-        total_chunks = (len(packet_data) + chunk_size - 1) // chunk_size
-
-        success_count = 0
-        total_bytes = 0
-
+        # Snapshot dos destinos (montagem e envio fora do lock)
+        now = time.time()
+        fec_loss = 0.0
+        targets = []
         with self.clients_lock:
             for client_ip, client_info in self.connected_clients.items():
-                client_success = True
-
-                for chunk_idx in range(total_chunks):
-                    # Extrai chunk de dados
-                    start = chunk_idx * chunk_size
-                    end = min(start + chunk_size, len(packet_data))
-                    chunk_data = packet_data[start:end]
-
-                    # Monta cabeçalho do fragmento
-                    # I = unsigned int (4 bytes), H = unsigned short (2 bytes)
-                    header = struct.pack(
-                        "<IIHH",
-                        self.FRAG_MAGIC,
-                        frame_id,
-                        chunk_idx,
-                        total_chunks
-                    )
+                feedback = client_info.get("video_feedback")
+                fec = (
+                    feedback is not None
+                    and now - client_info["video_feedback_time"]
+                    < self.FEC_FEEDBACK_TIMEOUT
+                )
+                if fec:
+                    fec_loss = max(fec_loss, feedback.get("loss", 0.0))
+                targets.append((client_ip, client_info["port"], fec))
 
-                    fragment = header + chunk_data
+        self.fec_ratio = 0.0
+        if fec_loss >= self.FEC_MIN_LOSS:
+            self.fec_ratio = min(self.FEC_MAX_RATIO, fec_loss * self.FEC_LOSS_GAIN)
 
-                    try:
-                        self.send_socket.sendto(
-                            fragment, (client_ip, client_info["port"])
-                        )
-                        total_bytes += len(fragment)
-                    except Exception as e:
-                        warn(f"Erro ao enviar fragmento {chunk_idx}/{total_chunks} para {client_ip}: {e}", "NET", rate_limit=5.0)
-                        client_success = False
-                        break
+        plain = None
+        protected = None
+        success_count = 0
+        total_bytes = 0
+        total_chunks = 0
 
-                if client_success:
-                    success_count += 1
+        for client_ip, client_port, fec in targets:
+            if fec and self.fec_ratio > 0:
+                if protected is None:
+                    protected = self._build_fec_fragments(
+                        packet_data, prefix, frame_id, self.fec_ratio
+                    )
+                datagrams = protected
+            else:
+                if plain is None:
+                    plain = self._build_fragments(packet_data, prefix, frame_id)
+                datagrams = plain
+            try:
+                total_bytes += self.video_batcher.send((client_ip, client_port), datagrams)
+                total_chunks += len(datagrams)
+                success_count += 1
+            except Exception as e:
+                warn(
+                    f"Erro ao enviar fragmentos ({len(datagrams)}) para {client_ip}: {e}",
+                    "NET",
+                    rate_limit=5.0,
+                )
 
         if success_count > 0:
             self.packets_sent += total_chunks
@@ -601,6 +818,87 @@ class NetworkManager:
             self.send_errors += 1
             return False
 
+    def _build_fragments(self, packet_data: bytes, prefix: bytes, frame_id: int) -> list:
+        """Monta os fragmentos FRAG (segmentos para o DatagramBatcher)"""
+        chunk_size = self.MAX_PACKET_SIZE - self.FRAG_HEADER_SIZE
+        prefix_len = len(prefix)
+        packet_len = prefix_len + len(packet_data)
+        total_chunks = (packet_len + chunk_size - 1) // chunk_size
+
+        # Cabeçalhos de todos os fragmentos em um único buffer
+        headers = bytearray(self.FRAG_HEADER_SIZE * total_chunks)
+        datagrams = []
+        for chunk_idx in range(total_chunks):
+            header_start = chunk_idx * self.FRAG_HEADER_SIZE
+            self.FRAG_HEADER.pack_into(
+                headers, header_start, self.FRAG_MAGIC, frame_id, chunk_idx, total_chunks
+            )
+            segments = [(headers, header_start, header_start + self.FRAG_HEADER_SIZE)]
+            segments.extend(
+                self._chunk_segments(packet_data, prefix, chunk_idx * chunk_size, chunk_size)
+            )
+            datagrams.append(segments)
+        return datagrams
+
+    def _build_fec_fragments(
+        self, packet_data: bytes, prefix: bytes, frame_id: int, ratio: float
+    ) -> list:
+        """Monta os fragmentos FEC: chunks de dados seguidos da paridade XOR"""
+        chunk_size = self.MAX_PACKET_SIZE - self.FEC_HEADER_SIZE
+        prefix_len = len(prefix)
+        packet_len = prefix_len + len(packet_data)
+        data_chunks = (packet_len + chunk_size - 1) // chunk_size
+        parity_chunks = min(data_chunks, 255, max(1, int(np.ceil(data_chunks * ratio))))
+        total = data_chunks + parity_chunks
+
+        # Pacote com padding de zeros até um múltiplo do chunk (buffer reutilizado)
+        padded_len = data_chunks * chunk_size
+        if self._fec_buffer.size < padded_len:
+            self._fec_buffer = np.zeros(padded_len, dtype=np.uint8)
+        padded = self._fec_buffer[:padded_len]
+        padded[:prefix_len] = np.frombuffer(prefix, dtype=np.uint8)
+        padded[prefix_len:packet_len] = np.frombuffer(packet_data, dtype=np.uint8)
+        padded[packet_len:] = 0
+        rows = padded.reshape(data_chunks, chunk_size)
+
+        parity = bytearray(parity_chunks * chunk_size)
+        parity_rows = np.frombuffer(parity, dtype=np.uint8).reshape(parity_chunks, chunk_size)
+        for group in range(parity_chunks):
+            np.bitwise_xor.reduce(rows[group::parity_chunks], axis=0, out=parity_rows[group])
+        del parity_rows
+
+        headers = bytearray(self.FEC_HEADER_SIZE * total)
+        datagrams = []
+        for index in range(total):
+            header_start = index * self.FEC_HEADER_SIZE
+            self.FEC_HEADER.pack_into(
+                headers, header_start, self.FEC_MAGIC, frame_id, index,
+                data_chunks, parity_chunks, 0, packet_len,
+            )
+            segments = [(headers, header_start, header_start + self.FEC_HEADER_SIZE)]
+            if index < data_chunks:
+                segments.extend(
+                    self._chunk_segments(packet_data, prefix, index * chunk_size, chunk_size)
+                )
+            else:
+                start = (index - data_chunks) * chunk_size
+                segments.append((parity, start, start + chunk_size))
+            datagrams.append(segments)
+
+        self.fec_parity_sent += parity_chunks
+        return datagrams
+
+    @staticmethod
+    def _chunk_segments(packet_data: bytes, prefix: bytes, start: int, chunk_size: int) -> list:
+        """Segmentos do trecho [start, start + chunk_size) de prefix + packet_data"""
+        prefix_len = len(prefix)
+        end = min(start + chunk_size, prefix_len + len(packet_data))
+        segments = []
+        if start < prefix_len:
+            segments.append((prefix, start, min(end, prefix_len)))
+        segments.append((packet_data, max(start - prefix_len, 0), end - prefix_len))
+        return segments
+
     def send_video_frame(self, frame_data: Optional[bytes]) -> bool:
         """
         Envia frame de vídeo (porta 9999).
@@ -614,19 +912,43 @@ class NetworkManager:
         if not frame_data:
             return False
 
-        # Pacote simples: 4 bytes tamanho + dados do frame
-        packet = struct.pack("<I", len(frame_data)) + frame_data
+        # Pacote simples: 4 bytes tamanho + dados do frame (o prefixo vai
+        # como segmento separado, sem copiar o frame)
+        return self._send_video_payload(frame_data, struct.pack("<I", len(frame_data)))
+
+    def send_h264_frame(self, frame: Dict[str, Any]) -> bool:
+        """
+        Envia um access unit H.264 (porta 9999) com seq e flag de keyframe.
+
+        Args:
+            frame (dict): Frame do NalRingBuffer {'seq', 'data', 'keyframe', ...}
+
+        Returns:
+            bool: True se enviado com sucesso
+        """
+        frame_data = frame["data"]
+        if not frame_data:
+            return False
+
+        flags = self.H264_FLAG_KEYFRAME if frame["keyframe"] else 0
+        header = self.H264_HEADER.pack(self.H264_MAGIC, frame["seq"], flags)
+        prefix = struct.pack("<I", len(header) + len(frame_data)) + header
+        return self._send_video_payload(frame_data, prefix)
+
+    def _send_video_payload(self, frame_data: bytes, prefix: bytes) -> bool:
+        """Envia prefixo + frame, fragmentando se necessário"""
+        packet_size = len(prefix) + len(frame_data)
 
         t0 = time.monotonic()
-        if len(packet) > self.MAX_PACKET_SIZE:
-            result = self._send_fragmented(packet)
+        if packet_size > self.MAX_PACKET_SIZE:
+            result = self._send_fragmented(frame_data, prefix)
         else:
-            result = self._send_single_packet(packet)
+            result = self._send_single_packet(frame_data, prefix)
         t_send = time.monotonic() - t0
 
         if t_send > 0.020:
             warn(
-                f"[DIAG] VIDEO SEND: {t_send*1000:.0f}ms, size={len(packet)}B",
+                f"[DIAG] VIDEO SEND: {t_send*1000:.0f}ms, size={packet_size}B",
                 "DIAG",
             )
 
@@ -635,6 +957,7 @@ class NetworkManager:
     def send_sensor_data(self, sensor_data: Dict[Any, Any]) -> bool:
         """
         Envia dados de sensores consolidados (porta 9997).
+        Clientes no formato CHN1 são ignorados (recebem send_channel_data).
 
         Args:
             sensor_data (dict): Dados dos sensores
@@ -648,23 +971,60 @@ class NetworkManager:
             return False
 
         try:
+            # Snapshot dos destinos (codificação e envio fora do lock)
+            with self.clients_lock:
+                targets = [
+                    (
+                        client_ip,
+                        client_info.get("sensor_format", SENSOR_FORMAT_JSON),
+                        client_info.pop("schema_pending", False),
+                    )
+                    for client_ip, client_info in self.connected_clients.items()
+                    if client_info.get("sensor_format") != SENSOR_FORMAT_CHANNELS
+                ]
+            if not targets:
+                return False
+
+            # Codifica uma vez por formato em uso
             t_serial_start = time.monotonic()
-            cleaned = self._convert_numpy_types(sensor_data)
-            sensor_json = json.dumps(cleaned, ensure_ascii=False)
-            sensor_bytes = sensor_json.encode("utf-8")
+            packets = {}  # {formato: bytes}
+            resend_schema = set()
+            for _, sensor_format, _ in targets:
+                if sensor_format in packets:
+                    continue
+                encoder = self.telemetry_encoders.get(sensor_format)
+                if encoder is None:
+                    cleaned = self._convert_numpy_types(sensor_data)
+                    packets[sensor_format] = json.dumps(
+                        cleaned, ensure_ascii=False
+                    ).encode("utf-8")
+                    continue
+                packets[sensor_format] = encoder.encode(sensor_data)
+                sent_id, sent_time = self._schema_sent[sensor_format]
+                now = time.monotonic()
+                if (
+                    encoder.schema_id != sent_id
+                    or now - sent_time >= self.SCHEMA_RESEND_INTERVAL
+                ):
+                    resend_schema.add(sensor_format)
+                    self._schema_sent[sensor_format] = (encoder.schema_id, now)
             t_serial = time.monotonic() - t_serial_start
 
             success_count = 0
+            sensor_bytes = b""
             t_sendto_start = time.monotonic()
-            with self.clients_lock:
-                for client_ip, client_info in self.connected_clients.items():
-                    try:
+            for client_ip, sensor_format, schema_pending in targets:
+                addr = (client_ip, self.sensor_port)
+                try:
+                    if sensor_format in resend_schema or schema_pending:
                         self.sensor_socket.sendto(
-                            sensor_bytes, (client_ip, self.sensor_port)
+                            self.telemetry_encoders[sensor_format].schema_packet(), addr
                         )
-                        success_count += 1
-                    except Exception:
-                        pass
+                    sensor_bytes = packets[sensor_format]
+                    self.sensor_socket.sendto(sensor_bytes, addr)
+                    success_count += 1
+                except Exception:
+                    pass
             t_sendto = time.monotonic() - t_sendto_start
 
             if t_serial > 0.050 or t_sendto > 0.050:
@@ -687,6 +1047,67 @@ class NetworkManager:
                 self.last_error_log = current_time
             return False
 
+    def send_channel_data(self, channel: int, data: Dict[Any, Any]) -> bool:
+        """
+        Publica um canal de telemetria para os clientes no formato CHN1.
+
+        Args:
+            channel: Canal lógico (CHANNEL_IMU, CHANNEL_POWER, ...)
+            data (dict): Dados da fonte do canal
+
+        Returns:
+            bool: True se enviado com sucesso
+        """
+        if not self.is_initialized or not self.sensor_socket:
+            return False
+
+        with self.clients_lock:
+            targets = [
+                client_ip
+                for client_ip, client_info in self.connected_clients.items()
+                if client_info.get("sensor_format") == SENSOR_FORMAT_CHANNELS
+            ]
+        if not targets:
+            return False
+
+        try:
+            encoder = self.channel_encoders[channel]
+            packet = encoder.encode(data)
+
+            # Schema na troca, periodicamente e após nova negociação
+            sent_id, sent_time = self._channel_schema_sent.get(channel, (-1, 0.0))
+            now = time.monotonic()
+            send_schema = (
+                encoder.schema_id != sent_id
+                or now - sent_time >= self.SCHEMA_RESEND_INTERVAL
+            )
+            if send_schema:
+                self._channel_schema_sent[channel] = (encoder.schema_id, now)
+
+            success_count = 0
+            for client_ip in targets:
+                addr = (client_ip, self.sensor_port)
+                try:
+                    if send_schema:
+                        self.sensor_socket.sendto(encoder.schema_packet(), addr)
+                    self.sensor_socket.sendto(packet, addr)
+                    success_count += 1
+                except Exception:
+                    pass
+
+            if success_count > 0:
+                self.packets_sent += 1
+                self.bytes_sent += len(packet)
+                return True
+            return False
+
+        except Exception as e:
+            current_time = time.time()
+            if current_time - self.last_error_log > 5.0:
+                warn(f"Erro ao enviar canal {channel}: {e}", "NET")
+                self.last_error_log = current_time
+            return False
+
     def send_frame_with_sensors(
         self, frame_data: Optional[bytes], sensor_data: Dict[Any, Any]
     ) -> bool:
@@ -726,6 +1147,8 @@ class NetworkManager:
             "packets_sent": self.packets_sent,
             "bytes_sent": self.bytes_sent,
             "send_errors": self.send_errors,
+            "fec_ratio": round(self.fec_ratio, 3),
+            "fec_parity_sent": self.fec_parity_sent,
             "elapsed_time": round(elapsed, 2),
             "packets_per_second": round(packets_per_second, 2),
             "bytes_per_second": round(bytes_per_second, 2),
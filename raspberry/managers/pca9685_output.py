@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+pca9685_output.py - Saída PWM Coalescida do PCA9685 (servos)
+Camada única de escrita nos canais do PCA9685, compartilhada por direção e
+freios: os managers só atualizam larguras de pulso em um buffer e um único
+flush por tick de controle escreve todos os canais alterados.
+
+FUNCIONAMENTO:
+=============
+- Buffer com os registradores (LEDn_ON, LEDn_OFF) dos 16 canais, lido do
+  chip na inicialização (canais não usados mantêm o valor atual)
+- set_angle()/set_pulse(): só alteram o buffer e marcam o canal (sem I2C)
+- flush(): escreve do menor ao maior canal alterado em UMA transação, com
+  auto-incremento (MODE1.AI, ativado pela lib ao definir a frequência):
+
+  | 0x06 + 4*lo | ON_L ON_H OFF_L OFF_H (canal lo) | ... | (canal hi) |
+
+  Direção (canal 0) + freios (3 e 7) = 33 bytes em vez de 3 transações
+- request_flush(): agenda o flush na thread do barramento (I2CBusScheduler)
+  com key por endereço — flushes pendentes se fundem em um só
+
+CONVERSÃO (igual a adafruit_motor.servo):
+========================================
+duty16 = min_duty + int(angle / actuation_range * duty_range)
+LEDn_OFF = duty16 >> 4 (12 bits), LEDn_ON = 0
+"""
+
+import struct
+import threading
+
+import board
+import busio
+from adafruit_pca9685 import PCA9685
+
+from managers.logger import info, warn
+
+
+class PCA9685Output:
+    """Buffer de pulsos dos 16 canais do PCA9685 com escrita em bloco"""
+
+    CHANNELS = 16
+    REG_LED0_ON_L = 0x06  # 4 registradores por canal
+    LED_FULL_OFF = 0x1000  # Bit 12 de LEDn_OFF: canal desligado
+    LED_REGS = struct.Struct("<HH")  # (ON, OFF) por canal
+
+    def __init__(self, address: int = 0x41, frequency: int = 50, i2c_scheduler=None):
+        """
+        Args:
+            address (int): Endereço I2C do PCA9685
+            frequency (int): Frequência PWM (50Hz para servos)
+            i2c_scheduler: I2CBusScheduler compartilhado entre dispositivos I2C
+        """
+        self.address = address
+        self.frequency = frequency
+        self.i2c_scheduler = i2c_scheduler
+
+        self.i2c = None
+        self.pca9685 = None
+        self.is_initialized = False
+
+        # Buffer (ON, OFF) por canal e canais alterados desde o último flush
+        self._lock = threading.Lock()
+        self._regs = [(0, self.LED_FULL_OFF)] * self.CHANNELS
+        self._dirty = set()
+        self._servos = {}  # canal -> (min_duty, duty_range, actuation_range)
+
+        # Estatísticas
+        self.flushes = 0
+        self.channels_written = 0
+
+    def initialize(self) -> bool:
+        """
+        Inicializa o PCA9685 e lê o estado atual dos canais
+
+        Returns:
+            bool: True se inicializado com sucesso
+        """
+        try:
+            if self.i2c_scheduler:
+                self.i2c_scheduler.call(self._setup, priority=0)
+            else:
+                self._setup()
+
+            self.is_initialized = True
+            info(f"PCA9685 0x{self.address:02X} @ {self.frequency:.1f}Hz (escrita em bloco)", "PCA9685")
+            return True
+
+        except Exception as e:
+            warn(f"Erro ao inicializar PCA9685 0x{self.address:02X}: {e}", "PCA9685")
+            self.is_initialized = False
+            return False
+
+    def _setup(self):
+        """Configura o chip e lê LED0..LED15 em um bloco (thread do barramento)"""
+        self.i2c = busio.I2C(board.SCL, board.SDA)
+        self.pca9685 = PCA9685(self.i2c, address=self.address)
+        self.pca9685.frequency = self.frequency
+        # Frequência real (prescaler inteiro) para a conversão dos pulsos
+        self.frequency = self.pca9685.frequency
+
+        raw = bytearray(self.LED_REGS.size * self.CHANNELS)
+        with self.pca9685.i2c_device as device:
+            device.write_then_readinto(bytes([self.REG_LED0_ON_L]), raw)
+        with self._lock:
+            self._regs = [
+                self.LED_REGS.unpack_from(raw, i * self.LED_REGS.size)
+                for i in range(self.CHANNELS)
+            ]
+            self._dirty.clear()
+
+    def add_servo(self, channel: int, min_pulse: int = 1000, max_pulse: int = 2000,
+                  actuation_range: float = 180.0):
+        """
+        Registra um servo no canal.
+
+        Args:
+            channel (int): Canal 0-15
+            min_pulse (int): Pulso em 0° (µs)
+            max_pulse (int): Pulso em actuation_range (µs)
+            actuation_range (float): Curso do servo (graus)
+        """
+        min_duty = int(min_pulse * self.frequency / 1000000 * 0xFFFF)
+        max_duty = max_pulse * self.frequency / 1000000 * 0xFFFF
+        self._servos[channel] = (min_duty, int(max_duty - min_duty), actuation_range)
+
+    def set_angle(self, channel: int, angle: float):
+        """Atualiza o ângulo de um servo no buffer (sem I2C)"""
+        min_duty, duty_range, actuation_range = self._servos[channel]
+        angle = max(0.0, min(actuation_range, angle))
+        duty = min_duty + int(angle / actuation_range * duty_range)
+        self._set_regs(channel, (0, duty >> 4))
+
+    def set_pulse(self, channel: int, pulse_us: float):
+        """Atualiza a largura de pulso de um canal no buffer (sem I2C)"""
+        duty = int(pulse_us * self.frequency / 1000000 * 0xFFFF)
+        self._set_regs(channel, (0, max(1, min(4095, duty >> 4))))
+
+    def _set_regs(self, channel: int, regs):
+        with self._lock:
+            if self._regs[channel] != regs:
+                self._regs[channel] = regs
+                self._dirty.add(channel)
+
+    def request_flush(self, wait: bool = False):
+        """
+        Agenda o flush na thread do barramento (prioridade alta).
+
+        Args:
+            wait (bool): Espera a escrita (inicialização); sem esperar, um
+                flush ainda pendente absorve este
+        """
+        if not self._dirty:
+            return
+        if not self.i2c_scheduler:
+            self.flush()
+        elif wait:
+            self.i2c_scheduler.call(self.flush, priority=0)
+        else:
+            self.i2c_scheduler.submit(self.flush, priority=0, key=("pca9685", self.address))
+
+    def flush(self) -> int:
+        """
+        Escreve os canais alterados em uma única transação I2C.
+
+        Returns:
+            int: Canais escritos (0 se nada mudou)
+        """
+        if not self.is_initialized:
+            return 0
+
+        with self._lock:
+            if not self._dirty:
+                return 0
+            dirty = self._dirty
+            self._dirty = set()
+            lo, hi = min(dirty), max(dirty)
+            regs = self._regs[lo:hi + 1]
+
+        size = self.LED_REGS.size
+        buffer = bytearray(1 + size * len(regs))
+        buffer[0] = self.REG_LED0_ON_L + size * lo
+        for i, (on, off) in enumerate(regs):
+            self.LED_REGS.pack_into(buffer, 1 + size * i, on, off)
+
+        try:
+            with self.pca9685.i2c_device as device:
+                device.write(buffer)
+        except Exception as e:
+            # Mantém os canais pendentes para o próximo flush
+            with self._lock:
+                self._dirty |= dirty
+            warn(f"Erro ao escrever PCA9685 0x{self.address:02X}: {e}", "PCA9685", rate_limit=5.0)
+            return 0
+
+        self.flushes += 1
+        self.channels_written += len(dirty)
+        return len(regs)
+
+    def cleanup(self):
+        """Libera o PCA9685 e o barramento"""
+        try:
+            if self.pca9685:
+                self.pca9685.deinit()
+                self.pca9685 = None
+            if self.i2c:
+                self.i2c.deinit()
+                self.i2c = None
+            self.is_initialized = False
+        except Exception as e:
+            warn(f"Erro ao finalizar PCA9685: {e}", "PCA9685")
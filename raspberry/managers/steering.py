@@ -96,12 +96,8 @@ import threading
 import time
 from typing import Any, Dict
 
-import board
-import busio
-from adafruit_motor import servo
-from adafruit_pca9685 import PCA9685
-
 from managers.logger import debug, error, info, warn
+from managers.pca9685_output import PCA9685Output
 
 
 class SteeringManager:
@@ -135,7 +131,8 @@ class SteeringManager:
         steering_sensitivity: float = 1.0,
         max_steering_angle: float = 90.0,  # ±90° (range completo 0°-180°)
         response_time: float = 0.15,
-        i2c_lock=None,  # Lock compartilhado do bus I2C
+        i2c_scheduler=None,  # Escalonador compartilhado do bus I2C
+        pwm_output: PCA9685Output = None,  # Saída PCA9685 compartilhada com freios
     ):
         """
         Inicializa o gerenciador de direção
@@ -146,9 +143,10 @@ class SteeringManager:
             steering_sensitivity (float): Sensibilidade da direção (0.5-2.0)
             max_steering_angle (float): Ângulo máximo de esterçamento
             response_time (float): Tempo de resposta da direção
-            i2c_lock: threading.Lock compartilhado entre dispositivos I2C
+            i2c_scheduler: I2CBusScheduler compartilhado entre dispositivos I2C
+            pwm_output: PCA9685Output compartilhado (None = cria um próprio)
         """
-        self.i2c_lock = i2c_lock
+        self.i2c_scheduler = i2c_scheduler
         self.steering_channel = steering_channel or self.STEERING_CHANNEL
         self.pca9685_address = pca9685_address or self.PCA9685_I2C_ADDRESS
 
@@ -169,10 +167,9 @@ class SteeringManager:
         self.servo_angle = self.STEERING_CENTER  # Ângulo do servo (0° a 180°)
         self.steering_input = 0.0  # Input de direção (-100% a +100%)
 
-        # Controle PCA9685
-        self.pca9685 = None
-        self.i2c = None
-        self.steering_servo = None
+        # Controle PCA9685 (buffer de pulsos; escrita em bloco no flush)
+        self.pwm_output = pwm_output
+        self._owns_output = pwm_output is None
 
         # Estado da direção
 
@@ -183,7 +180,6 @@ class SteeringManager:
         self.start_time = time.time()
         self.last_movement_time = 0.0
         self._last_log_time = 0.0
-        self._last_servo_angle = None  # Dedup I2C writes
 
     def initialize(self) -> bool:
         """
@@ -195,25 +191,22 @@ class SteeringManager:
         info(f"Inicializando direção | Canal: {self.steering_channel} | I2C: 0x{self.pca9685_address:02X} | Sens: {self.steering_sensitivity:.1f}x | ±{self.max_steering_angle}°", "STEERING")
 
         try:
-            # Inicializa barramento I2C (pode ser compartilhado com brake_manager)
-            self.i2c = busio.I2C(board.SCL, board.SDA)
-            self.pca9685 = PCA9685(self.i2c, address=self.pca9685_address)
-            self.pca9685.frequency = self.PWM_FREQUENCY
-            self.steering_servo = servo.Servo(
-                self.pca9685.channels[self.steering_channel],
+            # Saída PCA9685 (normalmente compartilhada com brake_manager)
+            if self.pwm_output is None:
+                self.pwm_output = PCA9685Output(
+                    self.pca9685_address, self.PWM_FREQUENCY, self.i2c_scheduler
+                )
+            if not self.pwm_output.is_initialized and not self.pwm_output.initialize():
+                raise RuntimeError(f"PCA9685 0x{self.pca9685_address:02X} indisponível")
+            self.pwm_output.add_servo(
+                self.steering_channel,
                 min_pulse=int(self.PULSE_MIN * 1000),  # converte para microssegundos
                 max_pulse=int(self.PULSE_MAX * 1000),
             )
 
-            # Posiciona servo na posição central
-            if self.i2c_lock:
-                self.i2c_lock.acquire(priority=0)
-                try:
-                    self.steering_servo.angle = self.STEERING_CENTER
-                finally:
-                    self.i2c_lock.release()
-            else:
-                self.steering_servo.angle = self.STEERING_CENTER
+            # Posiciona servo na posição central (espera a escrita)
+            self.pwm_output.set_angle(self.steering_channel, self.STEERING_CENTER)
+            self.pwm_output.request_flush(wait=True)
 
             # Aguarda servo se posicionar
             time.sleep(0.5)
@@ -232,13 +225,15 @@ class SteeringManager:
             self.is_initialized = False
             return False
 
-    def set_steering_input(self, steering_input: float):
+    def set_steering_input(self, steering_input: float, flush: bool = True):
         """
         Define entrada de direção
 
         Args:
             steering_input (float): Entrada de direção -100% a +100%
                                   (-100% = máximo esquerda, +100% = máximo direita)
+            flush (bool): Agenda a escrita no PCA9685; False quando o chamador
+                faz um único flush para direção e freios no mesmo tick
         """
         if not self.is_initialized:
             return
@@ -259,24 +254,15 @@ class SteeringManager:
             self.servo_angle = self.STEERING_CENTER + self.current_angle
 
             # Aplica movimento DIRETO ao servo (null check)
-            if self.steering_servo is not None:
+            if self.pwm_output is not None:
                 # Limita ângulo ao range válido do servo (0° a 180°)
                 final_angle = max(
                     self.STEERING_MIN_ANGLE,
                     min(self.STEERING_MAX_ANGLE, self.servo_angle),
                 )
 
-                # Só escreve no I2C se o ângulo mudou (dedup)
-                if self._last_servo_angle is None or abs(final_angle - self._last_servo_angle) >= 0.1:
-                    if self.i2c_lock:
-                        self.i2c_lock.acquire(priority=0)  # Alta
-                        try:
-                            self.steering_servo.angle = final_angle
-                        finally:
-                            self.i2c_lock.release()
-                    else:
-                        self.steering_servo.angle = final_angle
-                    self._last_servo_angle = final_angle
+                # Só atualiza o buffer; o canal só é escrito se o pulso mudou
+                self.pwm_output.set_angle(self.steering_channel, final_angle)
 
                 # Log rate limited a cada 1s
                 now = time.time()
@@ -293,6 +279,10 @@ class SteeringManager:
                 self.max_angle_reached = max(self.max_angle_reached, abs(target_angle))
                 self.last_movement_time = time.time()
 
+        # I2C fora do state_lock e sem esperar o barramento: o flush vai
+        # para a fila e se funde com um flush ainda não executado
+        if flush and self.pwm_output is not None:
+            self.pwm_output.request_flush()
 
     # REMOVIDO: funções auxiliares não usadas - movimento direto
 
@@ -369,14 +359,10 @@ class SteeringManager:
             self.center_steering()
             time.sleep(0.2)
 
-            # Libera referências (NÃO faz deinit — brake_manager faz deinit do PCA9685/I2C
-            # pois ambos compartilham o mesmo barramento físico e endereço 0x41)
-            if self.steering_servo:
-                self.steering_servo = None
-            if self.pca9685:
-                self.pca9685 = None
-            if self.i2c:
-                self.i2c = None
+            # Saída compartilhada é liberada por quem a criou (main.py)
+            if self.pwm_output and self._owns_output:
+                self.pwm_output.cleanup()
+            self.pwm_output = None
 
             self.is_initialized = False
             info("Sistema de direção finalizado", "STEERING")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+video_abr.py - Controle Adaptativo de Bitrate do Vídeo MJPEG (ABR)
+Ajusta qualidade JPEG, preset de resolução e FPS da câmera a partir dos
+relatórios VIDEO_FEEDBACK do cliente (perda, jitter e tempo de decode).
+
+SINAIS (VIDEO_FEEDBACK, ~1Hz):
+=============================
+- loss:      fração de chunks de vídeo perdidos (antes do FEC)
+- jitter_ms: variação do intervalo de chegada dos frames
+- decode_ms: tempo médio de decode JPEG no cliente
+
+DECISÃO:
+=======
+- Congestionado: perda > LOSS_HIGH ou jitter > JITTER_HIGH_MS
+  -> desce qualidade; no mínimo, desce resolução (qualidade volta ao teto);
+     na menor resolução, desce FPS (FPS é o último: latência de pilotagem)
+- Cliente lento: decode > DECODE_BUDGET do intervalo de frame
+  -> desce resolução (ou FPS): qualidade quase não muda o custo de decode
+- Folga: perda < LOSS_LOW, jitter < JITTER_LOW_MS e decode com sobra
+  -> sobe na ordem inversa: FPS, resolução (qualidade no mínimo), qualidade
+
+HISTERESE:
+=========
+- Desce após DOWN_REPORTS relatórios ruins seguidos; sobe após UP_REPORTS
+  relatórios bons seguidos
+- Nenhuma mudança antes de MIN_CHANGE_INTERVAL (encoder estabilizar);
+  subida só HOLD_AFTER_DOWN após uma descida (evita oscilação)
+- Teto = configuração da linha de comando ou último ajuste manual
+  (CAMERA_QUALITY / CAMERA_RESOLUTION)
+"""
+
+import time
+from typing import Any, Dict, Optional, Sequence
+
+
+class AdaptiveBitrateController:
+    """Controlador ABR de qualidade/resolução/FPS do MJPEG"""
+
+    QUALITY_MIN = 40
+    QUALITY_STEP = 10
+    FPS_MIN = 15
+    FPS_FACTOR = 0.75  # Passo multiplicativo de FPS
+
+    LOSS_HIGH = 0.08  # Acima do que o FEC costuma recuperar
+    LOSS_LOW = 0.01
+    JITTER_HIGH_MS = 30.0
+    JITTER_LOW_MS = 10.0
+    DECODE_BUDGET = 0.8  # Fração do intervalo de frame
+
+    DOWN_REPORTS = 2
+    UP_REPORTS = 5
+    MIN_CHANGE_INTERVAL = 2.0
+    HOLD_AFTER_DOWN = 10.0
+
+    def __init__(
+        self,
+        resolutions: Sequence[str],
+        resolution: Optional[str],
+        frame_rate: int,
+        quality: int,
+    ):
+        """
+        Args:
+            resolutions: Presets de resolução, do menor para o maior
+            resolution: Preset inicial (teto); None = resolução fora dos
+                presets (ABR não altera a resolução)
+            frame_rate: FPS inicial (teto)
+            quality: Qualidade JPEG inicial (teto)
+        """
+        self.resolutions = list(resolutions)
+        self.max_resolution = resolution
+        self.max_frame_rate = frame_rate
+        self.max_quality = quality
+
+        self.resolution = resolution
+        self.frame_rate = frame_rate
+        self.quality = quality
+
+        self._bad_reports = 0
+        self._good_reports = 0
+        self._last_change = 0.0
+        self._last_direction = 0  # -1 desceu, +1 subiu
+
+        # Estatísticas
+        self.steps_down = 0
+        self.steps_up = 0
+
+    def set_ceiling(self, resolution: Optional[str] = None, quality: Optional[int] = None):
+        """Ajuste manual: vira o novo teto e o valor atual"""
+        if resolution is not None:
+            self.max_resolution = self.resolution = resolution
+        if quality is not None:
+            self.max_quality = self.quality = quality
+        self._bad_reports = self._good_reports = 0
+        self._last_change = time.monotonic()
+
+    def update(self, feedback: Dict[str, float], now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Processa um relatório VIDEO_FEEDBACK.
+
+        Args:
+            feedback: {"loss": ..., "jitter_ms": ..., "decode_ms": ...}
+            now: Instante (time.monotonic) do relatório
+
+        Returns:
+            dict com os novos {"quality", "resolution", "frame_rate"} quando
+            há mudança, ou None
+        """
+        now = time.monotonic() if now is None else now
+        loss = feedback.get("loss", 0.0)
+        jitter = feedback.get("jitter_ms", 0.0)
+        decode = feedback.get("decode_ms", 0.0)
+        frame_interval_ms = 1000.0 / self.frame_rate
+
+        decode_bound = decode > self.DECODE_BUDGET * frame_interval_ms
+        congested = loss > self.LOSS_HIGH or jitter > self.JITTER_HIGH_MS
+        relaxed = (
+            loss < self.LOSS_LOW
+            and jitter < self.JITTER_LOW_MS
+            and decode < 0.5 * frame_interval_ms
+        )
+
+        if congested or decode_bound:
+            self._bad_reports += 1
+            self._good_reports = 0
+        elif relaxed:
+            self._good_reports += 1
+            self._bad_reports = 0
+        else:
+            self._bad_reports = self._good_reports = 0
+
+        since_change = now - self._last_change
+        if since_change < self.MIN_CHANGE_INTERVAL:
+            return None
+
+        changed = False
+        if self._bad_reports >= self.DOWN_REPORTS:
+            changed = self._step_down(decode_bound and not congested)
+            if changed:
+                self._last_direction = -1
+                self.steps_down += 1
+        elif self._good_reports >= self.UP_REPORTS:
+            if self._last_direction < 0 and since_change < self.HOLD_AFTER_DOWN:
+                return None
+            changed = self._step_up()
+            if changed:
+                self._last_direction = 1
+                self.steps_up += 1
+
+        if not changed:
+            return None
+        self._bad_reports = self._good_reports = 0
+        self._last_change = now
+        return self.get_settings()
+
+    def get_settings(self) -> Dict[str, Any]:
+        """Configuração atual de vídeo"""
+        return {
+            "quality": self.quality,
+            "resolution": self.resolution,
+            "frame_rate": self.frame_rate,
+        }
+
+    def _resolution_index(self, resolution: Optional[str]) -> int:
+        if resolution in self.resolutions:
+            return self.resolutions.index(resolution)
+        return -1
+
+    def _step_down(self, decode_bound: bool) -> bool:
+        """Reduz a carga um passo; False se já está no mínimo"""
+        res_idx = self._resolution_index(self.resolution)
+
+        if not decode_bound and self.quality > self.QUALITY_MIN:
+            self.quality = max(self.QUALITY_MIN, self.quality - self.QUALITY_STEP)
+            return True
+        if res_idx > 0:
+            # Resolução menor tem folga: qualidade volta ao teto
+            self.resolution = self.resolutions[res_idx - 1]
+            self.quality = self.max_quality
+            return True
+        if self.frame_rate > self.FPS_MIN:
+            self.frame_rate = max(self.FPS_MIN, int(self.frame_rate * self.FPS_FACTOR))
+            return True
+        return False
+
+    def _step_up(self) -> bool:
+        """Aumenta a carga um passo; False se já está no teto"""
+        res_idx = self._resolution_index(self.resolution)
+        max_idx = self._resolution_index(self.max_resolution)
+
+        if self.frame_rate < self.max_frame_rate:
+            self.frame_rate = min(
+                self.max_frame_rate, int(round(self.frame_rate / self.FPS_FACTOR))
+            )
+            return True
+        if 0 <= res_idx < max_idx:
+            # Resolução maior recomeça na qualidade mínima
+            self.resolution = self.resolutions[res_idx + 1]
+            self.quality = min(self.QUALITY_MIN, self.max_quality)
+            return True
+        if self.quality < self.max_quality:
+            self.quality = min(self.max_quality, self.quality + self.QUALITY_STEP)
+            return True
+        return False
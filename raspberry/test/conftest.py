@@ -0,0 +1,15 @@
+"""
+conftest.py - Configuração do pytest para os testes unitários do RPi
+
+Os testes unitários (test_*.py) importam os pacotes do projeto como no
+main.py (utils.<módulo>, managers.<módulo>), a partir de raspberry/. Os
+scripts de hardware desta pasta não seguem o padrão test_*.py e não são
+coletados.
+"""
+
+import sys
+from pathlib import Path
+
+RASPBERRY_DIR = str(Path(__file__).resolve().parent.parent)
+if RASPBERRY_DIR not in sys.path:
+    sys.path.insert(0, RASPBERRY_DIR)
@@ -0,0 +1,128 @@
+"""
+test_i2c_bus.py - Testes do escalonador do barramento I2C
+
+Sem hardware: as transações são funções Python que registram a ordem de
+execução. A thread do barramento é segurada por uma transação bloqueante
+enquanto a fila é montada.
+
+Roda: python -m pytest raspberry/test/test_i2c_bus.py
+"""
+
+import threading
+
+import pytest
+
+from utils.i2c_bus import I2CBusScheduler
+
+
+@pytest.fixture
+def bus():
+    scheduler = I2CBusScheduler()
+    scheduler.start()
+    yield scheduler
+    scheduler.stop()
+
+
+def _hold(bus):
+    """Ocupa a thread do barramento até o evento retornado ser setado"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5.0)
+
+    bus.submit(block, priority=bus.PRIORITY_HIGH)
+    assert started.wait(1.0)
+    return release
+
+
+def test_runs_inline_without_thread():
+    bus = I2CBusScheduler()
+    future = bus.submit(lambda a, b: a + b, 2, 3)
+
+    assert future.done() and future.result() == 5
+    assert bus.call(lambda: "ok") == "ok"
+
+
+def test_exception_is_delivered_to_caller(bus):
+    def fail():
+        raise OSError("NACK")
+
+    with pytest.raises(OSError, match="NACK"):
+        bus.call(fail)
+
+
+def test_keyed_submit_replaces_pending_request(bus):
+    executed = []
+    release = _hold(bus)
+
+    futures = [
+        bus.submit(executed.append, angle, priority=bus.PRIORITY_HIGH, key=("servo", 0))
+        for angle in (10, 20, 30)
+    ]
+    other = bus.submit(executed.append, "brake", priority=bus.PRIORITY_HIGH, key=("servo", 4))
+    release.set()
+    futures[-1].result(1.0)
+    other.result(1.0)
+
+    assert futures[0].cancelled() and futures[1].cancelled()
+    assert bus.replaced == 2
+    assert sorted(executed, key=str) == [30, "brake"]
+
+
+def test_deadline_order_within_priority(bus):
+    executed = []
+    release = _hold(bus)
+
+    for deadline in (30.0, 10.0, 20.0):
+        bus.submit(executed.append, deadline, priority=bus.PRIORITY_MEDIUM, deadline=deadline)
+    release.set()
+    bus.call(lambda: None, priority=bus.PRIORITY_LOW, deadline=60.0)
+
+    assert executed == [10.0, 20.0, 30.0]
+
+
+def test_late_request_runs_before_higher_priority(bus):
+    executed = []
+    release = _hold(bus)
+
+    bus.submit(executed.append, "steering", priority=bus.PRIORITY_HIGH, deadline=10.0)
+    bus.submit(executed.append, "ina219", priority=bus.PRIORITY_LOW, deadline=0.0)
+    release.set()
+    bus.call(lambda: None, priority=bus.PRIORITY_LOW, deadline=60.0)
+
+    assert executed == ["ina219", "steering"]
+
+
+def test_weighted_interleave_between_priorities(bus):
+    executed = []
+    release = _hold(bus)
+
+    for i in range(6):
+        bus.submit(executed.append, "H", priority=bus.PRIORITY_HIGH, deadline=10.0 + i)
+    for i in range(2):
+        bus.submit(executed.append, "L", priority=bus.PRIORITY_LOW, deadline=10.0 + i)
+    release.set()
+    bus.call(lambda: None, priority=bus.PRIORITY_LOW, deadline=60.0)
+
+    # A transação bloqueante já contou como 1º turno da prioridade alta
+    assert "".join(executed) == "HHLHHHLH"
+
+
+def test_stop_drains_pending_requests():
+    bus = I2CBusScheduler()
+    bus.start()
+    executed = []
+    release = _hold(bus)
+
+    futures = [bus.submit(executed.append, i, deadline=10.0 + i) for i in range(5)]
+    threading.Timer(0.05, release.set).start()
+    bus.stop()
+
+    assert executed == [0, 1, 2, 3, 4]
+    assert all(future.done() and not future.cancelled() for future in futures)
+    assert not bus.is_running
+    # Depois de stop(), executa direto na thread do chamador
+    assert bus.submit(executed.append, 5).done()
+    assert executed[-1] == 5
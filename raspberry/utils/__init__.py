@@ -1,3 +1,4 @@
-from .i2c_lock import PriorityI2CLock
+from .i2c_bus import I2CBusScheduler
+from .udp_batch import DatagramBatcher
 
-__all__ = ["PriorityI2CLock"]
+__all__ = ["DatagramBatcher", "I2CBusScheduler"]
@@ -0,0 +1,202 @@
+"""Escalonador do barramento I2C (uma única thread dona do bus).
+
+Substitui o PriorityI2CLock: em vez de cada thread (comandos, BMI160,
+energia) esperar o lock e fazer o I/O por conta própria, todas submetem
+transações para a thread do barramento, que as executa em sequência.
+
+    submit(fn, *args) -> Future   enfileira e retorna (não bloqueia)
+    call(fn, *args)   -> resultado  submit() + espera (leituras síncronas)
+
+Uma transação submetida com key substitui a pendente de mesma key ainda
+não executada (alvos de servo: só o mais recente importa).
+
+Ordem de execução:
+    1. Transações com deadline vencido, menor deadline primeiro
+    2. Intercalação por peso entre prioridades (turnos consecutivos):
+        0 = Alta  (steering/brake): 3 turnos seguidos
+        1 = Média (BMI160):         2 turnos seguidos
+        2 = Baixa (INA219):         1 turno seguido
+    3. Dentro da mesma prioridade, menor deadline primeiro (EDF)
+
+Sem a thread rodando (antes de start() ou depois de stop()) ou quando
+chamado da própria thread do barramento, a transação executa direto.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+
+class _Request:
+    __slots__ = ("fn", "args", "deadline", "key", "future")
+
+    def __init__(self, fn, args, deadline, key):
+        self.fn = fn
+        self.args = args
+        self.deadline = deadline
+        self.key = key
+        self.future = Future()
+
+
+class I2CBusScheduler:
+    """Fila de transações I2C com prioridade e deadline (uma thread dona)."""
+
+    PRIORITY_HIGH = 0    # Steering, Brake
+    PRIORITY_MEDIUM = 1  # BMI160
+    PRIORITY_LOW = 2     # INA219
+
+    # Turnos consecutivos antes de ceder vez
+    WEIGHT = {0: 3, 1: 2, 2: 1}
+
+    # Deadline padrão (s após o submit) por prioridade
+    DEADLINE = {0: 0.005, 1: 0.010, 2: 0.100}
+
+    # Espera máxima de call() (s)
+    CALL_TIMEOUT = 1.0
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queues = ([], [], [])  # heaps de (deadline, seq, _Request)
+        self._pending_keys = {}  # key -> _Request ainda na fila
+        self._seq = itertools.count()
+        self._run_prio = -1  # Última prioridade que executou
+        self._run_count = 0  # Execuções consecutivas dessa prioridade
+        self._running = False
+        self._thread = None
+
+        # Estatísticas
+        self.executed = 0
+        self.replaced = 0  # Transações substituídas por outra de mesma key
+        self.late = 0  # Executadas depois do deadline
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Inicia a thread do barramento."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="I2CBus", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Executa as transações pendentes e para a thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def submit(self, fn, *args, priority: int = 1, deadline: float = None, key=None) -> Future:
+        """Enfileira uma transação.
+
+        Args:
+            fn: Função que faz o I/O (executada na thread do barramento)
+            *args: Argumentos de fn
+            priority: PRIORITY_HIGH, PRIORITY_MEDIUM ou PRIORITY_LOW
+            deadline: Prazo em s a partir de agora (None = DEADLINE[priority])
+            key: Identifica o alvo; substitui a pendente com a mesma key
+
+        Returns:
+            Future com o retorno de fn (ou a exceção); cancelado se
+            substituído antes de executar
+        """
+        if deadline is None:
+            deadline = self.DEADLINE[priority]
+        request = _Request(fn, args, time.monotonic() + deadline, key)
+
+        with self._cond:
+            queued = self._running and threading.current_thread() is not self._thread
+            if queued:
+                if key is not None:
+                    old = self._pending_keys.get(key)
+                    if old is not None and old.future.cancel():
+                        self.replaced += 1
+                    self._pending_keys[key] = request
+                heapq.heappush(
+                    self._queues[priority], (request.deadline, next(self._seq), request)
+                )
+                self._cond.notify()
+
+        if not queued:
+            self._execute(request)
+        return request.future
+
+    def call(self, fn, *args, priority: int = 1, deadline: float = None, timeout: float = None):
+        """Executa uma transação e espera o resultado.
+
+        Raises:
+            A exceção de fn, ou concurrent.futures.TimeoutError
+        """
+        future = self.submit(fn, *args, priority=priority, deadline=deadline)
+        return future.result(self.CALL_TIMEOUT if timeout is None else timeout)
+
+    # ------------------------------------------------------------------
+    # Thread do barramento
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._cond:
+                request = self._next_request()
+                while request is None:
+                    if not self._running:
+                        return
+                    self._cond.wait()
+                    request = self._next_request()
+
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            if time.monotonic() > request.deadline:
+                self.late += 1
+            self._execute(request)
+
+    def _next_request(self):
+        """Retira a próxima transação da fila (chamar com _cond)."""
+        queues = self._queues
+        for queue in queues:
+            while queue and queue[0][2].future.cancelled():
+                heapq.heappop(queue)
+
+        ready = [p for p in range(3) if queues[p]]
+        if not ready:
+            return None
+
+        now = time.monotonic()
+        late = [p for p in ready if queues[p][0][0] <= now]
+        if late:
+            priority = min(late, key=lambda p: queues[p][0][0])
+        else:
+            priority = ready[0]
+            for p in ready:
+                # Prioridade que esgotou seus turnos cede vez às demais
+                exceeded = self._run_prio == p and self._run_count >= self.WEIGHT[p]
+                if not exceeded or len(ready) == 1:
+                    priority = p
+                    break
+
+        if self._run_prio == priority:
+            self._run_count += 1
+        else:
+            self._run_prio = priority
+            self._run_count = 1
+
+        request = heapq.heappop(queues[priority])[2]
+        if request.key is not None and self._pending_keys.get(request.key) is request:
+            del self._pending_keys[request.key]
+        return request
+
+    def _execute(self, request):
+        try:
+            result = request.fn(*request.args)
+        except Exception as e:
+            request.future.set_exception(e)
+        else:
+            request.future.set_result(result)
+        self.executed += 1
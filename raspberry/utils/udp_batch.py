@@ -0,0 +1,205 @@
+"""Envio de datagramas UDP em lote (scatter-gather + sendmmsg).
+
+Cada datagrama é descrito como uma lista de segmentos (buffer, início, fim)
+que são enviados sem concatenação: o kernel junta os pedaços (iovec).
+
+Caminhos, do mais rápido para o mais portável:
+    sendmmsg (Linux, via ctypes): todos os datagramas em uma syscall
+    socket.sendmsg (POSIX):       uma syscall por datagrama, sem cópia
+    socket.sendto (Windows):      junta os segmentos (uma cópia)
+"""
+
+import ctypes
+import errno
+import socket
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_ushort),  # Ordem de rede
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8),
+    ]
+
+
+def _load_sendmmsg():
+    """Retorna sendmmsg da libc, ou None se indisponível"""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.sendmmsg
+    except (OSError, AttributeError, TypeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    func.restype = ctypes.c_int
+    return func
+
+
+def _buffer_address(buf) -> int:
+    """Endereço do conteúdo de um bytes/bytearray (sem cópia)"""
+    if isinstance(buf, bytes):
+        return ctypes.cast(ctypes.c_char_p(buf), ctypes.c_void_p).value
+    return ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+
+
+class DatagramBatcher:
+    """Envia listas de datagramas (segmentos scatter-gather) por um socket UDP.
+
+    Exemplo:
+        batcher = DatagramBatcher(sock)
+        batcher.send(("192.168.1.10", 9999), [
+            [(header0, 0, 12), (frame, 0, 59988)],
+            [(header1, 0, 12), (frame, 59988, 80000)],
+        ])
+    """
+
+    # Datagramas por syscall sendmmsg (UIO_MAXIOV = 1024)
+    MAX_BATCH = 64
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._sendmmsg = _load_sendmmsg() if sock.family == socket.AF_INET else None
+        self._addr_cache = {}
+
+        if self._sendmmsg is not None:
+            self.mode = "sendmmsg"
+        elif hasattr(sock, "sendmsg"):
+            self.mode = "sendmsg"
+        else:
+            self.mode = "sendto"
+
+        self.syscalls = 0
+
+    def send(self, addr, datagrams) -> int:
+        """
+        Envia os datagramas para addr, na ordem.
+
+        Args:
+            addr: (ip, porta) de destino (IPv4 numérico para sendmmsg)
+            datagrams: Lista de datagramas; cada um é uma lista de segmentos
+                (buffer bytes/bytearray, início, fim)
+
+        Returns:
+            int: Bytes enviados
+
+        Raises:
+            OSError: Falha no envio (como socket.sendto)
+        """
+        if self.mode == "sendmmsg":
+            sockaddr = self._sockaddr(addr)
+            if sockaddr is not None:
+                try:
+                    return self._send_mmsg(sockaddr, datagrams)
+                except OSError as e:
+                    if e.errno not in (errno.ENOSYS, errno.EPERM):
+                        raise
+                    # Kernel/seccomp sem sendmmsg: usa sendmsg daqui em diante
+                    # (import local: managers.network importa este módulo)
+                    from managers.logger import warn
+
+                    warn(f"sendmmsg indisponível ({e}), usando sendmsg", "NET")
+                    self.mode = "sendmsg"
+
+        total = 0
+        for segments in datagrams:
+            if self.mode == "sendmsg":
+                buffers = [
+                    memoryview(buf)[start:end] for buf, start, end in segments if end > start
+                ]
+                total += self.sock.sendmsg(buffers, [], 0, addr)
+            else:
+                data = b"".join(
+                    memoryview(buf)[start:end] for buf, start, end in segments
+                )
+                total += self.sock.sendto(data, addr)
+            self.syscalls += 1
+        return total
+
+    def _sockaddr(self, addr):
+        """sockaddr_in em cache por destino (None se não for IPv4 numérico)"""
+        sockaddr = self._addr_cache.get(addr)
+        if sockaddr is None:
+            try:
+                packed = socket.inet_aton(addr[0])
+            except OSError:
+                return None
+            sockaddr = _SockAddrIn()
+            sockaddr.sin_family = socket.AF_INET
+            sockaddr.sin_port = socket.htons(addr[1])
+            sockaddr.sin_addr[:] = packed
+            self._addr_cache[addr] = sockaddr
+        return sockaddr
+
+    def _send_mmsg(self, sockaddr, datagrams) -> int:
+        """Envia via sendmmsg em lotes de MAX_BATCH"""
+        fd = self.sock.fileno()
+        total = 0
+        for batch_start in range(0, len(datagrams), self.MAX_BATCH):
+            batch = datagrams[batch_start:batch_start + self.MAX_BATCH]
+            count = len(batch)
+
+            # Um array de iovec contíguo para todo o lote
+            iov_count = sum(len(segments) for segments in batch)
+            iovecs = (_IOVec * iov_count)()
+            msgs = (_MMsgHdr * count)()
+            addresses = {}
+            iov_index = 0
+            for i, segments in enumerate(batch):
+                hdr = msgs[i].msg_hdr
+                hdr.msg_name = ctypes.addressof(sockaddr)
+                hdr.msg_namelen = ctypes.sizeof(sockaddr)
+                hdr.msg_iov = ctypes.cast(
+                    ctypes.addressof(iovecs) + iov_index * ctypes.sizeof(_IOVec),
+                    ctypes.POINTER(_IOVec),
+                )
+                first = iov_index
+                for buf, start, end in segments:
+                    if end <= start:
+                        continue
+                    base = addresses.get(id(buf))
+                    if base is None:
+                        base = addresses[id(buf)] = _buffer_address(buf)
+                    iovecs[iov_index].iov_base = base + start
+                    iovecs[iov_index].iov_len = end - start
+                    iov_index += 1
+                hdr.msg_iovlen = iov_index - first
+
+            sent = 0
+            while sent < count:
+                pending = ctypes.cast(
+                    ctypes.addressof(msgs) + sent * ctypes.sizeof(_MMsgHdr),
+                    ctypes.POINTER(_MMsgHdr),
+                )
+                result = self._sendmmsg(fd, pending, count - sent, 0)
+                self.syscalls += 1
+                if result < 0:
+                    err = ctypes.get_errno()
+                    if err == errno.EINTR:
+                        continue
+                    raise OSError(err, f"sendmmsg: {errno.errorcode.get(err, err)}")
+                if result == 0:
+                    raise OSError(errno.EIO, "sendmmsg não enviou nenhum datagrama")
+                for i in range(sent, sent + result):
+                    total += msgs[i].msg_len
+                sent += result
+        return total
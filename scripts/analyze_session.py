@@ -5,8 +5,14 @@ analyze_session.py - Analisador de Sessões F1 Car
 Analisa dados salvos pelo auto-save:
 - sensors_*.pkl - Dados brutos dos sensores BMI160
 - telemetry_*.pkl - Dados dos gráficos de telemetria
+- session_*.f1rec - Gravação contínua (sensores, telemetria, FF)
 - logs_*.txt - Logs do console
 
+No modo padrão (todos os arquivos) os dados vêm do session_loader.py:
+store colunar em cache, atualizado só com os arquivos novos/alterados.
+Com --latest/--timestamp, sensores e telemetria vêm do .pkl ou do
+session_*.f1rec da sessão (com o gravador ativo não há .pkl).
+
 Uso:
     python analyze_session.py                     # Analisa arquivos mais recentes
     python analyze_session.py --dir exports/auto  # Especifica diretório
@@ -33,9 +39,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 try:
     import numpy as np
 
+    from session_loader import load_session
+    from session_store import SESSION_PATTERN, read_source
+
     NUMPY_AVAILABLE = True
 except ImportError:
     NUMPY_AVAILABLE = False
+    SESSION_PATTERN = "session_*.f1rec"
+    load_session = None
+    read_source = None
     print("[WARN] NumPy não instalado. Estatísticas limitadas.")
 
 try:
@@ -116,13 +128,40 @@ class SessionAnalyzer:
         self.sensor_data: Optional[Dict] = None
         self.log_content: Optional[str] = None
         self.stats = SessionStats()
+        self.session = None  # session_loader.Session (modo todos os arquivos)
+        self._recording = None  # (arquivo .f1rec, blocos por stream) já lido
+
+    def _session(self):
+        """Sessão do diretório (store em cache, atualizado uma vez por execução)"""
+        if self.session is None:
+            self.session = load_session(self.data_dir)
+        return self.session
+
+    @staticmethod
+    def _file_timestamp(path: Path) -> str:
+        """Timestamp YYYYMMDD_HHMMSS do nome (telemetry_/sensors_/session_...)"""
+        return path.stem.split("_", 1)[-1]
 
     def find_latest_files(
         self,
     ) -> Tuple[Optional[Path], Optional[Path], Optional[Path]]:
-        """Encontra os arquivos mais recentes de cada tipo"""
-        telemetry_files = sorted(self.data_dir.glob("telemetry_*.pkl"), reverse=True)
-        sensor_files = sorted(self.data_dir.glob("sensors_*.pkl"), reverse=True)
+        """
+        Encontra os arquivos mais recentes de cada tipo.
+
+        Telemetria e sensores vêm do .pkl ou do session_*.f1rec, o que for
+        mais recente (com o gravador ativo o auto-save não gera .pkl)
+        """
+        sessions = list(self.data_dir.glob(SESSION_PATTERN))
+        telemetry_files = sorted(
+            [*self.data_dir.glob("telemetry_*.pkl"), *sessions],
+            key=self._file_timestamp,
+            reverse=True,
+        )
+        sensor_files = sorted(
+            [*self.data_dir.glob("sensors_*.pkl"), *sessions],
+            key=self._file_timestamp,
+            reverse=True,
+        )
         log_files = sorted(self.data_dir.glob("logs_*.txt"), reverse=True)
 
         return (
@@ -134,10 +173,15 @@ class SessionAnalyzer:
     def find_matching_files(
         self, timestamp: str
     ) -> Tuple[Optional[Path], Optional[Path], Optional[Path]]:
-        """Encontra arquivos com o mesmo timestamp"""
+        """Encontra arquivos com o mesmo timestamp (.pkl ou session_*.f1rec)"""
         telemetry = self.data_dir / f"telemetry_{timestamp}.pkl"
         sensors = self.data_dir / f"sensors_{timestamp}.pkl"
         logs = self.data_dir / f"logs_{timestamp}.txt"
+        recording = self.data_dir / SESSION_PATTERN.replace("*", timestamp)
+        if not telemetry.exists():
+            telemetry = recording
+        if not sensors.exists():
+            sensors = recording
 
         return (
             telemetry if telemetry.exists() else None,
@@ -145,11 +189,46 @@ class SessionAnalyzer:
             logs if logs.exists() else None,
         )
 
+    def _load_recording(self, filepath: Path, stream: str) -> Optional[Dict]:
+        """Colunas de um stream do session_*.f1rec, no formato de listas dos .pkl"""
+        if read_source is None:
+            raise RuntimeError("NumPy necessário para ler .f1rec")
+        if self._recording is None or self._recording[0] != filepath:
+            # Chunks válidos (sessão interrompida também: sem índice)
+            self._recording = (filepath, read_source(filepath)[0])
+        blocks = self._recording[1].get(stream)
+        if not blocks:
+            return None
+
+        columns = {}
+        for block in blocks:
+            columns.update(dict.fromkeys(block))
+        columns = {key: [] for key in columns}
+        for block in blocks:
+            rows = max(len(values) for values in block.values())
+            for key, column in columns.items():
+                values = block.get(key)
+                if values is None:
+                    column.extend([None] * rows)
+                elif isinstance(values, np.ndarray) and values.dtype != object:
+                    column.extend(None if v != v else v for v in values.tolist())
+                else:
+                    column.extend(values)
+        return columns
+
     def load_telemetry(self, filepath: Path) -> bool:
-        """Carrega dados de telemetria"""
+        """Carrega dados de telemetria (.pkl ou session_*.f1rec)"""
         try:
-            with open(filepath, "rb") as f:
-                self.telemetry_data = pickle.load(f)
+            if filepath.suffix == ".f1rec":
+                data = self._load_recording(filepath, "telemetry")
+                if data is None:
+                    print(f"[INFO] {filepath.name}: sem telemetria")
+                    return False
+                data["points_count"] = len(data.get("time", []))
+                self.telemetry_data = data
+            else:
+                with open(filepath, "rb") as f:
+                    self.telemetry_data = pickle.load(f)
             print(f"[OK] Telemetria carregada: {filepath.name}")
             print(
                 f"     Pontos: {self.telemetry_data.get('points_count', len(self.telemetry_data.get('time', [])))}"
@@ -160,10 +239,17 @@ class SessionAnalyzer:
             return False
 
     def load_sensors(self, filepath: Path) -> bool:
-        """Carrega dados de sensores"""
+        """Carrega dados de sensores (.pkl ou session_*.f1rec)"""
         try:
-            with open(filepath, "rb") as f:
-                self.sensor_data = pickle.load(f)
+            if filepath.suffix == ".f1rec":
+                data = self._load_recording(filepath, "sensors")
+                if data is None:
+                    print(f"[INFO] {filepath.name}: sem dados de sensores")
+                    return False
+                self.sensor_data = data
+            else:
+                with open(filepath, "rb") as f:
+                    self.sensor_data = pickle.load(f)
             print(f"[OK] Sensores carregados: {filepath.name}")
 
             # Conta pontos
@@ -201,90 +287,54 @@ class SessionAnalyzer:
         return telemetry_count, sensor_count, log_count
 
     def _load_all_telemetry(self) -> int:
-        """Carrega e combina todos os arquivos de telemetria"""
-        telemetry_files = sorted(self.data_dir.glob("telemetry_*.pkl"))
+        """Carrega toda a telemetria da pasta (session_loader.py)"""
+        telemetry_files = sorted(self.data_dir.glob("telemetry_*.pkl")) + sorted(
+            self.data_dir.glob(SESSION_PATTERN)
+        )
 
         if not telemetry_files:
             print("[INFO] Nenhum arquivo de telemetria encontrado")
             return 0
 
-        print(f"\n--- Carregando {len(telemetry_files)} arquivos de telemetria ---")
-
-        combined_data = {}
-        total_points = 0
-
-        for filepath in telemetry_files:
-            try:
-                with open(filepath, "rb") as f:
-                    data = pickle.load(f)
-
-                # Combina os dados
-                for key, values in data.items():
-                    if key in [
-                        "start_time",
-                        "max_points",
-                        "export_time",
-                        "points_count",
-                    ]:
-                        continue  # Pula metadados
-
-                    if isinstance(values, list):
-                        if key not in combined_data:
-                            combined_data[key] = []
-                        combined_data[key].extend(values)
-
-                points = data.get("points_count", len(data.get("time", [])))
-                total_points += points
-                print(f"  [+] {filepath.name}: {points} pontos")
-
-            except Exception as e:
-                print(f"  [!] Erro em {filepath.name}: {e}")
+        print(f"\n--- Carregando telemetria de {len(telemetry_files)} arquivos ---")
 
-        if combined_data:
-            self.telemetry_data = combined_data
-            self.telemetry_data["points_count"] = total_points
+        if load_session is None:
+            print("[ERRO] NumPy necessário para combinar os arquivos (use --latest)")
+            return 0
+        store = self._session().stream("telemetry", as_list=True)
+        if store is not None:
+            # Poucas colunas: materializa (metadado points_count entra no dict)
+            self.telemetry_data = dict(store)
+            self.telemetry_data["points_count"] = store.rows
             print(
-                f"[OK] Total telemetria: {total_points} pontos de {len(telemetry_files)} arquivos"
+                f"[OK] Total telemetria: {store.rows} pontos de {len(telemetry_files)} arquivos"
             )
 
         return len(telemetry_files)
 
     def _load_all_sensors(self) -> int:
-        """Carrega e combina todos os arquivos de sensores"""
-        sensor_files = sorted(self.data_dir.glob("sensors_*.pkl"))
+        """Carrega todos os sensores da pasta (session_loader.py).
+
+        As colunas são lidas sob demanda (memmap), no formato de listas dos .pkl.
+        """
+        sensor_files = sorted(self.data_dir.glob("sensors_*.pkl")) + sorted(
+            self.data_dir.glob(SESSION_PATTERN)
+        )
 
         if not sensor_files:
             print("[INFO] Nenhum arquivo de sensores encontrado")
             return 0
 
-        print(f"\n--- Carregando {len(sensor_files)} arquivos de sensores ---")
+        print(f"\n--- Carregando sensores de {len(sensor_files)} arquivos ---")
 
-        combined_data = {}
-        total_points = 0
-
-        for filepath in sensor_files:
-            try:
-                with open(filepath, "rb") as f:
-                    data = pickle.load(f)
-
-                # Combina os dados
-                for key, values in data.items():
-                    if isinstance(values, (list, tuple)):
-                        if key not in combined_data:
-                            combined_data[key] = []
-                        combined_data[key].extend(list(values))
-
-                points = len(data.get("timestamp", []))
-                total_points += points
-                print(f"  [+] {filepath.name}: {points} pontos")
-
-            except Exception as e:
-                print(f"  [!] Erro em {filepath.name}: {e}")
-
-        if combined_data:
-            self.sensor_data = combined_data
+        if load_session is None:
+            print("[ERRO] NumPy necessário para combinar os arquivos (use --latest)")
+            return 0
+        store = self._session().stream("sensors", as_list=True)
+        if store is not None:
+            self.sensor_data = store
             print(
-                f"[OK] Total sensores: {total_points} pontos de {len(sensor_files)} arquivos"
+                f"[OK] Total sensores: {store.rows} pontos de {len(sensor_files)} arquivos"
             )
 
         return len(sensor_files)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+session_loader.py - Carregamento compartilhado de sessões F1 Car (scripts)
+
+Ponto único de leitura dos dados do auto-save para os scripts de relatório
+e gráficos. Carrega o diretório uma vez, via store colunar em cache
+(session_store.py): a cada execução só os arquivos novos ou alterados
+(mtime/tamanho) são lidos e acrescentados às colunas.
+
+STREAMS:
+=======
+- sensors:   pacotes do RPi (~100Hz) + timings do cliente
+- ff:        métricas calculadas no cliente (FF, vídeo) (~100Hz)
+- telemetry: pontos dos gráficos de telemetria (~10Hz)
+
+ALINHAMENTO:
+===========
+session.align("ff", fields, on="sensors") devolve as colunas de um stream
+reamostradas na linha de tempo de outro: para cada timestamp de destino,
+a amostra mais recente com até `tolerance` segundos de atraso (NaN/None
+quando não há).
+
+Uso:
+    from session_loader import load_session
+
+    session = load_session("sessoes/01_indoor_20260413/exports/auto")
+    sensors = session.stream("sensors", numeric_only=True)
+    ff = session.align("ff", ["inertia", "ff_context"])
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from session_store import open_stream, update
+
+
+class Session:
+    """Streams de uma sessão, abertos sob demanda a partir do store em cache"""
+
+    def __init__(self, data_dir, verbose: bool = True):
+        """
+        Args:
+            data_dir: Diretório do auto-save (exports/auto)
+            verbose: Mostra o resumo da atualização do store
+        """
+        self.data_dir = Path(data_dir)
+        self.manifest = update(self.data_dir, verbose=verbose)
+        self._streams = {}
+        self._order = {}
+
+    @property
+    def sources(self) -> list[str]:
+        """Arquivos de origem no cache (ordem cronológica)"""
+        return [entry["name"] for entry in self.manifest["sources"]]
+
+    def rows(self, stream: str) -> int:
+        meta = self.manifest["streams"].get(stream)
+        return meta["rows"] if meta else 0
+
+    def stream(self, name: str, numeric_only: bool = False, as_list: bool = False):
+        """
+        Colunas de um stream (memmap, lidas sob demanda).
+
+        Args:
+            name: "sensors", "ff" ou "telemetry"
+            numeric_only: Omite campos string
+            as_list: Colunas como listas (formato dos .pkl)
+
+        Returns:
+            ColumnStore, ou None se o stream não tem dados
+        """
+        key = (name, numeric_only, as_list)
+        if key not in self._streams:
+            self._streams[key] = open_stream(
+                self.data_dir, name, as_list=as_list,
+                numeric_only=numeric_only, rebuild=False,
+            )
+        return self._streams[key]
+
+    def _timeline(self, name: str):
+        """(timestamps ordenados, índices de ordenação ou None) de um stream"""
+        if name not in self._order:
+            columns = self.stream(name)
+            if columns is None or "timestamp" not in columns:
+                self._order[name] = (None, None)
+            else:
+                ts = np.asarray(columns["timestamp"])
+                valid = ~np.isnan(ts)
+                if valid.all() and (len(ts) < 2 or np.all(np.diff(ts) >= 0)):
+                    self._order[name] = (ts, None)
+                else:
+                    # Arquivos de sessões diferentes podem se sobrepor: ordena
+                    order = np.flatnonzero(valid)
+                    order = order[np.argsort(ts[order], kind="stable")]
+                    self._order[name] = (ts[order], order)
+        return self._order[name]
+
+    def align(self, name: str, fields=None, on: str = "sensors",
+              tolerance: float = 0.1) -> dict:
+        """
+        Reamostra colunas de um stream na linha de tempo de outro.
+
+        Args:
+            name: Stream de origem ("ff", "telemetry", ...)
+            fields: Campos desejados (None = todos)
+            on: Stream de destino (define os timestamps)
+            tolerance: Atraso máximo aceito (s)
+
+        Returns:
+            dict: {campo: np.ndarray} com len(on) linhas — float64 (NaN sem
+                amostra) ou object (None sem amostra); vazio se algum dos
+                streams não tem timestamps
+        """
+        target = self.stream(on)
+        source = self.stream(name)
+        src_ts, order = self._timeline(name)
+        if target is None or source is None or src_ts is None or "timestamp" not in target:
+            return {}
+
+        ts = np.asarray(target["timestamp"])
+        idx = np.searchsorted(src_ts, ts, side="right") - 1
+        found = idx >= 0
+        found[found] &= (ts[found] - src_ts[idx[found]]) <= tolerance
+        idx = np.where(found, idx, 0)
+        if order is not None:
+            idx = order[idx] if len(order) else idx
+
+        result = {}
+        for field in (source if fields is None else fields):
+            if field not in source:
+                continue
+            column = np.asarray(source[field])
+            values = column[idx] if len(column) else np.empty(len(ts), column.dtype)
+            if values.dtype == object:
+                values = values.copy()
+                values[~found] = None
+            else:
+                values = np.where(found, values, np.nan)
+            result[field] = values
+        return result
+
+
+def load_session(data_dir, verbose: bool = True) -> Session:
+    """Abre (e atualiza o cache de) uma sessão — ver Session"""
+    return Session(data_dir, verbose=verbose)
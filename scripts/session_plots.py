@@ -2,15 +2,14 @@
 """
 session_plots.py - Geração completa de gráficos de uma sessão F1 Car
 
-Lê todos os sensors_*.pkl de um diretório e gera um conjunto de gráficos
-PNG + um arquivo analise.md com observações automáticas.
+Lê os sensores e o FF de um diretório (sensors_*.pkl, ff_*.pkl ou
+session_*.f1rec, via session_loader.py, com cache incremental) e gera um conjunto
+de gráficos PNG + um arquivo analise.md com observações automáticas.
 
 Uso:
     python3 scripts/session_plots.py sessoes/01_indoor_20260413
 """
 
-import glob
-import pickle
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +18,8 @@ import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 
+from session_loader import load_session
+
 # ── estilo ─────────────────────────────────────────────────────────────────────
 
 plt.rcParams.update({
@@ -62,58 +63,22 @@ COLORS = {
 
 # ── carregamento ───────────────────────────────────────────────────────────────
 
-def load_sensors(data_dir: Path) -> dict[str, np.ndarray]:
-    files = sorted(glob.glob(str(data_dir / "sensors_*.pkl")))
-    if not files:
-        print(f"[ERRO] Nenhum sensors_*.pkl em {data_dir}")
+def load_sensors(session) -> dict[str, np.ndarray]:
+    # Apenas campos numéricos (memmap, lidos sob demanda; NaN = ausente)
+    out = session.stream("sensors", numeric_only=True)
+    if out is None:
+        print(f"[ERRO] Nenhum sensors_*.pkl / session_*.f1rec em {session.data_dir}")
         sys.exit(1)
-
-    raw: dict[str, list] = {}
-    for f in files:
-        with open(f, "rb") as fh:
-            d = pickle.load(fh)
-        for k, v in d.items():
-            vals = v if isinstance(v, list) else list(v)
-            raw.setdefault(k, []).extend(vals)
-
-    out: dict[str, np.ndarray] = {}
-    for k, v in raw.items():
-        try:
-            out[k] = np.array(v, dtype=float)
-        except (ValueError, TypeError):
-            pass
     return out
 
 
-def load_ff(data_dir: Path) -> dict[str, np.ndarray] | None:
-    """Carrega todos os ff_*.pkl e retorna dict concatenado.
+def load_ff(session) -> dict[str, np.ndarray] | None:
+    """Carrega o stream de FF (ff_*.pkl / session_*.f1rec).
 
-    Retorna None se não houver arquivos (sessões antigas).
-    Campos string (ff_context, steering_feedback_direction) são mantidos como list.
+    Retorna None se não houver dados (sessões antigas).
+    Campos string (ff_context, steering_feedback_direction) vêm como array object.
     """
-    files = sorted(glob.glob(str(data_dir / "ff_*.pkl")))
-    if not files:
-        return None
-
-    raw: dict[str, list] = {}
-    for f in files:
-        with open(f, "rb") as fh:
-            d = pickle.load(fh)
-        for k, v in d.items():
-            vals = v if isinstance(v, list) else list(v)
-            raw.setdefault(k, []).extend(vals)
-
-    out: dict = {}
-    for k, v in raw.items():
-        # Campos string ficam como list
-        if any(isinstance(x, str) for x in v if x is not None):
-            out[k] = list(v)
-            continue
-        try:
-            out[k] = np.array([x if x is not None else np.nan for x in v], dtype=float)
-        except (ValueError, TypeError):
-            out[k] = list(v)
-    return out
+    return session.stream("ff")
 
 
 # ── helpers ────────────────────────────────────────────────────────────────────
@@ -595,15 +560,16 @@ def main():
 
     print(f"  Sessão: {session_dir.name}")
     print(f"  Lendo : {exports_dir}")
-    data = load_sensors(exports_dir)
+    session = load_session(exports_dir)
+    data = load_sensors(session)
     print(f"  sensors: {len(data)} campos | {len(data['timestamp'])} amostras")
 
-    ff_data = load_ff(exports_dir)
+    ff_data = load_ff(session)
     if ff_data is not None:
         ff_n = len(ff_data.get("timestamp", []))
         print(f"  ff     : {len(ff_data)} campos | {ff_n} amostras")
     else:
-        print(f"  ff     : (nenhum ff_*.pkl encontrado — sessão antiga)")
+        print(f"  ff     : (nenhum dado de FF encontrado — sessão antiga)")
 
     ts = data["timestamp"]
     times = [datetime.fromtimestamp(t) for t in ts]
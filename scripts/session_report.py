@@ -2,7 +2,8 @@
 """
 session_report.py - Relatório detalhado de sessão de testes F1 Car
 
-Lê todos os sensors_*.pkl de um diretório de sessão e gera:
+Lê os sensores de um diretório de sessão (sensors_*.pkl / session_*.f1rec,
+via session_loader.py, com cache incremental) e gera:
   - Resumo geral da sessão
   - Tabela por blocos de tempo (padrão: 3 min)
   - Estatísticas de bateria, corrente, temperatura, motor, rede, RPi
@@ -14,38 +15,22 @@ Uso:
 """
 
 import argparse
-import glob
-import pickle
 import sys
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 
+from session_loader import load_session
+
 # ── helpers ────────────────────────────────────────────────────────────────────
 
 def load_all_sensors(data_dir: str) -> dict[str, np.ndarray]:
-    files = sorted(glob.glob(f"{data_dir}/sensors_*.pkl"))
-    if not files:
-        print(f"[ERRO] Nenhum sensors_*.pkl em: {data_dir}")
+    # Apenas campos numéricos (memmap, lidos sob demanda; NaN = ausente)
+    result = load_session(data_dir).stream("sensors", numeric_only=True)
+    if result is None:
+        print(f"[ERRO] Nenhum sensors_*.pkl / session_*.f1rec em: {data_dir}")
         sys.exit(1)
-
-    raw: dict[str, list] = {}
-    for f in files:
-        with open(f, "rb") as fh:
-            d = pickle.load(fh)
-        for k, v in d.items():
-            vals = v if isinstance(v, list) else list(v)
-            raw.setdefault(k, []).extend(vals)
-
-    # Converte apenas arrays numéricos
-    result: dict[str, np.ndarray] = {}
-    for k, v in raw.items():
-        try:
-            arr = np.array(v, dtype=float)
-            result[k] = arr
-        except (ValueError, TypeError):
-            pass  # ignora campos não-numéricos (strings, bools)
     return result
 
 
@@ -312,7 +297,7 @@ def plot_session(d: dict[str, np.ndarray]) -> None:
 
 def main():
     parser = argparse.ArgumentParser(description="Relatório de sessão F1 Car")
-    parser.add_argument("data_dir", help="Diretório com sensors_*.pkl")
+    parser.add_argument("data_dir", help="Diretório com sensors_*.pkl / session_*.f1rec")
     parser.add_argument("--block", type=int, default=180,
                         help="Duração dos blocos em segundos (padrão: 180 = 3 min)")
     parser.add_argument("--plot", action="store_true",
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+session_store.py - Formato colunar em disco das sessões F1 Car (memmap)
+
+Converte os arquivos do auto-save (sensors_*.pkl, ff_*.pkl, telemetry_*.pkl
+e session_*.f1rec) para colunas .npy + manifest.json. Os scripts abrem só
+as colunas que usam, com np.load(mmap_mode="r") — sem unpickle nem
+concatenação a cada execução. Normalmente usado via session_loader.py.
+
+LAYOUT:
+======
+<exports/auto>/columnar/
+    manifest.json
+    sensors/<campo>.npy         float64 (NaN = ausente)
+    sensors/<campo>.codes.npy   int32 — campos string: índice em
+                                "categories" do manifest (-1 = None)
+    ff/...
+    telemetry/...
+
+manifest.json:
+    {"version": 2,
+     "sources": [{"name": "sensors_20260413_101500.pkl", "mtime": ..., "size": ...,
+                  "offset": ..., "rows": {"sensors": 2000}}, ...],
+     "streams": {"sensors": {"rows": N, "fields": {
+         "voltage_battery": {"kind": "float64"},
+         "ff_context": {"kind": "category", "categories": ["Idle", ...]}}}}}
+
+ATUALIZAÇÃO INCREMENTAL (update):
+================================
+- sources fica em ordem cronológica; o prefixo com mesmo nome, mtime e
+  tamanho é mantido (linhas já gravadas nas colunas)
+- .f1rec que só cresceu (sessão em gravação): lido a partir de "offset"
+- Arquivos novos/alterados depois do prefixo: lidos e acrescentados no
+  próprio .npy (dados no fim do arquivo + shape reescrito no cabeçalho),
+  sem reescrever as linhas já gravadas. Só um campo novo, um campo que
+  vira categoria ou um prefixo menor que o gravado reescrevem a coluna
+
+Uso:
+    python3 scripts/session_store.py sessoes/01_indoor_20260413/exports/auto
+    python3 scripts/session_store.py exports/auto --force
+"""
+
+import argparse
+import io
+import json
+import os
+import pickle
+import re
+import shutil
+import struct
+import sys
+import time
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+STORE_DIRNAME = "columnar"
+MANIFEST_NAME = "manifest.json"
+STORE_VERSION = 2
+
+# Arquivos .pkl do auto-save por stream
+PICKLE_PATTERNS = {
+    "sensors": "sensors_*.pkl",
+    "ff": "ff_*.pkl",
+    "telemetry": "telemetry_*.pkl",
+}
+# Gravação contínua (client/console/logic/session_recorder.py): todos os streams
+SESSION_PATTERN = "session_*.f1rec"
+
+# Formato .f1rec (deve ser igual ao session_recorder.py)
+F1REC_HEADER = struct.Struct("<4sHHd")
+F1REC_CHUNK_HEADER = struct.Struct("<4sII")
+F1REC_MAGIC = b"F1SR"
+F1REC_CHUNK_MAGIC = b"CHNK"
+
+_STAMP = re.compile(r"(\d{8}_\d{6})")
+
+
+# ── origem ─────────────────────────────────────────────────────────────────────
+
+def source_files(data_dir: Path) -> list[Path]:
+    """Arquivos de origem em ordem cronológica (pelo carimbo no nome)"""
+    files = [f for pattern in (*PICKLE_PATTERNS.values(), SESSION_PATTERN)
+             for f in data_dir.glob(pattern)]
+
+    def key(path: Path):
+        match = _STAMP.search(path.name)
+        return (match.group(1) if match else "", path.name)
+
+    return sorted(files, key=key)
+
+
+def _signature(path: Path) -> tuple[float, int]:
+    """(mtime, tamanho) — muda quando o arquivo é reescrito ou cresce"""
+    st = path.stat()
+    return st.st_mtime, st.st_size
+
+
+def read_source(path: Path, offset: int = 0) -> tuple[dict[str, list[dict]], int]:
+    """
+    Lê um arquivo de origem.
+
+    Args:
+        path: Arquivo .pkl ou .f1rec
+        offset: .f1rec: posição do primeiro chunk ainda não lido (0 = início)
+
+    Returns:
+        ({stream: [colunas, ...]}, offset após o último chunk válido) — cada
+        bloco é {campo: list | ndarray} com todas as colunas do mesmo tamanho
+    """
+    if path.suffix == ".f1rec":
+        return _read_f1rec(path, offset)
+
+    stream = next(s for s, pattern in PICKLE_PATTERNS.items()
+                  if path.match(pattern))
+    with open(path, "rb") as fh:
+        data = pickle.load(fh)
+    # Metadados escalares (start_time, max_points, ...) ficam de fora
+    columns = {k: v for k, v in data.items() if isinstance(v, (list, tuple, np.ndarray))}
+    if stream == "telemetry" and "timestamp" not in columns and "time" in columns:
+        # Tempo absoluto para alinhar com sensores/FF (time é relativo ao plotter)
+        start = data.get("start_time")
+        if isinstance(start, (int, float)):
+            columns["timestamp"] = [None if t is None else start + t for t in columns["time"]]
+    size = path.stat().st_size
+    return ({stream: [columns]} if columns else {}), size
+
+
+def _read_f1rec(path: Path, offset: int = 0) -> tuple[dict[str, list[dict]], int]:
+    """Chunks válidos de um .f1rec (para no primeiro truncado/corrompido)"""
+    blocks: dict[str, list[dict]] = {}
+    with open(path, "rb") as fh:
+        if offset:
+            fh.seek(offset)
+        else:
+            header = fh.read(F1REC_HEADER.size)
+            if len(header) < F1REC_HEADER.size or header[:4] != F1REC_MAGIC:
+                return blocks, 0
+            offset = fh.tell()
+        while True:
+            chunk_header = fh.read(F1REC_CHUNK_HEADER.size)
+            if len(chunk_header) < F1REC_CHUNK_HEADER.size:
+                break
+            magic, length, crc = F1REC_CHUNK_HEADER.unpack(chunk_header)
+            if magic != F1REC_CHUNK_MAGIC:
+                break  # Índice do fim do arquivo
+            payload = fh.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            chunk = pickle.loads(payload)
+            blocks.setdefault(chunk["stream"], []).append(chunk["columns"])
+            offset = fh.tell()
+    return blocks, offset
+
+
+# ── conversão ──────────────────────────────────────────────────────────────────
+
+def _block_rows(columns: dict) -> int:
+    return max((len(v) for v in columns.values()), default=0)
+
+
+def _to_float(values) -> np.ndarray | None:
+    """float64 com NaN no lugar de None, ou None se houver strings"""
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return values.astype(np.float64, copy=False)
+    try:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+def _encode(parts, categories: dict) -> np.ndarray:
+    """Códigos int32 das partes (categories é estendido; -1 = None/NaN)"""
+    values = [v for part in parts
+              for v in (part.tolist() if isinstance(part, np.ndarray) else part)]
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, v in enumerate(values):
+        if v is None or (isinstance(v, float) and v != v):
+            codes[i] = -1
+        else:
+            codes[i] = categories.setdefault(str(v), len(categories))
+    return codes
+
+
+def _save(path: Path, array: np.ndarray):
+    """np.save atômico (o arquivo antigo pode estar aberto como memmap)"""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        np.save(fh, array)
+    os.replace(tmp, path)
+
+
+_HEADER_IO = {
+    (1, 0): (np.lib.format.read_array_header_1_0, np.lib.format.write_array_header_1_0),
+    (2, 0): (np.lib.format.read_array_header_2_0, np.lib.format.write_array_header_2_0),
+}
+
+
+def _append_npy(path: Path, keep: int, parts) -> bool:
+    """
+    Acrescenta parts a um .npy 1-D logo após as keep primeiras linhas, no
+    próprio arquivo: grava os dados novos e reescreve só o shape no
+    cabeçalho (np.save reserva espaço para o shape crescer).
+
+    Returns:
+        bool: False (arquivo intocado) se não dá para acrescentar no lugar —
+            arquivo ausente, keep menor que o gravado (leitores com memmap
+            não podem ver o arquivo encolher) ou cabeçalho sem espaço
+    """
+    try:
+        fh = open(path, "r+b")
+    except OSError:
+        return False
+    with fh:
+        header_io = _HEADER_IO.get(np.lib.format.read_magic(fh))
+        if header_io is None:
+            return False
+        shape, fortran, dtype = header_io[0](fh)
+        offset = fh.tell()
+        if fortran or len(shape) != 1 or shape[0] != keep:
+            return False
+
+        data = [np.ascontiguousarray(part, dtype=dtype) for part in parts]
+        rows = keep + sum(len(d) for d in data)
+        header = io.BytesIO()
+        header_io[1](header, {"descr": np.lib.format.dtype_to_descr(dtype),
+                              "fortran_order": False, "shape": (rows,)})
+        if len(header.getvalue()) != offset:
+            return False
+
+        fh.seek(offset + keep * dtype.itemsize)
+        for d in data:
+            fh.write(d.tobytes())
+        fh.seek(0)
+        fh.write(header.getvalue())
+    return True
+
+
+def _append_stream(stream_dir: Path, old: dict | None, keep: int, blocks: list[dict]) -> dict:
+    """
+    Mantém as keep primeiras linhas de um stream e acrescenta os blocos.
+
+    Campos novos recebem NaN/None nas linhas antigas; um campo numérico que
+    passa a receber strings vira categoria.
+    """
+    stream_dir.mkdir(parents=True, exist_ok=True)
+    old_fields = old["fields"] if old and keep else {}
+    rows = [_block_rows(b) for b in blocks]
+    fields: dict[str, None] = dict.fromkeys(old_fields)
+    for b in blocks:
+        fields.update(dict.fromkeys(b))
+
+    meta = {}
+    for field in fields:
+        info = old_fields.get(field)
+        numeric = info is None or info["kind"] == "float64"
+        parts = []
+        for b, n in zip(blocks, rows):
+            values = b.get(field)
+            if values is None:
+                values = [None] * n
+            elif len(values) < n:  # Coluna curta (pickle antigo): completa
+                values = list(values) + [None] * (n - len(values))
+            converted = _to_float(values) if numeric else None
+            if converted is None:
+                numeric = False
+            parts.append(converted if converted is not None else values)
+
+        float_path = stream_dir / f"{field}.npy"
+        codes_path = stream_dir / f"{field}.codes.npy"
+        kind = info["kind"] if info else None
+
+        if numeric:
+            # Caso comum: acrescenta no lugar; senão reescreve a coluna
+            if kind != "float64" or not _append_npy(float_path, keep, parts):
+                if kind is None:
+                    head = np.full(keep, np.nan)
+                else:
+                    head = np.load(float_path, mmap_mode="r")[:keep]
+                _save(float_path, np.concatenate([head, *parts]))
+            meta[field] = {"kind": "float64"}
+            continue
+
+        if kind == "category":
+            categories = {c: i for i, c in enumerate(info["categories"])}
+            codes = _encode(parts, categories)
+            if not _append_npy(codes_path, keep, [codes]):
+                _save(codes_path, np.concatenate(
+                    [np.load(codes_path, mmap_mode="r")[:keep], codes]
+                ))
+        else:
+            # Campo novo ou numérico que passou a receber strings
+            if kind is None:
+                head = np.full(keep, np.nan)
+            else:
+                head = np.load(float_path, mmap_mode="r")[:keep]
+            categories = {}
+            _save(codes_path, _encode([head, *parts], categories))
+            float_path.unlink(missing_ok=True)
+        meta[field] = {"kind": "category", "categories": list(categories)}
+
+    return {"rows": keep + sum(rows), "fields": meta}
+
+
+def update(data_dir, store_dir=None, force: bool = False, verbose: bool = True) -> dict:
+    """
+    Atualiza o store colunar de forma incremental.
+
+    Os arquivos de origem são comparados com o manifest em ordem
+    cronológica: o prefixo inalterado (mesmo nome, mtime e tamanho) é
+    mantido; um .f1rec que só cresceu continua do último offset lido; o
+    restante (arquivos novos ou alterados) é lido e acrescentado.
+
+    Args:
+        data_dir: Diretório do auto-save (exports/auto)
+        store_dir: Destino (padrão: <data_dir>/columnar)
+        force: Ignora o store existente e reconverte tudo
+
+    Returns:
+        dict: Manifest atual
+    """
+    data_dir = Path(data_dir)
+    store_dir = Path(store_dir) if store_dir else data_dir / STORE_DIRNAME
+    files = source_files(data_dir)
+    manifest = None if force else read_manifest(store_dir)
+    old_sources = manifest["sources"] if manifest else []
+
+    # Prefixo inalterado
+    kept = []
+    for entry, path in zip(old_sources, files):
+        if entry["name"] != path.name or [entry["mtime"], entry["size"]] != list(_signature(path)):
+            break
+        kept.append(entry)
+    if manifest and len(kept) == len(old_sources) == len(files):
+        return manifest
+
+    t0 = time.monotonic()
+    pending = files[len(kept):]
+
+    # .f1rec em gravação: mesmo arquivo, só cresceu — continua do offset
+    resume = None
+    if pending and len(kept) < len(old_sources):
+        entry, path = old_sources[len(kept)], pending[0]
+        if (entry["name"] == path.name and path.suffix == ".f1rec"
+                and entry.get("offset") and path.stat().st_size >= entry["size"]):
+            resume = entry
+
+    keep_rows: dict[str, int] = {}
+    for entry in kept + ([resume] if resume else []):
+        for stream, n in entry["rows"].items():
+            keep_rows[stream] = keep_rows.get(stream, 0) + n
+
+    sources = list(kept)
+    new_blocks: dict[str, list[dict]] = {}
+    for path in pending:
+        offset = resume["offset"] if resume and path.name == resume["name"] else 0
+        try:
+            blocks, end = read_source(path, offset)
+        except Exception as e:
+            print(f"  [!] Erro em {path.name}: {e}")
+            blocks, end = {}, 0
+        rows = dict(resume["rows"]) if offset else {}
+        for stream, stream_blocks in blocks.items():
+            new_blocks.setdefault(stream, []).extend(stream_blocks)
+            rows[stream] = rows.get(stream, 0) + sum(_block_rows(b) for b in stream_blocks)
+        mtime, size = _signature(path)
+        sources.append({"name": path.name, "mtime": mtime, "size": size,
+                        "offset": end, "rows": rows})
+
+    # Sem manifest durante a escrita: um crash aqui força reconversão completa
+    store_dir.mkdir(parents=True, exist_ok=True)
+    (store_dir / MANIFEST_NAME).unlink(missing_ok=True)
+    old_streams = manifest["streams"] if manifest else {}
+    streams = {}
+    for stream in dict.fromkeys([*old_streams, *new_blocks]):
+        keep = keep_rows.get(stream, 0)
+        blocks = new_blocks.get(stream, [])
+        if keep or blocks:
+            streams[stream] = _append_stream(
+                store_dir / stream, old_streams.get(stream), keep, blocks
+            )
+        else:
+            shutil.rmtree(store_dir / stream, ignore_errors=True)
+
+    manifest = {"version": STORE_VERSION, "sources": sources, "streams": streams}
+    tmp = store_dir / (MANIFEST_NAME + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=1)
+    os.replace(tmp, store_dir / MANIFEST_NAME)
+
+    if verbose:
+        summary = ", ".join(f"{s}: {m['rows']} linhas" for s, m in streams.items())
+        print(f"  [store] {len(pending)} de {len(files)} arquivos lidos -> {store_dir} "
+              f"({summary or 'vazio'}) em {time.monotonic() - t0:.1f}s")
+    return manifest
+
+
+def convert(data_dir, store_dir=None, verbose: bool = True) -> dict:
+    """Reconverte todos os arquivos de origem (ignora o store existente)"""
+    return update(data_dir, store_dir, force=True, verbose=verbose)
+
+
+# ── leitura ────────────────────────────────────────────────────────────────────
+
+def read_manifest(store_dir: Path) -> dict | None:
+    try:
+        with open(store_dir / MANIFEST_NAME, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == STORE_VERSION else None
+
+
+def is_current(data_dir, manifest: dict | None) -> bool:
+    """True se o store reflete os arquivos de origem atuais"""
+    if manifest is None:
+        return False
+    current = [[f.name, *_signature(f)] for f in source_files(Path(data_dir))]
+    return current == [[e["name"], e["mtime"], e["size"]] for e in manifest["sources"]]
+
+
+class ColumnStore(Mapping):
+    """
+    Colunas de um stream, abertas sob demanda (memmap).
+
+    Campos numéricos: np.ndarray float64 somente leitura (memmap).
+    Campos string: np.ndarray object (None = ausente).
+    as_list=True devolve listas no formato dos .pkl (None = ausente, também
+    nos campos numéricos).
+    """
+
+    def __init__(self, stream_dir: Path, meta: dict, as_list: bool = False,
+                 numeric_only: bool = False):
+        self.stream_dir = stream_dir
+        self.rows = meta["rows"]
+        self.as_list = as_list
+        self._fields = {
+            name: info for name, info in meta["fields"].items()
+            if not numeric_only or info["kind"] == "float64"
+        }
+        self._cache = {}
+
+    def __getitem__(self, field):
+        if field in self._cache:
+            return self._cache[field]
+        info = self._fields[field]
+        if info["kind"] == "float64":
+            column = np.load(self.stream_dir / f"{field}.npy", mmap_mode="r")[: self.rows]
+            if self.as_list:
+                # NaN volta a ser None, como nos .pkl
+                column = [None if v != v else v for v in column.tolist()]
+        else:
+            codes = np.load(self.stream_dir / f"{field}.codes.npy", mmap_mode="r")[: self.rows]
+            lookup = np.array(info["categories"] + [None], dtype=object)
+            column = lookup[codes]  # -1 -> None (último)
+            if self.as_list:
+                column = column.tolist()
+        self._cache[field] = column
+        return column
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, field):
+        return field in self._fields
+
+
+def open_stream(data_dir, stream: str, as_list: bool = False,
+                numeric_only: bool = False, rebuild: bool = True):
+    """
+    Abre um stream do store, convertendo os arquivos de origem se preciso.
+
+    Args:
+        data_dir: Diretório do auto-save (exports/auto)
+        stream: "sensors", "ff" ou "telemetry"
+        as_list: Colunas como listas (formato dos .pkl)
+        numeric_only: Omite campos string
+        rebuild: Atualiza o store quando os arquivos de origem mudaram
+
+    Returns:
+        ColumnStore, ou None se o stream não tem dados
+    """
+    data_dir = Path(data_dir)
+    store_dir = data_dir / STORE_DIRNAME
+    manifest = update(data_dir, store_dir) if rebuild else read_manifest(store_dir)
+    if manifest is None:
+        return None
+    meta = manifest["streams"].get(stream)
+    if not meta or not meta["rows"]:
+        return None
+    return ColumnStore(store_dir / stream, meta, as_list=as_list, numeric_only=numeric_only)
+
+
+# ── main ───────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Converte/atualiza o store colunar de uma sessão")
+    parser.add_argument("data_dir", help="Diretório com sensors_*.pkl / session_*.f1rec")
+    parser.add_argument("--force", action="store_true",
+                        help="Reconverte mesmo se o store estiver atualizado")
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    if not data_dir.is_dir():
+        print(f"[ERRO] Diretório não encontrado: {data_dir}")
+        sys.exit(1)
+    store_dir = data_dir / STORE_DIRNAME
+    if not args.force and is_current(data_dir, read_manifest(store_dir)):
+        print(f"  [store] Atualizado: {store_dir}")
+        return
+    update(data_dir, store_dir, force=args.force)
+
+
+if __name__ == "__main__":
+    main()